@@ -45,6 +45,7 @@ assert PYNETDICOM_IMPLEMENTATION_UID.is_valid
 from pynetdicom import events as evt
 from pynetdicom.ae import ApplicationEntity as AE
 from pynetdicom.association import Association
+from pynetdicom.pool import AssociationPool
 from pynetdicom._globals import (
     ALL_TRANSFER_SYNTAXES,
     DEFAULT_TRANSFER_SYNTAXES,
@@ -105,6 +105,11 @@ memory required when:
 * Sending large datasets
 * Sending many datasets concurrently
 
+.. versionchanged:: 3.1
+
+    The data is sent directly from the file using
+    :meth:`socket.sendfile()<socket.socket.sendfile>` where possible
+
 As it's not possible to change the dataset encoding without loading it into
 memory, an exact matching accepted presentation context will be required.
 
@@ -117,6 +122,40 @@ Examples
 >>> _config.STORE_SEND_CHUNKED_DATASET = True
 """
 
+STORE_SEND_DEFLATE_THRESHOLD: int | None = None
+"""Prefer deflating large datasets without pixel data when sending them.
+
+.. versionadded:: 3.1
+
+If not ``None`` then when using
+:meth:`~pynetdicom.association.Association.send_c_store` with a dataset that
+doesn't contain *Pixel Data*, *Float Pixel Data* or *Double Float Pixel Data*,
+and the peer has accepted a presentation context for the dataset's SOP class
+with *Deflated Explicit VR Little Endian* transfer syntax, then that context
+will be used whenever the dataset is at least this many bytes long when
+encoded as *Explicit VR Little Endian*. This can considerably reduce the time
+taken to send large text-heavy datasets such as Structured Reports and RT Plans
+over slow network links.
+
+If :attr:`~pynetdicom._config.STORE_SEND_CHUNKED_DATASET` is ``True`` then
+a file path to a dataset encoded as *Explicit VR Little Endian* is sent
+deflated if its dataset is at least this many bytes long. The dataset itself
+is not checked for pixel data.
+
+The dataset is deflated as it's sent, so the deflated dataset is never held in
+memory in full.
+
+Default: ``None``
+
+Examples
+--------
+
+Prefer deflating datasets of 1 MB or more
+
+>>> from pynetdicom import _config
+>>> _config.STORE_SEND_DEFLATE_THRESHOLD = 1024 * 1024
+"""
+
 STORE_RECV_CHUNKED_DATASET: bool = False
 """Chunk a dataset file when receiving it to minimise memory usage.
 
@@ -132,6 +171,12 @@ amount of memory required when:
 * Receiving large datasets
 * Receiving many datasets concurrently
 
+.. versionchanged:: 3.1
+
+    The file used for each dataset can be customised using
+    :attr:`AE.dataset_writer<pynetdicom.ae.ApplicationEntity.dataset_writer>`,
+    which allows the dataset to be written directly to its final location
+
 Default: ``False``
 
 Examples
@@ -141,6 +186,114 @@ Examples
 >>> _config.STORE_RECV_CHUNKED_DATASET = True
 """
 
+MAX_QUEUED_MESSAGES: int | None = None
+"""The maximum number of received DIMSE messages waiting to be processed per
+association.
+
+.. versionadded:: 3.1
+
+If not ``None`` then once an association has this many received DIMSE
+messages (such as C-STORE requests or pending C-FIND responses) waiting to be
+processed, no more data will be read from the peer until the number drops
+below the limit. This lets TCP flow control slow down a peer that sends
+messages faster than they can be handled, rather than the messages being held
+in memory.
+
+Reading is only paused during data transfer and only P-DATA-TF PDUs are held
+back, so an A-RELEASE-RQ or A-ABORT from the peer is still acted on if it's
+the next PDU to be received. Time spent paused doesn't count towards the
+network timeout. The current number of waiting messages is available from
+:attr:`DIMSEServiceProvider.queued_messages
+<pynetdicom.dimse.DIMSEServiceProvider.queued_messages>`.
+
+Default: ``None``
+
+Examples
+--------
+
+>>> from pynetdicom import _config
+>>> _config.MAX_QUEUED_MESSAGES = 100
+"""
+
+MAX_QUEUED_BYTES: int | None = None
+"""The maximum size of the received DIMSE messages waiting to be processed
+per association, in bytes.
+
+.. versionadded:: 3.1
+
+If not ``None`` then once the encoded DIMSE messages (including any datasets)
+waiting to be processed by an association reach this size, no more data will
+be read from the peer until the size drops below the limit. As complete
+messages are required before they can be processed, the limit may be exceeded
+by up to the size of a single message. Datasets received when
+:attr:`~pynetdicom._config.STORE_RECV_CHUNKED_DATASET` is ``True`` are
+written to file and don't count towards the limit.
+
+The current size is available from :attr:`DIMSEServiceProvider.queued_bytes
+<pynetdicom.dimse.DIMSEServiceProvider.queued_bytes>`.
+
+Default: ``None``
+
+Examples
+--------
+
+>>> from pynetdicom import _config
+>>> _config.MAX_QUEUED_BYTES = 64 * 1024 * 1024
+"""
+
+PACK_DIMSE_MESSAGES: bool = False
+"""Send the fragments of consecutive DIMSE messages in the same P-DATA-TF PDU.
+
+.. versionadded:: 3.1
+
+The fragments of a single DIMSE message are always packed into as few P-DATA-TF
+PDUs as the peer's maximum PDU length allows, so a small command set and data
+set are sent in the same PDU. If ``True`` then any DIMSE messages waiting to
+be sent, such as pending C-FIND responses, will also be packed into the same
+PDUs, further reducing the number of PDUs and system calls for small messages.
+
+This is permitted by the DICOM Standard but isn't supported by the receiving
+side of pynetdicom prior to v3.1, which discards the fragments that follow the
+end of a message.
+
+Default: ``False``
+
+Examples
+--------
+
+>>> from pynetdicom import _config
+>>> _config.PACK_DIMSE_MESSAGES = True
+"""
+
+USE_ASYNCIO_DUL: bool = False
+"""Run the DICOM Upper Layer of all associations on a single :mod:`asyncio`
+event loop.
+
+.. versionadded:: 3.1
+
+If ``True`` then rather than each association using its own thread for the
+DICOM Upper Layer service, the state machine, PDU framing and socket I/O for
+every association will be run on a single event loop in a shared thread. This
+halves the number of threads required per association and idle associations
+use no CPU, which may be useful when handling a large number of concurrent
+associations.
+
+As event handlers for the PDU, data and state machine transition events (and
+the decoding of received DIMSE messages) will be run in the event loop's
+thread, any handlers bound to these events should return quickly as they'll
+block all other associations in the meantime.
+
+Must be set before any associations are requested or servers started.
+
+Default: ``False``
+
+Examples
+--------
+
+>>> from pynetdicom import _config
+>>> _config.USE_ASYNCIO_DUL = True
+"""
+
 PASS_CONTEXTVARS: bool = False
 """Pass context-local state to concurrent pynetdicom code.
 
@@ -4095,11 +4095,16 @@ def doc_handle_async(event: "Event", *args: Sequence[Any]) -> tuple[int, int]:
     :dcm:`Asynchronous Operations Window Negotiation<part07/sect_D.3.3.3.html>`
     item will be sent in reply to the association requestor.
 
-    Because *pynetdicom* doesn't support asynchronous operations if the
-    handler is implemented then the response to the asynchronous
-    operations window negotiation request will always return the default
-    number of operations invoked/performed, (1, 1), regardless of what
-    values are returned by the handler.
+    If the handler is implemented then the returned number of operations
+    invoked/performed will be sent in the response, reduced to no more than
+    the values requested. When the number of operations invoked is greater
+    than 1 then the requests received from the peer will be performed
+    concurrently, up to that number at once. Handlers for those requests may
+    then be called from several threads at the same time.
+
+    .. versionchanged:: 3.1
+
+        The values returned by the handler are now used in the response.
 
     **Event**
 
@@ -4117,11 +4122,11 @@ def doc_handle_async(event: "Event", *args: Sequence[Any]) -> tuple[int, int]:
           that received the Asynchronous Operations Window Negotiation request.
         * :attr:`~pynetdicom.events.Event.event`: the event that occurred as
           :class:`~pynetdicom.events.InterventionEvent`.
-        * ``invoked``: the *Maximum Number Operations Invoked* parameter
+        * ``nr_invoked``: the *Maximum Number Operations Invoked* parameter
           value of the Asynchronous Operations Window Negotiation item as
           an :class:`int`. If the value is ``0`` then an unlimited number of
           invocations are requested.
-        * ``performed``: the *Maximum Number Operations Performed*
+        * ``nr_performed``: the *Maximum Number Operations Performed*
           parameter value of the Asynchronous Operations Window Negotiation
           item as an :class:`int`. If the value is ``0`` then an unlimited
           number of performances are requested.
@@ -4140,9 +4145,8 @@ def doc_handle_async(event: "Event", *args: Sequence[Any]) -> tuple[int, int]:
     int, int
         The (maximum number operations invoked, maximum number operations
         performed). A value of ``0`` indicates that an unlimited number of
-        operations is supported. As asynchronous operations are not
-        supported the returned values will be ignored and (1, 1) sent in
-        response.
+        operations is supported. If the handler raises an exception or the
+        returned values are invalid then (1, 1) will be sent in response.
 
     References
     ----------
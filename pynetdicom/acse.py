@@ -75,17 +75,23 @@ class ACSE:
             If the ``evt.EVT_ASYNC_OPS`` handler hasn't been implemented
             then returns ``None``, otherwise returns an
             :class:`AsynchronousOperationsWindowNegotiation` item with the
-            default values for the number of operations invoked/performed
-            (1, 1).
+            number of operations invoked/performed returned by the handler,
+            reduced to no more than the requested values. If the handler
+            raises an exception or returns invalid values then the default
+            (1, 1) will be used.
         """
         # pylint: disable=broad-except
         setattr(self.assoc, "abort", self.assoc._abort_nonblocking)
 
+        inv, perf = self.requestor.asynchronous_operations
         try:
-            # Response is always ignored as async ops is not supported
-            inv, perf = self.requestor.asynchronous_operations
-            _ = evt.trigger(
-                self.assoc, evt.EVT_ASYNC_OPS, {"nr_invoked": inv, "nr_performed": perf}
+            invoked, performed = cast(
+                tuple[int, int],
+                evt.trigger(
+                    self.assoc,
+                    evt.EVT_ASYNC_OPS,
+                    {"nr_invoked": inv, "nr_performed": perf},
+                ),
             )
         except NotImplementedError:
             setattr(self.assoc, "abort", self.assoc._abort_blocking)
@@ -93,12 +99,28 @@ class ACSE:
         except Exception as exc:
             LOGGER.error("Exception raised in handler bound to 'evt.EVT_ASYNC_OPS'")
             LOGGER.exception(exc)
+            invoked, performed = 1, 1
 
         setattr(self.assoc, "abort", self.assoc._abort_blocking)
 
+        values = (invoked, performed)
+        if not all(isinstance(v, int) and 0 <= v <= 65535 for v in values):
+            LOGGER.error(
+                "Invalid number of operations returned by the handler bound to "
+                f"'evt.EVT_ASYNC_OPS': {values}, using (1, 1) instead"
+            )
+            invoked, performed = 1, 1
+
+        # The accepted values mustn't exceed those requested, 0 is unlimited
+        if inv:
+            invoked = min(invoked or inv, inv)
+
+        if perf:
+            performed = min(performed or perf, perf)
+
         item = AsynchronousOperationsWindowNegotiation()
-        item.maximum_number_operations_invoked = 1
-        item.maximum_number_operations_performed = 1
+        item.maximum_number_operations_invoked = invoked
+        item.maximum_number_operations_performed = performed
 
         return item
 
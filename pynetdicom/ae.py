@@ -2,32 +2,43 @@
 The main user class, represents a DICOM Application Entity
 """
 
+from collections import deque
+from concurrent.futures import Future
 from copy import deepcopy
 from datetime import datetime
 import logging
+import os
+from pathlib import Path
+import queue
 import socket
 from ssl import SSLContext
 import threading
 from typing import (
     cast,
+    Callable,
     TypeVar,
     Type,
     Any,
+    Iterable,
+    Iterator,
     Sequence,
 )
 import warnings
 
+from pydicom.dataset import Dataset, FileMetaDataset
 from pydicom.uid import UID
 
 from pynetdicom import _config
 from pynetdicom.association import Association
+from pynetdicom.dsutils import DatasetWriter, read_header, split_dataset
 from pynetdicom.events import EventHandlerType
-from pynetdicom.presentation import PresentationContext
+from pynetdicom.presentation import PresentationContext, build_context
 from pynetdicom.pdu_primitives import _UI
 from pynetdicom.transport import (
     AssociationSocket,
     AssociationServer,
     ThreadedAssociationServer,
+    MultiProcessAssociationServer,
     AddressInformation,
 )
 from pynetdicom.utils import make_target, set_ae, decode_bytes, set_uid
@@ -43,6 +54,8 @@ LOGGER = logging.getLogger(__name__)
 
 _T = TypeVar("_T")
 ListCXType = list[PresentationContext]
+DatasetWriterType = Callable[[FileMetaDataset], DatasetWriter | None]
+StoreItemType = str | Path | Dataset
 TSyntaxType = None | str | UID | Sequence[str] | Sequence[UID]
 
 
@@ -100,7 +113,12 @@ class ApplicationEntity:
         self._require_calling_aet: list[str] = []
         self._require_called_aet = False
 
-        self._servers: list[ThreadedAssociationServer] = []
+        # Factory for the writers used when receiving chunked datasets
+        self._dataset_writer: DatasetWriterType | None = None
+
+        self._servers: list[
+            ThreadedAssociationServer | MultiProcessAssociationServer
+        ] = []
         self._lock: threading.Lock = threading.Lock()
 
     @property
@@ -683,7 +701,7 @@ class ApplicationEntity:
         current association.
         """
         # Creates and binds to `address` but doesn't connect
-        sock = AssociationSocket(assoc, address=address)
+        sock = assoc.dul._socket_class(assoc, address=address)
         sock.tls_args = tls_args
         return sock
 
@@ -721,6 +739,57 @@ class ApplicationEntity:
         for assoc in self.active_associations:
             assoc.connection_timeout = self.connection_timeout
 
+    @property
+    def dataset_writer(self) -> DatasetWriterType | None:
+        """Get or set the factory for the writers used to store datasets
+        received in C-STORE requests.
+
+        .. versionadded:: 3.1
+
+        Only used when :attr:`~pynetdicom._config.STORE_RECV_CHUNKED_DATASET`
+        is ``True``. The factory is called with the File Meta Information for
+        each received dataset and should return a
+        :class:`~pynetdicom.dsutils.DatasetWriter`, or ``None`` to use the
+        default writer which stores the dataset in a temporary file. As the
+        File Meta Information includes the *Media Storage SOP Class UID* and
+        *Media Storage SOP Instance UID* this can be used to write datasets
+        directly to their final location, depending on their SOP Class.
+
+        Examples
+        --------
+
+        Write CT Image Storage datasets directly to a storage directory::
+
+            from pynetdicom import AE, _config
+            from pynetdicom.dsutils import DatasetWriter
+            from pynetdicom.sop_class import CTImageStorage
+
+            _config.STORE_RECV_CHUNKED_DATASET = True
+
+            def writer(file_meta):
+                if file_meta.MediaStorageSOPClassUID == CTImageStorage:
+                    uid = file_meta.MediaStorageSOPInstanceUID
+                    return DatasetWriter(f"/path/to/storage/{uid}.dcm")
+
+            ae = AE()
+            ae.dataset_writer = writer
+
+        Parameters
+        ----------
+        value : Callable[[pydicom.dataset.FileMetaDataset], DatasetWriter | None] | None
+            The writer factory to use, or ``None`` to always use the default
+            writer (default ``None``).
+        """
+        return self._dataset_writer
+
+    @dataset_writer.setter
+    def dataset_writer(self, value: DatasetWriterType | None) -> None:
+        """Set the dataset writer factory."""
+        if value is not None and not callable(value):
+            raise TypeError("'dataset_writer' must be a callable or None")
+
+        self._dataset_writer = value
+
     @property
     def dimse_timeout(self) -> float | None:
         """Get or set the DIMSE timeout (in seconds).
@@ -1344,6 +1413,219 @@ class ApplicationEntity:
 
         self._require_calling_aet = values
 
+    def send_many(
+        self,
+        datasets: Iterable[StoreItemType],
+        addr: str | tuple[str, int, int],
+        port: int,
+        ae_title: str = "ANY-SCP",
+        parallel: int = 1,
+        max_pdu: int = DEFAULT_MAX_LENGTH,
+        ext_neg: list[_UI] | None = None,
+        bind_address: tuple[str, int] | tuple[str, int, int, int] | None = None,
+        tls_args: tuple[SSLContext, str] | None = None,
+    ) -> Iterator[tuple[StoreItemType, Dataset]]:
+        """Send datasets to a peer Storage SCP using C-STORE requests.
+
+        .. versionadded:: 3.1
+
+        Presentation contexts are requested for each unique combination of
+        the datasets' *SOP Class UID* and *Transfer Syntax UID*, so the
+        datasets can be sent without conversion. Dataset files are only read
+        up to the end of the File Meta Information and are then sent in
+        chunks without being decoded, provided the File Meta Information
+        includes the (0002,0002) *Media Storage SOP Class UID*, (0002,0003)
+        *Media Storage SOP Instance UID* and (0002,0010) *Transfer Syntax UID*
+        elements, otherwise they're read using
+        :func:`~pydicom.filereader.dcmread`.
+
+        The datasets are sent using up to `parallel` associations at once. If
+        more than 128 presentation contexts are required then the datasets
+        are sent in groups, each using new associations. If the peer agrees
+        to an Asynchronous Operations Window requested using `ext_neg` then
+        the C-STORE requests sent over each association will be pipelined.
+
+        Parameters
+        ----------
+        datasets : iterable of str, pathlib.Path or pydicom.dataset.Dataset
+            The datasets or paths to the dataset files to be sent.
+        addr : str | tuple[str, int, int]
+            The peer AE's TCP/IP address, see :meth:`associate`.
+        port : int
+            The peer AE's listen port number.
+        ae_title : str, optional
+            The peer's AE title (default ``'ANY-SCP'``).
+        parallel : int, optional
+            The maximum number of associations to use at once (default ``1``).
+        max_pdu : int, optional
+            The maximum PDV receive size in bytes to use when negotiating the
+            associations (default ``16832``).
+        ext_neg : list of UserInformation objects, optional
+            Extended negotiation items to use when requesting the
+            associations.
+        bind_address : tuple[str, int] | tuple[str, int, int, int], optional
+            The address to bind the associations' sockets to.
+        tls_args : 2-tuple, optional
+            The (`ssl_context`, `server_hostname`) to use for TLS.
+
+        Yields
+        ------
+        tuple[str | pathlib.Path | pydicom.dataset.Dataset, pydicom.dataset.Dataset]
+            The dataset or path from `datasets` and the status of the
+            corresponding C-STORE response, in the order the responses are
+            received. If the dataset couldn't be sent or no response was
+            received then the status will be an empty
+            :class:`~pydicom.dataset.Dataset`.
+
+        Raises
+        ------
+        ValueError
+            If `parallel` is less than 1.
+
+        Examples
+        --------
+
+        Send all the dataset files in a directory using 4 associations
+
+        >>> paths = Path("path/to/datasets").glob("**/*.dcm")
+        >>> for path, status in ae.send_many(paths, "127.0.0.1", 11112, parallel=4):
+        ...     print(f"{path}: 0x{status.get('Status', 0xFFFF):04X}")
+        """
+        if parallel < 1:
+            raise ValueError("'parallel' must be greater than 0")
+
+        kwargs = {
+            "addr": addr,
+            "port": port,
+            "ae_title": ae_title,
+            "max_pdu": max_pdu,
+            "ext_neg": ext_neg,
+            "bind_address": bind_address,
+            "tls_args": tls_args,
+        }
+
+        return self._send_many(datasets, parallel, kwargs)
+
+    def _send_many(
+        self,
+        datasets: Iterable[StoreItemType],
+        parallel: int,
+        kwargs: dict[str, Any],
+    ) -> Iterator[tuple[StoreItemType, Dataset]]:
+        """Yield the results of sending `datasets`, see :meth:`send_many`."""
+        # Group the datasets by the presentation context needed to send them
+        groups: dict[tuple[UID, UID], list[tuple[StoreItemType, bool]]] = {}
+        for dataset in datasets:
+            try:
+                sop_class, tsyntax, chunked = self._get_store_parameters(dataset)
+            except Exception as exc:
+                LOGGER.error(f"Unable to send the dataset {_item_name(dataset)}")
+                LOGGER.exception(exc)
+                yield dataset, Dataset()
+                continue
+
+            groups.setdefault((sop_class, tsyntax), []).append((dataset, chunked))
+
+        # Presentation contexts are limited to 128 for each association
+        keys = list(groups)
+        for idx in range(0, len(keys), 128):
+            contexts = [build_context(*key) for key in keys[idx : idx + 128]]
+            items: queue.SimpleQueue[tuple[StoreItemType, bool]] = queue.SimpleQueue()
+            for key in keys[idx : idx + 128]:
+                for item in groups.pop(key):
+                    items.put(item)
+
+            yield from self._send_many_group(items, contexts, parallel, kwargs)
+
+    def _send_many_group(
+        self,
+        items: "queue.SimpleQueue[tuple[StoreItemType, bool]]",
+        contexts: ListCXType,
+        parallel: int,
+        kwargs: dict[str, Any],
+    ) -> Iterator[tuple[StoreItemType, Dataset]]:
+        """Yield the results of sending `items` over up to `parallel`
+        associations that request `contexts`.
+        """
+        results: queue.SimpleQueue[tuple[StoreItemType, Dataset]]
+        results = queue.SimpleQueue()
+        is_stopped = threading.Event()
+
+        def send() -> None:
+            """Send items from the queue over one association at a time."""
+            # pylint: disable=protected-access
+            assoc: Association | None = None
+            pending: deque[tuple[StoreItemType, Future[Dataset]]] = deque()
+            try:
+                while not is_stopped.is_set():
+                    try:
+                        dataset, chunked = items.get_nowait()
+                    except queue.Empty:
+                        return
+
+                    if assoc is None or not assoc.is_established:
+                        assoc = self.associate(contexts=contexts, **kwargs)
+                        if not assoc.is_established:
+                            # Leave the dataset for the other associations
+                            items.put((dataset, chunked))
+                            return
+
+                    try:
+                        req, context_id = assoc._c_store_request(
+                            dataset, assoc._next_message_id(), 2, None, None, chunked
+                        )
+                        pending.append((dataset, assoc._submit(req, context_id)))
+                    except Exception as exc:
+                        name = _item_name(dataset)
+                        LOGGER.error(f"Unable to send the dataset {name}")
+                        LOGGER.exception(exc)
+                        results.put((dataset, Dataset()))
+
+                    while pending and pending[0][1].done():
+                        dataset, future = pending.popleft()
+                        results.put((dataset, future.result()))
+            finally:
+                if assoc and assoc.is_established:
+                    # Waits for any outstanding responses
+                    assoc.release()
+
+                for dataset, future in pending:
+                    results.put((dataset, future.result()))
+
+        nr_items = items.qsize()
+        workers = [
+            threading.Thread(target=send, daemon=True)
+            for _ in range(min(parallel, nr_items))
+        ]
+        for worker in workers:
+            worker.start()
+
+        try:
+            nr_results = 0
+            while nr_results < nr_items:
+                try:
+                    result = results.get(timeout=0.1)
+                except queue.Empty:
+                    if results.empty() and not any(t.is_alive() for t in workers):
+                        break
+
+                    continue
+
+                nr_results += 1
+                yield result
+
+            if not items.empty():
+                LOGGER.error(
+                    f"Unable to send {items.qsize()} dataset(s) as no association "
+                    "could be established with the peer"
+                )
+
+            while not items.empty():
+                dataset, _ = items.get()
+                yield dataset, Dataset()
+        finally:
+            is_stopped.set()
+
     def shutdown(self) -> None:
         """Stop any active association servers and threads."""
         for assoc in self.active_associations:
@@ -1364,7 +1646,8 @@ class ApplicationEntity:
         evt_handlers: list[EventHandlerType] | None = None,
         ae_title: str | None = None,
         contexts: ListCXType | None = None,
-    ) -> ThreadedAssociationServer | None:
+        processes: int = 1,
+    ) -> ThreadedAssociationServer | MultiProcessAssociationServer | None:
         """Start the AE as an association *acceptor*.
 
         If set to non-blocking then a running
@@ -1372,6 +1655,10 @@ class ApplicationEntity:
         instance will be returned. This can be stopped using
         :meth:`~pynetdicom.transport.AssociationServer.shutdown`.
 
+        If `processes` is greater than ``1`` then a
+        :class:`~pynetdicom.transport.MultiProcessAssociationServer` will be used
+        instead, with the associations handled by separate worker processes.
+
         .. versionchanged:: 2.0
 
             `ae_title` should now be :class:`str`
@@ -1419,13 +1706,47 @@ class ApplicationEntity:
             The presentation contexts that will be supported by the SCP. If
             not used then the presentation contexts in the
             :attr:`supported_contexts` property will be used instead (default).
+        processes : int, optional
+            The number of worker processes to run the server in (default ``1``).
+            Values greater than ``1`` require a platform that supports
+            :func:`os.fork` and ``SO_REUSEPORT``. Event handlers are bound in, and
+            run by, each worker process.
+
+            .. versionadded:: 3.1
 
         Returns
         -------
-        transport.ThreadedAssociationServer or None
+        transport.ThreadedAssociationServer, MultiProcessAssociationServer or None
             If `block` is ``False`` then returns the server instance, otherwise
             returns ``None``.
         """
+        if processes > 1:
+            mp_server = cast(
+                MultiProcessAssociationServer,
+                self.make_server(
+                    address,
+                    ae_title=ae_title,
+                    contexts=contexts,
+                    ssl_context=ssl_context,
+                    evt_handlers=evt_handlers,
+                    server_class=MultiProcessAssociationServer,
+                    processes=processes,
+                ),
+            )
+            mp_server.start()
+            self._servers.append(mp_server)
+
+            if not block:
+                return mp_server
+
+            try:
+                # **BLOCKING**
+                mp_server.serve_forever()
+            except KeyboardInterrupt:
+                mp_server.shutdown()
+
+            return None
+
         if block:
             # Blocking server
             server = self.make_server(
@@ -1594,3 +1915,36 @@ class ApplicationEntity:
         invalid = [ii for ii in contexts if not isinstance(ii, PresentationContext)]
         if invalid:
             raise ValueError("'contexts' must be a list of PresentationContext items")
+
+    @staticmethod
+    def _get_store_parameters(dataset: StoreItemType) -> tuple[UID, UID, bool]:
+        """Return the *SOP Class UID* and *Transfer Syntax UID* to use when
+        sending `dataset` and whether it can be sent in chunks.
+        """
+        if isinstance(dataset, Dataset):
+            return dataset.SOPClassUID, dataset.file_meta.TransferSyntaxUID, False
+
+        # Only read the File Meta Information if possible
+        file_meta, _ = split_dataset(Path(dataset))
+        keywords = [
+            "MediaStorageSOPClassUID",
+            "MediaStorageSOPInstanceUID",
+            "TransferSyntaxUID",
+        ]
+        if all(kw in file_meta for kw in keywords):
+            return (
+                file_meta.MediaStorageSOPClassUID,
+                file_meta.TransferSyntaxUID,
+                True,
+            )
+
+        ds = read_header(dataset, ["SOPClassUID"])
+        return ds.SOPClassUID, ds.file_meta.TransferSyntaxUID, False
+
+
+def _item_name(dataset: StoreItemType) -> str:
+    """Return a description of `dataset` suitable for logging."""
+    if isinstance(dataset, Dataset):
+        return f"with SOP Instance UID '{dataset.get('SOPInstanceUID', '')}'"
+
+    return f"at {os.fspath(dataset)}"
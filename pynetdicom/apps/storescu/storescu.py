@@ -5,6 +5,8 @@ Used for transferring DICOM SOP Instances to a Storage SCP.
 """
 
 import argparse
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import os
 from pathlib import Path
 import sys
@@ -20,6 +22,7 @@ from pydicom.uid import (
 
 from pynetdicom import AE, StoragePresentationContexts
 from pynetdicom.apps.common import setup_logging, get_files
+from pynetdicom.dsutils import HeaderCache, read_header
 from pynetdicom._globals import DEFAULT_MAX_LENGTH
 
 
@@ -101,6 +104,27 @@ def _setup_argparser(args=None):
         help="recursively search the given directory",
         action="store_true",
     )
+    in_opts.add_argument(
+        "-pf",
+        "--prefetch",
+        metavar="[n]umber of files",
+        help=(
+            "read up to n files ahead of the one being sent (0 to disable, "
+            "default: 4)"
+        ),
+        type=int,
+        default=4,
+    )
+    in_opts.add_argument(
+        "-hc",
+        "--header-cache",
+        metavar="[f]ile",
+        help=(
+            "cache the file headers read when using --required-contexts in f, "
+            "so unchanged files aren't read again"
+        ),
+        type=str,
+    )
 
     # Network Options
     net_opts = parser.add_argument_group("Network Options")
@@ -193,13 +217,17 @@ def _setup_argparser(args=None):
     return parser.parse_args(args)
 
 
-def get_contexts(fpaths, app_logger):
+def get_contexts(fpaths, app_logger, cache=None):
     """Return the valid DICOM files and their context values.
 
     Parameters
     ----------
     fpaths : list of str
         A list of paths to the files to try and get data from.
+    app_logger : logging.Logger
+        The application's logger.
+    cache : pynetdicom.dsutils.HeaderCache, optional
+        The cache to use for the file headers.
 
     Returns
     -------
@@ -212,16 +240,18 @@ def get_contexts(fpaths, app_logger):
     contexts = {}
     for fpath in fpaths:
         path = os.fspath(Path(fpath).resolve())
+        # Only read the start of the dataset
         try:
-            ds = dcmread(path)
+            ds = read_header(path, ["SOPClassUID"], cache)
         except Exception:
             bad.append(("Bad DICOM file", path))
             continue
 
-        try:
-            sop_class = ds.SOPClassUID
-            tsyntax = ds.file_meta.TransferSyntaxUID
-        except Exception:
+        file_meta = ds.file_meta
+        sop_class = file_meta.get("MediaStorageSOPClassUID", None)
+        sop_class = sop_class or ds.get("SOPClassUID", None)
+        tsyntax = file_meta.get("TransferSyntaxUID", None)
+        if not sop_class or not tsyntax:
             bad.append(("Unknown SOP Class or Transfer Syntax UID", path))
             continue
 
@@ -237,6 +267,34 @@ def get_contexts(fpaths, app_logger):
     return good, contexts
 
 
+def read_files(fpaths, prefetch):
+    """Yield the files as they're needed, reading ahead in the background.
+
+    Parameters
+    ----------
+    fpaths : list of str
+        A list of paths to the files to be read.
+    prefetch : int
+        The maximum number of files to read ahead of the one being yielded,
+        if ``0`` then each file is only read when it's needed.
+
+    Yields
+    ------
+    str, concurrent.futures.Future
+        The path to the file and a future for the decoded dataset.
+    """
+    # Read the upcoming files while the current one is being sent
+    with ThreadPoolExecutor(max_workers=max(prefetch, 1)) as pool:
+        pending = deque()
+        for fpath in fpaths:
+            pending.append((fpath, pool.submit(dcmread, fpath)))
+            if len(pending) > prefetch:
+                yield pending.popleft()
+
+        while pending:
+            yield pending.popleft()
+
+
 def main(args=None):
     """Run the application."""
     args = _setup_argparser(args)
@@ -261,7 +319,11 @@ def main(args=None):
 
     if args.required_contexts:
         # Only propose required presentation contexts
-        lfiles, contexts = get_contexts(lfiles, APP_LOGGER)
+        if args.header_cache:
+            with HeaderCache(args.header_cache) as cache:
+                lfiles, contexts = get_contexts(lfiles, APP_LOGGER, cache)
+        else:
+            lfiles, contexts = get_contexts(lfiles, APP_LOGGER)
         try:
             for abstract, transfer in contexts.items():
                 for tsyntax in transfer:
@@ -301,10 +363,10 @@ def main(args=None):
     )
     if assoc.is_established:
         ii = 1
-        for fpath in lfiles:
+        for fpath, future in read_files(lfiles, args.prefetch):
             APP_LOGGER.info(f"Sending file: {fpath}")
             try:
-                ds = dcmread(fpath)
+                ds = future.result()
                 assoc.send_c_store(ds, ii)
                 ii += 1
             except InvalidDicomError:
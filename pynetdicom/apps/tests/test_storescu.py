@@ -2,6 +2,7 @@
 
 import logging
 import os
+from pathlib import Path
 import subprocess
 import sys
 import time
@@ -9,6 +10,7 @@ import time
 import pytest
 
 from pydicom import dcmread
+from pydicom.errors import InvalidDicomError
 from pydicom.uid import (
     ExplicitVRLittleEndian,
     ImplicitVRLittleEndian,
@@ -24,6 +26,9 @@ from pynetdicom import (
     AllStoragePresentationContexts,
     ALL_TRANSFER_SYNTAXES,
 )
+from pynetdicom import dsutils
+from pynetdicom.apps.storescu import storescu
+from pynetdicom.dsutils import HeaderCache
 from pynetdicom.sop_class import Verification, CTImageStorage, MRImageStorage
 
 
@@ -573,6 +578,113 @@ class StoreSCUBase:
 
         assert len(events) == 6
 
+    @pytest.mark.parametrize("prefetch", ["0", "2"])
+    def test_flag_prefetch(self, prefetch):
+        """Test the --prefetch flag."""
+        events = []
+
+        def handle_store(event):
+            events.append(event.request.AffectedSOPInstanceUID)
+            return 0x0000
+
+        handlers = [(evt.EVT_C_STORE, handle_store)]
+
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        for cx in AllStoragePresentationContexts:
+            ae.add_supported_context(cx.abstract_syntax, ALL_TRANSFER_SYNTAXES)
+        scp = ae.start_server(("localhost", 11112), block=False, evt_handlers=handlers)
+
+        p = self.func([DATA_DIR, "--prefetch", prefetch, "-cx"])
+        p.wait()
+        assert p.returncode == 0
+
+        scp.shutdown()
+
+        # Files are still sent in order
+        fpaths = sorted(os.path.join(DATA_DIR, f) for f in os.listdir(DATA_DIR))
+        fpaths = [f for f in fpaths if os.path.isfile(f)]
+        assert events == [dcmread(f).SOPInstanceUID for f in fpaths]
+
+    def test_flag_header_cache(self, tmp_path):
+        """Test the --header-cache flag."""
+        events = []
+
+        def handle_store(event):
+            events.append(event)
+            return 0x0000
+
+        handlers = [(evt.EVT_C_STORE, handle_store)]
+
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        ae.add_supported_context(CTImageStorage)
+        scp = ae.start_server(("localhost", 11112), block=False, evt_handlers=handlers)
+
+        cache = os.fspath(tmp_path / "cache.db")
+        for _ in range(2):
+            p = self.func([DATASET_FILE, "-cx", "--header-cache", cache])
+            p.wait()
+            assert p.returncode == 0
+
+        scp.shutdown()
+
+        assert len(events) == 2
+        assert os.path.exists(cache)
+
+
+class TestGetContexts:
+    """Tests for get_contexts()"""
+
+    def test_header_only(self):
+        """Test getting the contexts from the file headers."""
+        fpaths = [
+            DATASET_FILE,
+            BE_DATASET_FILE,
+            # Missing the Media Storage SOP Class UID
+            os.path.join(DATA_DIR, "CTImageStorage_bad_meta.dcm"),
+            __file__,
+        ]
+        logger = logging.getLogger("test_storescu")
+        good, contexts = storescu.get_contexts(fpaths, logger)
+        assert good == [os.fspath(Path(f).resolve()) for f in fpaths[:3]]
+        assert contexts == {
+            CTImageStorage: [ExplicitVRLittleEndian],
+            MRImageStorage: [ExplicitVRBigEndian],
+        }
+
+    def test_header_cache(self, tmp_path, monkeypatch):
+        """Test getting the contexts using a header cache."""
+        fpaths = [DATASET_FILE, BE_DATASET_FILE]
+        logger = logging.getLogger("test_storescu")
+        with HeaderCache(tmp_path / "cache.db") as cache:
+            result = storescu.get_contexts(fpaths, logger, cache)
+
+        def read_partial(*args, **kwargs):
+            raise RuntimeError("File read")
+
+        monkeypatch.setattr(dsutils, "read_partial", read_partial)
+        with HeaderCache(tmp_path / "cache.db") as cache:
+            assert storescu.get_contexts(fpaths, logger, cache) == result
+
+    def test_read_files(self):
+        """Test read_files() reads ahead."""
+        fpaths = [DATASET_FILE, BE_DATASET_FILE, __file__]
+        files = storescu.read_files(fpaths, 2)
+        fpath, future = next(files)
+        assert fpath == DATASET_FILE
+        assert future.result().PatientName == "CompressedSamples^CT1"
+        # The remaining files have been submitted for reading
+        results = list(files)
+        assert [fpath for fpath, _ in results] == fpaths[1:]
+        assert results[0][1].result().SOPClassUID == MRImageStorage
+        with pytest.raises(InvalidDicomError):
+            results[1][1].result()
+
 
 class TestStoreSCU(StoreSCUBase):
     """Tests for storescu.py"""
@@ -1,6 +1,8 @@
 """Defines the Association class which handles associating with peers."""
 
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from io import BytesIO
+import itertools
 import logging
 import os
 from pathlib import Path
@@ -18,7 +20,13 @@ import warnings
 from pydicom import dcmread
 from pydicom.dataset import Dataset
 from pydicom.tag import BaseTag
-from pydicom.uid import UID, ImplicitVRLittleEndian, ExplicitVRBigEndian
+from pydicom.uid import (
+    UID,
+    ImplicitVRLittleEndian,
+    ExplicitVRLittleEndian,
+    ExplicitVRBigEndian,
+    DeflatedExplicitVRLittleEndian,
+)
 
 # pylint: disable=no-name-in-module
 from pynetdicom.acse import ACSE
@@ -40,7 +48,7 @@ from pynetdicom.dimse_primitives import (
     DimseServiceType,
 )
 from pynetdicom.dsutils import decode, encode, pretty_dataset, split_dataset
-from pynetdicom.dul import DULServiceProvider
+from pynetdicom.dul import DULServiceProvider, AsyncioDULServiceProvider
 from pynetdicom._globals import (
     MODE_REQUESTOR,
     MODE_ACCEPTOR,
@@ -92,6 +100,14 @@ if TYPE_CHECKING:  # pragma: no cover
 
 # pylint: enable=no-name-in-module
 LOGGER = logging.getLogger(__name__)
+
+# Datasets with any of these elements aren't deflated by preference
+_PIXEL_KEYWORDS = ("PixelData", "FloatPixelData", "DoubleFloatPixelData")
+
+# The accepted contexts for each role, keyed by transfer syntax, with ``None``
+#   for any role
+_RoleIndexType = dict[str | None, dict[UID, PresentationContext]]
+
 HandlerType = dict[
     evt.EventType,
     (list[tuple[Callable, None | list[Any]]] | tuple[Callable, None | list[Any]]),
@@ -164,12 +180,16 @@ class Association(threading.Thread):
         self._sent_release: bool = False
 
         # Accepted and rejected presentation contexts
-        self._accepted_cx: dict[int, PresentationContext] = {}
+        self._accepted_cx = {}
         self._rejected_cx: list[PresentationContext] = []
 
         # Service providers
         self.acse: ACSE = ACSE(self)
-        self.dul: DULServiceProvider = DULServiceProvider(self)
+        self.dul: DULServiceProvider
+        if _config.USE_ASYNCIO_DUL:
+            self.dul = AsyncioDULServiceProvider(self)
+        else:
+            self.dul = DULServiceProvider(self)
         self.dimse: DIMSEServiceProvider = DIMSEServiceProvider(self)
 
         # Timeouts (in seconds), needs to be set after DUL init
@@ -196,6 +216,19 @@ class Association(threading.Thread):
         self._reactor_checkpoint.set()
         # Used to ensure the reactor is paused before DIMSE messaging
         self._is_paused: bool = False
+        # The Message IDs used by the submit_*() methods
+        self._message_ids = itertools.count(1)
+        # The futures for the requests sent using the submit_*() methods that
+        #   are waiting for a response, keyed by the request's *Message ID*
+        self._outstanding: dict[int, Future[Dataset]] = {}
+        self._outstanding_cond = threading.Condition()
+        # Used to perform the requests received from the peer concurrently
+        #   when the Asynchronous Operations Window allows it
+        self._performer: ThreadPoolExecutor | None = None
+        self._performer_futures: set[Future[None]] = set()
+        self._max_performing: int = 1
+        # The *Message ID* values of the requests being performed
+        self._performing: set[int] = set()
 
         # Windows timer resolution
         self._timer_resolution: float | None = _config.WINDOWS_TIMER_RESOLUTION
@@ -263,6 +296,23 @@ class Association(threading.Thread):
         """Non-blocking implementation of Association.abort()"""
         return self._abort_blocking(block)
 
+    @property
+    def _accepted_cx(self) -> dict[int, PresentationContext]:
+        """Return the accepted presentation contexts as {context ID: context}."""
+        return self._accepted_by_id
+
+    @_accepted_cx.setter
+    def _accepted_cx(self, contexts: dict[int, PresentationContext]) -> None:
+        """Set the accepted presentation contexts."""
+        self._accepted_by_id = contexts
+        # Index of the accepted contexts by abstract syntax, built when first
+        #   used, and the (exact, convertible) contexts for previous lookups
+        self._context_index: dict[UID, _RoleIndexType] | None = None
+        self._context_matches: dict[
+            tuple[str, str, str | None, int | None],
+            tuple[PresentationContext | None, PresentationContext | None],
+        ] = {}
+
     @property
     def accepted_contexts(self) -> list[PresentationContext]:
         """Return a :class:`list` of accepted
@@ -434,68 +484,14 @@ class Association(threading.Thread):
         presentation.PresentationContext
             An accepted presentation context.
         """
+        cx = self._find_context(
+            ab_syntax, tr_syntax, role, context_id, allow_conversion
+        )
+        if cx is not None:
+            return cx
+
         ab_syntax = UID(ab_syntax)
         tr_syntax = UID(tr_syntax)
-
-        try:
-            possible_contexts = [self._accepted_cx[context_id]]  # type: ignore
-        except KeyError:
-            possible_contexts = self.accepted_contexts
-
-        # Filter by abstract syntax
-        possible_contexts = [
-            cx for cx in possible_contexts if ab_syntax == cx.abstract_syntax
-        ]
-
-        # For UPS we can also match UPS Push to Pull/Watch/Event/Query
-        if ab_syntax == UnifiedProcedureStepPush and not possible_contexts:
-            LOGGER.info(
-                "No exact matching context found for 'Unified Procedure Step "
-                "- Push SOP Class', checking accepted contexts for other UPS "
-                "SOP classes"
-            )
-            ups = [
-                UnifiedProcedureStepPull,
-                UnifiedProcedureStepWatch,
-                UnifiedProcedureStepEvent,
-                UnifiedProcedureStepQuery,
-            ]
-            possible_contexts.extend(
-                [cx for cx in self._accepted_cx.values() if cx.abstract_syntax in ups]
-            )
-
-        # Filter by role
-        if role == "scu":
-            possible_contexts = [cx for cx in possible_contexts if cx.as_scu is True]
-        if role == "scp":
-            possible_contexts = [cx for cx in possible_contexts if cx.as_scp is True]
-
-        matches = []
-        for cx in possible_contexts:
-            cx_syntax = cx.transfer_syntax[0]
-            if tr_syntax:
-                if tr_syntax == cx_syntax:
-                    # Exact match to transfer syntax
-                    return cx
-
-                # Compressed transfer syntaxes are not convertible
-                #   This excludes deflated transfer syntaxes
-                if tr_syntax.is_compressed or cx_syntax.is_compressed:
-                    continue
-
-                # Filter out contexts where the endianness doesn't match
-                if tr_syntax.is_little_endian != cx_syntax.is_little_endian:
-                    continue
-
-            # Match to convertible transfer syntaxes
-            #   Allowable matches:
-            #       explicit VR <-> implicit VR
-            #       deflated <-> inflated
-            matches.append(cx)
-
-        if allow_conversion and matches:
-            return matches[0]
-
         role = role or "scu"
         msg = (
             f"No presentation context for '{ab_syntax.name}' has been "
@@ -508,6 +504,126 @@ class Association(threading.Thread):
         LOGGER.error(msg)
         raise ValueError(msg)
 
+    def _get_deflate_context(self, ab_syntax: UID) -> PresentationContext | None:
+        """Return an accepted presentation context for `ab_syntax` with
+        *Deflated Explicit VR Little Endian* transfer syntax for the SCU role,
+        or ``None`` if there's no such context.
+
+        .. versionadded:: 3.1
+        """
+        roles = self._get_context_index().get(ab_syntax)
+        if roles is None:
+            return None
+
+        return roles["scu"].get(DeflatedExplicitVRLittleEndian)
+
+    def _find_context(
+        self,
+        ab_syntax: str | UID,
+        tr_syntax: str | UID,
+        role: str | None,
+        context_id: int | None,
+        allow_conversion: bool,
+    ) -> PresentationContext | None:
+        """Return the accepted presentation context matching the parameters or
+        ``None`` if there's no match, see :meth:`_get_valid_context`.
+
+        .. versionadded:: 3.1
+        """
+        key = (ab_syntax, tr_syntax, role, context_id)
+        try:
+            exact, convertible = self._context_matches[key]
+        except KeyError:
+            ab_syntax = UID(ab_syntax)
+            tr_syntax = UID(tr_syntax)
+            roles = None
+            if context_id in self._accepted_cx:
+                cx = self._accepted_cx[context_id]
+                if cx.abstract_syntax == ab_syntax:
+                    roles = self._index_roles([cx])
+            else:
+                roles = self._get_context_index().get(ab_syntax)
+
+            if roles is None and ab_syntax == UnifiedProcedureStepPush:
+                # For UPS we can also match UPS Push to Pull/Watch/Event/Query
+                LOGGER.info(
+                    "No exact matching context found for 'Unified Procedure Step "
+                    "- Push SOP Class', checking accepted contexts for other UPS "
+                    "SOP classes"
+                )
+                ups = [
+                    UnifiedProcedureStepPull,
+                    UnifiedProcedureStepWatch,
+                    UnifiedProcedureStepEvent,
+                    UnifiedProcedureStepQuery,
+                ]
+                roles = self._index_roles(
+                    [
+                        cx
+                        for cx in self._accepted_cx.values()
+                        if cx.abstract_syntax in ups
+                    ]
+                )
+
+            contexts = roles.get(role, roles[None]) if roles else {}
+            exact = contexts.get(tr_syntax) if tr_syntax else None
+            convertible = None
+            for cx_syntax, cx in contexts.items():
+                # Match to convertible transfer syntaxes
+                #   Allowable matches:
+                #       explicit VR <-> implicit VR
+                #       deflated <-> inflated
+                #   Compressed transfer syntaxes are not convertible, which
+                #   excludes deflated transfer syntaxes
+                if not tr_syntax or (
+                    not tr_syntax.is_compressed
+                    and not cx_syntax.is_compressed
+                    and tr_syntax.is_little_endian == cx_syntax.is_little_endian
+                ):
+                    convertible = cx
+                    break
+
+            self._context_matches[key] = (exact, convertible)
+
+        if exact is not None:
+            return exact
+
+        return convertible if allow_conversion else None
+
+    def _get_context_index(self) -> dict[UID, _RoleIndexType]:
+        """Return the index of the accepted presentation contexts.
+
+        .. versionadded:: 3.1
+        """
+        if self._context_index is None:
+            contexts: dict[UID, list[PresentationContext]] = {}
+            for cx in self.accepted_contexts:
+                contexts.setdefault(cast(UID, cx.abstract_syntax), []).append(cx)
+
+            self._context_index = {
+                ab_syntax: self._index_roles(items)
+                for ab_syntax, items in contexts.items()
+            }
+
+        return self._context_index
+
+    @staticmethod
+    def _index_roles(contexts: list[PresentationContext]) -> _RoleIndexType:
+        """Return `contexts` indexed by role and transfer syntax, with the
+        lowest context ID used for each transfer syntax.
+        """
+        roles: _RoleIndexType = {None: {}, "scu": {}, "scp": {}}
+        for cx in contexts:
+            tr_syntax = cx.transfer_syntax[0]
+            roles[None].setdefault(tr_syntax, cx)
+            if cx.as_scu is True:
+                roles["scu"].setdefault(tr_syntax, cx)
+
+            if cx.as_scp is True:
+                roles["scp"].setdefault(tr_syntax, cx)
+
+        return roles
+
     def _handle_no_response(self) -> None:
         """Common reaction when DIMSE timeout hit or no response message."""
         # Avoids writing the same unit test for each send_ method
@@ -538,9 +654,21 @@ class Association(threading.Thread):
         self._kill = True
         self.is_established = False
         self._is_paused = True
+        # No more responses will be received
+        self._abandon_requests()
+        if self._performer is not None:
+            # No more responses can be sent
+            self._performer.shutdown(wait=False, cancel_futures=True)
+
         while self.dul.is_alive() and not self.dul.stop_dul():
             time.sleep(0.01)
 
+        # Delete any dataset that was only partly written to file
+        message = getattr(self.dimse, "message", None)
+        if message is not None and message._data_set_file is not None:
+            message._data_set_file.close()
+            message._data_set_file = None
+
     @property
     def local(self) -> dict[str, Any]:
         """Return a :class:`dict` with information about the local AE."""
@@ -603,8 +731,22 @@ class Association(threading.Thread):
         return self._rejected_cx
 
     def release(self) -> None:
-        """Initiate association release by sending an A-RELEASE request."""
+        """Initiate association release by sending an A-RELEASE request.
+
+        .. versionchanged:: 3.1
+
+            Waits for the responses to any requests sent using the
+            ``submit_*()`` methods before releasing
+        """
         if self.is_established:
+            # Wait for the responses to any outstanding requests
+            with self._outstanding_cond:
+                is_done = self._wait_for_responses(0)
+
+            if not is_done:
+                self._handle_no_response()
+                return
+
             # Ensure the reactor is paused so it doesn't
             #   steal incoming ACSE messages
             self._reactor_checkpoint.clear()
@@ -709,6 +851,16 @@ class Association(threading.Thread):
         5. Checks DUL idle timeout
             If timed out then kill thread
         """
+        window = self._perform_window
+        if window != 1:
+            # The peer may have more than one request outstanding so perform
+            #   them concurrently, up to the agreed window
+            self._max_performing = window or min(32, (os.cpu_count() or 1) + 4)
+            self._performer = ThreadPoolExecutor(
+                max_workers=self._max_performing,
+                thread_name_prefix=f"{self.name}-perform",
+            )
+
         self._is_paused = False
         while not self._kill:
             time.sleep(0.001)
@@ -726,12 +878,19 @@ class Association(threading.Thread):
 
             # Check with the DIMSE provider to see if a completely decoded
             #   message is available
-            context_id, msg = self.dimse.get_msg(block=False)
-            if msg:
-                self._serve_request(msg, cast(int, context_id))
+            if self._performer is None:
+                context_id, msg = self.dimse.get_msg(block=False)
+                if msg:
+                    self._serve_request(msg, cast(int, context_id))
+            else:
+                self._dispatch_requests()
 
             # Check for release request from the peer
             if self.is_established and self.acse.is_release_requested():
+                # Finish performing any requests first
+                self._is_paused = True
+                wait(self._performer_futures)
+                self._is_paused = False
                 # Send A-RELEASE response
                 self.acse.send_release(is_response=True)
                 LOGGER.info("Association Released")
@@ -839,11 +998,12 @@ class Association(threading.Thread):
         #   (U) Affected SOP Class UID
         #   (U) Affected SOP Instance UID
         #   (M) Status
-        rsp = C_STORE()
-        rsp.MessageID = req.MessageID
-        rsp.MessageIDBeingRespondedTo = req.MessageID
-        rsp.AffectedSOPInstanceUID = req.AffectedSOPInstanceUID
-        rsp.AffectedSOPClassUID = req.AffectedSOPClassUID
+        rsp = C_STORE._trusted(
+            MessageID=req.MessageID,
+            MessageIDBeingRespondedTo=req.MessageID,
+            AffectedSOPInstanceUID=req.AffectedSOPInstanceUID,
+            AffectedSOPClassUID=req.AffectedSOPClassUID,
+        )
 
         try:
             context = self._get_valid_context(
@@ -1811,6 +1971,7 @@ class Association(threading.Thread):
         :class:`~pynetdicom.service_class.StorageServiceClass`
         :class:`~pynetdicom.service_class.NonPatientObjectStorageServiceClass`
         :attr:`~pynetdicom._config.STORE_SEND_CHUNKED_DATASET`
+        :attr:`~pynetdicom._config.STORE_SEND_DEFLATE_THRESHOLD`
 
         References
         ----------
@@ -1822,6 +1983,50 @@ class Association(threading.Thread):
           :dcm:`9.3.1<part07/sect_9.3.html#sect_9.3.1>` and
           :dcm:`Annex C<part07/chapter_C.html>`
         """
+        req, context_id = self._c_store_request(
+            dataset, msg_id, priority, originator_aet, originator_id
+        )
+
+        # Pause the reactor to prevent a race condition
+        self._reactor_checkpoint.clear()
+        while not self._is_paused:
+            time.sleep(0.0001)
+
+        # Send C-STORE request to the peer via DIMSE and wait for the response
+        self.dimse.send_msg(req, context_id)
+        cx_id, rsp = self.dimse.get_msg(block=True)
+
+        # Unpause the reactor
+        self._reactor_checkpoint.set()
+
+        # If `rsp` is None then the DIMSE timeout expired so abort
+        if rsp is None:
+            self._handle_no_response()
+            return Dataset()
+
+        # Determine validity of the response and get the status
+        status = self._check_received_status(rsp)
+
+        return status
+
+    def _c_store_request(
+        self,
+        dataset: str | Path | Dataset,
+        msg_id: int,
+        priority: int,
+        originator_aet: str | None,
+        originator_id: int | None,
+        chunked: bool | None = None,
+    ) -> tuple[C_STORE, int]:
+        """Return a C-STORE request primitive for `dataset` and the ID of the
+        presentation context to send it with.
+
+        .. versionadded:: 3.1
+
+        See :meth:`send_c_store` for the parameters and exceptions raised. If
+        `chunked` is ``None`` then whether a dataset file is sent in chunks
+        is set by :attr:`~pynetdicom._config.STORE_SEND_CHUNKED_DATASET`.
+        """
         # Can't send a C-STORE without an Association
         if not self.is_established:
             raise RuntimeError(
@@ -1843,10 +2048,13 @@ class Association(threading.Thread):
         req.MoveOriginatorApplicationEntityTitle = originator_aet
         req.MoveOriginatorMessageID = originator_id
 
+        if chunked is None:
+            chunked = _config.STORE_SEND_CHUNKED_DATASET
+
         allow_conversion = True
         if not isinstance(dataset, Dataset):
             fpath = Path(dataset)
-            if not _config.STORE_SEND_CHUNKED_DATASET:
+            if not chunked:
                 dataset = dcmread(os.fspath(fpath))
             else:
                 dataset = None  # type:ignore[assignment]
@@ -1930,23 +2138,57 @@ class Association(threading.Thread):
                     )
 
         # Get a Presentation Context to use for sending the message
-        context = self._get_valid_context(
-            sop_class, tsyntax, "scu", allow_conversion=allow_conversion
-        )
+        context: PresentationContext | None = None
+        bytestream: bytes | None = None
+        threshold = _config.STORE_SEND_DEFLATE_THRESHOLD
+        if threshold is not None and tsyntax in (
+            ImplicitVRLittleEndian,
+            ExplicitVRLittleEndian,
+        ):
+            context = self._get_deflate_context(sop_class)
+
+        if context and dataset:
+            # Prefer deflating large datasets without pixel data
+            dataset = cast(Dataset, dataset)
+            if not any(kw in dataset for kw in _PIXEL_KEYWORDS):
+                bytestream = encode(dataset, False, True)
+
+            if bytestream is None or len(bytestream) < cast(int, threshold):
+                context = None
+                bytestream = None
+        elif context and req._dataset_path:
+            # Chunked dataset, only an Explicit VR Little Endian file is usable
+            fpath, offset = cast(tuple[Path, int], req._dataset_path)
+            if tsyntax != ExplicitVRLittleEndian or (
+                fpath.stat().st_size - offset < cast(int, threshold)
+            ):
+                context = None
+
+        if context is None:
+            context = self._get_valid_context(
+                sop_class, tsyntax, "scu", allow_conversion=allow_conversion
+            )
+
         transfer_syntax = context.transfer_syntax[0]
 
         req.AffectedSOPClassUID = sop_class
         req.AffectedSOPInstanceUID = sop_instance
 
+        # Deflated datasets are encoded as Explicit VR Little Endian and
+        #   then deflated while being sent
+        req._deflate_dataset = transfer_syntax.is_deflated and (
+            bool(dataset) or tsyntax != transfer_syntax
+        )
+
         # Encode the `dataset` using the agreed transfer syntax
         #   Will return None if failed to encode
         if dataset:
-            bytestream = encode(
-                cast(Dataset, dataset),
-                transfer_syntax.is_implicit_VR,
-                transfer_syntax.is_little_endian,
-                transfer_syntax.is_deflated,
-            )
+            if bytestream is None:
+                bytestream = encode(
+                    cast(Dataset, dataset),
+                    transfer_syntax.is_implicit_VR,
+                    transfer_syntax.is_little_endian,
+                )
 
             if bytestream is not None:
                 req.DataSet = BytesIO(bytestream)
@@ -1954,27 +2196,7 @@ class Association(threading.Thread):
                 LOGGER.error("Failed to encode the supplied dataset")
                 raise ValueError("Failed to encode the supplied dataset")
 
-        # Pause the reactor to prevent a race condition
-        self._reactor_checkpoint.clear()
-        while not self._is_paused:
-            time.sleep(0.0001)
-
-        # Send C-STORE request to the peer via DIMSE and wait for the response
-        self.dimse.send_msg(req, cast(int, context.context_id))
-        cx_id, rsp = self.dimse.get_msg(block=True)
-
-        # Unpause the reactor
-        self._reactor_checkpoint.set()
-
-        # If `rsp` is None then the DIMSE timeout expired so abort
-        if rsp is None:
-            self._handle_no_response()
-            return Dataset()
-
-        # Determine validity of the response and get the status
-        status = self._check_received_status(rsp)
-
-        return status
+        return req, cast(int, context.context_id)
 
     def _wrap_find_responses(
         self,
@@ -3487,6 +3709,297 @@ class Association(threading.Thread):
 
         return status, attribute_list
 
+    def _abandon_requests(self) -> None:
+        """Set the status of all outstanding requests sent using the
+        ``submit_*()`` methods to an empty :class:`~pydicom.dataset.Dataset`.
+        """
+        with self._outstanding_cond:
+            futures = list(self._outstanding.values())
+            self._outstanding.clear()
+            self._outstanding_cond.notify_all()
+
+        for future in futures:
+            future.set_result(Dataset())
+
+    def _discard_cancels(self) -> None:
+        """Discard any received C-CANCEL requests that don't match a request
+        being performed.
+        """
+        cancel_req = self.dimse.cancel_req
+        for msg_id in list(cancel_req):
+            if msg_id not in self._performing:
+                cancel_req.pop(msg_id, None)
+
+    def _dispatch_requests(self) -> None:
+        """Pass the received DIMSE messages to the worker pool to be
+        performed, up to the number that may be performed at once.
+        """
+        performer = cast(ThreadPoolExecutor, self._performer)
+        futures = self._performer_futures
+        futures.difference_update([f for f in futures if f.done()])
+        while len(futures) < self._max_performing:
+            context_id, msg = self.dimse.get_msg(block=False)
+            if not msg:
+                return
+
+            futures.add(
+                performer.submit(self._serve_request, msg, cast(int, context_id))
+            )
+
+    @property
+    def _invoke_window(self) -> int:
+        """Return the maximum number of outstanding requests the local AE may
+        invoke, ``0`` for no maximum.
+
+        If no Asynchronous Operations Window Negotiation response was received
+        from the acceptor then only one request may be outstanding.
+        """
+        invoked, performed = self.acceptor.asynchronous_operations
+        return invoked if self.is_requestor else performed
+
+    @property
+    def _perform_window(self) -> int:
+        """Return the maximum number of requests from the peer the local AE
+        may perform at once, ``0`` for no maximum.
+
+        If no Asynchronous Operations Window Negotiation response was sent by
+        the acceptor then only one request may be performed at a time.
+        """
+        invoked, performed = self.acceptor.asynchronous_operations
+        return invoked if self.is_acceptor else performed
+
+    def _next_message_id(self) -> int:
+        """Return a *Message ID* that isn't used by an outstanding request."""
+        while True:
+            msg_id = next(self._message_ids) % 65536
+            if msg_id not in self._outstanding:
+                return msg_id
+
+    def _receive_response(self, rsp: DimseServiceType) -> None:
+        """Set the status of the outstanding request that `rsp` is a response
+        to.
+
+        Called by the DUL thread so mustn't block.
+        """
+        msg_id = cast(int, rsp.MessageIDBeingRespondedTo)
+        with self._outstanding_cond:
+            future = self._outstanding.pop(msg_id, None)
+            self._outstanding_cond.notify_all()
+
+        if future is None:
+            # Already abandoned
+            return
+
+        if rsp.is_valid_response:
+            future.set_result(self._check_received_status(rsp))
+            return
+
+        msg_type = rsp.__class__.__name__.replace("_", "-")
+        LOGGER.error(f"Received an invalid {msg_type} response from the peer")
+        self._abort_nonblocking()
+        future.set_result(Dataset())
+
+    def _submit(self, primitive: DimseServiceType, context_id: int) -> Future[Dataset]:
+        """Send the request `primitive` without waiting for the response.
+
+        Parameters
+        ----------
+        primitive : dimse_primitives DIMSE Primitive class
+            The request primitive to send, the peer must send a single
+            response.
+        context_id : int
+            The ID of the presentation context to send the request with.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            A future for the status of the response.
+        """
+        msg_id = cast(int, primitive.MessageID)
+        future: Future[Dataset] = Future()
+        # A running future can't be cancelled
+        future.set_running_or_notify_cancel()
+
+        window = self._invoke_window
+        with self._outstanding_cond:
+            if msg_id in self._outstanding:
+                raise ValueError(
+                    f"A request with Message ID {msg_id} is already waiting "
+                    "for a response"
+                )
+
+            is_open = not window or self._wait_for_responses(window - 1)
+            if is_open:
+                self._outstanding[msg_id] = future
+
+        if not is_open:
+            # The window is full and the DIMSE timeout expired so abort
+            self._handle_no_response()
+            future.set_result(Dataset())
+            return future
+
+        self.dimse.send_msg(primitive, context_id)
+        if not self.is_established:
+            # The association ended while the request was being sent
+            self._abandon_requests()
+
+        return future
+
+    def _wait_for_responses(self, nr_outstanding: int) -> bool:
+        """Wait until no more than `nr_outstanding` requests sent using the
+        ``submit_*()`` methods are waiting for a response.
+
+        Must be called while holding ``_outstanding_cond``. Returns ``False``
+        if no response is received within the DIMSE timeout, ``True``
+        otherwise.
+        """
+        outstanding = self._outstanding
+        while len(outstanding) > nr_outstanding:
+            current = len(outstanding)
+            if not self._outstanding_cond.wait_for(
+                lambda: len(outstanding) < current, timeout=self.dimse_timeout
+            ):
+                return False
+
+        return True
+
+    def submit_c_echo(self, msg_id: int | None = None) -> Future[Dataset]:
+        """Send a C-ECHO request to the peer AE without waiting for the
+        response.
+
+        .. versionadded:: 3.1
+
+        Parameters
+        ----------
+        msg_id : int, optional
+            The C-ECHO request's *Message ID*, must be between 0 and 65535,
+            inclusive, and not be in use by another outstanding request. If
+            not used then an unused *Message ID* will be chosen.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            A future that will be set to the status of the C-ECHO response,
+            as returned by :meth:`send_c_echo`.
+
+        Raises
+        ------
+        RuntimeError
+            If called without an association to a peer SCP.
+        ValueError
+            If the association has no accepted presentation context for
+            *Verification SOP Class* or if `msg_id` is already in use by an
+            outstanding request.
+
+        See Also
+        --------
+        :meth:`~pynetdicom.association.Association.send_c_echo`
+        :meth:`~pynetdicom.association.Association.submit_c_store`
+        """
+        # Can't send a C-ECHO without an Association
+        if not self.is_established:
+            raise RuntimeError(
+                "The association with a peer SCP must be established before "
+                "sending a C-ECHO request"
+            )
+
+        context = self._get_valid_context(Verification, "", "scu")
+
+        primitive = C_ECHO()
+        primitive.MessageID = self._next_message_id() if msg_id is None else msg_id
+        primitive.AffectedSOPClassUID = Verification
+
+        LOGGER.info(f"Sending Echo Request: MsgID {primitive.MessageID}")
+
+        return self._submit(primitive, cast(int, context.context_id))
+
+    def submit_c_store(
+        self,
+        dataset: str | Path | Dataset,
+        msg_id: int | None = None,
+        priority: int = 2,
+        originator_aet: str | None = None,
+        originator_id: int | None = None,
+    ) -> Future[Dataset]:
+        """Send a C-STORE request to the peer AE without waiting for the
+        response.
+
+        .. versionadded:: 3.1
+
+        Requests are pipelined, with up to the *Maximum Number Operations
+        Invoked* agreed with the peer using :dcm:`Asynchronous Operations
+        Window Negotiation<part07/sect_D.3.3.3.html>` waiting for a response
+        at once. If that many requests are already outstanding then blocks
+        until a response is received, or until the DIMSE timeout expires, in
+        which case the association will be aborted. Responses are matched to
+        their request using the *Message ID*, so on high-latency connections
+        sending several datasets no longer requires a round trip per dataset.
+
+        If the peer didn't agree to an asynchronous operations window then
+        only one request may be outstanding at a time.
+
+        Parameters
+        ----------
+        dataset : pydicom.dataset.Dataset, str or pathlib.Path
+            The DICOM dataset to send to the peer or the file path to the
+            dataset to be sent.
+        msg_id : int, optional
+            The C-STORE request's *Message ID*, must be between 0 and 65535,
+            inclusive, and not be in use by another outstanding request. If
+            not used then an unused *Message ID* will be chosen.
+        priority : int, optional
+            The value of the C-STORE request's *Priority* parameter, one of
+            ``0`` (medium), ``1`` (high) or ``2`` (low, default).
+        originator_aet : str, optional
+            The value of the *Move Originator Application Entity Title*
+            parameter for the C-STORE request.
+        originator_id : int, optional
+            The value of the *Move Originator Message ID* parameter for the
+            C-STORE request.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            A future that will be set to the status of the C-STORE response,
+            as returned by :meth:`send_c_store`. If the association is
+            released or aborted before the response is received then the
+            status will be an empty :class:`~pydicom.dataset.Dataset`.
+
+        Raises
+        ------
+        RuntimeError
+            If called with no established association.
+        AttributeError
+            If `dataset` is missing (0008,0016) *SOP Class UID*,
+            (0008,0018) *SOP Instance UID* elements or the (0002,0010)
+            *Transfer Syntax UID* file meta information element.
+        ValueError
+            If no accepted Presentation Context for `dataset` exists, if
+            unable to encode the `dataset` or if `msg_id` is already in use by
+            an outstanding request.
+
+        See Also
+        --------
+        :meth:`~pynetdicom.association.Association.send_c_store`
+        :meth:`~pynetdicom.association.Association.submit_c_echo`
+
+        Examples
+        --------
+
+        Send several datasets and then wait for their responses
+
+        >>> futures = [assoc.submit_c_store(ds) for ds in datasets]
+        >>> statuses = [future.result() for future in futures]
+        """
+        if msg_id is None:
+            msg_id = self._next_message_id()
+
+        req, context_id = self._c_store_request(
+            dataset, msg_id, priority, originator_aet, originator_id
+        )
+
+        return self._submit(req, context_id)
+
     def _serve_request(self, msg: DimseServiceType, context_id: int) -> None:
         """Handle a DIMSE service request.
 
@@ -3545,15 +4058,23 @@ class Association(threading.Thread):
             return
 
         # Run corresponding Service Class in SCP mode
+        msg_id = cast(int, msg.MessageID)
+        # Requests may be performed concurrently by the worker pool, in which
+        #   case the reactor keeps running
+        is_inline = self._performer is None
         try:
             # Clear out any C-CANCEL requests received beforehand
-            self.dimse.cancel_req = {}
+            self._discard_cancels()
+            self._performing.add(msg_id)
             # In case the SCP calls one of the send_* methods
-            self._is_paused = True
+            if is_inline:
+                self._is_paused = True
             service_class.SCP(msg, context)
-            self._is_paused = False
+            if is_inline:
+                self._is_paused = False
             # Clear out any unacted upon requests received during
-            self.dimse.cancel_req = {}
+            self._performing.discard(msg_id)
+            self._discard_cancels()
         except NotImplementedError:
             # SCP isn't implemented
             LOGGER.error(
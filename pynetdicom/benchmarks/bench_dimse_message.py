@@ -2,14 +2,29 @@
 
 from io import BytesIO
 import os
+from pathlib import Path
+import tempfile
 import threading
 import time
+import tracemalloc
+import zlib
 
 from pydicom import dcmread
+from pydicom.dataset import Dataset
 
-from pynetdicom.dimse_messages import DIMSEMessage, C_STORE_RQ
-from pynetdicom.dimse_primitives import C_STORE
+from pynetdicom.dimse_messages import (
+    DIMSEMessage,
+    C_FIND_RSP,
+    C_STORE_RQ,
+    C_STORE_RSP,
+    _status_response,
+)
+from pynetdicom import evt
+from pynetdicom.dimse_primitives import C_FIND, C_STORE
 from pynetdicom.dsutils import encode
+from pynetdicom.pdu import P_DATA_TF
+from pynetdicom.pdu_primitives import P_DATA
+from pynetdicom.presentation import build_context
 
 
 TEST_DS_DIR = os.path.join(os.path.dirname(__file__), "../tests", "dicom_files")
@@ -57,3 +72,274 @@ class TestEncodeMessage:
         for ii in range(100):
             for fragment in self.msg.encode_msg(1, 16382):
                 pass
+
+    def time_encode_packed(self):
+        """Benchmark for encode with several PDVs per P-DATA."""
+        for ii in range(100):
+            for fragment in self.msg.encode_msg(1, 16382, pack=True):
+                pass
+
+
+class TimeEncodeFindResponse:
+    def setup(self):
+        primitive = C_FIND()
+        primitive.MessageIDBeingRespondedTo = 7
+        primitive.AffectedSOPClassUID = "1.2.840.10008.5.1.4.1.2.1.1"
+        primitive.Status = 0xFF00
+        ds = Dataset()
+        ds.QueryRetrieveLevel = "PATIENT"
+        ds.PatientID = "1234567"
+        ds.PatientName = "Citizen^Jan"
+        primitive.Identifier = BytesIO(encode(ds, True, True))
+        self.msg = C_FIND_RSP()
+        self.msg.primitive_to_message(primitive)
+
+    def time_encode(self):
+        """Time encoding pending C-FIND responses, one PDV per P-DATA."""
+        for ii in range(1000):
+            for fragment in self.msg.encode_msg(1, 16382):
+                P_DATA_TF(fragment).encode_buffers()
+
+    def time_encode_packed(self):
+        """Time encoding pending C-FIND responses, packed into one P-DATA."""
+        for ii in range(1000):
+            for fragment in self.msg.encode_msg(1, 16382, pack=True):
+                P_DATA_TF(fragment).encode_buffers()
+
+
+class TimeCommandSet:
+    def setup(self):
+        self.primitive = primitive = C_STORE()
+        primitive.MessageIDBeingRespondedTo = 7
+        primitive.AffectedSOPClassUID = "1.2.840.10008.5.1.4.1.1.2"
+        primitive.AffectedSOPInstanceUID = "1.2.392.200036.9116.2.6.1.48"
+        primitive.Status = 0x0000
+
+        msg = C_STORE_RSP()
+        msg.primitive_to_message(primitive)
+        self.p_data = next(msg.encode_msg(1, 16382))
+
+        # Check the encoding matches pydicom's
+        encoded = self.p_data.presentation_data_value_list[0][1][1:]
+        assert encoded == encode(msg.command_set, True, True)
+
+    def time_encode(self):
+        """Time converting C-STORE-RSP primitives to P-DATA."""
+        for ii in range(1000):
+            msg = C_STORE_RSP()
+            msg.primitive_to_message(self.primitive)
+            for fragment in msg.encode_msg(1, 16382):
+                pass
+
+    def time_encode_template(self):
+        """Time converting C-STORE-RSP primitives to P-DATA using a cached
+        template.
+        """
+        for ii in range(1000):
+            msg = _status_response(self.primitive)
+            for fragment in msg.encode_msg(1, 16382):
+                pass
+
+    def time_encode_dataset(self):
+        """Time converting C-STORE-RSP primitives to P-DATA using pydicom."""
+        for ii in range(1000):
+            msg = C_STORE_RSP()
+            msg.command_set
+            msg.primitive_to_message(self.primitive)
+            for fragment in msg.encode_msg(1, 16382):
+                pass
+
+    def time_decode(self):
+        """Time converting P-DATA to C-STORE-RSP primitives."""
+        for ii in range(1000):
+            msg = DIMSEMessage()
+            msg.decode_msg(self.p_data)
+            msg.message_to_primitive()
+
+    def time_decode_dataset(self):
+        """Time converting P-DATA to C-STORE-RSP primitives using pydicom."""
+        for ii in range(1000):
+            msg = DIMSEMessage()
+            msg.decode_msg(self.p_data)
+            msg.command_set
+            msg.message_to_primitive()
+
+
+class MemoryInFlightMessage:
+    """Bytes per in-flight response, as its primitive and DIMSE message."""
+
+    unit = "bytes"
+
+    def setup(self):
+        self.store = C_STORE()
+        self.store.MessageID = 7
+        self.store.AffectedSOPClassUID = "1.2.840.10008.5.1.4.1.1.2"
+        self.store.AffectedSOPInstanceUID = "1.2.392.200036.9116.2.6.1.48"
+
+        ds = Dataset()
+        ds.QueryRetrieveLevel = "PATIENT"
+        ds.PatientID = "1234567"
+        ds.PatientName = "Citizen^Jan"
+        self.identifier = BytesIO(encode(ds, True, True))
+        self.find = C_FIND()
+        self.find.MessageID = 7
+        self.find.AffectedSOPClassUID = "1.2.840.10008.5.1.4.1.2.1.1"
+
+    @staticmethod
+    def _measure(func, nr_messages=1000):
+        """Return the mean number of bytes allocated by `func` and still
+        referenced afterwards.
+        """
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            in_flight = [func() for ii in range(nr_messages)]
+            after = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+
+        assert len(in_flight) == nr_messages
+        return (after - before) / nr_messages
+
+    def track_c_store_rsp(self):
+        """Bytes per in-flight C-STORE-RSP."""
+        req = self.store
+
+        def func():
+            rsp = C_STORE._trusted(
+                MessageID=req.MessageID,
+                MessageIDBeingRespondedTo=req.MessageID,
+                AffectedSOPInstanceUID=req.AffectedSOPInstanceUID,
+                AffectedSOPClassUID=req.AffectedSOPClassUID,
+                Status=0x0000,
+            )
+            return rsp, _status_response(rsp)
+
+        return self._measure(func)
+
+    def track_c_find_rsp_pending(self):
+        """Bytes per in-flight pending C-FIND-RSP."""
+        req = self.find
+
+        def func():
+            rsp = C_FIND._trusted(
+                MessageID=req.MessageID,
+                MessageIDBeingRespondedTo=req.MessageID,
+                AffectedSOPClassUID=req.AffectedSOPClassUID,
+                Status=0xFF00,
+                Identifier=self.identifier,
+            )
+            msg = C_FIND_RSP()
+            msg.primitive_to_message(rsp)
+            return rsp, msg
+
+        return self._measure(func)
+
+
+class TimeWriteReceivedDataset:
+    """Time writing a large received C-STORE dataset to file."""
+
+    def setup(self):
+        primitive = C_STORE()
+        primitive.MessageID = 7
+        primitive.AffectedSOPClassUID = "1.2.840.10008.5.1.4.1.1.2"
+        primitive.AffectedSOPInstanceUID = "1.2.392.200036.9116.2.6.1.48"
+        # About 40 MB
+        primitive.DataSet = BytesIO(encode(DATASET, True, True) * 1000)
+        msg = C_STORE_RQ()
+        msg.primitive_to_message(primitive)
+
+        # Decode from P-DATA-TF PDUs, as received from the peer
+        pdus = [P_DATA_TF(p).encode() for p in msg.encode_msg(1, 16382)]
+        msg = DIMSEMessage()
+        for pdu in pdus:
+            p_data_tf = P_DATA_TF()
+            p_data_tf.decode(pdu)
+            msg.decode_msg(p_data_tf.to_primitive())
+
+        cx = build_context("1.2.840.10008.5.1.4.1.1.2", "1.2.840.10008.1.2")
+        cx.context_id = 1
+        self.event = evt.Event(
+            None,
+            evt.EVT_C_STORE,
+            {"request": msg.message_to_primitive(), "context": cx.as_tuple},
+        )
+
+    def time_encoded_dataset(self):
+        """Time writing using Event.encoded_dataset()."""
+        with open(os.devnull, "wb") as f:
+            f.write(self.event.encoded_dataset())
+
+    def time_encoded_dataset_buffers(self):
+        """Time writing using Event.encoded_dataset_buffers()."""
+        with open(os.devnull, "wb") as f:
+            f.writelines(self.event.encoded_dataset_buffers())
+
+
+
+class MemorySendDeflated:
+    """Peak bytes allocated while deflating and sending a large C-STORE
+    dataset from file.
+    """
+
+    unit = "bytes"
+
+    def setup(self):
+        ds = Dataset()
+        ds.ImageComments = os.urandom(4096).hex()
+        fd, self.path = tempfile.mkstemp()
+        # About 20 MB
+        with os.fdopen(fd, "wb") as f:
+            f.write(encode(ds, False, True) * 2500)
+
+    def teardown(self):
+        os.remove(self.path)
+
+    @staticmethod
+    def _measure(primitive_func):
+        """Return the peak number of bytes allocated while sending."""
+        tracemalloc.start()
+        try:
+            msg = C_STORE_RQ()
+            msg.primitive_to_message(primitive_func())
+            for p_data in msg.encode_msg(1, 16382, pack=True):
+                for _, value in p_data.presentation_data_value_list:
+                    bytes(value)
+
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    def _primitive(self):
+        primitive = C_STORE()
+        primitive.MessageID = 7
+        primitive.AffectedSOPClassUID = "1.2.840.10008.5.1.4.1.1.88.11"
+        primitive.AffectedSOPInstanceUID = "1.2.3.4"
+        return primitive
+
+    def track_deflate_whole(self):
+        """Deflate the whole dataset before sending it."""
+
+        def func():
+            primitive = self._primitive()
+            with open(self.path, "rb") as f:
+                compressor = zlib.compressobj(
+                    zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -zlib.MAX_WBITS
+                )
+                deflated = compressor.compress(f.read()) + compressor.flush()
+
+            primitive.DataSet = BytesIO(deflated)
+            return primitive
+
+        return self._measure(func)
+
+    def track_deflate_streamed(self):
+        """Deflate the dataset as it's sent."""
+
+        def func():
+            primitive = self._primitive()
+            primitive._dataset_path = (Path(self.path), 0)
+            primitive._deflate_dataset = True
+            return primitive
+
+        return self._measure(func)
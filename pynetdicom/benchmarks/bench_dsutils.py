@@ -0,0 +1,57 @@
+"""Performance tests for reading dataset file headers."""
+
+import os
+import shutil
+import tempfile
+
+from pydicom import dcmread
+
+from pynetdicom.dsutils import HeaderCache, read_header
+
+
+TEST_DS_DIR = os.path.join(os.path.dirname(__file__), "..", "tests", "dicom_files")
+DATASETS = ["CTImageStorage.dcm", "MRImageStorage_ExplicitVRBigEndian.dcm"]
+
+
+class TimeReadHeader:
+    """Time getting the SOP Class UID and Transfer Syntax UID of 200 files."""
+
+    def setup(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.paths = []
+        for ii in range(200):
+            path = os.path.join(self.tmpdir, f"{ii}.dcm")
+            shutil.copy(os.path.join(TEST_DS_DIR, DATASETS[ii % 2]), path)
+            self.paths.append(path)
+
+        self.cache = HeaderCache(os.path.join(self.tmpdir, "cache.db"))
+        for path in self.paths:
+            read_header(path, cache=self.cache)
+
+    def teardown(self):
+        self.cache.close()
+        shutil.rmtree(self.tmpdir)
+
+    def time_dcmread(self):
+        """Read the entire dataset"""
+        for path in self.paths:
+            ds = dcmread(path)
+            ds.SOPClassUID, ds.file_meta.TransferSyntaxUID
+
+    def time_dcmread_stop_before_pixels(self):
+        """Read the dataset up to the pixel data"""
+        for path in self.paths:
+            ds = dcmread(path, stop_before_pixels=True)
+            ds.SOPClassUID, ds.file_meta.TransferSyntaxUID
+
+    def time_read_header(self):
+        """Read only the Q/R keys"""
+        for path in self.paths:
+            ds = read_header(path)
+            ds.SOPClassUID, ds.file_meta.TransferSyntaxUID
+
+    def time_read_header_cached(self):
+        """Get the Q/R keys from the header cache"""
+        for path in self.paths:
+            ds = read_header(path, cache=self.cache)
+            ds.SOPClassUID, ds.file_meta.TransferSyntaxUID
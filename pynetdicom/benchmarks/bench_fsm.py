@@ -0,0 +1,67 @@
+"""Performance tests for the fsm module."""
+
+from pynetdicom.fsm import StateMachine
+from pynetdicom.pdu_primitives import P_DATA
+
+
+class DummyQueue:
+    def __init__(self, item):
+        self.item = item
+
+    def get(self, block=True):
+        return self.item
+
+
+class DummyPDU:
+    def to_primitive(self):
+        return None
+
+
+class DummyDIMSE:
+    def receive_primitive(self, primitive):
+        pass
+
+
+class DummyAssociation:
+    def __init__(self):
+        self.dimse = DummyDIMSE()
+
+    def get_handlers(self, event):
+        return []
+
+
+class DummyDUL:
+    """A DUL that only does what's needed by the data transfer actions."""
+
+    def __init__(self):
+        primitive = P_DATA()
+        primitive.presentation_data_value_list = [[1, b"\x03\x00"]]
+        self.to_provider_queue = DummyQueue(primitive)
+        self._recv_pdu = DummyQueue(DummyPDU())
+        self.assoc = DummyAssociation()
+
+    def _send(self, pdu):
+        pass
+
+
+class TimeFSM:
+    def setup(self):
+        """Setup the benchmark"""
+        self.fsm = StateMachine(DummyDUL())
+        self.fsm.transition("Sta6")
+
+    def time_receive_data(self):
+        """Time the Sta6 + Evt10 transition for every received P-DATA-TF.
+
+        The action itself does almost nothing, so this is mostly the state
+        machine's own overhead.
+        """
+        do_action = self.fsm.do_action
+        for ii in range(10000):
+            do_action("Evt10")
+
+    def time_send_data(self):
+        """Time the Sta6 + Evt9 transition for every sent P-DATA-TF."""
+        do_action = self.fsm.do_action
+        for ii in range(10000):
+            do_action("Evt9")
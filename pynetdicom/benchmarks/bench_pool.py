@@ -0,0 +1,32 @@
+"""Performance tests for reusing associations with an AssociationPool."""
+
+from pynetdicom import AE, AssociationPool
+from pynetdicom.sop_class import Verification
+
+
+class TimeRepeatedBatches:
+    """Time sending many small batches of requests to the same peer."""
+
+    def setup(self):
+        self.ae = ae = AE()
+        ae.add_supported_context(Verification)
+        ae.add_requested_context(Verification)
+        self.scp = ae.start_server(("localhost", 11113), block=False)
+
+    def teardown(self):
+        self.scp.shutdown()
+        self.ae.shutdown()
+
+    def time_associate_per_batch(self):
+        """Request a new association for each of 50 batches."""
+        for _ in range(50):
+            assoc = self.ae.associate("localhost", 11113)
+            assoc.send_c_echo()
+            assoc.release()
+
+    def time_pool_per_batch(self):
+        """Acquire an association from a pool for each of 50 batches."""
+        with AssociationPool(self.ae) as pool:
+            for _ in range(50):
+                with pool.association("localhost", 11113) as assoc:
+                    assoc.send_c_echo()
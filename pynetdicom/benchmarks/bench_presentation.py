@@ -192,3 +192,39 @@ class TimePresentationRequestor:
         """Time a basic presentation service negotiation."""
         for ii in range(100):
             negotiate_as_requestor(self.requestor_contexts, self.acceptor_contexts)
+
+
+class TimeGetValidContext:
+    """Time finding the accepted context to use with many accepted contexts"""
+
+    def setup(self):
+        from pynetdicom import AE
+        from pynetdicom.association import Association
+
+        self.assoc = Association(AE(), "requestor")
+        contexts = {}
+        for ii, cx in enumerate(StoragePresentationContexts[:128]):
+            cx = build_context(cx.abstract_syntax, "1.2.840.10008.1.2")
+            cx.context_id = ii * 2 + 1
+            cx._as_scu = True
+            cx._as_scp = False
+            contexts[cx.context_id] = cx
+
+        self.assoc._accepted_cx = contexts
+        self.abstract_syntaxes = [cx.abstract_syntax for cx in contexts.values()]
+
+    def time_exact(self):
+        """Time 1000 lookups with the accepted transfer syntax"""
+        syntaxes = self.abstract_syntaxes
+        for ii in range(1000):
+            self.assoc._get_valid_context(
+                syntaxes[ii % len(syntaxes)], "1.2.840.10008.1.2", "scu"
+            )
+
+    def time_convertible(self):
+        """Time 1000 lookups with a convertible transfer syntax"""
+        syntaxes = self.abstract_syntaxes
+        for ii in range(1000):
+            self.assoc._get_valid_context(
+                syntaxes[ii % len(syntaxes)], "1.2.840.10008.1.2.1", "scu"
+            )
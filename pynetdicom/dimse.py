@@ -2,13 +2,14 @@
 Implementation of the DIMSE service provider.
 """
 
+from collections import deque
 from io import BytesIO
 import logging
 import queue
 import threading
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, Callable, cast
 
-from pynetdicom import evt
+from pynetdicom import _config, evt
 
 # pylint: disable=no-name-in-module
 from pynetdicom.dimse_messages import (
@@ -36,6 +37,7 @@ from pynetdicom.dimse_messages import (
     N_CREATE_RSP,
     N_DELETE_RSP,
     DIMSEMessage,
+    _status_response,
 )
 
 # pylint: enable=no-name-in-module
@@ -55,12 +57,12 @@ from pynetdicom.dimse_primitives import (
     DimsePrimitiveType,
     DimseServiceType,
 )
+from pynetdicom.pdu_primitives import P_DATA
 from pynetdicom.utils import make_target
 
 if TYPE_CHECKING:  # pragma: no cover
     from pynetdicom.association import Association
     from pynetdicom.dul import DULServiceProvider
-    from pynetdicom.pdu_primitives import P_DATA
 
 
 LOGGER = logging.getLogger(__name__)
@@ -96,6 +98,66 @@ _RSP_TO_MESSAGE = {
 _QueueItem = tuple[None, None] | tuple[int, DimseServiceType]
 
 
+class _MessageQueue(queue.Queue):
+    """A :class:`queue.Queue` for received DIMSE messages that tracks the
+    number of bytes of encoded message data it holds.
+
+    Adding items never blocks, instead the queue is considered full once the
+    limits set by :attr:`~pynetdicom._config.MAX_QUEUED_MESSAGES` or
+    :attr:`~pynetdicom._config.MAX_QUEUED_BYTES` are reached, and `notify` is
+    called when an item is taken from a full queue.
+    """
+
+    def __init__(self, notify: Callable[[], None]) -> None:
+        super().__init__()
+        self._notify = notify
+
+    def _init(self, maxsize: int) -> None:
+        super()._init(maxsize)
+        self._sizes: deque[int] = deque()
+        self.nbytes = 0
+
+    def _put(self, item: Any) -> None:
+        self.queue.append(item)
+        self._sizes.append(0)
+
+    def _get(self) -> Any:
+        is_full = self.is_full
+        self.nbytes -= self._sizes.popleft()
+        item = self.queue.popleft()
+        if is_full and not self.is_full:
+            self._notify()
+
+        return item
+
+    @property
+    def is_full(self) -> bool:
+        """Return ``True`` if the queue has reached its configured limits."""
+        max_items = _config.MAX_QUEUED_MESSAGES
+        if max_items is not None and len(self.queue) >= max_items:
+            return True
+
+        max_bytes = _config.MAX_QUEUED_BYTES
+        return max_bytes is not None and self.nbytes >= max_bytes
+
+    def put_msg(self, item: _QueueItem, nbytes: int) -> None:
+        """Add `item` to the queue without blocking.
+
+        Parameters
+        ----------
+        item : tuple[int, DimseServiceType]
+            The (*Context ID*, *Message*) to add to the queue.
+        nbytes : int
+            The size of the encoded message, in bytes.
+        """
+        with self.mutex:
+            self._put(item)
+            self._sizes[-1] = nbytes
+            self.nbytes += nbytes
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
+
+
 class DIMSEServiceProvider:
     """The DIMSE service provider.
 
@@ -161,7 +223,11 @@ class DIMSEServiceProvider:
         The DIMSE message currently being received.
     msg_queue: queue.queue of dimse_messages.DIMSEMessage
         A queue holding decoded DIMSE Message primitives received from the
-        peer, except for C-CANCEL requests.
+        peer, except for C-CANCEL requests and the responses to requests sent
+        using the ``Association.submit_*()`` methods. While the queue is full
+        the DUL stops reading from the peer, see
+        :attr:`~pynetdicom._config.MAX_QUEUED_MESSAGES` and
+        :attr:`~pynetdicom._config.MAX_QUEUED_BYTES`.
 
     References
     ----------
@@ -181,7 +247,9 @@ class DIMSEServiceProvider:
 
         self.cancel_req: dict[int, C_CANCEL] = {}
         self.message: DIMSEMessage | None = None
-        self.msg_queue: "queue.Queue[_QueueItem]" = queue.Queue()
+        self.msg_queue: "queue.Queue[_QueueItem]" = _MessageQueue(self._resume_recv)
+        # Prevents the P-DATA primitives of different messages interleaving
+        self._send_lock = threading.Lock()
 
     @property
     def assoc(self) -> "Association":
@@ -222,6 +290,28 @@ class DIMSEServiceProvider:
         except queue.Empty:
             return None, None
 
+    @property
+    def queued_bytes(self) -> int:
+        """Return the size of the messages waiting in the
+        :attr:`~DIMSEServiceProvider.msg_queue`, in bytes.
+
+        .. versionadded:: 3.1
+
+        Only includes the encoded message data held in memory, so datasets
+        received with :attr:`~pynetdicom._config.STORE_RECV_CHUNKED_DATASET`
+        aren't included.
+        """
+        return getattr(self.msg_queue, "nbytes", 0)
+
+    @property
+    def queued_messages(self) -> int:
+        """Return the number of messages waiting in the
+        :attr:`~DIMSEServiceProvider.msg_queue`.
+
+        .. versionadded:: 3.1
+        """
+        return self.msg_queue.qsize()
+
     @property
     def maximum_pdu_size(self) -> int:
         """Return the peer's maximum PDU length as :class:`int`."""
@@ -245,7 +335,11 @@ class DIMSEServiceProvider:
         except (queue.Empty, IndexError):
             return None, None
 
-    def receive_primitive(self, primitive: "P_DATA") -> None:
+    def _resume_recv(self) -> None:
+        """Wake the DUL so it can resume reading from the peer."""
+        self.dul._wakeup()
+
+    def receive_primitive(self, primitive: P_DATA) -> None:
         """Process a P-DATA primitive received from the remote.
 
         A DIMSE message is split into one or more P-DATA primitives, which
@@ -258,19 +352,31 @@ class DIMSEServiceProvider:
         This makes it possible to process incoming P-DATA primitives into
         DIMSE messages while a service class implementation is running.
 
+        .. versionchanged:: 3.1
+
+            A P-DATA primitive may contain the PDVs of more than one message.
+
         Parameters
         ----------
         primitive : pdu_primitives.P_DATA
             A P-DATA primitive received from the peer to be processed.
         """
-        if self.message is None:
-            self.message = DIMSEMessage()
+        pdvs = primitive.presentation_data_value_list
+        while True:
+            if self.message is None:
+                self.message = DIMSEMessage()
+
+            if not self.message.decode_msg(primitive, self.assoc):
+                return
 
-        if self.message.decode_msg(primitive, self.assoc):
             # Trigger event
             evt.trigger(self.assoc, evt.EVT_DIMSE_RECV, {"message": self.message})
 
             context_id = cast(int, self.message.context_id)
+            nbytes = (
+                self.message.encoded_command_set.getbuffer().nbytes
+                + cast(BytesIO, self.message.data_set).getbuffer().nbytes
+            )
             try:
                 d_primitive = self.message.message_to_primitive()
             except Exception as exc:
@@ -283,9 +389,15 @@ class DIMSEServiceProvider:
 
             # Keep C-CANCEL requests separate from other messages
             # Only allow up to 10 C-CANCEL requests
+            msg_id = d_primitive.MessageIDBeingRespondedTo
             if isinstance(d_primitive, C_CANCEL) and len(self.cancel_req) < 10:
-                msg_id = cast(int, d_primitive.MessageIDBeingRespondedTo)
-                self.cancel_req[msg_id] = d_primitive
+                self.cancel_req[cast(int, msg_id)] = d_primitive
+            elif msg_id in self.assoc._outstanding and not isinstance(
+                d_primitive, C_CANCEL
+            ):
+                # Response to a request sent using one of the
+                #   Association.submit_*() methods
+                self.assoc._receive_response(d_primitive)
             elif (
                 isinstance(d_primitive, N_EVENT_REPORT) and d_primitive.is_valid_request
             ):
@@ -297,7 +409,9 @@ class DIMSEServiceProvider:
                 )
                 t.start()
             else:
-                self.msg_queue.put((context_id, cast(DimseServiceType, d_primitive)))
+                cast(_MessageQueue, self.msg_queue).put_msg(
+                    (context_id, cast(DimseServiceType, d_primitive)), nbytes
+                )
 
             # Fix for memory leak, Issue #41
             #   Reset the DIMSE message, ready for the next one
@@ -305,11 +419,28 @@ class DIMSEServiceProvider:
             self.message.data_set = BytesIO()
             self.message._data_set_file = None
             self.message._data_set_path = None
+            nr_pdvs = self.message._nr_pdvs
             self.message = None
 
+            # A P-DATA may contain the end of one message and the start of
+            #   the next
+            pdvs = pdvs[nr_pdvs:]
+            if not pdvs:
+                return
+
+            primitive = P_DATA()
+            primitive._presentation_data_value_list = pdvs
+
     def send_msg(self, primitive: DimsePrimitiveType, context_id: int) -> None:
         """Encode and send a DIMSE-C or DIMSE-N message to the peer AE.
 
+        .. versionchanged:: 3.1
+
+            * C-ECHO and C-STORE responses with no status parameters other
+              than *Status* have their command set encoded from a cached
+              template.
+            * May be called by several threads at once.
+
         Parameters
         ----------
         primitive : dimse_primitives DIMSE Primitive class
@@ -318,19 +449,39 @@ class DIMSEServiceProvider:
             The ID of the presentation context that the message is to be
             sent under.
         """
-        if primitive.MessageIDBeingRespondedTo is None:
-            dimse_msg = _RQ_TO_MESSAGE[primitive.__class__]()  # type: ignore
-        else:
-            dimse_msg = _RSP_TO_MESSAGE[primitive.__class__]()
+        dimse_msg = None
+        if primitive.MessageIDBeingRespondedTo is not None:
+            # Fast path for the usual C-ECHO and C-STORE responses
+            dimse_msg = _status_response(primitive)
+
+        if dimse_msg is None:
+            if primitive.MessageIDBeingRespondedTo is None:
+                dimse_msg = _RQ_TO_MESSAGE[primitive.__class__]()  # type: ignore
+            else:
+                dimse_msg = _RSP_TO_MESSAGE[primitive.__class__]()
+
+            # Convert DIMSE primitive to DIMSE Message
+            dimse_msg.primitive_to_message(primitive)
 
-        # Convert DIMSE primitive to DIMSE Message
-        dimse_msg.primitive_to_message(primitive)
         dimse_msg.context_id = context_id
 
         # Trigger event
         evt.trigger(self.assoc, evt.EVT_DIMSE_SENT, {"message": dimse_msg})
 
-        # Split the full messages into P-DATA chunks,
-        #   each below the max_pdu size
-        for pdata in dimse_msg.encode_msg(context_id, self.maximum_pdu_size):
-            self.dul.send_pdu(pdata)
+        # Split the full messages into P-DATA chunks, each below the max_pdu
+        #   size and with as many fragments as will fit
+        pending: list[P_DATA] = []
+        max_length = self.maximum_pdu_size
+        with self._send_lock:
+            for pdata in dimse_msg.encode_msg(context_id, max_length, pack=True):
+                pending.append(pdata)
+                # Hold back the last command set fragment until the first data
+                #   set fragment is available so the DUL can send them together
+                if pdata.presentation_data_value_list[-1][1][0:1] == b"\x03":
+                    continue
+
+                self.dul.send_pdus(pending)
+                pending = []
+
+            if pending:
+                self.dul.send_pdus(pending)
@@ -1,12 +1,16 @@
 """Define the DIMSE Message classes."""
 
+from functools import lru_cache
 from io import BytesIO
 import logging
 from math import ceil
 from pathlib import Path
-from tempfile import NamedTemporaryFile
-from typing import Iterator, TYPE_CHECKING, cast
+from struct import Struct, error as StructError
+from typing import Any, Callable, Iterable, Iterator, TYPE_CHECKING, cast
+import zlib
 
+from pydicom.datadict import dictionary_VR, tag_for_keyword
+from pydicom.dataelem import DataElement
 from pydicom.dataset import Dataset
 from pydicom.filewriter import write_file_meta_info
 from pydicom.tag import Tag
@@ -28,12 +32,12 @@ from pynetdicom.dimse_primitives import (
     N_DELETE,
     DimsePrimitiveType,
 )
-from pynetdicom.dsutils import encode, decode, create_file_meta
+from pynetdicom.dsutils import encode, decode, create_file_meta, DatasetWriter
+from pynetdicom.pdu_items import _FileFragment, _FileSource
 from pynetdicom.pdu_primitives import P_DATA
 
 if TYPE_CHECKING:  # pragma: no cover
     from pynetdicom.association import Association
-    from pynetdicom.dimse_primitives import NTF
 
 
 LOGGER = logging.getLogger(__name__)
@@ -289,6 +293,331 @@ _MSG_TO_PRIMITVE = {
 
 _MULTIVALUE_TAGS = [Tag("OffendingElement"), Tag("AttributeIdentifierList")]
 
+# The (VR, keyword) of each command set element, keyed by tag
+_COMMAND_ELEMENTS: dict[int, tuple[str, str]] = {
+    cast(int, tag_for_keyword(kw)): (dictionary_VR(kw), kw)
+    for keywords in _COMMAND_SET_KEYWORDS.values()
+    for kw in keywords
+}
+# The command set element tags of each message type, used as the template
+#   for the command set values of new messages
+_COMMAND_TEMPLATES: dict[str, tuple[int, ...]] = {
+    name: tuple(sorted(cast(int, tag_for_keyword(kw)) for kw in keywords))
+    for name, keywords in _COMMAND_SET_KEYWORDS.items()
+}
+
+# Implicit VR Little Endian element header: group, element, value length
+_ELEMENT_HEADER = Struct("<HHL")
+_US = Struct("<H")
+_UL = Struct("<L")
+# The encoded (0000,0000) Command Group Length element header
+_GROUP_LENGTH_HEADER = b"\x00\x00\x00\x00\x04\x00\x00\x00"
+# Padding for odd length values of the string VRs that can be encoded by
+#   _encode_command_set()
+_STRING_PADDING = {"UI": b"\x00", "AE": b" ", "LO": b" "}
+
+
+def _encode_command_set(values: dict[int, Any]) -> bytes | None:
+    """Return the command set `values` encoded as Implicit VR Little Endian.
+
+    .. versionadded:: 3.1
+
+    Command sets are small and only use a handful of VRs so encoding them
+    directly is much faster than going through *pydicom*.
+
+    Parameters
+    ----------
+    values : dict[int, Any]
+        The command set element values, keyed by tag.
+
+    Returns
+    -------
+    bytes | None
+        The encoded command set, or ``None`` if it contains an element that
+        must be encoded by *pydicom*, such as an **AT** element, a non-ASCII
+        value or a ``None`` value.
+    """
+    parts = []
+    try:
+        for tag in sorted(values):
+            value = values[tag]
+            vr = _COMMAND_ELEMENTS[tag][0]
+            if vr == "US" or vr == "UL":
+                if not isinstance(value, int):
+                    return None
+
+                data = _US.pack(value) if vr == "US" else _UL.pack(value)
+            elif vr in _STRING_PADDING and isinstance(value, str):
+                data = value.encode("ascii")
+                if len(data) % 2:
+                    data += _STRING_PADDING[vr]
+            else:
+                return None
+
+            parts.append(_ELEMENT_HEADER.pack(tag >> 16, tag & 0xFFFF, len(data)))
+            parts.append(data)
+    except (KeyError, StructError, UnicodeEncodeError):
+        return None
+
+    return b"".join(parts)
+
+
+def _decode_command_set(data: bytes) -> dict[int, Any] | None:
+    """Return the values of the Implicit VR Little Endian encoded command set
+    `data`.
+
+    .. versionadded:: 3.1
+
+    Parameters
+    ----------
+    data : bytes
+        The encoded command set.
+
+    Returns
+    -------
+    dict[int, Any] | None
+        The command set element values keyed by tag, or ``None`` if the
+        command set must be decoded by *pydicom*, such as when it contains an
+        **AT** element, an empty or multi-valued element or is missing the
+        *Command Field* or *Command Data Set Type* elements.
+    """
+    values: dict[int, Any] = {}
+    offset = 0
+    length = len(data)
+    try:
+        while offset < length:
+            group, elem, value_length = _ELEMENT_HEADER.unpack_from(data, offset)
+            tag = group << 16 | elem
+            vr = _COMMAND_ELEMENTS[tag][0]
+            offset += 8
+            value = data[offset : offset + value_length]
+            offset += value_length
+            if not value_length or offset > length:
+                return None
+
+            if vr == "US" or vr == "UL":
+                values[tag] = (_US if vr == "US" else _UL).unpack(value)[0]
+            elif vr in _STRING_PADDING and b"\\" not in value:
+                # Remove the non-significant padding as pydicom does
+                if vr == "UI":
+                    values[tag] = UID(value.decode("ascii").rstrip("\x00 "))
+                elif vr == "AE":
+                    values[tag] = value.decode("ascii").strip()
+                else:
+                    values[tag] = value.decode("ascii").rstrip("\x00 ")
+            else:
+                return None
+    except (KeyError, StructError, UnicodeDecodeError):
+        return None
+
+    if 0x00000100 not in values or 0x00000800 not in values:
+        return None
+
+    return values
+
+
+@lru_cache(maxsize=256)
+def _status_response_template(
+    command_field: int, sop_class_uid: str
+) -> tuple[bytes, bytes] | None:
+    """Return the encoded fixed parts of a C-ECHO-RSP or C-STORE-RSP command
+    set without a data set.
+
+    .. versionadded:: 3.1
+
+    Parameters
+    ----------
+    command_field : int
+        The *Command Field* value of the response.
+    sop_class_uid : str
+        The *Affected SOP Class UID* value of the response.
+
+    Returns
+    -------
+    tuple[bytes, bytes] | None
+        The encoded elements up to the *Message ID Being Responded To* value
+        and those between it and the *Status* value, or ``None`` if
+        `sop_class_uid` cannot be encoded without *pydicom*.
+    """
+    head = _encode_command_set({0x00000002: sop_class_uid, 0x00000100: command_field})
+    if head is None:
+        return None
+
+    return (
+        head + _ELEMENT_HEADER.pack(0x0000, 0x0120, 2),
+        b"".join(
+            (
+                cast(bytes, _encode_command_set({0x00000800: 0x0101})),
+                _ELEMENT_HEADER.pack(0x0000, 0x0900, 2),
+            )
+        ),
+    )
+
+
+def _status_response(primitive: DimsePrimitiveType) -> "DIMSEMessage | None":
+    """Return a C-ECHO-RSP or C-STORE-RSP message for the response
+    `primitive` with the command set encoded from a cached template.
+
+    .. versionadded:: 3.1
+
+    Only responses with no parameters other than the *Affected SOP Class UID*,
+    *Affected SOP Instance UID*, *Message ID Being Responded To* and *Status*
+    can use a template, such as the usual *Success* and *Warning* responses.
+
+    Parameters
+    ----------
+    primitive : dimse_primitives.C_ECHO or dimse_primitives.C_STORE
+        The response primitive to convert.
+
+    Returns
+    -------
+    DIMSEMessage | None
+        The response message, or ``None`` if `primitive` must be converted
+        using :meth:`DIMSEMessage.primitive_to_message`.
+    """
+    instance_uid = None
+    tail: bytes | None = b""
+    if isinstance(primitive, C_STORE):
+        instance_uid = primitive.AffectedSOPInstanceUID
+        if instance_uid is None or primitive.OffendingElement is not None:
+            return None
+
+        tail = _encode_command_set({0x00001000: instance_uid})
+        msg: DIMSEMessage = C_STORE_RSP()
+    elif isinstance(primitive, C_ECHO):
+        msg = C_ECHO_RSP()
+    else:
+        return None
+
+    message_id = primitive.MessageIDBeingRespondedTo
+    status = primitive.Status
+    sop_class_uid = primitive.AffectedSOPClassUID
+    if (
+        message_id is None
+        or status is None
+        or sop_class_uid is None
+        or tail is None
+        or primitive.ErrorComment is not None
+        or primitive._dataset_path is not None
+    ):
+        return None
+
+    command_field = _MESSAGE_FIELDS[msg.__class__.__name__.replace("_", "-")]
+    template = _status_response_template(command_field, sop_class_uid)
+    if template is None:
+        return None
+
+    head, middle = template
+    length = len(head) + len(middle) + len(tail) + 4
+    try:
+        encoded = b"".join(
+            (
+                _GROUP_LENGTH_HEADER,
+                _UL.pack(length),
+                head,
+                _US.pack(message_id),
+                middle,
+                _US.pack(status),
+                tail,
+            )
+        )
+    except StructError:
+        return None
+
+    values = {
+        0x00000000: length,
+        0x00000002: sop_class_uid,
+        0x00000100: command_field,
+        0x00000120: message_id,
+        0x00000800: 0x0101,
+        0x00000900: status,
+    }
+    if instance_uid is not None:
+        values[0x00001000] = instance_uid
+
+    msg._command_values = values
+    msg._encoded_command = encoded
+
+    return msg
+
+
+# The size of the chunks of an encoded data set that are deflated at a time
+_DEFLATE_CHUNK_SIZE = 64 * 1024
+
+
+def _read_chunks(path: Path, offset: int) -> Iterator[bytes]:
+    """Yield the data in the file at `path` from `offset` onwards, in chunks."""
+    with path.open("rb") as f:
+        f.seek(offset)
+        while chunk := f.read(_DEFLATE_CHUNK_SIZE):
+            yield chunk
+
+
+class _Deflater:
+    """Deflate an encoded data set as its fragments are produced.
+
+    .. versionadded:: 3.1
+
+    Only as much of the encoded data set as is needed to produce the next
+    fragment is compressed, so the deflated data set is never held in memory
+    in full. The output matches that of :func:`~pynetdicom.dsutils.encode`.
+    """
+
+    def __init__(self, chunks: Iterable[bytes | memoryview]) -> None:
+        """Create a new deflater.
+
+        Parameters
+        ----------
+        chunks : Iterable[bytes | memoryview]
+            The encoded data set to be deflated, in chunks.
+        """
+        self._chunks = iter(chunks)
+        self._compressor = zlib.compressobj(
+            zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -zlib.MAX_WBITS
+        )
+        # Deflated data that's yet to be returned as a fragment
+        self._buffer = bytearray()
+        self._nr_returned = 0
+        self._finished = False
+
+    def fragment(self, size: int) -> tuple[bytes, bool]:
+        """Return the next fragment of the deflated data set.
+
+        Parameters
+        ----------
+        size : int
+            The maximum size of the fragment, or ``0`` for the remainder of
+            the deflated data set.
+
+        Returns
+        -------
+        tuple[bytes, bool]
+            The fragment and ``True`` if it's the last fragment, ``False``
+            otherwise.
+        """
+        buffer = self._buffer
+        # Keep going until there's more than `size` bytes, so we know if the
+        #   fragment is the last one or not
+        while not self._finished and (not size or len(buffer) <= size):
+            chunk = next(self._chunks, None)
+            if chunk is not None:
+                buffer += self._compressor.compress(chunk)
+                continue
+
+            buffer += self._compressor.flush()
+            # Pad to an even length
+            if (self._nr_returned + len(buffer)) % 2:
+                buffer += b"\x00"
+
+            self._finished = True
+
+        size = size or len(buffer)
+        fragment = bytes(buffer[:size])
+        del buffer[:size]
+        self._nr_returned += len(fragment)
+
+        return fragment, self._finished and not buffer
+
 
 class DIMSEMessage:
     """Represents a DIMSE Message.
@@ -338,6 +667,19 @@ class DIMSEMessage:
         encoded Command Set data from the fragments.
     """
 
+    __slots__ = (
+        "context_id",
+        "encoded_command_set",
+        "data_set",
+        "_command_values",
+        "_command_set",
+        "_encoded_command",
+        "_data_set_path",
+        "_data_set_file",
+        "_nr_pdvs",
+        "_deflate_data_set",
+    )
+
     def __init__(self) -> None:
         """Create a new DIMSE Message."""
         self.context_id: int | None = None
@@ -345,24 +687,68 @@ class DIMSEMessage:
         # Required to save command set data from multiple fragments
         self.encoded_command_set = BytesIO()
         self.data_set: BytesIO | None = BytesIO()
-        self.command_set = Dataset()
+        # The command set is kept as its element values keyed by tag and only
+        #   converted to a Dataset when the `command_set` attribute is used
+        self._command_values: dict[int, Any] | None = None
+        self._command_set: Dataset | None = None
+        # The encoded `_command_values`, if known
+        self._encoded_command: bytes | None = None
 
         # If reading the dataset in chunks this will be a tuple:
         #   (its file path, a byte offset to the start of the dataset)
         # If writing the dataset in chunks this will be a Path:
         #   its file path
         self._data_set_path: Path | tuple[Path, int] | None = None
-        # If writing the dataset in chunks this will be a NamedTemporaryFile:
-        #   the file object backing its file path
-        self._data_set_file: "NTF | None" = None
+        # If writing the dataset in chunks this will be the DatasetWriter
+        #   used to write it to its file path
+        self._data_set_file: DatasetWriter | None = None
+        # The number of PDVs of the last decoded P-DATA primitive that were
+        #   part of the message, any others belong to the following messages
+        self._nr_pdvs = 0
+        # If True then the encoded dataset is deflated as it's sent
+        self._deflate_data_set = False
 
         cls_name = self.__class__.__name__
         if cls_name == "DIMSEMessage":
+            self._command_set = Dataset()
             return
 
-        # Set the command set attributes for the subclasses
-        for keyword in _COMMAND_SET_KEYWORDS[cls_name.replace("_", "-")]:
-            setattr(self.command_set, keyword, None)
+        # Set the command set elements for the subclasses
+        self._command_values = dict.fromkeys(
+            _COMMAND_TEMPLATES[cls_name.replace("_", "-")]
+        )
+
+    @property
+    def command_set(self) -> Dataset:
+        """Get or set the message's *Command Set* as a
+        :class:`~pydicom.dataset.Dataset`.
+
+        .. versionchanged:: 3.1
+
+            The dataset is only created when first used.
+        """
+        if self._command_set is None:
+            ds = Dataset()
+            for tag, value in cast(dict[int, Any], self._command_values).items():
+                ds[tag] = DataElement(tag, _COMMAND_ELEMENTS[tag][0], value)
+
+            self._command_set = ds
+            self._command_values = None
+
+        return self._command_set
+
+    @command_set.setter
+    def command_set(self, ds: Dataset) -> None:
+        """Set the message's *Command Set*."""
+        self._command_set = ds
+        self._command_values = None
+
+    def _command_value(self, tag: int) -> Any:
+        """Return the value of the command set element with `tag`."""
+        if self._command_values is not None:
+            return self._command_values[tag]
+
+        return self.command_set[tag].value
 
     def decode_msg(self, primitive: P_DATA, assoc: "Association | None" = None) -> bool:
         """Converts P-DATA primitives into a ``DIMSEMessage`` sub-class.
@@ -393,7 +779,9 @@ class DIMSEMessage:
         -------
         bool
             ``True`` when the DIMSE message is completely decoded, ``False``
-            otherwise.
+            otherwise. A P-DATA primitive may contain the end of one message
+            and the start of the next, in which case only the PDVs up to the
+            end of the message are decoded.
 
         References
         ----------
@@ -404,7 +792,9 @@ class DIMSEMessage:
         if primitive.__class__ != P_DATA or primitive is None:
             return False
 
-        for context_id, data in primitive.presentation_data_value_list:
+        # Received PDVs are never sent from file
+        pdvs = cast(list[tuple[int, bytes]], primitive.presentation_data_value_list)
+        for index, (context_id, data) in enumerate(pdvs):
             # The first byte of the P-DATA is the Message Control Header
             #   See Part 8, Annex E.2
             # The standard says that only the significant bits (ie the last
@@ -435,51 +825,54 @@ class DIMSEMessage:
                     self.context_id = context_id
 
                     # Command Set is always encoded Implicit VR Little Endian
-                    #   decode(dataset, is_implicit_VR, is_little_endian)
-                    # pylint: disable=attribute-defined-outside-init
-                    self.command_set = decode(self.encoded_command_set, True, True)
+                    values = _decode_command_set(self.encoded_command_set.getvalue())
+                    if values is not None:
+                        self._command_values = values
+                        self._command_set = None
+                        self._encoded_command = None
+                    else:
+                        #   decode(dataset, is_implicit_VR, is_little_endian)
+                        self.command_set = decode(self.encoded_command_set, True, True)
 
                     # Determine which DIMSE Message class to use
                     self.__class__ = _MESSAGE_TYPES[
-                        cast(int, self.command_set.CommandField)
+                        cast(int, self._command_value(0x00000100))
                     ][1]
 
                     # Determine if a Data Set is present by checking for
                     #   (0000, 0800) CommandDataSetType US 1. If the value is
                     #   0x0101 no dataset present, otherwise one is.
-                    if self.command_set.CommandDataSetType == 0x0101:
+                    if self._command_value(0x00000800) == 0x0101:
                         # By returning True we're indicating that the message
                         #   has been completely decoded
+                        self._nr_pdvs = index + 1
                         return True
 
                     # Data Set is present
                     if _config.STORE_RECV_CHUNKED_DATASET and isinstance(
                         self, C_STORE_RQ
                     ):
-                        # delete=False is a workaround for Windows
-                        # Setting delete=True prevents us from re-opening
-                        # the file after it is opened by NamedTemporaryFile
-                        # below.
-                        self._data_set_file = cast(
-                            "NTF",
-                            NamedTemporaryFile(delete=False, mode="wb", suffix=".dcm"),
+                        assoc = cast("Association", assoc)
+                        cx = assoc._accepted_cx[context_id]
+                        file_meta = create_file_meta(
+                            sop_class_uid=self._command_value(0x00000002),
+                            sop_instance_uid=self._command_value(0x00001000),
+                            transfer_syntax=cx.transfer_syntax[0],
                         )
-                        self._data_set_path = Path(self._data_set_file.name)
+
+                        writer = None
+                        if assoc.ae.dataset_writer:
+                            writer = assoc.ae.dataset_writer(file_meta)
+
+                        self._data_set_file = writer or DatasetWriter()
+                        self._data_set_path = self._data_set_file.open()
+
                         # Write the File Meta
                         self._data_set_file.write(b"\x00" * 128)
                         self._data_set_file.write(b"DICM")
-
-                        cs = self.command_set
-                        cx = cast("Association", assoc)._accepted_cx[context_id]
-                        sop_class = cast(UID, cs.AffectedSOPClassUID)
-                        sop_instance = cast(UID, cs.AffectedSOPInstanceUID)
                         write_file_meta_info(
                             self._data_set_file,  # type: ignore
-                            create_file_meta(
-                                sop_class_uid=sop_class,
-                                sop_instance_uid=sop_instance,
-                                transfer_syntax=cx.transfer_syntax[0],
-                            ),
+                            file_meta,
                         )
 
             # DATA SET
@@ -489,24 +882,38 @@ class DIMSEMessage:
                 # As with the command set, the data set may be spread over
                 #   a number of fragments in each P-DATA primitive and a
                 #   number of P-DATA primitives.
+                # The fragment is written from a view of the PDV so it's only
+                #   copied once, into the data set or its file
+                fragment = memoryview(data)[1:]
                 if self._data_set_file:
-                    self._data_set_file.write(data[1:])
-                    self._data_set_file.file.flush()
+                    self._data_set_file.write(fragment)
                 else:
-                    cast(BytesIO, self.data_set).write(data[1:])
+                    cast(BytesIO, self.data_set).write(fragment)
 
                 # The final data set fragment (xxxxxx10) has been added
                 if control_header_byte & 2 != 0:
+                    if self._data_set_file:
+                        # Only moved to its final location once the
+                        #   EVT_C_STORE handler has succeeded
+                        self._data_set_path = self._data_set_file.finish()
+
                     # By returning True we're indicating that the message
                     #   has been completely decoded
+                    self._nr_pdvs = index + 1
                     return True
 
         # We return False to indicate that the message isn't yet fully decoded
         return False
 
-    def encode_msg(self, context_id: int, max_pdu_length: int) -> Iterator[P_DATA]:
+    def encode_msg(
+        self, context_id: int, max_pdu_length: int, pack: bool = False
+    ) -> Iterator[P_DATA]:
         """Yield P-DATA primitives for the current DIMSE Message.
 
+        .. versionchanged:: 3.1
+
+            Added the `pack` keyword parameter.
+
         **Encoding**
 
         The encoding of the Command Set shall be *Little Endian Implicit VR*,
@@ -529,6 +936,12 @@ class DIMSEMessage:
             The *ID* of the agreed presentation context.
         max_pdu_length : int
             The maximum PDV length (in bytes).
+        pack : bool, optional
+            If ``False`` (default) then each P-DATA primitive contains a single
+            PDV, otherwise each contains as many PDVs as will fit within
+            `max_pdu_length`, with fragments sized to fill the remaining space.
+            For example, the command set and a small data set will be sent
+            in the same P-DATA-TF PDU.
 
         Yields
         ------
@@ -546,8 +959,21 @@ class DIMSEMessage:
         self.context_id = context_id
 
         # The Command Set is always Little Endian Implicit VR (PS3.7 6.3.1)
-        #   encode(dataset, is_implicit_VR, is_little_endian)
-        encoded_command_set = cast(bytes, encode(self.command_set, True, True))
+        encoded_command_set = None
+        if self._command_values is not None:
+            encoded_command_set = self._encoded_command or _encode_command_set(
+                self._command_values
+            )
+
+        if encoded_command_set is None:
+            #   encode(dataset, is_implicit_VR, is_little_endian)
+            encoded_command_set = cast(bytes, encode(self.command_set, True, True))
+
+        if pack:
+            yield from self._encode_packed(
+                context_id, max_pdu_length, encoded_command_set
+            )
+            return
 
         # COMMAND SET (always)
         # Split the command set into fragments with maximum size max_pdu_length
@@ -577,7 +1003,19 @@ class DIMSEMessage:
 
         # DATASET (if available)
         #   Check that the Data Set is not empty
-        if self.data_set is not None:
+        deflater = self._deflater()
+        if deflater:
+            # Each fragment is only deflated when required
+            fragment_length = max(max_pdu_length - 6, 0)
+            is_last = False
+            while not is_last:
+                fragment, is_last = deflater.fragment(fragment_length)
+                pdata = P_DATA()
+                pdata.presentation_data_value_list.append(
+                    (context_id, (b"\x02" if is_last else b"\x00") + fragment)
+                )
+                yield pdata
+        elif self.data_set is not None:
             encoded_data_set = self.data_set.getvalue()
             if encoded_data_set:
                 # Split the data set into fragments with maximum
@@ -606,33 +1044,173 @@ class DIMSEMessage:
                 )
                 yield pdata
         elif self._data_set_path is not None:
-            # Read and send encoded dataset from file
-            # Buffer size determined by io.DEFAULT_BUFFER_SIZE
-            self._data_set_path = cast(tuple[Path, int], self._data_set_path)
-            with open(self._data_set_path[0], "rb") as f:
-                end = f.seek(0, 2)
-                length = end - f.seek(self._data_set_path[1])
-
-                if max_pdu_length == 0:
-                    nr_fragments = 1
-                    max_pdu_length = length + 6
-                else:
-                    nr_fragments = ceil(length / (max_pdu_length - 6))
-
-                # First to (n - 1)th dataset fragment - bits xxxxxx00
-                for ii in range(int(nr_fragments - 1)):
-                    pdata = P_DATA()
-                    pdata.presentation_data_value_list.append(
-                        (context_id, b"\x00" + f.read(max_pdu_length - 6))
-                    )
-                    yield pdata
+            # Send encoded dataset from file, the fragments are only read when
+            #   sent so they can be sent directly from the file
+            path, offset = cast(tuple[Path, int], self._data_set_path)
+            length = max(path.stat().st_size - offset, 0)
+            # All the fragments share the one file handle
+            source = _FileSource(path)
+
+            if max_pdu_length == 0:
+                nr_fragments = 1
+                fragment_length = length
+            else:
+                fragment_length = max_pdu_length - 6
+                nr_fragments = ceil(length / fragment_length)
 
-                # Last dataset fragment - bits xxxxxx10
+            # First to (n - 1)th dataset fragment - bits xxxxxx00
+            for ii in range(int(nr_fragments - 1)):
                 pdata = P_DATA()
                 pdata.presentation_data_value_list.append(
-                    (context_id, b"\x02" + f.read(max_pdu_length - 6))
+                    (
+                        context_id,
+                        _FileFragment(b"\x00", source, offset, fragment_length),
+                    )
                 )
                 yield pdata
+                offset += fragment_length
+                length -= fragment_length
+
+            # Last dataset fragment - bits xxxxxx10
+            pdata = P_DATA()
+            pdata.presentation_data_value_list.append(
+                (context_id, _FileFragment(b"\x02", source, offset, length))
+            )
+            yield pdata
+
+    def _encode_packed(
+        self, context_id: int, max_pdu_length: int, encoded_command_set: bytes
+    ) -> Iterator[P_DATA]:
+        """Yield P-DATA primitives for the current DIMSE message, each with
+        as many PDVs as will fit within `max_pdu_length`.
+
+        Parameters
+        ----------
+        context_id : int
+            The *ID* of the agreed presentation context.
+        max_pdu_length : int
+            The maximum PDV list length (in bytes), ``0`` for no maximum.
+        encoded_command_set : bytes
+            The encoded command set.
+
+        Yields
+        ------
+        pdu_primitives.P_DATA
+            The current DIMSE message as one or more P-DATA service
+            primitives.
+        """
+        if 0 < max_pdu_length < 7:
+            raise ValueError("'max_pdu_length' cannot be between 1 and 7.")
+
+        # (header, last fragment header, length, fragment(header, offset, size))
+        parts: list[tuple[bytes, bytes, int, Callable[..., Any]]] = [
+            (
+                b"\x01",
+                b"\x03",
+                len(encoded_command_set),
+                lambda header, offset, size: (
+                    header + encoded_command_set[offset : offset + size]
+                ),
+            )
+        ]
+        # The length of a deflated dataset isn't known in advance, so it's
+        #   handled separately after the other parts
+        deflater = self._deflater()
+        if deflater is None and self.data_set is not None:
+            encoded_data_set = self.data_set.getvalue()
+            if encoded_data_set:
+                parts.append(
+                    (
+                        b"\x00",
+                        b"\x02",
+                        len(encoded_data_set),
+                        lambda header, offset, size: (
+                            header + encoded_data_set[offset : offset + size]
+                        ),
+                    )
+                )
+        elif deflater is None and self._data_set_path is not None:
+            # The fragments are only read from file when sent
+            path, start = cast(tuple[Path, int], self._data_set_path)
+            source = _FileSource(path)
+            parts.append(
+                (
+                    b"\x00",
+                    b"\x02",
+                    max(path.stat().st_size - start, 0),
+                    lambda header, offset, size: (
+                        _FileFragment(header, source, start + offset, size)
+                    ),
+                )
+            )
+
+        pdata = P_DATA()
+        # The space remaining in the current primitive's PDV list, each PDV
+        #   takes 6 bytes for the item length, context ID and control header
+        space = max_pdu_length
+        for header, last_header, length, fragment in parts:
+            offset = 0
+            while True:
+                if max_pdu_length:
+                    # Start a new primitive if there's no room for any data
+                    if space < 6 + min(length - offset, 1):
+                        yield pdata
+                        pdata = P_DATA()
+                        space = max_pdu_length
+
+                    size = min(length - offset, space - 6)
+                    space -= 6 + size
+                else:
+                    size = length - offset
+
+                end = offset + size
+                value = fragment(last_header if end == length else header, offset, size)
+                pdata.presentation_data_value_list.append((context_id, value))
+                offset = end
+                if offset == length:
+                    break
+
+        is_last = deflater is None
+        while not is_last:
+            deflater = cast(_Deflater, deflater)
+            if max_pdu_length:
+                if space < 7:
+                    yield pdata
+                    pdata = P_DATA()
+                    space = max_pdu_length
+
+                data, is_last = deflater.fragment(space - 6)
+                space -= 6 + len(data)
+            else:
+                data, is_last = deflater.fragment(0)
+
+            value = (b"\x02" if is_last else b"\x00") + data
+            pdata.presentation_data_value_list.append((context_id, value))
+
+        yield pdata
+
+    def _deflater(self) -> _Deflater | None:
+        """Return a :class:`_Deflater` for the encoded dataset, or ``None``
+        if the dataset isn't to be deflated or there's no dataset.
+        """
+        if not self._deflate_data_set:
+            return None
+
+        if self.data_set is not None:
+            encoded_data_set = memoryview(self.data_set.getvalue())
+            if not encoded_data_set:
+                return None
+
+            return _Deflater(
+                encoded_data_set[idx : idx + _DEFLATE_CHUNK_SIZE]
+                for idx in range(0, len(encoded_data_set), _DEFLATE_CHUNK_SIZE)
+            )
+
+        if self._data_set_path is not None:
+            path, offset = cast(tuple[Path, int], self._data_set_path)
+            return _Deflater(_read_chunks(path, offset))
+
+        return None
 
     @staticmethod
     def _generate_pdv_fragments(
@@ -708,16 +1286,23 @@ class DIMSEMessage:
         # Command Set
         # For each parameter in the primitive, set the appropriate value
         #   from the Message's Command Set elements
-        for elem in self.command_set:
-            if hasattr(primitive, elem.keyword):
-                value = elem.value
-                if elem.VM > 1 and elem.tag not in _MULTIVALUE_TAGS:
-                    LOGGER.warning(
-                        f"Non-conformant VM {elem.VM} for '{elem.keyword}', "
-                        "taking the first value"
-                    )
-                    value = value[0]
-                setattr(primitive, elem.keyword, value)
+        if self._command_values is not None:
+            for tag, value in self._command_values.items():
+                keyword = _COMMAND_ELEMENTS[tag][1]
+                if hasattr(primitive, keyword):
+                    setattr(primitive, keyword, value)
+
+        else:
+            for elem in self.command_set:
+                if hasattr(primitive, elem.keyword):
+                    value = elem.value
+                    if elem.VM > 1 and elem.tag not in _MULTIVALUE_TAGS:
+                        LOGGER.warning(
+                            f"Non-conformant VM {elem.VM} for '{elem.keyword}', "
+                            "taking the first value"
+                        )
+                        value = value[0]
+                    setattr(primitive, elem.keyword, value)
 
         # Datasets
         # Set the primitive's DataSet/Identifier/etc attribute
@@ -755,34 +1340,42 @@ class DIMSEMessage:
 
         # Command Set
         # Convert the message command set to the primitive attributes
-        for elem in self.command_set:
-            # Use the element keyword as these should match the parameter
-            #   names in the primitive
-            if hasattr(primitive, elem.keyword):
-                # If value hasn't been set for a parameter then delete
-                #   the corresponding element
-                attr = getattr(primitive, elem.keyword)
-                if attr is not None:
-                    elem.value = attr
-                else:
-                    del self.command_set[elem.tag]
+        if self._command_values is not None:
+            values = self._command_values
+            for tag in list(values):
+                # Use the element keyword as these should match the parameter
+                #   names in the primitive
+                keyword = _COMMAND_ELEMENTS[tag][1]
+                if hasattr(primitive, keyword):
+                    # If value hasn't been set for a parameter then delete
+                    #   the corresponding element
+                    attr = getattr(primitive, keyword)
+                    if attr is not None:
+                        values[tag] = attr
+                    else:
+                        del values[tag]
+        else:
+            for elem in self.command_set:
+                if hasattr(primitive, elem.keyword):
+                    attr = getattr(primitive, elem.keyword)
+                    if attr is not None:
+                        elem.value = attr
+                    else:
+                        del self.command_set[elem.tag]
 
-        # There's a one-to-one relationship in the _MESSAGE_TYPES dict, so
-        #   invert it for convenience
-        rev_type = {vv[0]: kk for kk, vv in _MESSAGE_TYPES.items()}
-        self.command_set.CommandField = rev_type[cls_type_name]
+        self._set_command_value(0x00000100, _MESSAGE_FIELDS[cls_type_name])
 
         # Data Set
         # Default to no Data Set
         self.data_set = BytesIO()
-        self.command_set.CommandDataSetType = 0x0101
+        dataset_type = 0x0101
 
         try:
             # These message types *may* have a dataset
             dataset_keyword = _DATASET_KEYWORDS[self.__class__.__name__]
             self.data_set = getattr(primitive, dataset_keyword)
             if self.data_set:
-                self.command_set.CommandDataSetType = 0x0001
+                dataset_type = 0x0001
         except KeyError:
             # The following message types never have a dataset
             # 'C_ECHO_RQ', 'C_ECHO_RSP', 'N_DELETE_RQ', 'C_STORE_RSP',
@@ -791,11 +1384,23 @@ class DIMSEMessage:
 
         self._data_set_path = getattr(primitive, "_dataset_path", None)
         if self._data_set_path:
-            self.command_set.CommandDataSetType = 0x0001
+            dataset_type = 0x0001
+
+        self._deflate_data_set = getattr(primitive, "_deflate_dataset", False)
+
+        self._set_command_value(0x00000800, dataset_type)
 
         # Set the Command Set length
         self._set_command_group_length()
 
+    def _set_command_value(self, tag: int, value: Any) -> None:
+        """Set the `value` of the command set element with `tag`."""
+        if self._command_values is not None:
+            self._command_values[tag] = value
+            self._encoded_command = None
+        else:
+            self.command_set[tag] = DataElement(tag, _COMMAND_ELEMENTS[tag][0], value)
+
     def _set_command_group_length(self) -> None:
         """Reset the Command Group Length element value.
 
@@ -803,6 +1408,18 @@ class DIMSEMessage:
         values, this should be called to set the (Command Group Length* element
         value correctly.
         """
+        if self._command_values is not None:
+            self._command_values[0x00000000] = 0
+            encoded = _encode_command_set(self._command_values)
+            if encoded is not None:
+                # Exclude the encoded Command Group Length element itself
+                length = len(encoded) - 12
+                self._command_values[0x00000000] = length
+                self._encoded_command = b"".join(
+                    (_GROUP_LENGTH_HEADER, _UL.pack(length), encoded[12:])
+                )
+                return
+
         # Remove CommandGroupLength to stop it messing up the length calc
         del self.command_set.CommandGroupLength
 
@@ -814,95 +1431,95 @@ class DIMSEMessage:
 
 # Create DIMSEMessage subclasses
 class C_STORE_RQ(DIMSEMessage):
-    pass
+    __slots__ = ()
 
 
 class C_STORE_RSP(DIMSEMessage):
-    pass
+    __slots__ = ()
 
 
 class C_FIND_RQ(DIMSEMessage):
-    pass
+    __slots__ = ()
 
 
 class C_FIND_RSP(DIMSEMessage):
-    pass
+    __slots__ = ()
 
 
 class C_GET_RQ(DIMSEMessage):
-    pass
+    __slots__ = ()
 
 
 class C_GET_RSP(DIMSEMessage):
-    pass
+    __slots__ = ()
 
 
 class C_MOVE_RQ(DIMSEMessage):
-    pass
+    __slots__ = ()
 
 
 class C_MOVE_RSP(DIMSEMessage):
-    pass
+    __slots__ = ()
 
 
 class C_ECHO_RQ(DIMSEMessage):
-    pass
+    __slots__ = ()
 
 
 class C_ECHO_RSP(DIMSEMessage):
-    pass
+    __slots__ = ()
 
 
 class C_CANCEL_RQ(DIMSEMessage):
-    pass
+    __slots__ = ()
 
 
 class N_EVENT_REPORT_RQ(DIMSEMessage):
-    pass
+    __slots__ = ()
 
 
 class N_EVENT_REPORT_RSP(DIMSEMessage):
-    pass
+    __slots__ = ()
 
 
 class N_GET_RQ(DIMSEMessage):
-    pass
+    __slots__ = ()
 
 
 class N_GET_RSP(DIMSEMessage):
-    pass
+    __slots__ = ()
 
 
 class N_SET_RQ(DIMSEMessage):
-    pass
+    __slots__ = ()
 
 
 class N_SET_RSP(DIMSEMessage):
-    pass
+    __slots__ = ()
 
 
 class N_ACTION_RQ(DIMSEMessage):
-    pass
+    __slots__ = ()
 
 
 class N_ACTION_RSP(DIMSEMessage):
-    pass
+    __slots__ = ()
 
 
 class N_CREATE_RQ(DIMSEMessage):
-    pass
+    __slots__ = ()
 
 
 class N_CREATE_RSP(DIMSEMessage):
-    pass
+    __slots__ = ()
 
 
 class N_DELETE_RQ(DIMSEMessage):
-    pass
+    __slots__ = ()
 
 
 class N_DELETE_RSP(DIMSEMessage):
-    pass
+    __slots__ = ()
 
 
 # Values from PS3.5
@@ -932,6 +1549,10 @@ _MESSAGE_TYPES = {
     0x8150: ("N-DELETE-RSP", N_DELETE_RSP),
 }
 
+# There's a one-to-one relationship in the _MESSAGE_TYPES dict, so
+#   invert it for convenience
+_MESSAGE_FIELDS = {name: field for field, (name, _) in _MESSAGE_TYPES.items()}
+
 _DATASET_KEYWORDS = {
     "C_STORE_RQ": "DataSet",
     "C_FIND_RQ": "Identifier",
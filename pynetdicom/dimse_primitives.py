@@ -10,7 +10,7 @@ from collections.abc import Sequence
 from io import BytesIO
 import logging
 from pathlib import Path
-from typing import TYPE_CHECKING, TypeAlias
+from typing import TYPE_CHECKING, Any, TypeAlias, TypeVar
 import warnings
 
 from pydicom.tag import Tag, BaseTag
@@ -21,17 +21,7 @@ from pynetdicom.utils import set_ae, decode_bytes, set_uid
 
 
 if TYPE_CHECKING:  # pragma: no cover
-    from io import BufferedWriter
-    from typing import Protocol  # Python 3.8+
-
-    class NTF(Protocol):
-        # Protocol for a NamedTemporaryFile
-        name: str
-        file: BufferedWriter
-
-        def write(self, data: bytes) -> bytes: ...
-
-        def close(self) -> None: ...
+    from pynetdicom.dsutils import DatasetWriter
 
 
 LOGGER = logging.getLogger(__name__)
@@ -42,6 +32,7 @@ DimseServiceType: TypeAlias = (
     "N_ACTION | N_CREATE | N_DELETE | N_EVENT_REPORT | N_GET | N_SET"
 )
 DimsePrimitiveType: TypeAlias = "C_CANCEL | DimseServiceType"
+_T = TypeVar("_T", bound="DIMSEPrimitive")
 
 
 # pylint: disable=invalid-name
@@ -55,44 +46,138 @@ class DIMSEPrimitive:
     REQUEST_KEYWORDS: tuple[str, ...] = ()
     RESPONSE_KEYWORDS: tuple[str, ...] = ("MessageIDBeingRespondedTo", "Status")
 
-    _action_type_id: int | None = None
-    _affected_sop_class_uid: UID | None = None
-    _affected_sop_instance_uid: UID | None = None
-    _attribute_identifier_list: BaseTag | list[BaseTag] | None = None
-    _dataset: BytesIO | None = None
-    _event_type_id: int | None = None
-    _message_id: int | None = None
-    _message_id_being_responded_to: int | None = None
-    _move_destination: str | None = None
-    _move_originator_application_entity_title: str | None = None
-    _move_originator_message_id: int | None = None
-    _number_of_completed_suboperations: int | None = None
-    _number_of_failed_suboperations: int | None = None
-    _number_of_remaining_suboperations: int | None = None
-    _number_of_warning_suboperations: int | None = None
-    _priority: int = 0x02
-    _requested_sop_class_uid: UID | None = None
-    _requested_sop_instance_uid: UID | None = None
-    _status: int | None = None
-
-    _context_id: int | None = None
-
-    # If we are sending a C-STORE service primitive:
-    #   If None then the dataset is encoded as BytesIO
-    #   If not None then the dataset is stored at (path, offset)
-    # If we are receiving a C-STORE service primitive:
-    #   If None then the dataset is encoded as BytesIO
-    #   If not None then the dataset is stored at _dataset_path
-    # self._dataset_path = None
-    # If we are sending a C-STORE service primitive:
-    #   Always None
-    # If we are receiving a C-STORE service primitive:
-    #   If None then the dataset is encoded as BytesIO
-    #   If not None then _dataset_file backs the dataset stored
-    #   at _dataset_path
-    # self._dataset_file = None
-    _dataset_path: Path | tuple[Path, int] | None = None
-    _dataset_file: "NTF | None" = None
+    # Parameter values are stored in slots rather than an instance __dict__
+    #   to reduce the size of each primitive, the plain (non-property)
+    #   parameters are added as slots by the subclasses
+    __slots__ = (
+        "_action_type_id",
+        "_affected_sop_class_uid",
+        "_affected_sop_instance_uid",
+        "_attribute_identifier_list",
+        "_dataset",
+        "_event_type_id",
+        "_message_id",
+        "_message_id_being_responded_to",
+        "_move_destination",
+        "_move_originator_application_entity_title",
+        "_move_originator_message_id",
+        "_number_of_completed_suboperations",
+        "_number_of_failed_suboperations",
+        "_number_of_remaining_suboperations",
+        "_number_of_warning_suboperations",
+        "_priority",
+        "_requested_sop_class_uid",
+        "_requested_sop_instance_uid",
+        "_status",
+        "_context_id",
+        "_dataset_path",
+        "_dataset_file",
+        "_deflate_dataset",
+    )
+
+    # The storage slot used by each property parameter, used by _trusted()
+    _STORAGE: dict[str, str] = {
+        "ActionInformation": "_dataset",
+        "ActionReply": "_dataset",
+        "ActionTypeID": "_action_type_id",
+        "AffectedSOPClassUID": "_affected_sop_class_uid",
+        "AffectedSOPInstanceUID": "_affected_sop_instance_uid",
+        "AttributeIdentifierList": "_attribute_identifier_list",
+        "AttributeList": "_dataset",
+        "DataSet": "_dataset",
+        "EventInformation": "_dataset",
+        "EventReply": "_dataset",
+        "EventTypeID": "_event_type_id",
+        "Identifier": "_dataset",
+        "MessageID": "_message_id",
+        "MessageIDBeingRespondedTo": "_message_id_being_responded_to",
+        "ModificationList": "_dataset",
+        "MoveDestination": "_move_destination",
+        "MoveOriginatorApplicationEntityTitle": (
+            "_move_originator_application_entity_title"
+        ),
+        "MoveOriginatorMessageID": "_move_originator_message_id",
+        "NumberOfCompletedSuboperations": "_number_of_completed_suboperations",
+        "NumberOfFailedSuboperations": "_number_of_failed_suboperations",
+        "NumberOfRemainingSuboperations": "_number_of_remaining_suboperations",
+        "NumberOfWarningSuboperations": "_number_of_warning_suboperations",
+        "Priority": "_priority",
+        "RequestedSOPClassUID": "_requested_sop_class_uid",
+        "RequestedSOPInstanceUID": "_requested_sop_instance_uid",
+        "Status": "_status",
+    }
+
+    def __init__(self) -> None:
+        self._action_type_id: int | None = None
+        self._affected_sop_class_uid: UID | None = None
+        self._affected_sop_instance_uid: UID | None = None
+        self._attribute_identifier_list: BaseTag | list[BaseTag] | None = None
+        self._dataset: BytesIO | None = None
+        self._event_type_id: int | None = None
+        self._message_id: int | None = None
+        self._message_id_being_responded_to: int | None = None
+        self._move_destination: str | None = None
+        self._move_originator_application_entity_title: str | None = None
+        self._move_originator_message_id: int | None = None
+        self._number_of_completed_suboperations: int | None = None
+        self._number_of_failed_suboperations: int | None = None
+        self._number_of_remaining_suboperations: int | None = None
+        self._number_of_warning_suboperations: int | None = None
+        self._priority: int = 0x02
+        self._requested_sop_class_uid: UID | None = None
+        self._requested_sop_instance_uid: UID | None = None
+        self._status: int | None = None
+
+        self._context_id: int | None = None
+
+        # If we are sending a C-STORE service primitive:
+        #   If None then the dataset is encoded as BytesIO
+        #   If not None then the dataset is stored at (path, offset)
+        # If we are receiving a C-STORE service primitive:
+        #   If None then the dataset is encoded as BytesIO
+        #   If not None then the dataset is stored at _dataset_path
+        self._dataset_path: Path | tuple[Path, int] | None = None
+        # If we are sending a C-STORE service primitive:
+        #   Always None
+        # If we are receiving a C-STORE service primitive:
+        #   If None then the dataset is encoded as BytesIO
+        #   If not None then _dataset_file is the DatasetWriter used to write
+        #   the dataset stored at _dataset_path
+        self._dataset_file: "DatasetWriter | None" = None
+        # If we are sending a C-STORE service primitive:
+        #   If True then the dataset is encoded as Explicit VR Little Endian
+        #   and will be deflated as it's sent
+        self._deflate_dataset: bool = False
+
+    @classmethod
+    def _trusted(cls: type[_T], **kwargs: Any) -> _T:
+        """Return a new primitive with its parameters set without validation.
+
+        .. versionadded:: 3.1
+
+        Intended for internal use when building a primitive from values that
+        have already been validated, such as a response that copies the
+        parameters of the request it's responding to. Values are stored
+        as-is, so UIDs must already be :class:`~pydicom.uid.UID` and datasets
+        must be :class:`~io.BytesIO`.
+
+        Parameters
+        ----------
+        **kwargs
+            The parameter values to use, keyed by the parameter's DICOM
+            element keyword, such as ``MessageID=1``.
+
+        Returns
+        -------
+        DIMSEPrimitive
+            The primitive, as an instance of the class used to call the method.
+        """
+        primitive = cls()
+        storage = DIMSEPrimitive._STORAGE
+        for keyword, value in kwargs.items():
+            setattr(primitive, storage.get(keyword, keyword), value)
+
+        return primitive
 
     @property
     def AffectedSOPClassUID(self) -> UID | None:
@@ -477,7 +562,11 @@ class C_STORE(DIMSEPrimitive):
         "DataSet",
     )
 
+    __slots__ = ("ErrorComment", "OffendingElement")
+
     def __init__(self) -> None:
+        super().__init__()
+
         # Variable names need to match the corresponding DICOM Element keywords
         #   in order for the DIMSE Message classes to be built correctly.
         # Changes to the variable names can be made provided the DIMSEMessage()
@@ -488,9 +577,9 @@ class C_STORE(DIMSEPrimitive):
         # self.AffectedSOPClassUID: UID | None = None
         # self.AffectedSOPInstanceUID: UID | None = None
         # self.Priority = 0x02
-        self.MoveOriginatorApplicationEntityTitle: str | None = None
-        self.MoveOriginatorMessageID: int | None = None
-        self.DataSet: BytesIO | None = None
+        # self.MoveOriginatorApplicationEntityTitle: str | None = None
+        # self.MoveOriginatorMessageID: int | None = None
+        # self.DataSet: BytesIO | None = None
         # self.Status: int | None = None
 
         # Optional Command Set elements used with specific Status values
@@ -678,7 +767,11 @@ class C_FIND(DIMSEPrimitive):
     )
     REQUEST_KEYWORDS = ("MessageID", "AffectedSOPClassUID", "Priority", "Identifier")
 
+    __slots__ = ("ErrorComment", "OffendingElement")
+
     def __init__(self) -> None:
+        super().__init__()
+
         # Variable names need to match the corresponding DICOM Element keywords
         #   in order for the DIMSE Message classes to be built correctly.
         # Changes to the variable names can be made provided the DIMSEMessage()
@@ -688,7 +781,7 @@ class C_FIND(DIMSEPrimitive):
         # self.MessageIDBeingRespondedTo = None
         # self.AffectedSOPClassUID = None
         # self.Priority = 0x02
-        self.Identifier = None
+        # self.Identifier = None
         # self.Status = None
 
         # Optional Command Set elements used in with specific Status values
@@ -808,7 +901,11 @@ class C_GET(DIMSEPrimitive):
     )
     REQUEST_KEYWORDS = ("MessageID", "AffectedSOPClassUID", "Priority", "Identifier")
 
+    __slots__ = ("ErrorComment", "OffendingElement")
+
     def __init__(self) -> None:
+        super().__init__()
+
         # Variable names need to match the corresponding DICOM Element keywords
         #   in order for the DIMSE Message classes to be built correctly.
         # Changes to the variable names can be made provided the DIMSEMessage()
@@ -818,12 +915,12 @@ class C_GET(DIMSEPrimitive):
         # self.MessageIDBeingRespondedTo = None
         # self.AffectedSOPClassUID = None
         # self.Priority = 0x02
-        self.Identifier = None
+        # self.Identifier = None
         # self.Status = None
-        self.NumberOfRemainingSuboperations = None
-        self.NumberOfCompletedSuboperations = None
-        self.NumberOfFailedSuboperations = None
-        self.NumberOfWarningSuboperations = None
+        # self.NumberOfRemainingSuboperations = None
+        # self.NumberOfCompletedSuboperations = None
+        # self.NumberOfFailedSuboperations = None
+        # self.NumberOfWarningSuboperations = None
 
         # For Failure statuses 0xA701, 0xA900
         self.ErrorComment = None
@@ -1000,7 +1097,11 @@ class C_MOVE(DIMSEPrimitive):
         "MoveDestination",
     )
 
+    __slots__ = ("ErrorComment", "OffendingElement")
+
     def __init__(self) -> None:
+        super().__init__()
+
         # Variable names need to match the corresponding DICOM Element keywords
         #   in order for the DIMSE Message classes to be built correctly.
         # Changes to the variable names can be made provided the DIMSEMessage()
@@ -1010,13 +1111,13 @@ class C_MOVE(DIMSEPrimitive):
         # self.MessageIDBeingRespondedTo = None
         # self.AffectedSOPClassUID = None
         # self.Priority = 0x02
-        self.MoveDestination = None
-        self.Identifier = None
+        # self.MoveDestination = None
+        # self.Identifier = None
         # self.Status = None
-        self.NumberOfRemainingSuboperations = None
-        self.NumberOfCompletedSuboperations = None
-        self.NumberOfFailedSuboperations = None
-        self.NumberOfWarningSuboperations = None
+        # self.NumberOfRemainingSuboperations = None
+        # self.NumberOfCompletedSuboperations = None
+        # self.NumberOfFailedSuboperations = None
+        # self.NumberOfWarningSuboperations = None
 
         # Optional Command Set elements used in with specific Status values
         # For Failure statuses 0xA900
@@ -1182,7 +1283,11 @@ class C_ECHO(DIMSEPrimitive):
     STATUS_OPTIONAL_KEYWORDS = ("ErrorComment",)
     REQUEST_KEYWORDS = ("MessageID", "AffectedSOPClassUID")
 
+    __slots__ = ("ErrorComment",)
+
     def __init__(self) -> None:
+        super().__init__()
+
         # Variable names need to match the corresponding DICOM Element keywords
         #   in order for the DIMSE Message classes to be built correctly.
         # Changes to the variable names can be made provided the DIMSEMessage()
@@ -1220,6 +1325,13 @@ class C_CANCEL:
     * DICOM Standard, Part 7, :dcm:`Section 9.3.2.3<part07/sect_9.3.2.3.html>`
     """
 
+    __slots__ = (
+        "_message_id_being_responded_to",
+        "_context_id",
+        "_dataset_path",
+        "_dataset_file",
+    )
+
     def __init__(self) -> None:
         """Initialise the C_CANCEL"""
         # Variable names need to match the corresponding DICOM Element keywords
@@ -1230,7 +1342,7 @@ class C_CANCEL:
         self._message_id_being_responded_to: int | None = None
         self._context_id: int | None = None
         self._dataset_path: Path | tuple[Path, int] | None = None
-        self._dataset_file: "NTF" | None = None
+        self._dataset_file: "DatasetWriter | None" = None
 
     @property
     def MessageIDBeingRespondedTo(self) -> int | None:
@@ -1325,14 +1437,18 @@ class N_EVENT_REPORT(DIMSEPrimitive):
         "AffectedSOPInstanceUID",
     )
 
+    __slots__ = ("ErrorComment", "ErrorID")
+
     def __init__(self) -> None:
+        super().__init__()
+
         # self.MessageID = None
         # self.MessageIDBeingRespondedTo = None
         # self.AffectedSOPClassUID = None
         # self.AffectedSOPInstanceUID = None
-        self.EventTypeID = None
-        self.EventInformation = None
-        self.EventReply = None
+        # self.EventTypeID = None
+        # self.EventInformation = None
+        # self.EventReply = None
         # self.Status = None
 
         # Optional status elements
@@ -1466,15 +1582,19 @@ class N_GET(DIMSEPrimitive):
     )
     REQUEST_KEYWORDS = ("MessageID", "RequestedSOPClassUID", "RequestedSOPInstanceUID")
 
+    __slots__ = ("ErrorComment", "ErrorID")
+
     def __init__(self) -> None:
+        super().__init__()
+
         # self.MessageID = None
         # self.MessageIDBeingRespondedTo = None
         # self.RequestedSOPClassUID = None
         # self.RequestedSOPInstanceUID = None
-        self.AttributeIdentifierList = None
+        # self.AttributeIdentifierList = None
         # self.AffectedSOPClassUID = None
         # self.AffectedSOPInstanceUID = None
-        self.AttributeList = None
+        # self.AttributeList = None
         # self.Status = None
 
         # (Optional) elements for specific status values
@@ -1648,13 +1768,17 @@ class N_SET(DIMSEPrimitive):
         "ModificationList",
     )
 
+    __slots__ = ("AttributeIdentifierList", "ErrorComment", "ErrorID")
+
     def __init__(self) -> None:
+        super().__init__()
+
         # self.MessageID = None
         # self.MessageIDBeingRespondedTo = None
         # self.RequestedSOPClassUID = None
         # self.RequestedSOPInstanceUID = None
-        self.ModificationList = None
-        self.AttributeList = None
+        # self.ModificationList = None
+        # self.AttributeList = None
         # self.AffectedSOPClassUID = None
         # self.AffectedSOPInstanceUID = None
         # self.Status = None
@@ -1808,16 +1932,20 @@ class N_ACTION(DIMSEPrimitive):
         "ActionTypeID",
     )
 
+    __slots__ = ("ErrorComment", "ErrorID")
+
     def __init__(self) -> None:
+        super().__init__()
+
         # self.MessageID = None
         # self.MessageIDBeingRespondedTo = None
         # self.RequestedSOPClassUID = None
         # self.RequestedSOPInstanceUID = None
-        self.ActionTypeID = None
-        self.ActionInformation = None
+        # self.ActionTypeID = None
+        # self.ActionInformation = None
         # self.AffectedSOPClassUID = None
         # self.AffectedSOPInstanceUID = None
-        self.ActionReply = None
+        # self.ActionReply = None
         # self.Status = None
 
         # Optional status elements
@@ -1977,12 +2105,16 @@ class N_CREATE(DIMSEPrimitive):
     )
     REQUEST_KEYWORDS = ("MessageID", "AffectedSOPClassUID")
 
+    __slots__ = ("ErrorComment", "ErrorID")
+
     def __init__(self) -> None:
+        super().__init__()
+
         # self.MessageID = None
         # self.MessageIDBeingRespondedTo = None
         # self.AffectedSOPClassUID = None
         # self.AffectedSOPInstanceUID = None
-        self.AttributeList = None
+        # self.AttributeList = None
         # self.Status = None
 
         # Optional elements
@@ -2075,7 +2207,11 @@ class N_DELETE(DIMSEPrimitive):
     )
     REQUEST_KEYWORDS = ("MessageID", "RequestedSOPClassUID", "RequestedSOPInstanceUID")
 
+    __slots__ = ("ErrorComment", "ErrorID")
+
     def __init__(self) -> None:
+        super().__init__()
+
         # self.MessageID = None
         # self.MessageIDBeingRespondedTo = None
         # self.RequestedSOPClassUID = None
@@ -2,16 +2,21 @@
 
 from io import BytesIO
 import logging
+import os
 from pathlib import Path
+import sqlite3
+import tempfile
+import threading
+from typing import Any, BinaryIO, Sequence, cast
 import zlib
 
 from pydicom import Dataset
 from pydicom.dataset import FileMetaDataset
 from pydicom.dataelem import DataElement
 from pydicom.filebase import DicomBytesIO
-from pydicom.filereader import read_dataset, read_preamble
+from pydicom.filereader import read_dataset, read_partial, read_preamble
 from pydicom.filewriter import write_dataset, write_file_meta_info
-from pydicom.tag import BaseTag
+from pydicom.tag import BaseTag, Tag
 from pydicom.uid import UID
 
 from pynetdicom import PYNETDICOM_IMPLEMENTATION_UID, PYNETDICOM_IMPLEMENTATION_VERSION
@@ -20,6 +25,23 @@ from pynetdicom.utils import pretty_bytes
 
 LOGGER = logging.getLogger(__name__)
 
+# The elements read by read_header() by default
+HEADER_KEYWORDS = (
+    "SOPClassUID",
+    "SOPInstanceUID",
+    "StudyDate",
+    "StudyTime",
+    "AccessionNumber",
+    "Modality",
+    "PatientName",
+    "PatientID",
+    "StudyInstanceUID",
+    "SeriesInstanceUID",
+    "StudyID",
+    "SeriesNumber",
+    "InstanceNumber",
+)
+
 
 def create_file_meta(
     *,
@@ -298,3 +320,315 @@ def split_dataset(path: Path) -> tuple[Dataset, int]:
             fp, is_implicit_VR=False, is_little_endian=True, stop_when=_not_group_0002
         )
         return file_meta, fp.tell()
+
+
+class HeaderCache:
+    """An on-disk cache of the elements read from dataset files by
+    :func:`read_header`.
+
+    .. versionadded:: 3.1
+
+    Cached elements are keyed by the file's path, modification time and size,
+    so files that have changed since they were cached are read again. The
+    cache is stored as an SQLite database and may be shared between threads.
+
+    .. code-block:: python
+
+        from pynetdicom.dsutils import HeaderCache, read_header
+
+        with HeaderCache("headers.db") as cache:
+            for path in paths:
+                ds = read_header(path, cache=cache)
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        The path to the cache's database file, which will be created if it
+        doesn't exist.
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        self.path = Path(path)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS headers ("
+                "path TEXT, tags TEXT, mtime INTEGER, size INTEGER, "
+                "file_meta BLOB, dataset BLOB, PRIMARY KEY (path, tags))"
+            )
+
+        # The number of entries added since the last commit
+        self._pending = 0
+
+    def __enter__(self) -> "HeaderCache":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Write any new entries to disk and close the cache."""
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
+
+    def get(self, path: str | os.PathLike, tags: Sequence[int]) -> Dataset | None:
+        """Return the cached elements for the file at `path`.
+
+        Parameters
+        ----------
+        path : str | os.PathLike
+            The path to the dataset file.
+        tags : Sequence[int]
+            The tags of the elements that were read.
+
+        Returns
+        -------
+        pydicom.dataset.Dataset | None
+            The cached elements and File Meta Information, or ``None`` if
+            there's no entry for the file or it's been modified since it was
+            cached.
+        """
+        key, mtime, size = self._key(path, tags)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT mtime, size, file_meta, dataset FROM headers "
+                "WHERE path = ? AND tags = ?",
+                key,
+            ).fetchone()
+
+        if row is None or row[:2] != (mtime, size):
+            return None
+
+        # Cached as Explicit VR Little Endian, values are converted when used
+        ds = decode(BytesIO(row[3]), False, True)
+        ds.file_meta = FileMetaDataset(decode(BytesIO(row[2]), False, True))
+
+        return ds
+
+    def set(self, path: str | os.PathLike, tags: Sequence[int], ds: Dataset) -> None:
+        """Add the elements read from the file at `path` to the cache.
+
+        Parameters
+        ----------
+        path : str | os.PathLike
+            The path to the dataset file.
+        tags : Sequence[int]
+            The tags of the elements that were read.
+        ds : pydicom.dataset.Dataset
+            The elements that were read, including any File Meta Information.
+        """
+        key, mtime, size = self._key(path, tags)
+        file_meta = getattr(ds, "file_meta", None) or FileMetaDataset()
+        encoded_meta = encode(file_meta, False, True)
+        encoded_ds = encode(ds, False, True)
+        if encoded_meta is None or encoded_ds is None:
+            return
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO headers VALUES (?, ?, ?, ?, ?, ?)",
+                (*key, mtime, size, encoded_meta, encoded_ds),
+            )
+            # Commit in batches, committing each entry is much slower
+            self._pending += 1
+            if self._pending >= 1000:
+                self._conn.commit()
+                self._pending = 0
+
+    @staticmethod
+    def _key(
+        path: str | os.PathLike, tags: Sequence[int]
+    ) -> tuple[tuple[str, str], int, int]:
+        """Return the (path, tags) key and the modification time and size of
+        the file at `path`.
+        """
+        st = os.stat(path)
+        key = (os.path.abspath(path), ",".join(f"{tag:08X}" for tag in sorted(tags)))
+
+        return key, st.st_mtime_ns, st.st_size
+
+
+def read_header(
+    path: str | os.PathLike,
+    keywords: Sequence[str] | None = None,
+    cache: HeaderCache | None = None,
+) -> Dataset:
+    """Return the File Meta Information and selected elements from a dataset
+    file without reading the rest of the dataset.
+
+    .. versionadded:: 3.1
+
+    The dataset is only read up to the last of the elements in `keywords`, the
+    values of any other elements before it are skipped over without being
+    decoded. This makes it much faster than :func:`~pydicom.filereader.dcmread`
+    when only a few attributes such as the *SOP Class UID* are needed, for
+    example when finding the presentation contexts needed to send a large
+    number of files.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        The path to a dataset written in the DICOM File Format.
+    keywords : Sequence[str], optional
+        The keywords of the elements to read, if not used then the *SOP Class
+        UID*, *SOP Instance UID* and the Patient, Study, Series and Image
+        level Query/Retrieve keys in ``HEADER_KEYWORDS`` will be read.
+    cache : dsutils.HeaderCache, optional
+        If used then the cache to get the elements from, and to add them to if
+        the file hasn't been read before.
+
+    Returns
+    -------
+    pydicom.dataset.Dataset
+        The elements that were present in the dataset, with the File Meta
+        Information as its ``file_meta`` attribute.
+    """
+    tags = sorted(Tag(kw) for kw in (keywords or HEADER_KEYWORDS))
+    if cache is not None:
+        ds = cache.get(path, tags)
+        if ds is not None:
+            return ds
+
+    def _after_last(tag: BaseTag, VR: str | None, length: int) -> bool:
+        """Return True if the tag is after the last one to be read."""
+        return bool(tag > tags[-1])
+
+    with open(path, "rb") as fp:
+        ds = read_partial(fp, stop_when=_after_last, specific_tags=list(tags))
+
+    if cache is not None:
+        cache.set(path, tags, ds)
+
+    return ds
+
+
+class DatasetWriter:
+    """Write a dataset received in a C-STORE request to file as it arrives.
+
+    .. versionadded:: 3.1
+
+    Used when :attr:`~pynetdicom._config.STORE_RECV_CHUNKED_DATASET` is
+    ``True``, see :attr:`AE.dataset_writer
+    <pynetdicom.ae.ApplicationEntity.dataset_writer>` for how to use a
+    writer other than the default.
+
+    The dataset is written to a temporary file while it's being received. If
+    `path` is used then the temporary file is created in the same directory and
+    if the ``evt.EVT_C_STORE`` handler returns a success or warning status
+    it's atomically renamed to `path`, otherwise the temporary file is deleted
+    after the handler returns.
+
+    Parameters
+    ----------
+    path : str | os.PathLike | None, optional
+        The path the dataset should be stored at once it's been received,
+        any missing parent directories will be created. If ``None`` (default)
+        then the dataset will only be available during the ``evt.EVT_C_STORE``
+        handler.
+    buffer_size : int, optional
+        The size of the write buffer, in bytes (default ``1048576``).
+    preallocate : int, optional
+        If non-zero then the expected size of the file in bytes, which will be
+        used to preallocate disk space for it where supported.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike | None = None,
+        buffer_size: int = 1048576,
+        preallocate: int = 0,
+    ) -> None:
+        self.path = Path(path) if path is not None else None
+        self.buffer_size = buffer_size
+        self.preallocate = preallocate
+
+        self._file: BinaryIO | None = None
+        self._tmp_path: Path | None = None
+
+    def close(self) -> None:
+        """Close the file without moving it to its final location.
+
+        If the dataset hasn't been completely received or the writer is
+        temporary then the file will also be deleted.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+        if self._tmp_path is not None:
+            try:
+                os.unlink(self._tmp_path)
+            except OSError:
+                # This is best effort on e.g Windows where files may
+                # not be deleted while in use.
+                pass
+
+            self._tmp_path = None
+
+    def commit(self) -> Path:
+        """Move the dataset to its final location and return the path to the
+        file.
+
+        If the writer is temporary then the file isn't moved.
+        """
+        path = self.finish()
+        if self.path is None:
+            return path
+
+        os.replace(path, self.path)
+        self._tmp_path = None
+
+        return self.path
+
+    def finish(self) -> Path:
+        """Finish writing the dataset and return the path to the temporary
+        file.
+        """
+        if self._file is not None:
+            # Remove any preallocated space that wasn't used
+            self._file.truncate(self._file.tell())
+            self._file.close()
+            self._file = None
+
+        return cast(Path, self._tmp_path)
+
+    @property
+    def is_temporary(self) -> bool:
+        """Return ``True`` if the file is deleted after the ``evt.EVT_C_STORE``
+        handler returns.
+        """
+        return self.path is None
+
+    def open(self) -> Path:
+        """Open a temporary file for writing the dataset to and return its
+        path.
+        """
+        directory = None
+        prefix = None
+        if self.path is not None:
+            directory = self.path.parent
+            directory.mkdir(parents=True, exist_ok=True)
+            prefix = f".{self.path.name}."
+
+        fd, name = tempfile.mkstemp(suffix=".dcm", prefix=prefix, dir=directory)
+        self._tmp_path = Path(name)
+        self._file = open(fd, "wb", buffering=self.buffer_size)
+
+        if self.preallocate and hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(fd, 0, self.preallocate)
+            except OSError:
+                pass
+
+        return self._tmp_path
+
+    def write(self, data: bytes | memoryview) -> None:
+        """Write `data` to the file.
+
+        `data` may be a view of the association's receive buffer, so it must
+        be copied if kept after returning.
+        """
+        cast(BinaryIO, self._file).write(data)
@@ -4,12 +4,16 @@ Implements the DICOM Upper Layer service provider.
 
 import logging
 import queue
+import selectors
+import socket
 import struct
+import threading
 from threading import Thread
 import time
-from typing import TYPE_CHECKING, cast, Type
+from typing import TYPE_CHECKING, Any, Callable, cast, Type
 
 from pynetdicom import evt
+from pynetdicom._globals import DEFAULT_MAX_LENGTH
 from pynetdicom.fsm import StateMachine
 from pynetdicom.pdu import (
     A_ASSOCIATE_RQ,
@@ -30,12 +34,19 @@ from pynetdicom.pdu_primitives import (
     _PDUPrimitiveType,
 )
 from pynetdicom.timer import Timer
-from pynetdicom.transport import T_CONNECT
+from pynetdicom.transport import (
+    T_CONNECT,
+    AssociationSocket,
+    AsyncioAssociationSocket,
+    _get_event_loop,
+    _in_event_loop,
+)
 from pynetdicom.utils import make_target
 
 if TYPE_CHECKING:  # pragma: no cover
+    import asyncio
+
     from pynetdicom.association import Association
-    from pynetdicom.transport import AssociationSocket
 
     _QueueType = queue.Queue[_PDUPrimitiveType | T_CONNECT]
     _UserQueuePrimitives = A_ASSOCIATE | A_RELEASE | A_ABORT | A_P_ABORT
@@ -43,6 +54,36 @@ if TYPE_CHECKING:  # pragma: no cover
 
 LOGGER = logging.getLogger(__name__)
 
+# PDU type, reserved, PDU length
+UNPACK_PDU_HEADER = struct.Struct(">BBL").unpack_from
+
+
+class _WakeupQueue(queue.Queue):
+    """A :class:`queue.Queue` that calls `notify` whenever an item is added.
+
+    Used so that adding events or primitives for the DUL reactor from another
+    thread will wake it if it's waiting for activity.
+    """
+
+    def __init__(self, notify: Callable[[], None]) -> None:
+        super().__init__()
+        self._notify = notify
+
+    def put(self, item: Any, block: bool = True, timeout: float | None = None) -> None:
+        super().put(item, block, timeout)
+        self._notify()
+
+    def put_items(self, items: list[Any]) -> None:
+        """Add all of `items` to the queue before calling `notify`."""
+        with self.not_full:
+            for item in items:
+                self._put(item)
+                self.unfinished_tasks += 1
+
+            self.not_empty.notify(len(items))
+
+        self._notify()
+
 
 class DULServiceProvider(Thread):
     """The DICOM Upper Layer Service Provider.
@@ -65,6 +106,9 @@ class DULServiceProvider(Thread):
         The DICOM Upper Layer's State Machine.
     """
 
+    # The type of AssociationSocket used with the service provider
+    _socket_class: Type[AssociationSocket] = AssociationSocket
+
     def __init__(self, assoc: "Association") -> None:
         """Create a new DUL service provider for `assoc`.
 
@@ -79,32 +123,58 @@ class DULServiceProvider(Thread):
         self.socket: "AssociationSocket | None" = None
 
         # Tracks the events the state machine needs to process
-        self.event_queue: "queue.Queue[str]" = queue.Queue()
+        self.event_queue: "queue.Queue[str]" = _WakeupQueue(self._wakeup)
         # These queues provide communication between the DUL service
         #   user and the DUL service provider.
         # An event occurs when the DUL service user adds to
         #   the to_provider_queue
         # The queue contains A-ASSOCIATE, A-RELEASE, A-ABORT, A-P-ABORT, P-DATA and
         #   T-CONNECT primitives from the local user that are to be sent to the peer
-        self.to_provider_queue: "_QueueType" = queue.Queue()
+        self.to_provider_queue: "_QueueType" = _WakeupQueue(self._wakeup)
         # A primitive is sent to the service user when the DUL service provider
         # adds to the to_user_queue.
         self.to_user_queue: "queue.Queue[_UserQueuePrimitives]" = queue.Queue()
 
         # A queue storing PDUs received from the peer
         self._recv_pdu: "queue.Queue[_PDUType]" = queue.Queue()
+        # The buffer PDUs are received into, grown as required up to the
+        #   maximum PDU length we've negotiated. Received P-DATA-TF PDUs refer
+        #   to the buffer until they've been processed
+        self._recv_buffer = bytearray(6 + DEFAULT_MAX_LENGTH)
+        # The header of a P-DATA-TF PDU read while reading was paused, the rest
+        #   of the PDU is read once reading resumes
+        self._recv_header: bytes | None = None
+        # PDUs waiting to be sent to the peer
+        self._send_pending: list[_PDUType] = []
 
         # Set the (network) idle and ARTIM timers
         # Timeouts gets set after DUL init so these are temporary
-        self._idle_timer = Timer(60)
-        self.artim_timer = Timer(30)
+        # Rather than being checked every pass of the reactor, the timers
+        #   are checked by the shared timer wheel, which sets these flags
+        #   and wakes the reactor once they've expired
+        self._idle_expired = False
+        self._artim_expired = False
+        self._idle_timer = Timer(60, self._on_idle_timer)
+        self.artim_timer = Timer(30, self._on_artim_timer)
 
         # State machine - PS3.8 Section 9.2
         self.state_machine = StateMachine(self)
 
-        # Controls the minimum delay between loops in run() in seconds
-        # TODO: try and make this event based rather than running loops
+        # The delay used when waiting for the reactor to stop (in seconds)
         self._run_loop_delay = 0.001
+        # The maximum time the reactor will block waiting for activity (in
+        #   seconds), a safety net for changes that don't wake the reactor
+        #   such as the socket being closed from another thread
+        self._max_wait = 0.5
+
+        # The reactor blocks on the transport socket and the receiving end of
+        #   a wakeup socket pair, which is written to when an event or
+        #   primitive is queued by another thread
+        self._selector: selectors.BaseSelector | None = None
+        self._registered: socket.socket | None = None
+        self._wakeup_recv: socket.socket | None = None
+        self._wakeup_send: socket.socket | None = None
+        self._wakeup_pending = False
 
         Thread.__init__(self, target=make_target(self.run_reactor))
         self.daemon = False
@@ -115,12 +185,18 @@ class DULServiceProvider(Thread):
         """Return the parent :class:`~pynetdicom.association.Association`."""
         return self._assoc
 
-    def _decode_pdu(self, bytestream: bytearray) -> tuple[_PDUType, str]:
+    def _decode_pdu(
+        self, bytestream: bytes | bytearray | memoryview
+    ) -> tuple[_PDUType, str]:
         """Decode a received PDU.
 
+        .. versionchanged:: 3.1
+
+            Added support for decoding from a :class:`memoryview`
+
         Parameters
         ----------
-        bytestream : bytearray
+        bytestream : bytes | bytearray | memoryview
             The received PDU.
 
         Returns
@@ -130,20 +206,67 @@ class DULServiceProvider(Thread):
             corresponding to receiving that PDU type.
         """
         # Trigger before data is decoded in case of exception in decoding
-        b = bytes(bytestream)
-        evt.trigger(self.assoc, evt.EVT_DATA_RECV, {"data": b})
+        #   but only copy the data if there's a handler to receive it
+        if self.assoc.get_handlers(evt.EVT_DATA_RECV):
+            evt.trigger(self.assoc, evt.EVT_DATA_RECV, {"data": bytes(bytestream)})
 
-        pdu_cls, event = _PDU_TYPES[b[0:1]]
+        pdu_cls, event = _PDU_TYPES[bytes(bytestream[0:1])]
         pdu = pdu_cls()
-        pdu.decode(b)
+        # P-DATA-TF PDUs are decoded directly from the receive buffer, the
+        #   others are small so it's simpler to decode them from bytes
+        if isinstance(pdu, P_DATA_TF):
+            pdu.decode(bytestream)
+        else:
+            pdu.decode(bytes(bytestream))
 
         evt.trigger(self.assoc, evt.EVT_PDU_RECV, {"pdu": pdu})
 
         return pdu, event
 
+    def _grow_recv_buffer(self, nr_bytes: int, required: int) -> None:
+        """Replace the receive buffer with a larger one.
+
+        The buffer is grown towards `required`, but to no more than double its
+        current size or the maximum PDU length we've negotiated (whichever is
+        larger) so the length of a received PDU can't be used to force a large
+        allocation before the data arrives.
+
+        Parameters
+        ----------
+        nr_bytes : int
+            The number of bytes at the start of the current buffer to keep.
+        required : int
+            The total number of bytes required.
+        """
+        maximum_length = self.assoc.local.get("pdv_size") or 0
+        size = len(self._recv_buffer)
+        buffer = bytearray(min(required, max(2 * size, 6 + maximum_length)))
+        buffer[:nr_bytes] = memoryview(self._recv_buffer)[:nr_bytes]
+        self._recv_buffer = buffer
+
     def idle_timer_expired(self) -> bool:
         """Return ``True`` if the network idle timer has expired."""
-        return self._idle_timer.expired
+        if not (self._idle_expired and self._idle_timer.expired):
+            return False
+
+        if self._is_recv_paused():
+            # The peer isn't idle if we're not reading its data, so the time
+            #   spent waiting for received messages to be processed doesn't
+            #   count
+            self._idle_expired = False
+            self._idle_timer.restart()
+            return False
+
+        return True
+
+    def _on_artim_timer(self) -> None:
+        """Wake the reactor when the ARTIM timer expires."""
+        self._artim_expired = True
+        self._wakeup()
+
+    def _on_idle_timer(self) -> None:
+        """Flag the network idle timer as expired."""
+        self._idle_expired = True
 
     def _is_transport_event(self) -> bool:
         """Check to see if the socket has incoming data
@@ -157,7 +280,7 @@ class DULServiceProvider(Thread):
         """
         # Sta13: waiting for the transport connection to close
         # however it may still receive data that needs to be acted on
-        self.socket = cast("AssociationSocket", self.socket)
+        self.socket = cast(AssociationSocket, self.socket)
         if self.state_machine.current_state == "Sta13":
             # Check to see if there's more data to be read
             #   Might be any incoming PDU or valid/invalid data
@@ -177,15 +300,39 @@ class DULServiceProvider(Thread):
         #   type
         # Fix for #28 - caused by peer disconnecting before run loop is
         #   stopped by assoc.release()
-        if self.socket and self.socket.ready:
+        if self._is_recv_paused():
+            return self._read_pdu_header()
+
+        if self._recv_header is not None or (self.socket and self.socket.ready):
             self._read_pdu_data()
             return True
 
         return False
 
+    def _is_recv_blocked(self) -> bool:
+        """Return ``True`` if reading is paused and the next PDU is a
+        P-DATA-TF, so nothing more can be read from the peer until it's
+        resumed.
+        """
+        return self._recv_header is not None and self._is_recv_paused()
+
+    def _is_recv_paused(self) -> bool:
+        """Return ``True`` if reading P-DATA-TF PDUs from the peer is paused
+        because too many received DIMSE messages are waiting to be processed.
+        """
+        # Only pause during data transfer
+        if self.state_machine.current_state != "Sta6":
+            return False
+
+        try:
+            return cast(bool, self.assoc.dimse.msg_queue.is_full)  # type: ignore
+        except AttributeError:
+            return False
+
     def kill_dul(self) -> None:
         """Kill the DUL reactor and stop the thread"""
         self._kill_thread = True
+        self._wakeup()
 
     @property
     def network_timeout(self) -> float | None:
@@ -242,6 +389,51 @@ class DULServiceProvider(Thread):
 
         return True
 
+    def _read_pdu_header(self) -> bool:
+        """Read the header of the next PDU while reading is paused.
+
+        Only P-DATA-TF PDUs are held back, so any other PDU, such as an
+        A-RELEASE-RQ or A-ABORT, is still read and acted on, as is the
+        connection being closed by the peer.
+
+        **Events Emitted**
+
+        - Evt17: Transport connection closed
+        - As for :meth:`_read_pdu_data` if the PDU isn't a P-DATA-TF
+
+        Returns
+        -------
+        bool
+            ``True`` if an event has been added to the event queue, ``False``
+            otherwise.
+        """
+        self.socket = cast(AssociationSocket, self.socket)
+        if self._recv_header is not None or not self.socket.ready:
+            return False
+
+        header = bytearray(6)
+        try:
+            nr_read = self.socket.recv_into(memoryview(header))
+        except (OSError, TimeoutError) as exc:
+            LOGGER.error("Connection closed before the entire PDU was received")
+            LOGGER.exception(exc)
+            # Evt17: Transport connection closed
+            self.event_queue.put("Evt17")
+            return True
+
+        if nr_read < 6:
+            # Evt17: Transport connection closed
+            self.event_queue.put("Evt17")
+            return True
+
+        self._recv_header = bytes(header)
+        if header[0] == 0x04:
+            # P-DATA-TF, read the rest once reading resumes
+            return False
+
+        self._read_pdu_data()
+        return True
+
     def _read_pdu_data(self) -> None:
         """Read PDU data sent by the peer from the socket.
 
@@ -263,32 +455,43 @@ class DULServiceProvider(Thread):
         - Evt17: Transport connection closed
         - Evt19: Invalid or unrecognised PDU
         """
-        bytestream = bytearray()
-        self.socket = cast("AssociationSocket", self.socket)
-
-        # Try and read the PDU type and length from the socket
-        try:
-            bytestream.extend(self.socket.recv(6))
-        except (OSError, TimeoutError) as exc:
-            # READ_PDU_EXC_A
-            LOGGER.error("Connection closed before the entire PDU was received")
-            LOGGER.exception(exc)
-            # Evt17: Transport connection closed
-            self.event_queue.put("Evt17")
-            return
+        self.socket = cast(AssociationSocket, self.socket)
+
+        # The presentation data values of a decoded P-DATA-TF are views of the
+        #   receive buffer, so if one is still waiting to be processed then
+        #   receive into a new buffer rather than overwrite it
+        if self._recv_pdu.queue:
+            self._recv_buffer = bytearray(len(self._recv_buffer))
+
+        header, self._recv_header = self._recv_header, None
+        if header is not None:
+            # The PDU type and length were read while reading was paused
+            self._recv_buffer[:6] = header
+            nr_read = 6
+        else:
+            # Try and read the PDU type and length from the socket
+            try:
+                nr_read = self.socket.recv_into(memoryview(self._recv_buffer)[:6])
+            except (OSError, TimeoutError) as exc:
+                # READ_PDU_EXC_A
+                LOGGER.error("Connection closed before the entire PDU was received")
+                LOGGER.exception(exc)
+                # Evt17: Transport connection closed
+                self.event_queue.put("Evt17")
+                return
 
-        try:
-            # Byte 1 is always the PDU type
-            # Byte 2 is always reserved
-            # Bytes 3-6 are always the PDU length
-            pdu_type, _, pdu_length = struct.unpack(">BBL", bytestream)
-        except struct.error:
+        if nr_read < 6:
             # READ_PDU_EXC_B
             # LOGGER.error("Insufficient data received to decode the PDU")
             # Evt17: Transport connection closed
             self.event_queue.put("Evt17")
             return
 
+        # Byte 1 is always the PDU type
+        # Byte 2 is always reserved
+        # Bytes 3-6 are always the PDU length
+        pdu_type, _, pdu_length = UNPACK_PDU_HEADER(self._recv_buffer)
+
         # If the `pdu_type` is unrecognised
         if pdu_type not in (0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07):
             # READ_PDU_EXC_C
@@ -297,9 +500,19 @@ class DULServiceProvider(Thread):
             self.event_queue.put("Evt19")
             return
 
-        # Try and read the rest of the PDU
+        # Try and read the rest of the PDU directly into the receive buffer
+        length = 6 + pdu_length
         try:
-            bytestream += self.socket.recv(pdu_length)
+            while nr_read < length:
+                if len(self._recv_buffer) == nr_read:
+                    self._grow_recv_buffer(nr_read, length)
+
+                end = min(length, len(self._recv_buffer))
+                view = memoryview(self._recv_buffer)[nr_read:end]
+                nr_recv = self.socket.recv_into(view)
+                nr_read += nr_recv
+                if nr_recv < len(view):
+                    break
         except (OSError, TimeoutError) as exc:
             # READ_PDU_EXC_D
             LOGGER.error("Connection closed before the entire PDU was received")
@@ -309,19 +522,19 @@ class DULServiceProvider(Thread):
             return
 
         # Check that the PDU data was completely read
-        if len(bytestream) != 6 + pdu_length:
+        if nr_read != length:
             # READ_PDU_EXC_E
             # Evt17: Transport connection closed
             LOGGER.error(
-                f"The received PDU is shorter than expected ({len(bytestream)} of "
-                f"{6 + pdu_length} bytes received)"
+                f"The received PDU is shorter than expected ({nr_read} of "
+                f"{length} bytes received)"
             )
             self.event_queue.put("Evt17")
             return
 
         try:
             # Decode the PDU data, get corresponding FSM event
-            pdu, event = self._decode_pdu(bytestream)
+            pdu, event = self._decode_pdu(memoryview(self._recv_buffer)[:length])
             self.event_queue.put(event)
         except Exception as exc:
             # READ_PDU_EXC_F
@@ -381,85 +594,289 @@ class DULServiceProvider(Thread):
         the connection for incoming data. When incoming data is received it
         categorises it and add its to the
         :attr:`~DULServiceProvider.to_user_queue`.
+
+        When there's nothing to do the reactor blocks until either data is
+        available on the connection, an event or primitive is queued by
+        another thread or the ARTIM timer expires.
         """
+        self._open_selector()
+        try:
+            self._run_reactor()
+        finally:
+            self._close_selector()
+
+    def _run_reactor(self) -> None:
+        """Run the DUL reactor loop."""
         # Main DUL loop
         self._idle_timer.start()
-        self.socket = cast("AssociationSocket", self.socket)
-        sleep = False
 
         while True:
             # Let the assoc reactor off the leash
             if not self.assoc._dul_ready.is_set():
                 self.assoc._dul_ready.set()
-                # When single-stepping the reactor, sleep between events so that
-                # test code has time to run.
-                sleep = True
-
-            if sleep:
-                # If there were no events to process on the previous loop,
-                #   sleep before checking again, otherwise check immediately
-                # Setting `_run_loop_delay` higher will use less CPU when idle, but
-                #   will also increase the latency to respond to new requests
-                time.sleep(self._run_loop_delay)
 
             if self._kill_thread:
                 break
 
-            # Check the ARTIM timer first so its event is placed on the queue
-            #   ahead of any other events this loop
+            # If there was nothing to do, wait for something to happen then
+            #   return to the start of the loop
+            if not self._run_once():
+                self._wait()
+
+    def _run_once(self) -> bool:
+        """Perform a single pass of the reactor.
+
+        Returns
+        -------
+        bool
+            ``True`` if an event was processed by the state machine, ``False``
+            if there was nothing to do or the reactor has been killed.
+        """
+        self.socket = cast(AssociationSocket, self.socket)
+
+        # Check the ARTIM timer first so its event is placed on the queue
+        #   ahead of any other events this loop
+        if self._artim_expired:
+            self._artim_expired = False
+            # The timer may have been stopped or restarted in the meantime
             if self.artim_timer.expired:
                 self.event_queue.put("Evt18")
 
-            # Check the connection for incoming data
+        # Check the connection for incoming data
+        try:
+            # We can either encode and send a primitive **OR**
+            #   receive and decode a PDU per loop of the reactor
+            if self._process_recv_primitive():  # encode (sent by state machine)
+                pass
+            elif self._is_transport_event():  # receive and decode PDU
+                self._idle_timer.restart()
+        except Exception as exc:
+            LOGGER.error("Exception in DUL.run(), aborting association")
+            LOGGER.exception(exc)
+            # Bypass the state machine and send an A-ABORT
+            #   we do it this way because an exception here will mess up
+            #   the state machine and we can't guarantee it'll get sent
+            #   otherwise
+            abort_pdu = A_ABORT_RQ()
+            abort_pdu.source = 0x02
+            abort_pdu.reason_diagnostic = 0x00
+            self.socket.send(abort_pdu.encode())
+            self.assoc.is_aborted = True
+            self.assoc.is_established = False
+            # Hard shutdown of the Association and DUL reactors
+            self.assoc._kill = True
+            self._kill_thread = True
+            return False
+
+        # Check the event queue to see if there is anything to do
+        try:
+            event = self.event_queue.get(block=False)
+        except queue.Empty:
+            # Nothing to do, so don't hold back any PDUs
+            self._flush_send()
+            return False
+
+        self.state_machine.do_action(event)
+
+        return True
+
+    def _open_selector(self) -> None:
+        """Create the selector and wakeup socket pair used by the reactor."""
+        self._selector = selectors.DefaultSelector()
+        self._wakeup_recv, self._wakeup_send = socket.socketpair()
+        self._wakeup_recv.setblocking(False)
+        self._wakeup_send.setblocking(False)
+        self._selector.register(self._wakeup_recv, selectors.EVENT_READ)
+
+    def _close_selector(self) -> None:
+        """Close the selector and wakeup socket pair used by the reactor."""
+        wakeup_recv, wakeup_send = self._wakeup_recv, self._wakeup_send
+        self._wakeup_recv = self._wakeup_send = None
+        self._registered = None
+        if self._selector:
+            self._selector.close()
+            self._selector = None
+
+        for sock in (wakeup_recv, wakeup_send):
+            if sock:
+                sock.close()
+
+    def _register_transport(self) -> None:
+        """Ensure the current transport socket is registered with the selector."""
+        selector = cast(selectors.BaseSelector, self._selector)
+        sock = getattr(self.socket, "socket", None)
+        if self._is_recv_blocked():
+            # Don't wake for incoming data we won't read
+            sock = None
+
+        if sock is self._registered:
+            return
+
+        # The socket may change when the connection is made (i.e. TLS
+        #   wrapping) or when the connection is closed
+        if self._registered is not None:
             try:
-                # We can either encode and send a primitive **OR**
-                #   receive and decode a PDU per loop of the reactor
-                if self._process_recv_primitive():  # encode (sent by state machine)
-                    pass
-                elif self._is_transport_event():  # receive and decode PDU
-                    self._idle_timer.restart()
-            except Exception as exc:
-                LOGGER.error("Exception in DUL.run(), aborting association")
-                LOGGER.exception(exc)
-                # Bypass the state machine and send an A-ABORT
-                #   we do it this way because an exception here will mess up
-                #   the state machine and we can't guarantee it'll get sent
-                #   otherwise
-                abort_pdu = A_ABORT_RQ()
-                abort_pdu.source = 0x02
-                abort_pdu.reason_diagnostic = 0x00
-                self.socket.send(abort_pdu.encode())
-                self.assoc.is_aborted = True
-                self.assoc.is_established = False
-                # Hard shutdown of the Association and DUL reactors
-                self.assoc._kill = True
-                self._kill_thread = True
-                return
+                selector.unregister(self._registered)
+            except (KeyError, ValueError, OSError):
+                pass
 
-            # Check the event queue to see if there is anything to do
+        self._registered = None
+        if isinstance(sock, socket.socket):
             try:
-                event = self.event_queue.get(block=False)
-            # If the queue is empty, return to the start of the loop
-            except queue.Empty:
-                sleep = True
-                continue
+                selector.register(sock, selectors.EVENT_READ)
+                self._registered = sock
+            except (KeyError, ValueError, OSError):
+                pass
+
+    def _wait(self) -> None:
+        """Block until there may be something for the reactor to do.
+
+        Returns when the connection has incoming data, the reactor has been
+        woken by another thread, the ARTIM timer expires or
+        :attr:`~DULServiceProvider._max_wait` seconds have passed.
+        """
+        if self._selector is None:
+            # Reactor not running in its own thread, don't block
+            time.sleep(self._run_loop_delay)
+            return
 
-            self.state_machine.do_action(event)
-            sleep = False
+        self._register_transport()
+        try:
+            self._selector.select(self._max_wait)
+        except (OSError, ValueError):
+            # Transport socket closed underneath us, the next pass will
+            #   detect the closed connection
+            self._registered = None
+
+        # Drain the wakeup socket then clear the flag, both before the queues
+        #   are checked again. A wakeup sent after the socket is drained
+        #   either leaves its byte in the socket or is for an item that's
+        #   already queued, so no wakeups are lost
+        try:
+            while cast(socket.socket, self._wakeup_recv).recv(512):
+                pass
+        except OSError:
+            pass
+
+        self._wakeup_pending = False
+
+    def _wakeup(self) -> None:
+        """Wake the reactor if it's waiting for activity."""
+        # No need to wake if we are the reactor or a wakeup is already pending
+        if self._wakeup_pending or threading.current_thread() is self:
+            return
+
+        sock = self._wakeup_send
+        if sock is None:
+            return
+
+        self._wakeup_pending = True
+        try:
+            sock.send(b"\x00")
+        except OSError:
+            # Buffer full (already awake) or the reactor has stopped
+            pass
 
     def _send(self, pdu: _PDUType) -> None:
         """Encode and send a PDU to the peer.
 
+        .. versionchanged:: 3.1
+
+            The final P-DATA-TF of a command set is held back and sent
+            together with the following P-DATA-TF if one is already queued
+
         Parameters
         ----------
         pdu : pynetdicom.pdu.PDU
             The PDU to be encoded and sent to the peer.
         """
-        if self.socket is not None:
-            self.socket.send(pdu.encode())
-            evt.trigger(self.assoc, evt.EVT_PDU_SENT, {"pdu": pdu})
-        else:
+        if self.socket is None:
             LOGGER.warning("Attempted to send data over closed connection")
+            return
+
+        self._send_pending.append(pdu)
+        if not self._is_coalesced(pdu):
+            self._flush_send()
+
+    def _is_coalesced(self, pdu: _PDUType) -> bool:
+        """Return ``True`` if `pdu` should be held back and sent with the next
+        PDU, ``False`` otherwise.
+        """
+        # Only the last command fragment when the next primitive is P-DATA,
+        #   which should be the start of the message's data set
+        if not isinstance(pdu, P_DATA_TF) or not pdu.presentation_data_value_items:
+            return False
+
+        value = pdu.presentation_data_value_items[-1].presentation_data_value
+        if not value or value[0] & 0x03 != 0x03:
+            return False
+
+        try:
+            return isinstance(self.to_provider_queue.queue[0], P_DATA)
+        except IndexError:
+            return False
+
+    def _pack_p_data(self, primitive: P_DATA) -> P_DATA:
+        """Return a P-DATA primitive with the PDVs of `primitive` followed by
+        those of any queued P-DATA primitives that fit within the peer's
+        maximum PDU length.
+
+        .. versionadded:: 3.1
+
+        Parameters
+        ----------
+        primitive : pdu_primitives.P_DATA
+            The P-DATA primitive to be sent, which has been taken from the
+            :attr:`to_provider_queue`.
+
+        Returns
+        -------
+        pdu_primitives.P_DATA
+            Either `primitive` if no queued primitives fit, or a new primitive
+            with the combined PDVs, in order.
+        """
+        pending = self.to_provider_queue.queue
+        if not pending or not isinstance(pending[0], P_DATA):
+            return primitive
+
+        maximum_length = self.assoc.dimse.maximum_pdu_size
+        pdvs = list(primitive.presentation_data_value_list)
+        length = sum(5 + len(value) for _, value in pdvs)
+        while pending and isinstance(pending[0], P_DATA):
+            next_pdvs = pending[0].presentation_data_value_list
+            next_length = sum(5 + len(value) for _, value in next_pdvs)
+            if maximum_length and length + next_length > maximum_length:
+                break
+
+            self.to_provider_queue.get(False)
+            pdvs.extend(next_pdvs)
+            length += next_length
+
+        if len(pdvs) == len(primitive.presentation_data_value_list):
+            return primitive
+
+        packed = P_DATA()
+        packed.presentation_data_value_list.extend(pdvs)
+        return packed
+
+    def _flush_send(self) -> None:
+        """Send any PDUs waiting to be sent to the peer."""
+        if not self._send_pending:
+            return
+
+        pdus, self._send_pending = self._send_pending, []
+        if self.socket is None:
+            LOGGER.warning("Attempted to send data over closed connection")
+            return
+
+        # Trigger before the data is sent so the event always occurs before
+        #   the peer is able to respond to the PDU
+        buffers = []
+        for pdu in pdus:
+            buffers.extend(pdu.encode_buffers())
+            evt.trigger(self.assoc, evt.EVT_PDU_SENT, {"pdu": pdu})
+
+        self.socket.send_buffers(buffers)
 
     def send_pdu(self, primitive: _PDUPrimitiveType) -> None:
         """Place a primitive in the provider queue to be sent to the peer.
@@ -486,6 +903,21 @@ class DULServiceProvider(Thread):
 
         self.to_provider_queue.put(primitive)
 
+    def send_pdus(self, primitives: list[P_DATA]) -> None:
+        """Place P-DATA primitives in the provider queue to be sent to the peer.
+
+        .. versionadded:: 3.1
+
+        All of the primitives are queued before the reactor is woken so that
+        consecutive PDUs can be sent together.
+
+        Parameters
+        ----------
+        primitives : list[pdu_primitives.P_DATA]
+            The primitives to be sent, in order.
+        """
+        cast(_WakeupQueue, self.to_provider_queue).put_items(primitives)
+
     def stop_dul(self) -> bool:
         """Stop the reactor if current state is ``'Sta1'``
 
@@ -497,6 +929,7 @@ class DULServiceProvider(Thread):
         """
         if self.state_machine.current_state == "Sta1":
             self._kill_thread = True
+            self._wakeup()
             # Fix for Issue 39
             # Give the DUL thread time to exit
             while self.is_alive():
@@ -516,3 +949,123 @@ _PDU_TYPES: dict[bytes, tuple[Type[_PDUType], str]] = {
     b"\x06": (A_RELEASE_RP, "Evt13"),
     b"\x07": (A_ABORT_RQ, "Evt16"),
 }
+
+
+class AsyncioDULServiceProvider(DULServiceProvider):
+    """A DICOM Upper Layer Service Provider that runs on an :mod:`asyncio`
+    event loop.
+
+    .. versionadded:: 3.1
+
+    Rather than running in its own thread, the state machine and PDU handling
+    are run as callbacks on a single event loop shared by all associations
+    using the asyncio upper layer, with framing of the incoming PDUs performed
+    by an :class:`asyncio.Protocol`. The event loop is only woken when data is
+    received from the peer, a primitive or event is queued or the ARTIM timer
+    expires.
+
+    Used when :attr:`~pynetdicom._config.USE_ASYNCIO_DUL` is ``True``.
+    """
+
+    _socket_class = AsyncioAssociationSocket
+
+    def __init__(self, assoc: "Association") -> None:
+        """Create a new DUL service provider for `assoc`.
+
+        Parameters
+        ----------
+        assoc : association.Association
+            The DUL's parent :class:`~pynetdicom.association.Association`
+            instance.
+        """
+        self._loop: "asyncio.AbstractEventLoop | None" = None
+        self._running = False
+        self._step_pending = False
+        self._in_step = False
+        # The maximum number of events processed per event loop callback
+        self._max_events = 64
+
+        super().__init__(assoc)
+
+    def is_alive(self) -> bool:
+        """Return ``True`` if the service provider is running."""
+        return self._running
+
+    def _process_recv_primitive(self) -> bool:
+        """Check to see if the local user has sent any primitives to the DUL"""
+        # Stop sending while the transport's write buffer is full
+        if getattr(self.socket, "_write_paused", False):
+            return False
+
+        return super()._process_recv_primitive()
+
+    def run_reactor(self) -> None:
+        """Not used, the service provider runs on the shared event loop."""
+        raise NotImplementedError(
+            "AsyncioDULServiceProvider runs on an event loop, use start() instead"
+        )
+
+    def start(self) -> None:
+        """Start the service provider on the shared event loop."""
+        self._loop = _get_event_loop()
+        self._running = True
+        self._loop.call_soon_threadsafe(self._start)
+
+    def _start(self) -> None:
+        """Start the service provider, run in the event loop's thread."""
+        self._idle_timer.start()
+        cast(AsyncioAssociationSocket, self.socket)._start_transport()
+        self.assoc._dul_ready.set()
+        self._step()
+
+    def _step(self) -> None:
+        """Process events until there's nothing to do."""
+        self._step_pending = False
+        if not self._running:
+            return
+
+        # Limit the number of events processed per pass so a busy association
+        #   doesn't starve the others sharing the event loop
+        nr_events = 0
+        self._in_step = True
+        try:
+            while not self._kill_thread and self._run_once():
+                nr_events += 1
+                if nr_events == self._max_events:
+                    break
+        except Exception as exc:
+            # Equivalent to an exception ending the DUL thread
+            LOGGER.error("Exception in the DUL event loop callback")
+            LOGGER.exception(exc)
+            self._kill_thread = True
+        finally:
+            self._in_step = False
+
+        if self._kill_thread:
+            self._stop()
+            return
+
+        if isinstance(self.socket, AsyncioAssociationSocket):
+            self.socket._pause_reading(self._is_recv_blocked())
+
+        if nr_events == self._max_events:
+            self._wakeup()
+
+    def _stop(self) -> None:
+        """Stop the service provider."""
+        if isinstance(self.socket, AsyncioAssociationSocket):
+            self.socket._stop_transport()
+
+        self._running = False
+
+    def _wakeup(self) -> None:
+        """Schedule a pass of the service provider on the event loop."""
+        # Avoid unnecessary callbacks when already processing events
+        if self._step_pending or (self._in_step and _in_event_loop()):
+            return
+
+        if self._loop is None or not self._running:
+            return
+
+        self._step_pending = True
+        self._loop.call_soon_threadsafe(self._step)
@@ -605,6 +605,14 @@ class Event:
 
         .. versionadded:: 2.0
 
+        .. versionchanged:: 3.1
+
+            If the :class:`~pynetdicom.dsutils.DatasetWriter` returned by
+            :attr:`AE.dataset_writer
+            <pynetdicom.ae.ApplicationEntity.dataset_writer>` has a `path`
+            then the dataset will be moved to its final location after the
+            handler returns a success or warning status
+
         Returns
         -------
         pathlib.Path
@@ -682,6 +690,61 @@ class Event:
             stream,
         ))
 
+    def encoded_dataset_buffers(self, include_meta: bool = True) -> list[memoryview]:
+        """Return the encoded C-STORE dataset sent by the peer as read-only
+        buffers, without first decoding or copying it.
+
+        .. versionadded:: 3.1
+
+        The received dataset is only copied once, from the association's
+        receive buffer into the request's *Data Set*, and the returned
+        buffers are views of it. Unlike :meth:`encoded_dataset`, the dataset
+        isn't copied again when including the file meta information, so
+        this is preferable when writing large datasets to file.
+
+        Examples
+        --------
+        Write the encoded dataset to file in the DICOM File Format::
+
+          def handle_store(event: pynetdicom.events.Event, dst: pathlib.Path) -> int:
+              with dst.open("wb") as f:
+                  f.writelines(event.encoded_dataset_buffers())
+
+              return 0x0000
+
+        Parameters
+        ----------
+        include_meta : bool, optional
+            If ``True`` (default) then the first buffer is the encoded DICOM
+            preamble, prefix and file meta information.
+
+        Returns
+        -------
+        list[memoryview]
+            The encoded dataset as sent by the peer, with or without a
+            preceding buffer containing the file meta information.
+
+        Raises
+        ------
+        AttributeError
+            If the corresponding event is not a C-STORE request.
+        """
+        try:
+            request = cast(C_STORE, self.request)
+            # getvalue() returns the BytesIO's own buffer rather than a copy
+            stream = cast(BytesIO, request.DataSet).getvalue()
+        except AttributeError:
+            raise AttributeError(
+                "The corresponding event is not a C-STORE request and has no "
+                "'Data Set' parameter"
+            )
+
+        if not include_meta:
+            return [memoryview(stream)]
+
+        meta = b"".join((b"\x00" * 128, b"DICM", encode_file_meta(self.file_meta)))
+        return [memoryview(meta), memoryview(stream)]
+
     @property
     def event(self) -> EventType:
         """Return the corresponding event.
@@ -780,7 +843,8 @@ class Event:
         Encode the File Meta Information in a new file and append the encoded
         *Data Set* to it. This skips having to decode/re-encode the *Data Set*
         as in the previous example (or alternatively, just use the
-        :meth:`~pynetdicom.events.Event.encoded_dataset` method).
+        :meth:`~pynetdicom.events.Event.encoded_dataset` or
+        :meth:`~pynetdicom.events.Event.encoded_dataset_buffers` methods).
 
         .. code-block:: python
 
@@ -4,9 +4,9 @@ The DUL's finite state machine representation.
 
 import logging
 import queue
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Callable, cast
 
-from pynetdicom import evt
+from pynetdicom import _config, evt
 from pynetdicom.pdu import (
     A_ASSOCIATE_RQ,
     A_ASSOCIATE_RJ,
@@ -40,8 +40,6 @@ class StateMachine:
 
     Attributes
     ----------
-    current_state : str
-        The current state of the state machine, ``'Sta1'`` to ``'Sta13'``.
     dul : dul.DULServiceProvider
         The DICOM Upper Layer service instance for the local AE
 
@@ -59,57 +57,69 @@ class StateMachine:
         dul : dul.DULServiceProvider
             The DICOM Upper Layer Service instance for the association.
         """
-        self.current_state = "Sta1"
+        # The index of the current state in the compiled transition table
+        self._state = _STATE_IDS["Sta1"]
         self.dul = dul
 
+    @property
+    def current_state(self) -> str:
+        """Get or set the current state of the state machine, ``'Sta1'`` to
+        ``'Sta13'``.
+        """
+        return _STATE_NAMES[self._state]
+
+    @current_state.setter
+    def current_state(self, state: str) -> None:
+        """Set the current state without triggering any actions."""
+        try:
+            self._state = _STATE_IDS[state]
+        except KeyError:
+            msg = f"Invalid state '{state}' for State Machine"
+            LOGGER.error(msg)
+            raise ValueError(msg) from None
+
     def do_action(self, event: str) -> None:
         """Execute the action triggered by `event`.
 
+        .. versionchanged:: 3.1
+
+            The action is found using the integer indexed tables compiled
+            from :attr:`TRANSITION_TABLE` and :attr:`ACTIONS` when the module
+            is imported and ``evt.EVT_FSM_TRANSITION`` is only triggered when
+            a handler is bound to it.
+
         Parameters
         ----------
         event : str
             The event to be processed, ``'Evt1'`` to ``'Evt19'``
         """
         # Check (event + state) is valid
-        if (event, self.current_state) not in TRANSITION_TABLE:
+        action_id = _TRANSITIONS[self._state][_EVENT_IDS.get(event, -1)]
+        if action_id < 0:
             msg = "Invalid event '{}' for the current state '{}'".format(
                 event, self.current_state
             )
             LOGGER.error(msg)
             raise InvalidEventError(msg)
 
-        action_name = TRANSITION_TABLE[(event, self.current_state)]
-
-        # action is the (description, function, state) tuple
-        #   associated with the action_name
-        action = ACTIONS[action_name]
-
         # Attempt to execute the action and move the state machine to its
         #   next state
         try:
             # Execute the required action
-            next_state = action[1](self.dul)
+            next_state = _ACTION_FUNCS[action_id](self.dul)
 
             # Event handler - FSM transition
-            evt.trigger(
-                self.dul.assoc,
-                evt.EVT_FSM_TRANSITION,
-                {
-                    "action": action_name,
-                    "current_state": self.current_state,
-                    "fsm_event": event,
-                    "next_state": next_state,
-                },
-            )
-            # print(
-            #     "{}: {} + {} -> {} -> {}".format(
-            #         self.dul.assoc.mode[0].upper(),
-            #         self.current_state,
-            #         event,
-            #         action_name,
-            #         next_state,
-            #     )
-            # )
+            if self.dul.assoc.get_handlers(evt.EVT_FSM_TRANSITION):
+                evt.trigger(
+                    self.dul.assoc,
+                    evt.EVT_FSM_TRANSITION,
+                    {
+                        "action": _ACTION_NAMES[action_id],
+                        "current_state": self.current_state,
+                        "fsm_event": event,
+                        "next_state": next_state,
+                    },
+                )
 
             # Move the state machine to the next state
             self.transition(next_state)
@@ -118,7 +128,7 @@ class StateMachine:
             LOGGER.error(
                 "State Machine received an exception attempting "
                 "to perform the action '%s' while in state '%s'",
-                action_name,
+                _ACTION_NAMES[action_id],
                 self.current_state,
             )
             LOGGER.exception(exc)
@@ -138,13 +148,7 @@ class StateMachine:
         ValueError
             If `state` is not a valid state.
         """
-        # Validate that state is acceptable
-        if state in STATES.keys():
-            self.current_state = state
-        else:
-            msg = f"Invalid state '{state}' for State Machine"
-            LOGGER.error(msg)
-            raise ValueError(msg)
+        self.current_state = state
 
 
 def AE_1(dul: "DULServiceProvider") -> str:
@@ -425,6 +429,8 @@ def DT_1(dul: "DULServiceProvider") -> str:
     """
     # P-DATA request received from local user
     primitive = cast("P_DATA", dul.to_provider_queue.get(False))
+    if _config.PACK_DIMSE_MESSAGES:
+        primitive = dul._pack_p_data(primitive)
 
     # Send P-DATA-TF PDU
     dul._send(P_DATA_TF(primitive))
@@ -1289,3 +1295,41 @@ TRANSITION_TABLE = {
     ("Evt19", "Sta12"): "AA-8",
     ("Evt19", "Sta13"): "AA-7",
 }
+
+
+# Compiled State Machine tables
+#   States, events and actions are numbered by their order in STATES, EVENTS
+#   and ACTIONS and _TRANSITIONS[state][event] is the action to perform, or -1
+#   if the event is invalid for the state. Each row has an extra -1 entry at
+#   the end so that unknown events may use index -1
+_STATE_NAMES: list[str] = []
+_STATE_IDS: dict[str, int] = {}
+_EVENT_IDS: dict[str, int] = {}
+_ACTION_NAMES: list[str] = []
+_ACTION_FUNCS: list[Callable[["DULServiceProvider"], str]] = []
+_TRANSITIONS: list[list[int]] = []
+
+
+def _compile_tables() -> None:
+    """Compile :attr:`STATES`, :attr:`EVENTS`, :attr:`ACTIONS` and
+    :attr:`TRANSITION_TABLE` into the integer indexed tables used by
+    :class:`StateMachine`.
+
+    Called when the module is imported, and must be called again if any of
+    the tables are modified afterwards.
+    """
+    _STATE_NAMES[:] = list(STATES)
+    _STATE_IDS.clear()
+    _STATE_IDS.update({name: idx for idx, name in enumerate(_STATE_NAMES)})
+    _EVENT_IDS.clear()
+    _EVENT_IDS.update({name: idx for idx, name in enumerate(EVENTS)})
+    _ACTION_NAMES[:] = list(ACTIONS)
+    _ACTION_FUNCS[:] = [ACTIONS[name][1] for name in _ACTION_NAMES]
+
+    action_ids = {name: idx for idx, name in enumerate(_ACTION_NAMES)}
+    _TRANSITIONS[:] = [[-1] * (len(_EVENT_IDS) + 1) for _ in _STATE_NAMES]
+    for (event, state), action in TRANSITION_TABLE.items():
+        _TRANSITIONS[_STATE_IDS[state]][_EVENT_IDS[event]] = action_ids[action]
+
+
+_compile_tables()
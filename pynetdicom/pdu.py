@@ -32,8 +32,12 @@ from pynetdicom.pdu_items import (
     UserInformationItem,
     PresentationDataValueItem,
     PDU_ITEM_TYPES,
+    _FileFragment,
     _PDUItemType,
     PDUItem,
+    _decode_items,
+    _ITEM_HEADER,
+    _PDV_HEADER,
 )
 from pynetdicom.utils import decode_bytes, set_ae
 
@@ -44,12 +48,14 @@ if TYPE_CHECKING:  # pragma: no cover
         A_RELEASE,
         A_ABORT,
         A_P_ABORT,
+        _PDVType,
     )
 
 
 LOGGER = logging.getLogger(__name__)
 
 _PDVItem = list[PresentationDataValueItem]
+_BufferType: TypeAlias = "bytes | _FileFragment"
 _AbortType: TypeAlias = "A_ABORT | A_P_ABORT"
 _PDUType: TypeAlias = (
     "A_ASSOCIATE_RQ | A_ASSOCIATE_AC | A_ASSOCIATE_RJ | "
@@ -69,6 +75,21 @@ PACK_UCHAR = UCHAR.pack
 PACK_UINT2 = UINT2.pack
 PACK_UINT4 = UINT4.pack
 
+# Precompiled layouts for the fixed length fields of each PDU
+#   A-ASSOCIATE-RQ and -AC: PDU type, reserved, PDU length, protocol version,
+#   reserved, called AE title, calling AE title, 32 reserved
+_ASSOCIATE_RQ_AC = Struct(">BxIHxx16s16s32x")
+#   A-ASSOCIATE-RJ: PDU type, reserved, PDU length, reserved, result, source,
+#   reason/diagnostic
+_ASSOCIATE_RJ = Struct(">BxIxBBB")
+#   P-DATA-TF: PDU type, reserved, PDU length
+_P_DATA_TF = Struct(">BxI")
+#   A-RELEASE-RQ and -RP: PDU type, reserved, PDU length, 4 reserved
+_RELEASE = Struct(">BxI4x")
+#   A-ABORT: PDU type, reserved, PDU length, 2 reserved, source,
+#   reason/diagnostic
+_ABORT = Struct(">BxIxxBB")
+
 
 class PDU:
     """Base class for PDUs.
@@ -124,6 +145,22 @@ class PDU:
 
         return bytestream
 
+    def encode_buffers(self) -> list[_BufferType]:
+        """Return the encoded PDU as a list of :class:`bytes`.
+
+        .. versionadded:: 3.1
+
+        Joining the returned buffers gives the same encoding as
+        :meth:`~PDU.encode`, they're intended to be sent to the peer using
+        scatter/gather I/O.
+
+        Returns
+        -------
+        list[bytes | pdu_items._FileFragment]
+            The encoded PDU.
+        """
+        return [self.encode()]
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field encoders."""
@@ -205,8 +242,7 @@ class PDU:
         """
         offset = 0
         while bytestream[offset : offset + 1]:
-            item_type = UNPACK_UCHAR(bytestream[offset : offset + 1])[0]
-            item_length = UNPACK_UINT2(bytestream[offset + 2 : offset + 4])[0]
+            item_type, item_length = _ITEM_HEADER.unpack_from(bytestream, offset)
             item_data = bytestream[offset : offset + 4 + item_length]
             assert len(item_data) == 4 + item_length
             yield item_type, item_data
@@ -587,6 +623,18 @@ class A_ASSOCIATE_RQ(PDU):
 
         self._calling_aet = cast(str, set_ae(value, "Calling AE Title", False, False))
 
+    def decode(self, bytestream: bytes) -> None:
+        """Decode `bytestream` and use the result to set the field values of
+        the PDU.
+        """
+        _, _, version, called_ae_title, calling_ae_title = _ASSOCIATE_RQ_AC.unpack_from(
+            bytestream
+        )
+        self.protocol_version = version
+        self.called_ae_title = called_ae_title
+        self.calling_ae_title = calling_ae_title
+        self.variable_items = cast(_PDUItemType, _decode_items(bytestream, 74))
+
     @property
     def _decoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -613,6 +661,18 @@ class A_ASSOCIATE_RQ(PDU):
             ((74, None), "variable_items", self._wrap_generate_items, []),
         ]
 
+    def encode(self) -> bytes:
+        """Return the encoded PDU as :class:`bytes`."""
+        items = b"".join([item.encode() for item in self.variable_items])
+        header = _ASSOCIATE_RQ_AC.pack(
+            0x01,
+            68 + len(items),
+            self.protocol_version,
+            self.called_ae_title.ljust(16).encode("ascii"),
+            self.calling_ae_title.ljust(16).encode("ascii"),
+        )
+        return header + items
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -951,6 +1011,18 @@ class A_ASSOCIATE_AC(PDU):
         """
         return self.reserved_aec
 
+    def decode(self, bytestream: bytes) -> None:
+        """Decode `bytestream` and use the result to set the field values of
+        the PDU.
+        """
+        _, _, version, reserved_aet, reserved_aec = _ASSOCIATE_RQ_AC.unpack_from(
+            bytestream
+        )
+        self.protocol_version = version
+        self.reserved_aet = reserved_aet
+        self.reserved_aec = reserved_aec
+        self.variable_items = cast(_PDUItemType, _decode_items(bytestream, 74))
+
     @property
     def _decoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -974,6 +1046,18 @@ class A_ASSOCIATE_AC(PDU):
             ((74, None), "variable_items", self._wrap_generate_items, []),
         ]
 
+    def encode(self) -> bytes:
+        """Return the encoded PDU as :class:`bytes`."""
+        items = b"".join([item.encode() for item in self.variable_items])
+        header = _ASSOCIATE_RQ_AC.pack(
+            0x02,
+            68 + len(items),
+            self.protocol_version,
+            self.reserved_aet.ljust(16).encode("ascii"),
+            self.reserved_aec.ljust(16).encode("ascii"),
+        )
+        return header + items
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -1243,6 +1327,15 @@ class A_ASSOCIATE_RJ(PDU):
 
         return primitive
 
+    def decode(self, bytestream: bytes) -> None:
+        """Decode `bytestream` and use the result to set the field values of
+        the PDU.
+        """
+        _, _, result, source, reason = _ASSOCIATE_RJ.unpack_from(bytestream)
+        self.result = result
+        self.source = source
+        self.reason_diagnostic = reason
+
     @property
     def _decoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -1265,6 +1358,12 @@ class A_ASSOCIATE_RJ(PDU):
             ((9, 1), "reason_diagnostic", self._wrap_unpack, [UNPACK_UCHAR]),
         ]
 
+    def encode(self) -> bytes:
+        """Return the encoded PDU as :class:`bytes`."""
+        return _ASSOCIATE_RJ.pack(
+            0x03, 4, self.result, self.source, self.reason_diagnostic
+        )
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -1391,6 +1490,12 @@ class P_DATA_TF(PDU):
 
     Notes
     -----
+    A decoded P-DATA-TF PDU only records where each presentation data value
+    is within the encoded data and the PDV items are created when
+    :attr:`presentation_data_value_items` is first accessed. Use
+    :attr:`presentation_data_values` to get the values without creating the
+    items or copying the data.
+
     A P-DATA-TF PDU requires the following parameters:
 
     * PDU type (1, fixed value, ``0x04``)
@@ -1431,11 +1536,64 @@ class P_DATA_TF(PDU):
         primitive : pynetdicom.pdu_primitive.P_DATA
             The primitive to use to initialise the PDU.
         """
-        self.presentation_data_value_items: _PDVItem = []
+        self._items: _PDVItem = []
+        # (context ID, value) for each PDV when decoded, until the items
+        #   are created
+        self._values: list[tuple[int, memoryview]] | None = None
 
         if primitive is not None:
             self.from_primitive(primitive)
 
+    @property
+    def presentation_data_value_items(self) -> _PDVItem:
+        """Get or set the *Presentation Data Value Item(s)* field value as
+        :class:`list` of :class:`~pynetdicom.pdu_items.PresentationDataValueItem`.
+
+        .. versionchanged:: 3.1
+
+            The items of a decoded PDU are created, and their values copied,
+            on first access.
+        """
+        if self._values is not None:
+            items = []
+            for context_id, value in self._values:
+                item = PresentationDataValueItem()
+                item.presentation_context_id = context_id
+                item.presentation_data_value = bytes(value)
+                items.append(item)
+
+            self._items, self._values = items, None
+
+        return self._items
+
+    @presentation_data_value_items.setter
+    def presentation_data_value_items(self, value: _PDVItem) -> None:
+        """Set the *Presentation Data Value Item(s)* field value."""
+        self._items, self._values = value, None
+
+    @property
+    def presentation_data_values(self) -> list[tuple[int, bytes | memoryview]]:
+        """Return the PDU's presentation data values as
+        ``[(context ID, value), ...]``.
+
+        .. versionadded:: 3.1
+
+        For a decoded PDU each value is a :class:`memoryview` of the decoded
+        data, which for PDUs received from the peer is the DUL's receive
+        buffer. The views are only valid until the DUL has finished with the
+        PDU, so the data should be copied if it's needed afterwards.
+        """
+        if self._values is not None:
+            return cast(list[tuple[int, bytes | memoryview]], self._values)
+
+        return [
+            (
+                cast(int, item.presentation_context_id),
+                cast(bytes, item.presentation_data_value),
+            )
+            for item in self._items
+        ]
+
     def from_primitive(self, primitive: "P_DATA") -> None:
         """Setup the current PDU using a P-DATA primitive.
 
@@ -1462,16 +1620,38 @@ class P_DATA_TF(PDU):
 
         primitive = P_DATA()
 
-        primitive.presentation_data_value_list = []
-        for item in self.presentation_data_value_items:
-            primitive.presentation_data_value_list.append(
-                (
-                    cast(int, item.presentation_context_id),
-                    cast(bytes, item.presentation_data_value),
-                )
-            )
+        # The values of a decoded PDU are passed on without being copied
+        primitive._presentation_data_value_list = cast(
+            "list[_PDVType]", self.presentation_data_values
+        )
         return primitive
 
+    def decode(self, bytestream: bytes | bytearray | memoryview) -> None:
+        """Decode `bytestream` and use the result to set the field values of
+        the PDU.
+
+        .. versionchanged:: 3.1
+
+            Only the location of each presentation data value is decoded,
+            see :attr:`presentation_data_values`, and `bytestream` may be a
+            :class:`bytearray` or :class:`memoryview`.
+        """
+        view = memoryview(bytestream)
+        values = []
+        offset, length = 6, len(view)
+        while offset < length:
+            item_length, context_id = _PDV_HEADER.unpack_from(view, offset)
+            end = offset + 4 + item_length
+            if item_length < 1 or end > length:
+                raise ValueError(
+                    "Invalid 'Item Length' value for a Presentation Data Value Item"
+                )
+
+            values.append((context_id, view[offset + 5 : end]))
+            offset = end
+
+        self._items, self._values = [], values
+
     @property
     def _decoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -1492,6 +1672,36 @@ class P_DATA_TF(PDU):
             ((6, None), "presentation_data_value_items", self._wrap_generate_items, [])
         ]
 
+    def encode_buffers(self) -> list[_BufferType]:
+        """Return the encoded PDU as a list of :class:`bytes`.
+
+        .. versionadded:: 3.1
+
+        The PDU and PDV item headers are encoded separately so the
+        presentation data values can be sent without being copied.
+        Presentation data values that are sent from a file are returned as
+        is, without reading the file.
+
+        Returns
+        -------
+        list[bytes | pdu_items._FileFragment]
+            The encoded PDU.
+        """
+        buffers: list[_BufferType] = [_P_DATA_TF.pack(0x04, self.pdu_length)]
+        for item in self.presentation_data_value_items:
+            buffers.append(
+                _PDV_HEADER.pack(item.item_length, item.presentation_context_id)
+            )
+            if item.presentation_data_value:
+                buffers.append(item.presentation_data_value)
+
+        return buffers
+
+    def encode(self) -> bytes:
+        """Return the encoded PDU as :class:`bytes`."""
+        items = b"".join([item.encode() for item in self.presentation_data_value_items])
+        return _P_DATA_TF.pack(0x04, len(items)) + items
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -1557,7 +1767,8 @@ class P_DATA_TF(PDU):
         while bytestream[offset : offset + 1]:
             item_length = UNPACK_UINT4(bytestream[offset : offset + 4])[0]
             context_id = UNPACK_UCHAR(bytestream[offset + 4 : offset + 5])[0]
-            data = bytestream[offset + 5 : offset + 4 + item_length]
+            # Copy the data as `bytestream` may be a view on a reused buffer
+            data = bytes(bytestream[offset + 5 : offset + 4 + item_length])
             assert len(data) == item_length - 1
             yield context_id, data
             # Change `offset` to the start of the next PDV item
@@ -1566,6 +1777,9 @@ class P_DATA_TF(PDU):
     @property
     def pdu_length(self) -> int:
         """Return the *PDU Length* field value as an int."""
+        if self._values is not None:
+            return sum(5 + len(value) for _, value in self._values)
+
         length = 0
         for item in self.presentation_data_value_items:
             length += len(item)
@@ -1693,6 +1907,12 @@ class A_RELEASE_RQ(PDU):
 
         return A_RELEASE()
 
+    def decode(self, bytestream: bytes) -> None:
+        """Decode `bytestream` and use the result to set the field values of
+        the PDU.
+        """
+        # No fields other than the PDU type and length
+
     @property
     def _decoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -1711,6 +1931,10 @@ class A_RELEASE_RQ(PDU):
         """
         return []
 
+    def encode(self) -> bytes:
+        """Return the encoded PDU as :class:`bytes`."""
+        return _RELEASE.pack(0x05, 4)
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -1828,6 +2052,12 @@ class A_RELEASE_RP(PDU):
 
         return primitive
 
+    def decode(self, bytestream: bytes) -> None:
+        """Decode `bytestream` and use the result to set the field values of
+        the PDU.
+        """
+        # No fields other than the PDU type and length
+
     @property
     def _decoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -1846,6 +2076,10 @@ class A_RELEASE_RP(PDU):
         """
         return []
 
+    def encode(self) -> bytes:
+        """Return the encoded PDU as :class:`bytes`."""
+        return _RELEASE.pack(0x06, 4)
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -1994,6 +2228,12 @@ class A_ABORT_RQ(PDU):
 
         return primitive
 
+    def decode(self, bytestream: bytes) -> None:
+        """Decode `bytestream` and use the result to set the field values of
+        the PDU.
+        """
+        _, _, self.source, self.reason_diagnostic = _ABORT.unpack_from(bytestream)
+
     @property
     def _decoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -2015,6 +2255,10 @@ class A_ABORT_RQ(PDU):
             ((9, 1), "reason_diagnostic", self._wrap_unpack, [UNPACK_UCHAR]),
         ]
 
+    def encode(self) -> bytes:
+        """Return the encoded PDU as :class:`bytes`."""
+        return _ABORT.pack(0x07, 4, self.source, self.reason_diagnostic)
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -42,7 +42,8 @@
 
 import logging
 from struct import Struct
-from typing import Any, TYPE_CHECKING, Iterator, cast, Callable, TypeAlias
+import threading
+from typing import Any, BinaryIO, TYPE_CHECKING, Iterator, cast, Callable, TypeAlias
 
 from pydicom.uid import UID
 
@@ -51,6 +52,9 @@ from pynetdicom.presentation import PresentationContext
 from pynetdicom.utils import validate_uid, decode_bytes, set_ae, set_uid
 
 if TYPE_CHECKING:  # pragma: no cover
+    from pathlib import Path
+    from socket import socket
+
     from pynetdicom.pdu_primitives import (
         MaximumLengthNotification,
         ImplementationVersionNameNotification,
@@ -79,6 +83,25 @@ PACK_UCHAR = UCHAR.pack
 PACK_UINT2 = UINT2.pack
 PACK_UINT4 = UINT4.pack
 
+# Precompiled layouts for the fixed length fields of each item
+#   Item type, reserved, item length
+_ITEM_HEADER = Struct(">BxH")
+#   Presentation Context (RQ): item header, context ID, 3 reserved
+_CONTEXT_RQ = Struct(">BxHB3x")
+#   Presentation Context (AC): item header, context ID, reserved,
+#   result/reason, reserved
+_CONTEXT_AC = Struct(">BxHBxBx")
+#   Maximum Length: item header, maximum length received
+_MAXIMUM_LENGTH = Struct(">BxHI")
+#   Asynchronous Operations Window: item header, invoked, performed
+_ASYNC_OPS = Struct(">BxHHH")
+#   SCP/SCU Role Selection: item header, UID length
+_ROLE_HEADER = Struct(">BxHH")
+#   SCP/SCU Role Selection: SCU role, SCP role
+_ROLES = Struct("BB")
+#   Presentation Data Value: item length, context ID
+_PDV_HEADER = Struct(">IB")
+
 
 _DecoderType = list[tuple[int, int | None, str, Callable[[Any], bytes], list[Any]]]
 _EncoderType = list[tuple[str, Callable[[Any], bytes], list[Any]]]
@@ -233,8 +256,7 @@ class PDUItem:
         """
         offset = 0
         while bytestream[offset : offset + 1]:
-            item_type = UNPACK_UCHAR(bytestream[offset : offset + 1])[0]
-            item_length = UNPACK_UINT2(bytestream[offset + 2 : offset + 4])[0]
+            item_type, item_length = _ITEM_HEADER.unpack_from(bytestream, offset)
             item_data = bytestream[offset : offset + 4 + item_length]
             assert len(item_data) == 4 + item_length
             yield item_type, item_data
@@ -272,6 +294,14 @@ class PDUItem:
 
         return bytestream
 
+    @staticmethod
+    def _wrap_uid(bytestream: bytes) -> UID:
+        """Return `bytestream` as a UID without any trailing null padding."""
+        if bytestream[-1:] == b"\x00":
+            bytestream = bytestream[:-1]
+
+        return UID(decode_bytes(bytestream))
+
     @staticmethod
     def _wrap_encode_items(items: list[_AllItemType]) -> bytes:
         """Return `items` encoded as bytes.
@@ -461,6 +491,12 @@ class ApplicationContextItem(PDUItem):
             UID, set_uid(value, "Application Context Name", True, False)
         )
 
+    def decode(self, bytestream: bytes) -> None:
+        """Decode `bytestream` and use the result to set the field values of
+        the item.
+        """
+        self.application_context_name = self._wrap_uid(bytestream[4:])
+
     @property
     def _decoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -479,6 +515,11 @@ class ApplicationContextItem(PDUItem):
         """
         return [((4, None), "application_context_name", self._wrap_uid_bytes, [])]
 
+    def encode(self) -> bytes:
+        """Return the encoded item as :class:`bytes`."""
+        name = self.application_context_name.encode("ascii")
+        return _ITEM_HEADER.pack(0x10, len(name)) + name
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -647,6 +688,16 @@ class PresentationContextItemRQ(PDUItem):
         """
         return self.presentation_context_id
 
+    def decode(self, bytestream: bytes) -> None:
+        """Decode `bytestream` and use the result to set the field values of
+        the item.
+        """
+        self.presentation_context_id = _CONTEXT_RQ.unpack_from(bytestream)[2]
+        self.abstract_transfer_syntax_sub_items = cast(
+            list[AbstractSyntaxSubItem | TransferSyntaxSubItem],
+            _decode_items(bytestream, 8),
+        )
+
     @property
     def _decoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -673,6 +724,14 @@ class PresentationContextItemRQ(PDUItem):
             ),
         ]
 
+    def encode(self) -> bytes:
+        """Return the encoded item as :class:`bytes`."""
+        items = b"".join(
+            [item.encode() for item in self.abstract_transfer_syntax_sub_items]
+        )
+        header = _CONTEXT_RQ.pack(0x20, 4 + len(items), self.presentation_context_id)
+        return header + items
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -837,6 +896,15 @@ class PresentationContextItemAC(PDUItem):
         """Return the item's *Presentation Context ID* field value."""
         return self.presentation_context_id
 
+    def decode(self, bytestream: bytes) -> None:
+        """Decode `bytestream` and use the result to set the field values of
+        the item.
+        """
+        _, _, context_id, result = _CONTEXT_AC.unpack_from(bytestream)
+        self.presentation_context_id = context_id
+        self.result_reason = result
+        self.transfer_syntax_sub_item = self._wrap_generate_items(bytestream[8:])
+
     @property
     def _decoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -859,6 +927,14 @@ class PresentationContextItemAC(PDUItem):
             ((8, None), "transfer_syntax_sub_item", self._wrap_generate_items, []),
         ]
 
+    def encode(self) -> bytes:
+        """Return the encoded item as :class:`bytes`."""
+        items = b"".join([item.encode() for item in self.transfer_syntax_sub_item])
+        header = _CONTEXT_AC.pack(
+            0x21, 4 + len(items), self.presentation_context_id, self.result_reason
+        )
+        return header + items
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -1077,6 +1153,12 @@ class UserInformationItem(PDUItem):
             if isinstance(item, SOPClassCommonExtendedNegotiationSubItem)
         ]
 
+    def decode(self, bytestream: bytes) -> None:
+        """Decode `bytestream` and use the result to set the field values of
+        the item.
+        """
+        self.user_data = cast(list[_UIType], _decode_items(bytestream, 4))
+
     @property
     def _decoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -1095,6 +1177,11 @@ class UserInformationItem(PDUItem):
         """
         return [((4, None), "user_data", self._wrap_generate_items, [])]
 
+    def encode(self) -> bytes:
+        """Return the encoded item as :class:`bytes`."""
+        items = b"".join([item.encode() for item in self.user_data])
+        return _ITEM_HEADER.pack(0x50, len(items)) + items
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -1293,6 +1380,12 @@ class AbstractSyntaxSubItem(PDUItem):
         """
         self._abstract_syntax_name = set_uid(value, "Abstract Syntax Name")
 
+    def decode(self, bytestream: bytes) -> None:
+        """Decode `bytestream` and use the result to set the field values of
+        the item.
+        """
+        self.abstract_syntax_name = self._wrap_uid(bytestream[4:])
+
     @property
     def _decoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -1311,6 +1404,11 @@ class AbstractSyntaxSubItem(PDUItem):
         """
         return [((4, None), "abstract_syntax_name", self._wrap_uid_bytes, [])]
 
+    def encode(self) -> bytes:
+        """Return the encoded item as :class:`bytes`."""
+        value = cast(UID, self.abstract_syntax_name).encode("ascii")
+        return _ITEM_HEADER.pack(0x30, len(value)) + value
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -1417,6 +1515,12 @@ class TransferSyntaxSubItem(PDUItem):
         self._skip_validation: bool = False
         self._transfer_syntax_name: UID | None = None
 
+    def decode(self, bytestream: bytes) -> None:
+        """Decode `bytestream` and use the result to set the field values of
+        the item.
+        """
+        self.transfer_syntax_name = self._wrap_uid(bytestream[4:])
+
     @property
     def _decoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -1435,6 +1539,11 @@ class TransferSyntaxSubItem(PDUItem):
         """
         return [((4, None), "transfer_syntax_name", self._wrap_uid_bytes, [])]
 
+    def encode(self) -> bytes:
+        """Return the encoded item as :class:`bytes`."""
+        value = cast(UID, self.transfer_syntax_name).encode("ascii")
+        return _ITEM_HEADER.pack(0x40, len(value)) + value
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -1571,6 +1680,12 @@ class MaximumLengthSubItem(PDUItem):
 
         return primitive
 
+    def decode(self, bytestream: bytes) -> None:
+        """Decode `bytestream` and use the result to set the field values of
+        the item.
+        """
+        self.maximum_length_received = _MAXIMUM_LENGTH.unpack_from(bytestream)[2]
+
     @property
     def _decoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -1591,6 +1706,10 @@ class MaximumLengthSubItem(PDUItem):
             ((4, None), "maximum_length_received", self._wrap_unpack, [UNPACK_UINT4])
         ]
 
+    def encode(self) -> bytes:
+        """Return the encoded item as :class:`bytes`."""
+        return _MAXIMUM_LENGTH.pack(0x51, 4, self.maximum_length_received)
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -1698,6 +1817,12 @@ class ImplementationClassUIDSubItem(PDUItem):
 
         return primitive
 
+    def decode(self, bytestream: bytes) -> None:
+        """Decode `bytestream` and use the result to set the field values of
+        the item.
+        """
+        self.implementation_class_uid = self._wrap_uid(bytestream[4:])
+
     @property
     def _decoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -1716,6 +1841,11 @@ class ImplementationClassUIDSubItem(PDUItem):
         """
         return [((4, None), "implementation_class_uid", self._wrap_uid_bytes, [])]
 
+    def encode(self) -> bytes:
+        """Return the encoded item as :class:`bytes`."""
+        value = cast(UID, self.implementation_class_uid).encode("ascii")
+        return _ITEM_HEADER.pack(0x52, len(value)) + value
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -1850,6 +1980,12 @@ class ImplementationVersionNameSubItem(PDUItem):
 
         return prim
 
+    def decode(self, bytestream: bytes) -> None:
+        """Decode `bytestream` and use the result to set the field values of
+        the item.
+        """
+        self.implementation_version_name = decode_bytes(bytestream[4:])
+
     @property
     def _decoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -1868,6 +2004,11 @@ class ImplementationVersionNameSubItem(PDUItem):
         """
         return [((4, None), "implementation_version_name", self._wrap_bytes, [])]
 
+    def encode(self) -> bytes:
+        """Return the encoded item as :class:`bytes`."""
+        value = cast(str, self.implementation_version_name).encode("ascii")
+        return _ITEM_HEADER.pack(0x55, len(value)) + value
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -2010,6 +2151,14 @@ class AsynchronousOperationsWindowSubItem(PDUItem):
 
         return primitive
 
+    def decode(self, bytestream: bytes) -> None:
+        """Decode `bytestream` and use the result to set the field values of
+        the item.
+        """
+        _, _, invoked, performed = _ASYNC_OPS.unpack_from(bytestream)
+        self.maximum_number_operations_invoked = invoked
+        self.maximum_number_operations_performed = performed
+
     @property
     def _decoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -2041,6 +2190,15 @@ class AsynchronousOperationsWindowSubItem(PDUItem):
             ),
         ]
 
+    def encode(self) -> bytes:
+        """Return the encoded item as :class:`bytes`."""
+        return _ASYNC_OPS.pack(
+            0x53,
+            4,
+            self.maximum_number_operations_invoked,
+            self.maximum_number_operations_performed,
+        )
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -2189,6 +2347,14 @@ class SCP_SCU_RoleSelectionSubItem(PDUItem):
 
         return primitive
 
+    def decode(self, bytestream: bytes) -> None:
+        """Decode `bytestream` and use the result to set the field values of
+        the item.
+        """
+        uid_length = self._uid_length = _ROLE_HEADER.unpack_from(bytestream)[2]
+        self.sop_class_uid = self._wrap_uid(bytestream[6 : 6 + uid_length])
+        self.scu_role, self.scp_role = _ROLES.unpack_from(bytestream, 6 + uid_length)
+
     @property
     def _decoders(self) -> Any:
         """Yield tuples that contain field decoders.
@@ -2226,6 +2392,15 @@ class SCP_SCU_RoleSelectionSubItem(PDUItem):
             [UNPACK_UCHAR],
         )
 
+    def encode(self) -> bytes:
+        """Return the encoded item as :class:`bytes`."""
+        uid = cast(UID, self.sop_class_uid).encode("ascii")
+        return (
+            _ROLE_HEADER.pack(0x54, 4 + len(uid), len(uid))
+            + uid
+            + _ROLES.pack(self.scu_role, self.scp_role)
+        )
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -3364,7 +3539,7 @@ class PresentationDataValueItem(PDUItem):
     def __init__(self) -> None:
         """Initialise a new Presentation Data Value Item."""
         self.presentation_context_id: int | None = None
-        self.presentation_data_value: bytes | None = None
+        self.presentation_data_value: "bytes | _FileFragment | None" = None
 
     @property
     def context_id(self) -> int | None:
@@ -3372,10 +3547,17 @@ class PresentationDataValueItem(PDUItem):
         return self.presentation_context_id
 
     @property
-    def data(self) -> bytes | None:
+    def data(self) -> "bytes | _FileFragment | None":
         """Return the item's *Presentation Data Value* field value."""
         return self.presentation_data_value
 
+    def decode(self, bytestream: bytes) -> None:
+        """Decode `bytestream` and use the result to set the field values of
+        the item.
+        """
+        self.presentation_context_id = _PDV_HEADER.unpack_from(bytestream)[1]
+        self.presentation_data_value = bytestream[5:]
+
     @property
     def _decoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -3397,6 +3579,11 @@ class PresentationDataValueItem(PDUItem):
             ((5, None), "presentation_data_value", self._wrap_bytes, []),
         ]
 
+    def encode(self) -> bytes:
+        """Return the encoded item as :class:`bytes`."""
+        value = bytes(cast(bytes, self.presentation_data_value))
+        return _PDV_HEADER.pack(1 + len(value), self.presentation_context_id) + value
+
     @property
     def _encoders(self) -> list[tuple[str, Callable, list[Any]]]:
         """Return an iterable of tuples that contain field decoders.
@@ -3413,7 +3600,7 @@ class PresentationDataValueItem(PDUItem):
         return [
             ("item_length", PACK_UINT4, []),
             ("presentation_context_id", PACK_UCHAR, []),
-            ("presentation_data_value", self._wrap_bytes, []),
+            ("presentation_data_value", bytes, []),
         ]
 
     @property
@@ -3453,6 +3640,116 @@ class PresentationDataValueItem(PDUItem):
         return "\n".join(s)
 
 
+class _FileSource:
+    """The file that a data set is read from when it's sent in fragments.
+
+    .. versionadded:: 3.1
+
+    The file is opened when first read and shared by all of the data set's
+    fragments, so it's only opened once per message rather than once per
+    fragment. It's closed once the last fragment has been sent.
+
+    Attributes
+    ----------
+    path : pathlib.Path
+        The path to the file containing the encoded data set.
+    """
+
+    def __init__(self, path: "Path") -> None:
+        self.path = path
+
+        self._file: BinaryIO | None = None
+        # Reads and sends change the file position
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close the file, if open."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def read(self, offset: int, length: int) -> bytes:
+        """Return `length` bytes from the file, starting at `offset`."""
+        with self._lock:
+            f = self._open()
+            f.seek(offset)
+            return f.read(length)
+
+    def sendfile(self, sock: "socket", offset: int, length: int) -> int:
+        """Send `length` bytes from the file using `sock`, starting at
+        `offset`, and return the number of bytes sent.
+        """
+        with self._lock:
+            # Uses os.sendfile() if possible, otherwise falls back to send()
+            return sock.sendfile(self._open(), offset, length)
+
+    def _open(self) -> BinaryIO:
+        """Return the file, opening it if required."""
+        if self._file is None:
+            self._file = open(self.path, "rb")
+
+        return self._file
+
+
+class _FileFragment:
+    """A presentation data value whose data set fragment is read from a file
+    when it's sent.
+
+    .. versionadded:: 3.1
+
+    Used with :attr:`~pynetdicom._config.STORE_SEND_CHUNKED_DATASET` so the
+    fragment can be sent to the peer directly from the file with
+    :meth:`socket.sendfile()<socket.socket.sendfile>`.
+
+    Attributes
+    ----------
+    header : bytes
+        The message control header.
+    source : pdu_items._FileSource
+        The file containing the encoded data set, shared by all the fragments
+        of the data set.
+    offset : int
+        The offset in the file to the start of the fragment.
+    length : int
+        The length of the fragment, in bytes.
+    """
+
+    def __init__(
+        self, header: bytes, source: _FileSource, offset: int, length: int
+    ) -> None:
+        self.header = header
+        self.source = source
+        self.offset = offset
+        self.length = length
+
+    def __bytes__(self) -> bytes:
+        """Return the presentation data value as :class:`bytes`."""
+        return self.header + self.source.read(self.offset, self.length)
+
+    def __getitem__(self, key: int | slice) -> Any:
+        """Return the value at `key`, only reading the file if required."""
+        nr_header = len(self.header)
+        if isinstance(key, int) and 0 <= key < nr_header:
+            return self.header[key]
+
+        if isinstance(key, slice) and key.step is None:
+            start = key.start or 0
+            if 0 <= start and key.stop is not None and key.stop <= nr_header:
+                return self.header[key]
+
+        return bytes(self)[key]
+
+    def __len__(self) -> int:
+        """Return the length of the presentation data value."""
+        return len(self.header) + self.length
+
+    @property
+    def is_last(self) -> bool:
+        """Return ``True`` if the fragment is the last of the data set."""
+        return bool(self.header[0] & 0x02)
+
+
 # PDU items and sub-items, indexed by their type
 PDU_ITEM_TYPES = {
     0x10: ApplicationContextItem,
@@ -3473,3 +3770,34 @@ PDU_ITEM_TYPES = {
 }
 
 _TYPE_TO_PDU_ITEM = {vv: kk for kk, vv in PDU_ITEM_TYPES.items()}
+
+
+def _decode_items(bytestream: bytes, offset: int = 0) -> list[_AllItemType]:
+    """Return the items decoded from `bytestream`, starting at `offset`.
+
+    Parameters
+    ----------
+    bytestream : bytes
+        The encoded PDU or item containing the items.
+    offset : int, optional
+        The offset in `bytestream` of the first item (default ``0``).
+
+    Returns
+    -------
+    list of PDU items
+        The decoded items.
+    """
+    items = []
+    length = len(bytestream)
+    while offset < length:
+        item_type, item_length = _ITEM_HEADER.unpack_from(bytestream, offset)
+        end = offset + 4 + item_length
+        if end > length:
+            raise ValueError("The encoded item is shorter than its 'Item Length'")
+
+        item = cast(_AllItemType, PDU_ITEM_TYPES[item_type]())
+        item.decode(bytestream[offset:end])
+        items.append(item)
+        offset = end
+
+    return items
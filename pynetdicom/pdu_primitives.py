@@ -18,6 +18,7 @@ from pynetdicom.pdu_items import (
     SOPClassCommonExtendedNegotiationSubItem,
     UserIdentitySubItemRQ,
     UserIdentitySubItemAC,
+    _FileFragment,
 )
 from pynetdicom.presentation import PresentationContext
 from pynetdicom.utils import validate_uid, decode_bytes, set_ae, set_uid
@@ -30,6 +31,8 @@ if TYPE_CHECKING:  # pragma: no cover
 LOGGER = logging.getLogger(__name__)
 
 _PDUPrimitiveType: TypeAlias = "A_ASSOCIATE | A_RELEASE | A_ABORT | A_P_ABORT | P_DATA"
+# (Context ID, PDV data), the data may be sent directly from file
+_PDVType: TypeAlias = "tuple[int, bytes | _FileFragment]"
 _UserInformationPrimitiveType = list[
     "MaximumLengthNotification | ImplementationClassUIDNotification | "
     "ImplementationVersionNameNotification | AsynchronousOperationsWindowNegotiation | "
@@ -725,6 +728,8 @@ class A_RELEASE:
     * DICOM Standard, Part 8, :dcm:`Section 7.2<part08/sect_7.2.html>`
     """
 
+    __slots__ = ("_result",)
+
     def __init__(self) -> None:
         self._result: str | None = None
 
@@ -781,6 +786,8 @@ class A_ABORT:
     * DICOM Standard, Part 8, :dcm:`Section 7.3<part08/sect_7.3.html>`
     """
 
+    __slots__ = ("_abort_source",)
+
     def __init__(self) -> None:
         self._abort_source: int | None = None
 
@@ -839,6 +846,8 @@ class A_P_ABORT:
     * DICOM Standard, Part 8, :dcm:`Section 7.4<part08/sect_7.4.html>`
     """
 
+    __slots__ = ("_provider_reason",)
+
     def __init__(self) -> None:
         self._provider_reason: int | None = None
 
@@ -899,11 +908,13 @@ class P_DATA:
     * DICOM Standard, Part 8, :dcm:`Section 7.6<part08/sect_7.6.html>`
     """
 
+    __slots__ = ("_presentation_data_value_list",)
+
     def __init__(self) -> None:
-        self._presentation_data_value_list: list[tuple[int, bytes]] = []
+        self._presentation_data_value_list: list[_PDVType] = []
 
     @property
-    def presentation_data_value_list(self) -> list[tuple[int, bytes]]:
+    def presentation_data_value_list(self) -> list[_PDVType]:
         """Get or set the *Presentation Data Value List*.
 
         Parameters
@@ -914,17 +925,25 @@ class P_DATA:
             The User Data values are taken from the Abstract Syntax and
             encoded in the Transfer Syntax identified by the Presentation
             Context ID. Each item in the list is ``[Context ID, PDV Data]``
+
+            .. versionchanged:: 3.1
+
+                The PDV data may also be a :class:`memoryview`, which is
+                used for primitives created from received P-DATA-TF PDUs,
+                or a fragment of a data set that's sent directly from file.
         """
         return self._presentation_data_value_list
 
     @presentation_data_value_list.setter
-    def presentation_data_value_list(self, value_list: list[tuple[int, bytes]]) -> None:
+    def presentation_data_value_list(self, value_list: list[_PDVType]) -> None:
         """Set the Presentation Data Value List."""
         # pylint: disable=attribute-defined-outside-init
         if isinstance(value_list, list):
             for pdv in value_list:
                 if isinstance(pdv, list):
-                    if isinstance(pdv[0], int) and isinstance(pdv[1], bytes):
+                    if isinstance(pdv[0], int) and isinstance(
+                        pdv[1], (bytes, memoryview)
+                    ):
                         pass
                     else:
                         raise TypeError(
@@ -0,0 +1,423 @@
+"""
+A pool of established associations that can be reused by an SCU.
+"""
+
+from collections import deque
+from contextlib import contextmanager
+import logging
+from ssl import SSLContext
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Iterator, Hashable
+
+from pynetdicom.association import Association
+from pynetdicom.events import EventHandlerType
+from pynetdicom.presentation import PresentationContext
+from pynetdicom.pdu_primitives import _UI
+from pynetdicom.sop_class import Verification  # type: ignore
+from pynetdicom._globals import DEFAULT_MAX_LENGTH
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pynetdicom.ae import ApplicationEntity
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+class AssociationPool:
+    """A pool of established associations with one or more peers.
+
+    .. versionadded:: 3.1
+
+    Requesting an association requires a TCP handshake, an optional TLS
+    handshake and association negotiation, which can take longer than the
+    operations being performed when making many small requests. An
+    :class:`AssociationPool` keeps the associations it's handed back
+    established so they can be reused by later requests with the same
+    peer and negotiation parameters.
+
+    Associations are handed out exclusively by :meth:`acquire` and should be
+    returned with :meth:`release` once they're no longer needed, or
+    :meth:`association` can be used to do both:
+
+    .. code-block:: python
+
+        from pynetdicom import AE, AssociationPool
+        from pynetdicom.sop_class import CTImageStorage, Verification
+
+        ae = AE()
+        ae.add_requested_context(CTImageStorage)
+        ae.add_requested_context(Verification)
+
+        with AssociationPool(ae) as pool:
+            for ds in datasets:
+                with pool.association("127.0.0.1", 11112) as assoc:
+                    if assoc.is_established:
+                        status = assoc.send_c_store(ds)
+
+    Associations that have been idle for longer than `idle_timeout` are
+    released and those that have been aborted or released by the peer are
+    discarded. If a *Verification SOP Class* presentation context has been
+    accepted then associations that have been idle for longer than
+    `check_idle` are checked by sending a C-ECHO request before being handed
+    out again.
+
+    Attributes
+    ----------
+    ae : ae.ApplicationEntity
+        The AE used to request new associations.
+    check_idle : float | None
+        The time (in seconds) an association may be idle before it's checked
+        using C-ECHO when acquired, or ``None`` to never check.
+    idle_timeout : float | None
+        The time (in seconds) an association may be idle before it's
+        released, or ``None`` to keep idle associations indefinitely. Should
+        be less than the AE's
+        :attr:`~pynetdicom.ae.ApplicationEntity.network_timeout`, otherwise
+        idle associations will be aborted instead.
+    max_size : int
+        The maximum number of associations, both idle and in use, for each
+        peer and set of negotiation parameters.
+    """
+
+    def __init__(
+        self,
+        ae: "ApplicationEntity",
+        max_size: int = 4,
+        idle_timeout: float | None = 30,
+        check_idle: float | None = 5,
+    ) -> None:
+        """Create a new association pool.
+
+        Parameters
+        ----------
+        ae : ae.ApplicationEntity
+            The AE to use to request new associations.
+        max_size : int, optional
+            The maximum number of associations for each peer and set of
+            negotiation parameters (default ``4``).
+        idle_timeout : float | None, optional
+            The time (in seconds) an association may be idle before it's
+            released (default ``30``), or ``None`` for no timeout.
+        check_idle : float | None, optional
+            The time (in seconds) an association may be idle before it's
+            checked using C-ECHO when acquired (default ``5``), or ``None``
+            to never check.
+        """
+        if max_size < 1:
+            raise ValueError("'max_size' must be greater than 0")
+
+        self.ae = ae
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.check_idle = check_idle
+
+        self._cond = threading.Condition()
+        self._is_closed = False
+        # The idle associations and the time they became idle, most recently
+        #   used last, keyed by the peer and negotiation parameters
+        self._idle: dict[Hashable, deque[tuple[Association, float]]] = {}
+        # The number of idle and in use associations for each key
+        self._size: dict[Hashable, int] = {}
+        # The associations that have been handed out and their keys
+        self._in_use: dict[Association, Hashable] = {}
+
+    def __enter__(self) -> "AssociationPool":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def acquire(
+        self,
+        addr: str | tuple[str, int, int],
+        port: int,
+        contexts: list[PresentationContext] | None = None,
+        ae_title: str = "ANY-SCP",
+        max_pdu: int = DEFAULT_MAX_LENGTH,
+        ext_neg: list[_UI] | None = None,
+        bind_address: tuple[str, int] | tuple[str, int, int, int] | None = None,
+        tls_args: tuple[SSLContext, str] | None = None,
+        evt_handlers: list[EventHandlerType] | None = None,
+        timeout: float | None = None,
+    ) -> Association:
+        """Return an association with a remote AE for exclusive use.
+
+        If there's an idle association with the same `addr`, `port`,
+        `ae_title`, `max_pdu`, `tls_args`, requested presentation contexts and
+        local AE title then it will be reused, otherwise a new association
+        will be requested using
+        :meth:`ApplicationEntity.associate()
+        <pynetdicom.ae.ApplicationEntity.associate>`. Any `ext_neg`,
+        `bind_address` and `evt_handlers` are only used when requesting a new
+        association.
+
+        As with :meth:`~pynetdicom.ae.ApplicationEntity.associate` the
+        returned association should be checked using
+        :attr:`Association.is_established
+        <pynetdicom.association.Association.is_established>` before use.
+
+        Parameters
+        ----------
+        addr : str | tuple[str, int, int]
+            The peer AE's TCP/IP address.
+        port : int
+            The peer AE's listen port number.
+        contexts : list of presentation.PresentationContext, optional
+            The presentation contexts to request, if not used then the AE's
+            :attr:`~pynetdicom.ae.ApplicationEntity.requested_contexts` will
+            be used instead.
+        ae_title : str, optional
+            The peer's AE title (default ``'ANY-SCP'``).
+        max_pdu : int, optional
+            The maximum PDV receive size in bytes (default ``16832``).
+        ext_neg : list of UserInformation objects, optional
+            Extended negotiation items to use when requesting a new
+            association.
+        bind_address : tuple[str, int] | tuple[str, int, int, int], optional
+            The address to bind a new association's socket to.
+        tls_args : 2-tuple, optional
+            The (`ssl_context`, `server_hostname`) to use for TLS.
+        evt_handlers : list of 2- or 3-tuple, optional
+            The event handlers to bind to a new association.
+        timeout : float | None, optional
+            If the pool already has `max_size` associations with the peer
+            and none are idle then the time (in seconds) to wait for one to
+            be released, or ``None`` (default) to wait indefinitely.
+
+        Returns
+        -------
+        association.Association
+            The association, which must be returned to the pool using
+            :meth:`release`.
+
+        Raises
+        ------
+        RuntimeError
+            If the pool has been closed.
+        TimeoutError
+            If no association became available within `timeout` seconds.
+        """
+        contexts = contexts or self.ae.requested_contexts
+        key = (
+            addr,
+            port,
+            ae_title,
+            self.ae.ae_title,
+            max_pdu,
+            tls_args,
+            tuple(
+                (
+                    cx.abstract_syntax,
+                    tuple(cx.transfer_syntax),
+                    cx.scu_role,
+                    cx.scp_role,
+                )
+                for cx in contexts
+            ),
+        )
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            item = self._checkout(key, deadline)
+            if item is None:
+                break
+
+            if self._is_usable(*item):
+                return item[0]
+
+            self._discard(item[0])
+
+        # No idle associations so request a new one
+        try:
+            assoc = self.ae.associate(
+                addr,
+                port,
+                contexts=contexts,
+                ae_title=ae_title,
+                max_pdu=max_pdu,
+                ext_neg=ext_neg,
+                bind_address=bind_address,
+                tls_args=tls_args,
+                evt_handlers=evt_handlers,
+            )
+        except Exception:
+            self._remove(key)
+            raise
+
+        if not assoc.is_established:
+            self._remove(key)
+            return assoc
+
+        with self._cond:
+            self._in_use[assoc] = key
+
+        return assoc
+
+    @contextmanager
+    def association(self, *args: Any, **kwargs: Any) -> Iterator[Association]:
+        """Return a context manager that acquires an association from the
+        pool and releases it back to the pool on exit.
+
+        Takes the same parameters as :meth:`acquire`.
+        """
+        assoc = self.acquire(*args, **kwargs)
+        try:
+            yield assoc
+        finally:
+            self.release(assoc)
+
+    def close(self) -> None:
+        """Close the pool and release its idle associations.
+
+        Associations that are in use will be released when they're returned
+        to the pool.
+        """
+        with self._cond:
+            self._is_closed = True
+            idle = [(a, key) for key, items in self._idle.items() for a, _ in items]
+            self._idle.clear()
+            self._cond.notify_all()
+
+        for assoc, key in idle:
+            self._discard(assoc, key)
+
+    @property
+    def is_closed(self) -> bool:
+        """Return ``True`` if the pool has been closed, ``False`` otherwise."""
+        return self._is_closed
+
+    def release(self, assoc: Association) -> None:
+        """Return an association acquired with :meth:`acquire` to the pool.
+
+        Associations that are no longer established are discarded, as are
+        all associations once the pool has been closed.
+
+        Parameters
+        ----------
+        assoc : association.Association
+            The association to return to the pool.
+        """
+        with self._cond:
+            key = self._in_use.pop(assoc, None)
+            if key is None:
+                # Not from the pool or already released
+                return
+
+            if assoc.is_established and not self._is_closed:
+                items = self._idle.setdefault(key, deque())
+                items.append((assoc, time.monotonic()))
+                self._cond.notify_all()
+                return
+
+        self._discard(assoc, key)
+
+    @property
+    def size(self) -> int:
+        """Return the total number of idle and in use associations."""
+        with self._cond:
+            return sum(self._size.values())
+
+    def _checkout(
+        self, key: Hashable, deadline: float | None
+    ) -> tuple[Association, float] | None:
+        """Return the most recently used idle association for `key` and the
+        time it became idle, or ``None`` if there are none and a new one may
+        be requested.
+        """
+        with self._cond:
+            while True:
+                if self._is_closed:
+                    raise RuntimeError("The association pool has been closed")
+
+                self._evict()
+                items = self._idle.get(key)
+                if items:
+                    assoc, idle_since = items.pop()
+                    self._in_use[assoc] = key
+                    return assoc, idle_since
+
+                if self._size.get(key, 0) < self.max_size:
+                    # Reserve a place for the new association
+                    self._size[key] = self._size.get(key, 0) + 1
+                    return None
+
+                timeout = None
+                if deadline is not None:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        raise TimeoutError(
+                            "Timed out waiting for an association to become "
+                            "available"
+                        )
+
+                if self.idle_timeout is not None:
+                    # Wake to evict any idle associations that time out
+                    timeout = min(timeout or self.idle_timeout, self.idle_timeout)
+
+                self._cond.wait(timeout)
+
+    def _discard(self, assoc: Association, key: Hashable | None = None) -> None:
+        """Remove `assoc` from the pool and release it if still established."""
+        with self._cond:
+            key = self._in_use.pop(assoc, key)
+
+        if assoc.is_established:
+            assoc.release()
+
+        if key is not None:
+            self._remove(key)
+
+    def _evict(self) -> None:
+        """Discard idle associations that have timed out or are no longer
+        established.
+
+        Must be called while holding ``_cond``.
+        """
+        now = time.monotonic()
+        for key, items in list(self._idle.items()):
+            for item in list(items):
+                assoc, idle_since = item
+                has_expired = (
+                    self.idle_timeout is not None
+                    and now - idle_since > self.idle_timeout
+                )
+                if not has_expired and assoc.is_established:
+                    continue
+
+                items.remove(item)
+                self._size[key] -= 1
+                if assoc.is_established:
+                    LOGGER.debug("Releasing idle association")
+                    # Release without blocking the other users of the pool
+                    threading.Thread(target=assoc.release, daemon=True).start()
+
+            if not self._size[key]:
+                del self._size[key]
+                del self._idle[key]
+
+    def _is_usable(self, assoc: Association, idle_since: float) -> bool:
+        """Return ``True`` if the idle association `assoc` is still usable."""
+        if not assoc.is_established:
+            return False
+
+        if self.check_idle is None or time.monotonic() - idle_since <= self.check_idle:
+            return True
+
+        # Check the peer is still responding to requests
+        contexts = assoc.accepted_contexts
+        if not any(cx.abstract_syntax == Verification for cx in contexts):
+            return True
+
+        status = assoc.send_c_echo()
+        return bool(assoc.is_established and status.get("Status", None) == 0x0000)
+
+    def _remove(self, key: Hashable) -> None:
+        """Free the place of an association for `key`."""
+        with self._cond:
+            self._size[key] -= 1
+            if not self._size[key]:
+                del self._size[key]
+                self._idle.pop(key, None)
+
+            self._cond.notify_all()
@@ -207,6 +207,17 @@ class PresentationContext:
       and :dcm:`Annex B <part08/chapter_B.html>`
     """
 
+    __slots__ = (
+        "_context_id",
+        "_abstract_syntax",
+        "_transfer_syntax",
+        "result",
+        "_scu_role",
+        "_scp_role",
+        "_as_scp",
+        "_as_scu",
+    )
+
     def __init__(self) -> None:
         """Create a new object."""
         self._context_id: None | int = None
@@ -343,7 +354,9 @@ class PresentationContext:
             return True
 
         if isinstance(other, self.__class__):
-            return self.__dict__ == other.__dict__
+            return all(
+                getattr(self, name) == getattr(other, name) for name in self.__slots__
+            )
 
         return NotImplemented
 
@@ -2,7 +2,6 @@
 
 from io import BytesIO
 import logging
-import os
 import sys
 import traceback
 from types import TracebackType
@@ -20,7 +19,7 @@ from pydicom.dataset import Dataset
 from pydicom.tag import Tag
 
 from pynetdicom import evt, _config
-from pynetdicom.dsutils import decode, encode, pretty_dataset
+from pynetdicom.dsutils import DatasetWriter, decode, encode, pretty_dataset
 from pynetdicom.dimse_primitives import (
     C_STORE,
     C_ECHO,
@@ -248,10 +247,11 @@ class ServiceClass:
         transfer_syntax = context.transfer_syntax[0]
 
         # Build C-FIND response primitive
-        rsp = C_FIND()
-        rsp.MessageID = req.MessageID
-        rsp.MessageIDBeingRespondedTo = req.MessageID
-        rsp.AffectedSOPClassUID = req.AffectedSOPClassUID
+        rsp = C_FIND._trusted(
+            MessageID=req.MessageID,
+            MessageIDBeingRespondedTo=req.MessageID,
+            AffectedSOPClassUID=req.AffectedSOPClassUID,
+        )
 
         # Decode and log Identifier
         if _config.LOG_REQUEST_IDENTIFIERS:
@@ -422,11 +422,8 @@ class ServiceClass:
             ``True`` if a C-CANCEL message has been received with a *Message ID
             Being Responded To* corresponding to `msg_id`, ``False`` otherwise.
         """
-        if msg_id in self.dimse.cancel_req.keys():
-            del self.dimse.cancel_req[msg_id]
-            return True
-
-        return False
+        # Other requests may be performed concurrently
+        return self.dimse.cancel_req.pop(msg_id, None) is not None
 
     def is_valid_status(self, status: int) -> bool:
         """Return ``True`` if `status` is valid for the service class.
@@ -1455,10 +1452,11 @@ class VerificationServiceClass(ServiceClass):
             The presentation context that the SCP is operating under.
         """
         # Build C-ECHO response primitive
-        rsp = C_ECHO()
-        rsp.MessageID = req.MessageID
-        rsp.MessageIDBeingRespondedTo = req.MessageID
-        rsp.AffectedSOPClassUID = req.AffectedSOPClassUID
+        rsp = C_ECHO._trusted(
+            MessageID=req.MessageID,
+            MessageIDBeingRespondedTo=req.MessageID,
+            AffectedSOPClassUID=req.AffectedSOPClassUID,
+        )
 
         setattr(self.assoc, "abort", self.assoc._abort_nonblocking)
         try:
@@ -1535,11 +1533,12 @@ class StorageServiceClass(ServiceClass):
             The presentation context that the SCP is operating under.
         """
         # Build C-STORE response primitive
-        rsp = C_STORE()
-        rsp.MessageID = req.MessageID
-        rsp.MessageIDBeingRespondedTo = req.MessageID
-        rsp.AffectedSOPInstanceUID = req.AffectedSOPInstanceUID
-        rsp.AffectedSOPClassUID = req.AffectedSOPClassUID
+        rsp = C_STORE._trusted(
+            MessageID=req.MessageID,
+            MessageIDBeingRespondedTo=req.MessageID,
+            AffectedSOPInstanceUID=req.AffectedSOPInstanceUID,
+            AffectedSOPClassUID=req.AffectedSOPClassUID,
+        )
 
         cx_id = cast(int, context.context_id)
 
@@ -1552,25 +1551,49 @@ class StorageServiceClass(ServiceClass):
                 evt.EVT_C_STORE,
                 {"request": req, "context": context.as_tuple},
             )
-            if req._dataset_file:
-                req._dataset_file.close()
-
-                try:
-                    # We passed delete=False when creating the temporary file
-                    os.unlink(req._dataset_file.name)
-                except OSError:
-                    # This is best effort on e.g Windows where files may
-                    # not be deleted while in use.
-                    pass
 
         # Exception in context or handler aborted/released
         if not ctx.success or not self.assoc.is_established:
+            if req._dataset_file:
+                req._dataset_file.close()
+
             return
 
         # Validate rsp_status and set rsp.Status accordingly
         rsp = self.validate_status(cast(StatusType, rsp_status), rsp)
+        if req._dataset_file:
+            self._commit_dataset(req._dataset_file, rsp)
+
         self.dimse.send_msg(rsp, cx_id)
 
+    def _commit_dataset(self, writer: DatasetWriter, rsp: C_STORE) -> None:
+        """Move a dataset written to file to its final location if the
+        handler returned a success or warning status.
+
+        Parameters
+        ----------
+        writer : dsutils.DatasetWriter
+            The writer used to store the dataset.
+        rsp : dimse_primitives.C_STORE
+            The C-STORE response primitive, its *Status* will be changed to
+            ``0xA700`` if the dataset couldn't be moved.
+        """
+        status = cast(int, rsp.Status)
+        try:
+            if status in self.statuses and self.statuses[status][0] in (
+                STATUS_SUCCESS,
+                STATUS_WARNING,
+            ):
+                writer.commit()
+        except Exception as exc:
+            LOGGER.error("Unable to move the received dataset to its final location")
+            LOGGER.exception(exc)
+            # Refused: Out of resources
+            rsp.Status = 0xA700
+        finally:
+            # Deletes the file unless it was moved to its final location
+            writer.close()
+
 
 class QueryRetrieveServiceClass(ServiceClass):
     """Implementation of the Query/Retrieve Service Class."""
@@ -1680,10 +1703,11 @@ class QueryRetrieveServiceClass(ServiceClass):
         transfer_syntax = context.transfer_syntax[0]
 
         # Build C-GET response primitive
-        rsp = C_GET()
-        rsp.MessageID = req.MessageID
-        rsp.MessageIDBeingRespondedTo = req.MessageID
-        rsp.AffectedSOPClassUID = req.AffectedSOPClassUID
+        rsp = C_GET._trusted(
+            MessageID=req.MessageID,
+            MessageIDBeingRespondedTo=req.MessageID,
+            AffectedSOPClassUID=req.AffectedSOPClassUID,
+        )
 
         if _config.LOG_REQUEST_IDENTIFIERS:
             try:
@@ -2045,10 +2069,11 @@ class QueryRetrieveServiceClass(ServiceClass):
         transfer_syntax = context.transfer_syntax[0]
 
         # Build C-MOVE response primitive
-        rsp = C_MOVE()
-        rsp.MessageID = req.MessageID
-        rsp.MessageIDBeingRespondedTo = req.MessageID
-        rsp.AffectedSOPClassUID = req.AffectedSOPClassUID
+        rsp = C_MOVE._trusted(
+            MessageID=req.MessageID,
+            MessageIDBeingRespondedTo=req.MessageID,
+            AffectedSOPClassUID=req.AffectedSOPClassUID,
+        )
 
         if _config.LOG_REQUEST_IDENTIFIERS:
             try:
@@ -2538,10 +2563,11 @@ class RelevantPatientInformationQueryServiceClass(ServiceClass):
         transfer_syntax = context.transfer_syntax[0]
 
         # Build C-FIND response primitive
-        rsp = C_FIND()
-        rsp.MessageID = req.MessageID
-        rsp.MessageIDBeingRespondedTo = req.MessageID
-        rsp.AffectedSOPClassUID = req.AffectedSOPClassUID
+        rsp = C_FIND._trusted(
+            MessageID=req.MessageID,
+            MessageIDBeingRespondedTo=req.MessageID,
+            AffectedSOPClassUID=req.AffectedSOPClassUID,
+        )
 
         # Decode and log Identifier
         if _config.LOG_REQUEST_IDENTIFIERS:
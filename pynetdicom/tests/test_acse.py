@@ -1956,7 +1956,7 @@ class TestAsyncOpsNegotiation:
         port = get_port()
 
         def handle(event):
-            return event.invoked, event.performed
+            return event.nr_invoked, event.nr_performed
 
         handlers = [(evt.EVT_ASYNC_OPS, handle)]
 
@@ -1976,8 +1976,51 @@ class TestAsyncOpsNegotiation:
         assoc = ae.associate("localhost", port, ext_neg=ext_neg)
 
         assert assoc.is_established
-        # Because pynetdicom doesn't support async ops this is always 1, 1
-        assert assoc.acceptor.asynchronous_operations == (1, 1)
+        assert assoc.acceptor.asynchronous_operations == (0, 2)
+
+        assoc.release()
+
+        scp.shutdown()
+
+    @pytest.mark.parametrize(
+        "requested, returned, accepted",
+        [
+            ((5, 5), (1, 1), (1, 1)),
+            ((5, 5), (7, 3), (5, 3)),
+            ((5, 5), (0, 0), (5, 5)),
+            ((0, 0), (7, 0), (7, 0)),
+            ((0, 2), (-1, 1), (1, 1)),
+            ((0, 2), (1, 65536), (1, 1)),
+            ((0, 2), ("a", 1), (1, 1)),
+        ],
+    )
+    def test_req_response_reduced(self, requested, returned, accepted, caplog):
+        """Test the response is reduced to the requested values."""
+        port = get_port()
+
+        def handle(event):
+            return returned
+
+        handlers = [(evt.EVT_ASYNC_OPS, handle)]
+
+        self.ae = ae = AE()
+        ae.add_supported_context(Verification)
+        ae.add_requested_context(Verification)
+        scp = ae.start_server(("localhost", port), block=False, evt_handlers=handlers)
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+
+        item = AsynchronousOperationsWindowNegotiation()
+        item.maximum_number_operations_invoked = requested[0]
+        item.maximum_number_operations_performed = requested[1]
+
+        with caplog.at_level(logging.ERROR, logger="pynetdicom"):
+            assoc = ae.associate("localhost", port, ext_neg=[item])
+
+        assert assoc.is_established
+        assert assoc.acceptor.asynchronous_operations == accepted
+        if accepted == (1, 1) and returned != (1, 1):
+            assert "Invalid number of operations returned" in caplog.text
 
         assoc.release()
 
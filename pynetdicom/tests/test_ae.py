@@ -12,10 +12,11 @@ import pytest
 
 from pydicom import dcmread, config as PYD_CONFIG
 from pydicom.dataset import Dataset
-from pydicom.uid import UID, ImplicitVRLittleEndian
+from pydicom.uid import UID, ExplicitVRLittleEndian, ImplicitVRLittleEndian
 
 from pynetdicom import (
     AE,
+    ALL_TRANSFER_SYNTAXES,
     build_context,
     _config,
     debug_logger,
@@ -27,7 +28,8 @@ from pynetdicom import (
     VerificationPresentationContexts,
 )
 from pynetdicom.presentation import build_context
-from pynetdicom.sop_class import RTImageStorage, Verification
+from pynetdicom.service_class import StorageServiceClass
+from pynetdicom.sop_class import RTImageStorage, Verification, uid_to_service_class
 from pynetdicom.transport import AssociationServer, RequestHandler
 
 from .utils import get_port
@@ -1029,6 +1031,26 @@ class TestAEGoodMiscSetters:
 
         assert ae.implementation_class_uid == UID("12.3.4")
 
+    def test_dataset_writer(self):
+        """Test dataset_writer"""
+        ae = AE()
+        assert ae.dataset_writer is None
+
+        def factory(file_meta):
+            return None
+
+        ae.dataset_writer = factory
+        assert ae.dataset_writer is factory
+
+        msg = r"'dataset_writer' must be a callable or None"
+        with pytest.raises(TypeError, match=msg):
+            ae.dataset_writer = "foo"
+
+        assert ae.dataset_writer is factory
+
+        ae.dataset_writer = None
+        assert ae.dataset_writer is None
+
 
 class TestAEBadInitialisation:
     def test_invalid_ae_title(self):
@@ -1888,3 +1910,196 @@ class TestAERequestedPresentationContexts:
         context = self.ae.requested_contexts[0]
         assert context.transfer_syntax == DEFAULT_TRANSFER_SYNTAXES
         assert context.abstract_syntax == "1.2.840.10008.5.1.4.1.1.481.1"
+
+
+class TestAESendMany:
+    """Tests for AE.send_many()"""
+
+    def setup_method(self):
+        """Run prior to each test"""
+        self.ae = None
+        self.received = []
+
+    def teardown_method(self):
+        """Clear any active threads"""
+        if self.ae:
+            self.ae.shutdown()
+
+    def start(self, contexts=StoragePresentationContexts, handle_store=None):
+        """Start a Storage SCP and return the AE."""
+
+        def handle(event):
+            self.received.append((event.assoc, event.request.AffectedSOPInstanceUID))
+            return 0x0000
+
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        for cx in contexts:
+            ae.add_supported_context(cx.abstract_syntax, ALL_TRANSFER_SYNTAXES)
+
+        self.scp = ae.start_server(
+            ("localhost", get_port()),
+            block=False,
+            evt_handlers=[(evt.EVT_C_STORE, handle_store or handle)],
+        )
+
+        return ae
+
+    def test_parallel_raises(self):
+        """Test an invalid `parallel` raises an exception."""
+        msg = "'parallel' must be greater than 0"
+        with pytest.raises(ValueError, match=msg):
+            AE().send_many([], "localhost", get_port(), parallel=0)
+
+    def test_send(self, monkeypatch):
+        """Test sending datasets and dataset files."""
+        ae = self.start()
+        paths = [
+            os.path.join(TEST_DS_DIR, "CTImageStorage.dcm"),
+            os.path.join(TEST_DS_DIR, "MRImageStorage_ExplicitVRBigEndian.dcm"),
+            os.path.join(TEST_DS_DIR, "MRImageStorage_JPG2000_Lossless.dcm"),
+        ]
+
+        def dcmread(*args, **kwargs):
+            raise RuntimeError("The file shouldn't be decoded")
+
+        # The files are sent without being decoded
+        monkeypatch.setattr("pynetdicom.association.dcmread", dcmread)
+        results = list(ae.send_many([DATASET] + paths, "localhost", get_port()))
+        assert [result[0] for result in results] == [DATASET] + paths
+        assert [result[1].Status for result in results] == [0x0000] * 4
+
+        # All sent over one association with a context for each
+        assert len(self.received) == 4
+        assert len({assoc for assoc, _ in self.received}) == 1
+        assoc = self.received[0][0]
+        assert len(assoc.accepted_contexts) == 4
+        assert [cx.transfer_syntax[0] for cx in assoc.accepted_contexts] == [
+            ImplicitVRLittleEndian,
+            "1.2.840.10008.1.2.1",
+            "1.2.840.10008.1.2.2",
+            "1.2.840.10008.1.2.4.90",
+        ]
+        assert self.received[0][1] == DATASET.SOPInstanceUID
+
+        self.scp.shutdown()
+
+    def test_send_failures(self, caplog):
+        """Test datasets that can't be sent."""
+        ae = self.start(contexts=[build_context(RTImageStorage)])
+        bad_file = os.path.join(TEST_DS_DIR, "CTImageStorage_bad_meta.dcm")
+        not_dicom = __file__
+        no_sop_class = Dataset()
+        no_sop_class.file_meta = Dataset()
+        no_sop_class.file_meta.TransferSyntaxUID = ImplicitVRLittleEndian
+
+        datasets = [not_dicom, no_sop_class, DATASET, bad_file]
+        with caplog.at_level(logging.ERROR, logger="pynetdicom"):
+            results = list(ae.send_many(datasets, "localhost", get_port()))
+
+        # Failures before association are returned first
+        assert [result[0] for result in results[:2]] == [not_dicom, no_sop_class]
+        assert [result[1] for result in results[:2]] == [Dataset(), Dataset()]
+        results = {id(result[0]): result[1] for result in results[2:]}
+        assert results[id(DATASET)].Status == 0x0000
+        # Read using dcmread, but no accepted context
+        assert results[id(bad_file)] == Dataset()
+        assert len(self.received) == 1
+
+        assert f"Unable to send the dataset at {not_dicom}" in caplog.text
+        assert "Unable to send the dataset with SOP Instance UID ''" in caplog.text
+        assert f"Unable to send the dataset at {bad_file}" in caplog.text
+        assert "No presentation context for 'CT Image Storage'" in caplog.text
+
+        self.scp.shutdown()
+
+    def test_parallel(self):
+        """Test sending using parallel associations."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def handle_store(event):
+            self.received.append((event.assoc, event.request.AffectedSOPInstanceUID))
+            try:
+                barrier.wait()
+            except threading.BrokenBarrierError:
+                return 0xC000
+
+            return 0x0000
+
+        ae = self.start(handle_store=handle_store)
+        datasets = []
+        for idx in range(6):
+            ds = Dataset()
+            ds.file_meta = Dataset()
+            ds.file_meta.TransferSyntaxUID = ImplicitVRLittleEndian
+            ds.SOPClassUID = RTImageStorage
+            ds.SOPInstanceUID = f"1.2.3.{idx}"
+            datasets.append(ds)
+
+        results = ae.send_many(datasets, "localhost", get_port(), parallel=3)
+        results = list(results)
+        assert [result[1].Status for result in results] == [0x0000] * 6
+        assert {result[0].SOPInstanceUID for result in results} == {
+            f"1.2.3.{idx}" for idx in range(6)
+        }
+        assert len({assoc for assoc, _ in self.received}) == 3
+
+        self.scp.shutdown()
+
+    def test_context_groups(self):
+        """Test sending datasets that need more than 128 contexts."""
+        ae = self.start()
+        storage_uids = [
+            cx.abstract_syntax
+            for cx in StoragePresentationContexts
+            if uid_to_service_class(cx.abstract_syntax) is StorageServiceClass
+        ]
+        datasets = []
+        for tsyntax in (ImplicitVRLittleEndian, ExplicitVRLittleEndian):
+            for uid in storage_uids[:70]:
+                ds = Dataset()
+                ds.file_meta = Dataset()
+                ds.file_meta.TransferSyntaxUID = tsyntax
+                ds.SOPClassUID = uid
+                ds.SOPInstanceUID = "1.2.3.4"
+                datasets.append(ds)
+
+        results = list(ae.send_many(datasets, "localhost", get_port()))
+        assert [result[0] for result in results] == datasets
+        assert [result[1].Status for result in results] == [0x0000] * 140
+        assoc = {assoc for assoc, _ in self.received}
+        assert sorted(len(assoc.accepted_contexts) for assoc in assoc) == [12, 128]
+
+        self.scp.shutdown()
+
+    def test_no_association(self, caplog):
+        """Test sending when unable to associate."""
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        paths = [os.path.join(TEST_DS_DIR, "CTImageStorage.dcm")] * 3
+        with caplog.at_level(logging.ERROR, logger="pynetdicom"):
+            results = list(ae.send_many(paths, "localhost", get_port(), parallel=2))
+
+        assert results == [(path, Dataset()) for path in paths]
+        assert (
+            "Unable to send 3 dataset(s) as no association could be established "
+            "with the peer"
+        ) in caplog.text
+
+    def test_stop_early(self):
+        """Test the associations are released if iteration stops early."""
+        ae = self.start()
+        results = ae.send_many([DATASET] * 10, "localhost", get_port())
+        assert next(results)[1].Status == 0x0000
+        results.close()
+
+        timeout = time.monotonic() + 5
+        while self.scp.active_associations and time.monotonic() < timeout:
+            time.sleep(0.01)
+
+        assert self.scp.active_associations == []
+        assert len(self.received) < 10
+
+        self.scp.shutdown()
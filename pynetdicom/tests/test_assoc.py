@@ -15,6 +15,7 @@ from pathlib import Path
 import queue
 import socket
 import sys
+import threading
 import time
 
 import pytest
@@ -48,6 +49,7 @@ from pynetdicom.events import Event
 from pynetdicom._globals import MODE_REQUESTOR
 from pynetdicom.pdu import A_RELEASE_RQ
 from pynetdicom.pdu_primitives import (
+    AsynchronousOperationsWindowNegotiation,
     UserIdentityNegotiation,
     SOPClassExtendedNegotiation,
     SOPClassCommonExtendedNegotiation,
@@ -1374,6 +1376,7 @@ class TestAssociationSendCStore:
             self.ae.shutdown()
 
         _config.STORE_SEND_CHUNKED_DATASET = False
+        _config.STORE_SEND_DEFLATE_THRESHOLD = None
 
     def test_must_be_associated(self):
         """Test SCU can't send without association."""
@@ -2130,6 +2133,489 @@ class TestAssociationSendCStore:
 
         assert "^^^^" == recv_ds[0].PatientName
 
+    def test_send_deflated_converted(self):
+        """Test sending a dataset using a deflated context."""
+        recv = []
+
+        def handle_store(event):
+            recv.append((event.context.transfer_syntax, event.dataset))
+            return 0x0000
+
+        handlers = [(evt.EVT_C_STORE, handle_store)]
+
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        ae.add_supported_context(CTImageStorage, DeflatedExplicitVRLittleEndian)
+        scp = ae.start_server(
+            ("localhost", get_port()), block=False, evt_handlers=handlers
+        )
+
+        ae.add_requested_context(CTImageStorage, DeflatedExplicitVRLittleEndian)
+        assoc = ae.associate("localhost", get_port())
+        assert assoc.is_established
+
+        status = assoc.send_c_store(DATASET)
+        assert status.Status == 0x0000
+
+        ae.maximum_pdu_size = 0
+        assoc.release()
+        assoc = ae.associate("localhost", get_port())
+        assert assoc.is_established
+        status = assoc.send_c_store(DATASET)
+        assert status.Status == 0x0000
+
+        assoc.release()
+        assert assoc.is_released
+
+        scp.shutdown()
+
+        assert 2 == len(recv)
+        for tsyntax, ds in recv:
+            assert tsyntax == DeflatedExplicitVRLittleEndian
+            assert "CompressedSamples^CT1" == ds.PatientName
+            assert DATASET.PixelData == ds.PixelData
+
+    def test_deflate_threshold(self):
+        """Test STORE_SEND_DEFLATE_THRESHOLD."""
+        recv = []
+
+        def handle_store(event):
+            recv.append((event.context.transfer_syntax, event.dataset))
+            return 0x0000
+
+        handlers = [(evt.EVT_C_STORE, handle_store)]
+
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        ae.add_supported_context(
+            CTImageStorage, [ExplicitVRLittleEndian, DeflatedExplicitVRLittleEndian]
+        )
+        scp = ae.start_server(
+            ("localhost", get_port()), block=False, evt_handlers=handlers
+        )
+
+        ae.add_requested_context(CTImageStorage, ExplicitVRLittleEndian)
+        ae.add_requested_context(CTImageStorage, DeflatedExplicitVRLittleEndian)
+        assoc = ae.associate("localhost", get_port())
+        assert assoc.is_established
+
+        ds = dcmread(DATASET_PATH)
+        del ds.PixelData
+        length = len(encode(ds, False, True))
+
+        # Default is not to prefer deflate
+        assert assoc.send_c_store(ds).Status == 0x0000
+        # Dataset is smaller than the threshold
+        _config.STORE_SEND_DEFLATE_THRESHOLD = length + 1
+        assert assoc.send_c_store(ds).Status == 0x0000
+        # Dataset is at least the threshold
+        _config.STORE_SEND_DEFLATE_THRESHOLD = length
+        assert assoc.send_c_store(ds).Status == 0x0000
+        # Datasets with pixel data are not deflated
+        _config.STORE_SEND_DEFLATE_THRESHOLD = 0
+        assert assoc.send_c_store(DATASET).Status == 0x0000
+
+        assoc.release()
+        assert assoc.is_released
+
+        scp.shutdown()
+
+        assert [ExplicitVRLittleEndian] * 2 == [t for t, _ in recv[:2]]
+        assert DeflatedExplicitVRLittleEndian == recv[2][0]
+        assert ExplicitVRLittleEndian == recv[3][0]
+        for _, ds in recv:
+            assert "CompressedSamples^CT1" == ds.PatientName
+
+    def test_deflate_threshold_chunks(self):
+        """Test STORE_SEND_DEFLATE_THRESHOLD when sending a chunked dataset."""
+        _config.STORE_SEND_CHUNKED_DATASET = True
+
+        recv = []
+
+        def handle_store(event):
+            recv.append((event.context.transfer_syntax, event.dataset))
+            return 0x0000
+
+        handlers = [(evt.EVT_C_STORE, handle_store)]
+
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        ae.add_supported_context(
+            CTImageStorage, [ExplicitVRLittleEndian, DeflatedExplicitVRLittleEndian]
+        )
+        scp = ae.start_server(
+            ("localhost", get_port()), block=False, evt_handlers=handlers
+        )
+
+        ae.add_requested_context(CTImageStorage, ExplicitVRLittleEndian)
+        ae.add_requested_context(CTImageStorage, DeflatedExplicitVRLittleEndian)
+        assoc = ae.associate("localhost", get_port())
+        assert assoc.is_established
+
+        assert assoc.send_c_store(DATASET_PATH).Status == 0x0000
+        _config.STORE_SEND_DEFLATE_THRESHOLD = os.path.getsize(DATASET_PATH) + 1
+        assert assoc.send_c_store(DATASET_PATH).Status == 0x0000
+        _config.STORE_SEND_DEFLATE_THRESHOLD = 0
+        assert assoc.send_c_store(DATASET_PATH).Status == 0x0000
+
+        assoc.release()
+        assert assoc.is_released
+
+        scp.shutdown()
+
+        assert [ExplicitVRLittleEndian] * 2 == [t for t, _ in recv[:2]]
+        assert DeflatedExplicitVRLittleEndian == recv[2][0]
+        for _, ds in recv:
+            assert "CompressedSamples^CT1" == ds.PatientName
+            assert DATASET.PixelData == ds.PixelData
+
+
+class TestAssociationSubmit:
+    """Run tests on Association submit_c_echo and submit_c_store."""
+
+    def setup_method(self):
+        """Run prior to each test"""
+        self.ae = None
+
+    def teardown_method(self):
+        """Clear any active threads"""
+        if self.ae:
+            self.ae.shutdown()
+
+    def associate(self, handlers, window=None):
+        """Return an association with an SCP using `handlers`."""
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        ae.add_supported_context(CTImageStorage)
+        ae.add_supported_context(Verification)
+        self.scp = ae.start_server(
+            ("localhost", get_port()), block=False, evt_handlers=handlers
+        )
+
+        ae.add_requested_context(CTImageStorage)
+        ae.add_requested_context(Verification)
+        assoc = ae.associate("localhost", get_port())
+        assert assoc.is_established
+        if window:
+            # Act as if the acceptor agreed to an asynchronous operations window
+            item = AsynchronousOperationsWindowNegotiation()
+            item.maximum_number_operations_invoked = window
+            item.maximum_number_operations_performed = 1
+            assoc.acceptor.primitive.user_information.append(item)
+            assert assoc._invoke_window == window
+
+        return assoc
+
+    def test_must_be_associated(self):
+        """Test can't submit without an association."""
+        assoc = self.associate([])
+        assoc.release()
+        assert assoc.is_released
+        with pytest.raises(RuntimeError):
+            assoc.submit_c_echo()
+
+        with pytest.raises(RuntimeError):
+            assoc.submit_c_store(DATASET)
+
+        self.scp.shutdown()
+
+    def test_submit_c_echo(self):
+        """Test submit_c_echo."""
+        assoc = self.associate([])
+        futures = [assoc.submit_c_echo() for _ in range(3)]
+        assert [f.result(timeout=5).Status for f in futures] == [0x0000] * 3
+
+        future = assoc.submit_c_echo(msg_id=8)
+        assert future.result(timeout=5).Status == 0x0000
+        assoc.release()
+        assert assoc.is_released
+
+        self.scp.shutdown()
+
+    def test_submit_c_store(self):
+        """Test pipelining C-STORE requests."""
+        event = threading.Event()
+        recv = []
+
+        def handle_store(ev):
+            event.wait(5)
+            recv.append(ev.request.MessageID)
+            return 0x0000 if ev.request.MessageID != 2 else 0xB000
+
+        assoc = self.associate([(evt.EVT_C_STORE, handle_store)], window=3)
+        futures = [assoc.submit_c_store(DATASET) for _ in range(3)]
+        assert len(assoc._outstanding) == 3
+        assert not any(f.done() for f in futures)
+
+        # The window is full, so blocks until a response is received
+        t = threading.Thread(
+            target=lambda: futures.append(assoc.submit_c_store(DATASET))
+        )
+        t.start()
+        time.sleep(0.2)
+        assert len(futures) == 3
+
+        event.set()
+        t.join()
+        statuses = [f.result(timeout=5).Status for f in futures]
+        assert statuses == [0x0000, 0xB000, 0x0000, 0x0000]
+        assert recv == [1, 2, 3, 4]
+        assert len(assoc._outstanding) == 0
+
+        msg = "A request with Message ID 5 is already waiting for a response"
+        event.clear()
+        assoc.submit_c_store(DATASET, msg_id=5)
+        with pytest.raises(ValueError, match=msg):
+            assoc.submit_c_store(DATASET, msg_id=5)
+
+        # Release waits for the outstanding response
+        event.set()
+        assoc.release()
+        assert assoc.is_released
+        assert recv == [1, 2, 3, 4, 5]
+
+        self.scp.shutdown()
+
+    def test_abort_abandons(self):
+        """Test aborting with outstanding requests."""
+        event = threading.Event()
+
+        def handle_store(ev):
+            event.wait(5)
+            return 0x0000
+
+        assoc = self.associate([(evt.EVT_C_STORE, handle_store)], window=2)
+        futures = [assoc.submit_c_store(DATASET) for _ in range(2)]
+        assoc.abort()
+        assert assoc.is_aborted
+        event.set()
+        assert [f.result(timeout=5) for f in futures] == [Dataset(), Dataset()]
+        assert len(assoc._outstanding) == 0
+
+        self.scp.shutdown()
+
+    def test_dimse_timeout(self):
+        """Test the window remaining full for the DIMSE timeout."""
+        event = threading.Event()
+
+        def handle_store(ev):
+            event.wait(5)
+            return 0x0000
+
+        assoc = self.associate([(evt.EVT_C_STORE, handle_store)])
+        assoc.dimse_timeout = 0.2
+        first = assoc.submit_c_store(DATASET)
+        second = assoc.submit_c_store(DATASET)
+        assert second.result(timeout=5) == Dataset()
+        assert first.result(timeout=5) == Dataset()
+        assert assoc.is_aborted
+        event.set()
+
+        self.scp.shutdown()
+
+
+class TestAssociationPerform:
+    """Run tests on the acceptor performing requests concurrently."""
+
+    def setup_method(self):
+        """Run prior to each test"""
+        self.ae = None
+
+    def teardown_method(self):
+        """Clear any active threads"""
+        if self.ae:
+            self.ae.shutdown()
+
+    def associate(self, handlers, window=None):
+        """Return an association with an SCP using `handlers`."""
+
+        def handle_async(event):
+            return event.nr_invoked, event.nr_performed
+
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        ae.add_supported_context(CTImageStorage)
+        ae.add_supported_context(PatientRootQueryRetrieveInformationModelFind)
+        handlers.append((evt.EVT_ASYNC_OPS, handle_async))
+        self.scp = ae.start_server(
+            ("localhost", get_port()), block=False, evt_handlers=handlers
+        )
+
+        ext_neg = []
+        if window:
+            item = AsynchronousOperationsWindowNegotiation()
+            item.maximum_number_operations_invoked = window
+            item.maximum_number_operations_performed = 1
+            ext_neg.append(item)
+
+        ae.add_requested_context(CTImageStorage)
+        ae.add_requested_context(PatientRootQueryRetrieveInformationModelFind)
+        assoc = ae.associate("localhost", get_port(), ext_neg=ext_neg)
+        assert assoc.is_established
+
+        return assoc
+
+    def test_no_window(self):
+        """Test requests are performed by the reactor without a window."""
+        threads = []
+
+        def handle_store(event):
+            threads.append(threading.current_thread())
+            return 0x0000
+
+        assoc = self.associate([(evt.EVT_C_STORE, handle_store)])
+        assert assoc.acceptor.asynchronous_operations == (1, 1)
+        assert assoc.send_c_store(DATASET).Status == 0x0000
+        scp_assoc = self.scp.active_associations[0]
+        assert scp_assoc._performer is None
+        assert threads == [scp_assoc]
+
+        assoc.release()
+        assert assoc.is_released
+
+        self.scp.shutdown()
+
+    def test_concurrent(self):
+        """Test requests are performed concurrently within the window."""
+        barrier = threading.Barrier(3, timeout=5)
+        threads = set()
+
+        def handle_store(event):
+            threads.add(threading.current_thread())
+            try:
+                barrier.wait()
+            except threading.BrokenBarrierError:
+                return 0xC000
+
+            return 0x0000
+
+        assoc = self.associate([(evt.EVT_C_STORE, handle_store)], window=3)
+        assert assoc.acceptor.asynchronous_operations == (3, 1)
+        scp_assoc = self.scp.active_associations[0]
+        assert scp_assoc._perform_window == 3
+
+        # Each handler waits until all 3 are being performed
+        futures = [assoc.submit_c_store(DATASET) for _ in range(6)]
+        assert [f.result(timeout=10).Status for f in futures] == [0x0000] * 6
+        assert len(threads) == 3
+        assert scp_assoc not in threads
+
+        assoc.release()
+        assert assoc.is_released
+        assert all(f.done() for f in scp_assoc._performer_futures)
+
+        self.scp.shutdown()
+
+    def test_bounded(self):
+        """Test no more than the window are performed at once."""
+        lock = threading.Lock()
+        performing = []
+        current = [0]
+
+        def handle_store(event):
+            with lock:
+                current[0] += 1
+                performing.append(current[0])
+
+            time.sleep(0.05)
+            with lock:
+                current[0] -= 1
+
+            return 0x0000
+
+        assoc = self.associate([(evt.EVT_C_STORE, handle_store)], window=2)
+        # Send more requests than the acceptor may perform at once
+        for item in assoc.acceptor.primitive.user_information:
+            if isinstance(item, AsynchronousOperationsWindowNegotiation):
+                item.maximum_number_operations_invoked = 0
+
+        assert assoc._invoke_window == 0
+        futures = [assoc.submit_c_store(DATASET) for _ in range(8)]
+        assert [f.result(timeout=10).Status for f in futures] == [0x0000] * 8
+        assert max(performing) == 2
+
+        assoc.release()
+        assert assoc.is_released
+
+        self.scp.shutdown()
+
+    def test_cancel(self):
+        """Test C-CANCEL is routed to the matching request."""
+        identifier = Dataset()
+        identifier.PatientID = "12345"
+        cancelled = []
+
+        def handle_find(event):
+            while not event.is_cancelled:
+                yield 0xFF00, identifier
+                time.sleep(0.01)
+
+            cancelled.append(event.request.MessageID)
+            yield 0xFE00, None
+
+        assoc = self.associate([(evt.EVT_C_FIND, handle_find)], window=2)
+
+        # Pause the reactor so we can get the responses ourselves
+        assoc._reactor_checkpoint.clear()
+        while not assoc._is_paused:
+            time.sleep(0.001)
+
+        query = Dataset()
+        query.QueryRetrieveLevel = "PATIENT"
+        query.PatientID = "*"
+        for msg_id in (1, 2):
+            req = C_FIND()
+            req.MessageID = msg_id
+            req.AffectedSOPClassUID = PatientRootQueryRetrieveInformationModelFind
+            req.Priority = 2
+            req.Identifier = BytesIO(encode(query, True, True))
+            assoc.dimse.send_msg(req, 3)
+
+        def next_status(msg_id):
+            """Return the status of the next response to `msg_id`."""
+            while True:
+                _, rsp = assoc.dimse.get_msg(block=True)
+                if rsp.MessageIDBeingRespondedTo == msg_id:
+                    return rsp.Status
+
+        def final_status(msg_id):
+            """Return the status of the final response to `msg_id`."""
+            status = next_status(msg_id)
+            while status == 0xFF00:
+                status = next_status(msg_id)
+
+            return status
+
+        # Both requests are being performed
+        assert next_status(1) == 0xFF00
+        assert next_status(2) == 0xFF00
+
+        assoc.send_c_cancel(2, 3)
+        assert final_status(2) == 0xFE00
+        assert cancelled == [2]
+
+        # The first request is still being performed
+        assert next_status(1) == 0xFF00
+        assoc.send_c_cancel(1, 3)
+        assert final_status(1) == 0xFE00
+        assert cancelled == [2, 1]
+        assoc._reactor_checkpoint.set()
+
+        assoc.release()
+        assert assoc.is_released
+
+        self.scp.shutdown()
+
 
 class TestAssociationSendCFind:
     """Run tests on Association send_c_find."""
@@ -5600,6 +6086,79 @@ class TestGetValidContext:
         assoc.release()
         scp.shutdown()
 
+    def test_index(self):
+        """Test the accepted contexts are indexed."""
+        assoc = Association(AE(), "requestor")
+        contexts = {}
+        for ii, (ab_syntax, tr_syntax, as_scu, as_scp) in enumerate(
+            [
+                (CTImageStorage, JPEGBaseline8Bit, True, False),
+                (CTImageStorage, ExplicitVRLittleEndian, True, False),
+                (CTImageStorage, ImplicitVRLittleEndian, False, True),
+                (CTImageStorage, ExplicitVRLittleEndian, True, True),
+                (CTImageStorage, DeflatedExplicitVRLittleEndian, True, False),
+            ]
+        ):
+            cx = build_context(ab_syntax, tr_syntax)
+            cx.context_id = 2 * ii + 1
+            cx._as_scu = as_scu
+            cx._as_scp = as_scp
+            contexts[cx.context_id] = cx
+
+        assoc._accepted_cx = contexts
+        assert assoc._context_index is None
+
+        cx = assoc._get_valid_context(CTImageStorage, ExplicitVRLittleEndian, "scu")
+        assert cx.context_id == 3
+        roles = assoc._context_index[CTImageStorage]
+        assert list(roles["scu"]) == [
+            JPEGBaseline8Bit,
+            ExplicitVRLittleEndian,
+            DeflatedExplicitVRLittleEndian,
+        ]
+        assert roles["scu"][ExplicitVRLittleEndian].context_id == 3
+        assert list(roles["scp"]) == [ImplicitVRLittleEndian, ExplicitVRLittleEndian]
+        assert roles["scp"][ExplicitVRLittleEndian].context_id == 7
+        assert len(roles[None]) == 4
+
+        # Convertible contexts
+        cx = assoc._get_valid_context(CTImageStorage, ImplicitVRLittleEndian, "scu")
+        assert cx.context_id == 3
+        cx = assoc._get_valid_context(CTImageStorage, ExplicitVRLittleEndian, "scp")
+        assert cx.context_id == 7
+        cx = assoc._get_valid_context(CTImageStorage, "", None)
+        assert cx.context_id == 1
+        cx = assoc._get_valid_context(CTImageStorage, "", "scp")
+        assert cx.context_id == 5
+        assert assoc._get_deflate_context(CTImageStorage).context_id == 9
+        assert assoc._get_deflate_context(MRImageStorage) is None
+
+        # Lookups are memoized
+        key = (CTImageStorage, ImplicitVRLittleEndian, "scu", None)
+        assert assoc._context_matches[key] == (None, contexts[3])
+        with pytest.raises(ValueError):
+            assoc._get_valid_context(
+                CTImageStorage, ImplicitVRLittleEndian, "scu", allow_conversion=False
+            )
+
+        # With context ID
+        cx = assoc._get_valid_context(CTImageStorage, "", "scp", context_id=7)
+        assert cx.context_id == 7
+        assert (CTImageStorage, "", "scp", 7) in assoc._context_matches
+        with pytest.raises(ValueError):
+            assoc._get_valid_context(CTImageStorage, "", "scp", context_id=3)
+
+        # Index is rebuilt when the accepted contexts change
+        assoc._accepted_cx = {3: contexts[3]}
+        assert assoc._context_index is None
+        assert assoc._context_matches == {}
+        cx = assoc._get_valid_context(CTImageStorage, ImplicitVRLittleEndian, "scu")
+        assert cx.context_id == 3
+        with pytest.raises(ValueError):
+            assoc._get_valid_context(CTImageStorage, JPEGBaseline8Bit, "scu")
+
+        assert assoc._get_deflate_context(CTImageStorage) is None
+
 
 class TestEventHandlingAcceptor:
     """Test the transport events and handling as acceptor."""
@@ -72,6 +72,76 @@ class TestPrimitive_C_CANCEL:
             primitive.MessageIDBeingRespondedTo = "test"
 
 
+class TestPrimitiveTrusted:
+    """Test trusted construction of DIMSE primitives."""
+
+    def test_slots(self):
+        """Test the primitives have no instance dict"""
+        for cls in (C_ECHO, C_STORE, C_FIND, C_GET, C_MOVE, C_CANCEL):
+            primitive = cls()
+            assert not hasattr(primitive, "__dict__")
+            with pytest.raises(AttributeError):
+                primitive.PatientName = "Foo"
+
+        primitive = C_STORE()
+        assert primitive.Priority == 0x02
+        assert primitive.MessageID is None
+        assert primitive.DataSet is None
+        assert primitive.ErrorComment is None
+        assert primitive.OffendingElement is None
+        assert primitive._context_id is None
+        assert primitive._dataset_path is None
+
+    def test_trusted(self):
+        """Test the parameters are set"""
+        ds = BytesIO(b"\x00\x01")
+        primitive = C_STORE._trusted(
+            MessageID=1,
+            MessageIDBeingRespondedTo=2,
+            AffectedSOPClassUID=UID("1.2.3"),
+            AffectedSOPInstanceUID=UID("1.2.3.4"),
+            Priority=0x01,
+            DataSet=ds,
+            Status=0x0000,
+            ErrorComment="Some comment",
+        )
+        assert isinstance(primitive, C_STORE)
+        assert primitive.MessageID == 1
+        assert primitive.MessageIDBeingRespondedTo == 2
+        assert primitive.AffectedSOPClassUID == "1.2.3"
+        assert primitive.AffectedSOPInstanceUID == "1.2.3.4"
+        assert primitive.Priority == 0x01
+        assert primitive.DataSet is ds
+        assert primitive.Status == 0x0000
+        assert primitive.ErrorComment == "Some comment"
+        assert primitive.OffendingElement is None
+        assert primitive.MoveOriginatorMessageID is None
+
+        primitive = C_FIND._trusted(Identifier=ds)
+        assert primitive.Identifier is ds
+        primitive = C_MOVE._trusted(
+            MoveDestination="STORESCP",
+            NumberOfRemainingSuboperations=3,
+        )
+        assert primitive.MoveDestination == "STORESCP"
+        assert primitive.NumberOfRemainingSuboperations == 3
+
+    def test_trusted_no_validation(self):
+        """Test the values aren't validated"""
+        primitive = C_ECHO._trusted(MessageID=70000)
+        assert primitive.MessageID == 70000
+        with pytest.raises(ValueError):
+            primitive.MessageID = 70000
+
+    def test_trusted_unknown_parameter(self):
+        """Test an unknown parameter raises an exception"""
+        with pytest.raises(AttributeError):
+            C_ECHO._trusted(OffendingElement=None)
+
+        with pytest.raises(AttributeError):
+            C_STORE._trusted(PatientName="Foo")
+
+
 class TestPrimitive_C_STORE:
     """Test DIMSE C-STORE operations."""
 
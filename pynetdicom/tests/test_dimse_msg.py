@@ -2,6 +2,8 @@
 
 from io import BytesIO
 import logging
+from math import ceil
+import zlib
 
 import pytest
 
@@ -35,6 +37,10 @@ from pynetdicom.dimse_messages import (
     N_DELETE_RSP,
     C_CANCEL_RQ,
     _COMMAND_SET_KEYWORDS,
+    _Deflater,
+    _decode_command_set,
+    _encode_command_set,
+    _status_response,
 )
 from pynetdicom.dimse_primitives import (
     C_STORE,
@@ -51,6 +57,7 @@ from pynetdicom.dimse_primitives import (
     C_CANCEL,
 )
 from pynetdicom.dsutils import encode, decode
+from pynetdicom.pdu_items import _FileFragment
 from pynetdicom.pdu_primitives import P_DATA
 from pynetdicom.utils import pretty_bytes
 from .encoded_dimse_msg import (
@@ -202,6 +209,180 @@ class TestDIMSEMessage:
         assert p_data_list[0].presentation_data_value_list[0][1] == c_store_rq_cmd
         assert p_data_list[1].presentation_data_value_list[0][1] == c_store_ds
 
+    def test_encode_file(self, tmp_path):
+        """Test encoding a data set sent from file."""
+        primitive = C_STORE()
+        primitive.MessageID = 7
+        primitive.AffectedSOPClassUID = "1.1.1"
+        primitive.AffectedSOPInstanceUID = "1.2.1"
+        primitive.Priority = 0x02
+
+        path = tmp_path / "dataset"
+        path.write_bytes(b"\xFF" * 10 + c_store_ds)
+        primitive._dataset_path = (path, 10)
+
+        dimse_msg = C_STORE_RQ()
+        dimse_msg.primitive_to_message(primitive)
+        p_data_list = list(dimse_msg.encode_msg(1, 16))
+        fragments = [
+            pdata.presentation_data_value_list[0][1]
+            for pdata in p_data_list
+            if isinstance(pdata.presentation_data_value_list[0][1], _FileFragment)
+        ]
+        assert len(fragments) == ceil(len(c_store_ds) / 10)
+        assert all(len(f) <= 11 for f in fragments)
+        assert [f[0] for f in fragments[:-1]] == [0x00] * (len(fragments) - 1)
+        assert fragments[-1][0] == 0x02
+        assert b"".join(bytes(f)[1:] for f in fragments) == c_store_ds
+
+        p_data_list = list(dimse_msg.encode_msg(1, 0))
+        assert len(p_data_list) == 2
+        fragment = p_data_list[1].presentation_data_value_list[0][1]
+        assert bytes(fragment) == b"\x02" + c_store_ds
+
+    def test_encode_packed(self):
+        """Test encoding with several PDVs per P-DATA."""
+        primitive = C_STORE()
+        primitive.MessageID = 7
+        primitive.AffectedSOPClassUID = "1.1.1"
+        primitive.AffectedSOPInstanceUID = "1.2.1"
+        primitive.Priority = 0x02
+        primitive.DataSet = BytesIO(c_store_ds)
+        dimse_msg = C_STORE_RQ()
+        dimse_msg.primitive_to_message(primitive)
+
+        # Command set and data set fit in one P-DATA
+        p_data_list = list(dimse_msg.encode_msg(1, 16382, pack=True))
+        assert len(p_data_list) == 1
+        pdvs = p_data_list[0].presentation_data_value_list
+        assert pdvs[0][1][0] == 0x03
+        assert pdvs[1] == (1, b"\x02" + c_store_ds)
+        assert dimse_msg.context_id == 1
+
+        p_data_list = list(dimse_msg.encode_msg(1, 0, pack=True))
+        assert len(p_data_list) == 1
+        assert p_data_list[0].presentation_data_value_list == pdvs
+
+        # The data set fills the space left by the command set
+        cmd_length = len(pdvs[0][1]) - 1
+        max_length = cmd_length + 6 + 16
+        p_data_list = list(dimse_msg.encode_msg(1, max_length, pack=True))
+        pdvs = p_data_list[0].presentation_data_value_list
+        assert [pdv[1][0] for pdv in pdvs] == [0x03, 0x00]
+        assert len(pdvs[1][1]) == 11
+
+        command = b""
+        data_set = b""
+        headers = []
+        for pdata in p_data_list:
+            pdvs = pdata.presentation_data_value_list
+            assert sum(5 + len(pdv[1]) for pdv in pdvs) <= max_length
+            for context_id, value in pdvs:
+                headers.append(value[0])
+                if value[0] & 0x01:
+                    command += value[1:]
+                else:
+                    data_set += value[1:]
+
+        assert headers[0] == 0x03
+        assert headers[1:-1] == [0x00] * (len(headers) - 2)
+        assert headers[-1] == 0x02
+        assert data_set == c_store_ds
+        assert decode(BytesIO(command), True, True) == dimse_msg.command_set
+
+        # Small maximum lengths fragment the command set as well
+        p_data_list = list(dimse_msg.encode_msg(1, 16, pack=True))
+        headers = [
+            pdv[1][0]
+            for pdata in p_data_list
+            for pdv in pdata.presentation_data_value_list
+        ]
+        assert headers.count(0x03) == 1
+        assert headers.count(0x02) == 1
+        assert headers.index(0x03) < headers.index(0x00)
+        for pdata in p_data_list:
+            pdvs = pdata.presentation_data_value_list
+            assert sum(5 + len(pdv[1]) for pdv in pdvs) <= 16
+
+        msg = "'max_pdu_length' cannot be between 1 and 7."
+        with pytest.raises(ValueError, match=msg):
+            next(dimse_msg.encode_msg(1, 6, pack=True))
+
+    def test_encode_packed_file(self, tmp_path):
+        """Test encoding a data set sent from file with several PDVs."""
+        primitive = C_STORE()
+        primitive.MessageID = 7
+        primitive.AffectedSOPClassUID = "1.1.1"
+        primitive.AffectedSOPInstanceUID = "1.2.1"
+        primitive.Priority = 0x02
+
+        path = tmp_path / "dataset"
+        path.write_bytes(b"\xFF" * 10 + c_store_ds)
+        primitive._dataset_path = (path, 10)
+
+        dimse_msg = C_STORE_RQ()
+        dimse_msg.primitive_to_message(primitive)
+        p_data_list = list(dimse_msg.encode_msg(1, 16382, pack=True))
+        assert len(p_data_list) == 1
+        pdvs = p_data_list[0].presentation_data_value_list
+        assert pdvs[0][1][0] == 0x03
+        assert isinstance(pdvs[1][1], _FileFragment)
+        assert bytes(pdvs[1][1]) == b"\x02" + c_store_ds
+
+        p_data_list = list(dimse_msg.encode_msg(1, 40, pack=True))
+        fragments = [
+            pdv[1]
+            for pdata in p_data_list
+            for pdv in pdata.presentation_data_value_list
+            if isinstance(pdv[1], _FileFragment)
+        ]
+        assert fragments[-1][0] == 0x02
+        assert b"".join(bytes(f)[1:] for f in fragments) == c_store_ds
+
+    @pytest.mark.parametrize("pack", [True, False])
+    def test_encode_deflated(self, pack, tmp_path):
+        """Test encoding a data set that's deflated as it's sent."""
+        primitive = C_STORE()
+        primitive.MessageID = 7
+        primitive.AffectedSOPClassUID = "1.1.1"
+        primitive.AffectedSOPInstanceUID = "1.2.1"
+        primitive.Priority = 0x02
+        primitive.DataSet = BytesIO(c_store_ds * 100)
+        primitive._deflate_dataset = True
+
+        path = tmp_path / "dataset"
+        path.write_bytes(b"\xFF" * 10 + c_store_ds * 100)
+        file_primitive = C_STORE()
+        file_primitive.MessageID = 7
+        file_primitive.AffectedSOPClassUID = "1.1.1"
+        file_primitive.AffectedSOPInstanceUID = "1.2.1"
+        file_primitive._dataset_path = (path, 10)
+        file_primitive._deflate_dataset = True
+
+        for prim in (primitive, file_primitive):
+            dimse_msg = C_STORE_RQ()
+            dimse_msg.primitive_to_message(prim)
+            assert dimse_msg._deflate_data_set
+            for max_length in (0, 16382, 40):
+                p_data_list = list(dimse_msg.encode_msg(1, max_length, pack=pack))
+                headers = []
+                data_set = b""
+                for pdata in p_data_list:
+                    pdvs = pdata.presentation_data_value_list
+                    if max_length:
+                        assert sum(5 + len(pdv[1]) for pdv in pdvs) <= max_length
+
+                    for context_id, value in pdvs:
+                        if not value[0] & 0x01:
+                            headers.append(value[0])
+                            data_set += value[1:]
+
+                assert headers[-1] == 0x02
+                assert headers[:-1] == [0x00] * (len(headers) - 1)
+                assert len(data_set) < len(c_store_ds) * 100
+                assert len(data_set) % 2 == 0
+                assert zlib.decompress(data_set, -zlib.MAX_WBITS) == c_store_ds * 100
+
     def test_encode_zero(self):
         """Test encoding with a 0 max pdu length."""
         primitive = C_STORE()
@@ -748,6 +929,288 @@ class TestDIMSEMessage:
         assert primitive.RequestedSOPInstanceUID is None
 
 
+ENCODED_COMMAND_SETS = [
+    (c_echo_rq_cmd, True),
+    (c_echo_rsp_cmd, True),
+    (c_store_rq_cmd, True),
+    (c_store_rsp_cmd, True),
+    (c_find_rq_cmd, True),
+    (c_find_rsp_cmd, True),
+    (c_get_rq_cmd, True),
+    (c_get_rsp_cmd, True),
+    (c_move_rq_cmd, True),
+    (c_move_rsp_cmd, True),
+    (c_move_rsp_cmd_with_dup, False),  # AT and multi-valued US elements
+    (n_er_rq_cmd, True),
+    (n_er_rsp_cmd, True),
+    (n_get_rq_cmd, False),  # AT element
+    (n_get_rsp_cmd, True),
+    (n_delete_rq_cmd, True),
+    (n_delete_rsp_cmd, True),
+    (n_action_rq_cmd, True),
+    (n_action_rsp_cmd, True),
+    (n_create_rq_cmd, True),
+    (n_create_rsp_cmd, True),
+    (n_set_rq_cmd, True),
+    (n_set_rsp_cmd, True),
+    (n_create_rq_cmd_empty, False),  # Empty UI element
+    (n_set_rq_cmd_empty, False),
+]
+
+
+class TestDeflater:
+    """Tests for _Deflater."""
+
+    def test_fragments(self):
+        """Test deflating in fragments."""
+        data = b"\x00\x01\x02" * 100000
+        chunks = [data[idx : idx + 1000] for idx in range(0, len(data), 1000)]
+        for size in (1, 7, 100, 0):
+            deflater = _Deflater(chunks)
+            fragments = []
+            is_last = False
+            while not is_last:
+                fragment, is_last = deflater.fragment(size)
+                assert fragment
+                if size:
+                    assert len(fragment) <= size
+
+                fragments.append(fragment)
+
+            assert zlib.decompress(b"".join(fragments), -zlib.MAX_WBITS) == data
+            assert deflater.fragment(size) == (b"", True)
+
+    def test_padding(self):
+        """Test the deflated data is padded to an even length."""
+        for data in (b"", b"\x00", b"\x01\x02\x03"):
+            deflated, is_last = _Deflater([data]).fragment(0)
+            assert is_last
+            assert len(deflated) % 2 == 0
+            assert zlib.decompress(deflated, -zlib.MAX_WBITS) == data
+
+    def test_matches_encode(self):
+        """Test the output matches that of dsutils.encode()."""
+        ds = Dataset()
+        ds.ImageComments = "Some comments" * 100
+        ds.PatientID = "1234"
+        data = encode(ds, False, True)
+        deflated, is_last = _Deflater([data]).fragment(0)
+        assert is_last
+        assert deflated == encode(ds, False, True, True)
+
+
+class TestCommandSetCodec:
+    """Tests for encoding and decoding command sets without pydicom"""
+
+    @pytest.mark.parametrize("data, supported", ENCODED_COMMAND_SETS)
+    def test_decode(self, data, supported):
+        """Test decoding matches pydicom"""
+        # Skip the message control header
+        data = data[1:]
+        values = _decode_command_set(data)
+        if not supported:
+            assert values is None
+            return
+
+        ds = decode(BytesIO(data), True, True)
+        assert values == {elem.tag: elem.value for elem in ds}
+        for elem in ds:
+            if elem.VR == "UI":
+                assert isinstance(values[elem.tag], UID)
+
+    @pytest.mark.parametrize("data, supported", ENCODED_COMMAND_SETS)
+    def test_encode(self, data, supported):
+        """Test encoding matches the original encoding"""
+        data = data[1:]
+        ds = decode(BytesIO(data), True, True)
+        values = {elem.tag: elem.value for elem in ds}
+        encoded = _encode_command_set(values)
+        if any(elem.VR == "AT" or elem.VM > 1 for elem in ds):
+            assert encoded is None
+            return
+
+        assert encoded == data
+        assert encoded == encode(ds, True, True)
+
+    def test_decode_padding(self):
+        """Test the non-significant padding is removed"""
+        data = (
+            b"\x00\x00\x00\x01\x02\x00\x00\x00\x01\x80"  # CommandField
+            b"\x00\x00\x00\x06\x06\x00\x00\x00 AB C "  # MoveDestination
+            b"\x00\x00\x00\x08\x02\x00\x00\x00\x01\x01"  # CommandDataSetType
+            b"\x00\x00\x02\x09\x06\x00\x00\x00 x y\x00 "  # ErrorComment
+            b"\x00\x00\x00\x10\x06\x00\x00\x001.2 \x00\x00"  # AffectedSOPInstanceUID
+        )
+        values = _decode_command_set(data)
+        ds = decode(BytesIO(data), True, True)
+        assert values == {elem.tag: elem.value for elem in ds}
+        assert values[0x00000600] == "AB C"
+        assert values[0x00000902] == " x y"
+        assert values[0x00001000] == "1.2"
+
+    def test_decode_unsupported(self):
+        """Test decoding command sets that need pydicom"""
+        # Missing CommandField
+        data = b"\x00\x00\x00\x08\x02\x00\x00\x00\x01\x01"
+        assert _decode_command_set(data) is None
+        # Unknown tag
+        assert _decode_command_set(b"\x00\x00\x01\x00\x02\x00\x00\x00\x01\x01") is None
+        # Truncated value
+        data = b"\x00\x00\x00\x01\x02\x00\x00\x00\x01"
+        assert _decode_command_set(data) is None
+        # Truncated header
+        assert _decode_command_set(b"\x00\x00\x00\x01\x02") is None
+        # Multi-valued string
+        data = b"\x00\x00\x00\x06\x04\x00\x00\x00A\\BC"
+        assert _decode_command_set(data) is None
+        # Non-ASCII string
+        data = b"\x00\x00\x02\x09\x02\x00\x00\x00\xe9 "
+        assert _decode_command_set(data) is None
+
+    def test_encode_unsupported(self):
+        """Test encoding command sets that need pydicom"""
+        assert _encode_command_set({0x00000110: "1"}) is None
+        assert _encode_command_set({0x00000110: 65536}) is None
+        assert _encode_command_set({0x00000110: None}) is None
+        assert _encode_command_set({0x00000902: "\u00e9"}) is None
+        assert _encode_command_set({0x00000902: b"A"}) is None
+        assert _encode_command_set({0x00000901: [0x00000001]}) is None
+        assert _encode_command_set({0x00010001: 1}) is None
+
+    def test_primitive_to_message(self):
+        """Test the encoded command set matches pydicom"""
+        primitive = C_STORE()
+        primitive.MessageIDBeingRespondedTo = 7
+        primitive.AffectedSOPClassUID = "1.2.840.10008.5.1.4.1.1.2"
+        primitive.AffectedSOPInstanceUID = "1.2.3"
+        primitive.Status = 0xB000
+        primitive.ErrorComment = "Some error"
+        msg = C_STORE_RSP()
+        msg.primitive_to_message(primitive)
+        assert msg._command_set is None
+
+        p_data = next(msg.encode_msg(1, 0))
+        encoded = p_data.presentation_data_value_list[0][1][1:]
+
+        cs = msg.command_set
+        assert msg._command_values is None
+        assert cs.CommandGroupLength == len(encoded) - 12
+        assert encoded == encode(cs, True, True)
+
+        # Changes to the command set are used
+        cs.MessageIDBeingRespondedTo = 8
+        p_data = next(msg.encode_msg(1, 0))
+        assert p_data.presentation_data_value_list[0][1][1:] == encode(cs, True, True)
+
+        # Falls back to pydicom for unsupported elements
+        primitive.OffendingElement = [0x00100010]
+        msg = C_STORE_RSP()
+        msg.primitive_to_message(primitive)
+        assert msg._command_set is not None
+        assert msg.command_set.OffendingElement == 0x00100010
+        p_data = next(msg.encode_msg(1, 0))
+        assert p_data.presentation_data_value_list[0][1][1:] == encode(
+            msg.command_set, True, True
+        )
+
+    def test_decode_msg(self):
+        """Test the command set is only converted to a Dataset when used"""
+        msg = DIMSEMessage()
+        p_data = P_DATA()
+        p_data.presentation_data_value_list.append([1, c_store_rsp_cmd])
+        assert msg.decode_msg(p_data)
+        assert isinstance(msg, C_STORE_RSP)
+        assert msg._command_set is None
+
+        primitive = msg.message_to_primitive()
+        assert primitive.MessageIDBeingRespondedTo == 5
+        assert primitive.AffectedSOPInstanceUID == "1.2.4.5.7.8"
+        assert msg._command_set is None
+
+        assert msg.command_set.MessageIDBeingRespondedTo == 5
+        assert msg.message_to_primitive().Status == primitive.Status
+
+
+class TestStatusResponse:
+    """Tests for _status_response()"""
+
+    @pytest.mark.parametrize("status", [0x0000, 0xB000, 0xB007, 0xC211])
+    @pytest.mark.parametrize("class_uid", ["1.2.840.10008.1.1", "1.2.3.4"])
+    def test_c_echo(self, status, class_uid):
+        """Test the C-ECHO-RSP matches primitive_to_message()"""
+        primitive = C_ECHO()
+        primitive.MessageID = 3
+        primitive.MessageIDBeingRespondedTo = 12
+        primitive.AffectedSOPClassUID = class_uid
+        primitive.Status = status
+
+        msg = _status_response(primitive)
+        assert isinstance(msg, C_ECHO_RSP)
+        ref = C_ECHO_RSP()
+        ref.primitive_to_message(primitive)
+        assert msg._command_values == ref._command_values
+        encoded = next(msg.encode_msg(1, 0)).presentation_data_value_list
+        assert encoded == next(ref.encode_msg(1, 0)).presentation_data_value_list
+        assert msg.command_set == ref.command_set
+        assert encoded[0][1][1:] == encode(msg.command_set, True, True)
+
+    @pytest.mark.parametrize("status", [0x0000, 0xB000, 0xB007, 0xC211])
+    @pytest.mark.parametrize("instance_uid", ["1.2.3", "1.2.3.4", "1.2.3.45"])
+    def test_c_store(self, status, instance_uid):
+        """Test the C-STORE-RSP matches primitive_to_message()"""
+        primitive = C_STORE()
+        primitive.MessageID = 3
+        primitive.MessageIDBeingRespondedTo = 65535
+        primitive.AffectedSOPClassUID = "1.2.840.10008.5.1.4.1.1.2"
+        primitive.AffectedSOPInstanceUID = instance_uid
+        primitive.Status = status
+
+        msg = _status_response(primitive)
+        assert isinstance(msg, C_STORE_RSP)
+        ref = C_STORE_RSP()
+        ref.primitive_to_message(primitive)
+        assert msg._command_values == ref._command_values
+        encoded = next(msg.encode_msg(1, 0)).presentation_data_value_list
+        assert encoded == next(ref.encode_msg(1, 0)).presentation_data_value_list
+        assert encoded[0][1][1:] == encode(ref.command_set, True, True)
+
+        msg = msg.message_to_primitive()
+        assert msg.MessageIDBeingRespondedTo == 65535
+        assert msg.AffectedSOPInstanceUID == instance_uid
+        assert msg.Status == status
+
+    def test_not_supported(self):
+        """Test None is returned if a template can't be used"""
+        primitive = C_STORE()
+        primitive.MessageIDBeingRespondedTo = 1
+        primitive.AffectedSOPClassUID = "1.2.840.10008.5.1.4.1.1.2"
+        assert _status_response(primitive) is None  # No Status
+
+        primitive.Status = 0x0000
+        assert _status_response(primitive) is None  # No Instance UID
+
+        primitive.AffectedSOPInstanceUID = "1.2.3"
+        assert isinstance(_status_response(primitive), C_STORE_RSP)
+
+        primitive.ErrorComment = "Some comment"
+        assert _status_response(primitive) is None
+
+        primitive.ErrorComment = None
+        primitive.OffendingElement = 0x00100010
+        assert _status_response(primitive) is None
+
+        primitive = C_FIND()
+        primitive.MessageIDBeingRespondedTo = 1
+        primitive.AffectedSOPClassUID = "1.2.840.10008.5.1.4.1.2.1.1"
+        primitive.Status = 0x0000
+        assert _status_response(primitive) is None
+
+        primitive = C_ECHO()
+        primitive.MessageIDBeingRespondedTo = 1
+        primitive.Status = 0x0000
+        assert _status_response(primitive) is None  # No Class UID
+
+
 class TestThreadSafety:
     """Tests for the thread safety of DIMSEMessage classes."""
 
@@ -818,7 +1281,9 @@ class TestThreadSafety:
 
     def test_message_builder_regression(self):
         """Regression test for DIMSEMessage class builder."""
-        with pytest.raises(AttributeError, match=r"no attribute 'command_set'"):
-            assert C_STORE_RQ.command_set.MessageID
-        with pytest.raises(AttributeError, match=r"no attribute 'data_set'"):
-            assert C_STORE_RQ.data_set.get_value() == b""
+        # The command set is created by each instance
+        assert not isinstance(C_STORE_RQ.command_set, Dataset)
+        assert C_STORE_RQ().command_set is not C_STORE_RQ().command_set
+        # The data set is also created by each instance
+        assert not isinstance(C_STORE_RQ.data_set, BytesIO)
+        assert C_STORE_RQ().data_set is not C_STORE_RQ().data_set
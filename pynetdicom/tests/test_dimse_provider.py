@@ -109,6 +109,7 @@ class DummyAssociation:
         self.is_acceptor = False
         self.is_requestor = True
         self._handlers = {}
+        self._outstanding = {}
 
     def abort(self):
         self.is_aborted = True
@@ -147,6 +148,11 @@ class DummyDUL:
         """Dummy Send method to test DIMSEServiceProvider.Send"""
         pass
 
+    @staticmethod
+    def send_pdus(pdvs):
+        """Dummy Send method to test DIMSEServiceProvider.Send"""
+        pass
+
     @staticmethod
     def receive_pdu():
         """Dummy Receive method to test DIMSEServiceProvider.Receive"""
@@ -156,6 +162,9 @@ class DummyDUL:
     def peek_next_pdu():
         return 0x01
 
+    def _wakeup(self):
+        self.wakeups = getattr(self, "wakeups", 0) + 1
+
 
 REFERENCE_MSG = [
     (C_ECHO(), ("C_ECHO_RQ", "C_ECHO_RSP")),
@@ -229,6 +238,233 @@ class TestDIMSEProvider:
         dimse.receive_primitive(pdata)
         assert dimse.assoc.dul.event_queue.get() == "Evt19"
 
+    def receive_c_store(self, dimse):
+        """Receive a C-STORE request with `dimse`"""
+        primitive = C_STORE()
+        primitive.MessageID = 7
+        primitive.AffectedSOPClassUID = "1.2.840.10008.5.1.4.1.1.2"
+        primitive.AffectedSOPInstanceUID = "1.2.392.200036.9116.2.6.1.48"
+        primitive.Priority = 0x02
+        primitive.DataSet = BytesIO(c_store_ds)
+
+        msg = C_STORE_RQ()
+        msg.primitive_to_message(primitive)
+        nbytes = 0
+        for pdata in msg.encode_msg(1, 16):
+            nbytes += len(pdata.presentation_data_value_list[0][1]) - 1
+            dimse.receive_primitive(pdata)
+
+        return nbytes
+
+    def test_queued_metrics(self):
+        """Test the number and size of the queued messages."""
+        dimse = DIMSEServiceProvider(DummyAssociation())
+        assert dimse.queued_messages == 0
+        assert dimse.queued_bytes == 0
+
+        nbytes = self.receive_c_store(dimse)
+        assert dimse.queued_messages == 1
+        assert dimse.queued_bytes == nbytes
+
+        self.receive_c_store(dimse)
+        dimse.msg_queue.put((None, None))
+        assert dimse.queued_messages == 3
+        assert dimse.queued_bytes == 2 * nbytes
+        assert not dimse.msg_queue.is_full
+
+        context_id, msg = dimse.get_msg()
+        assert context_id == 1
+        assert isinstance(msg, C_STORE)
+        assert dimse.queued_messages == 2
+        assert dimse.queued_bytes == nbytes
+
+        dimse.get_msg()
+        assert dimse.get_msg() == (None, None)
+        assert dimse.queued_messages == 0
+        assert dimse.queued_bytes == 0
+
+    def test_receive_multiple_messages(self):
+        """Test receiving a P-DATA with the PDVs of several messages."""
+        dimse = DIMSEServiceProvider(DummyAssociation())
+
+        primitive = C_STORE()
+        primitive.MessageID = 7
+        primitive.AffectedSOPClassUID = "1.2.840.10008.5.1.4.1.1.2"
+        primitive.AffectedSOPInstanceUID = "1.2.392.200036.9116.2.6.1.48"
+        primitive.Priority = 0x02
+        primitive.DataSet = BytesIO(c_store_ds)
+        msg = C_STORE_RQ()
+        msg.primitive_to_message(primitive)
+        pdvs = []
+        for pdata in msg.encode_msg(1, 0, pack=True):
+            pdvs.extend(pdata.presentation_data_value_list)
+
+        assert len(pdvs) == 2
+        # The start of a message
+        pdata = P_DATA()
+        pdata.presentation_data_value_list.extend(pdvs[:1])
+        dimse.receive_primitive(pdata)
+        assert dimse.queued_messages == 0
+
+        # The end of the message, a complete message and the start of another
+        pdata = P_DATA()
+        pdata.presentation_data_value_list.extend(pdvs[1:] + pdvs + pdvs[:1])
+        dimse.receive_primitive(pdata)
+        assert dimse.queued_messages == 2
+        assert dimse.message is not None
+
+        pdata = P_DATA()
+        pdata.presentation_data_value_list.extend(pdvs[1:])
+        dimse.receive_primitive(pdata)
+        assert dimse.queued_messages == 3
+        assert dimse.message is None
+        for _ in range(3):
+            context_id, received = dimse.get_msg()
+            assert received.MessageID == 7
+            assert received.DataSet.getvalue() == c_store_ds
+
+    def test_send_status_response(self):
+        """Test sending a C-STORE-RSP using a command set template."""
+        dimse = DIMSEServiceProvider(DummyAssociation())
+        sent = []
+        dimse.dul.send_pdus = sent.extend
+
+        primitive = C_STORE()
+        primitive.MessageIDBeingRespondedTo = 7
+        primitive.AffectedSOPClassUID = "1.2.840.10008.5.1.4.1.1.2"
+        primitive.AffectedSOPInstanceUID = "1.2.392.200036.9116.2.6.1.48"
+        primitive.Status = 0xB000
+        dimse.send_msg(primitive, 3)
+
+        assert len(sent) == 1
+        msg = C_STORE_RSP()
+        msg.primitive_to_message(primitive)
+        pdvs = next(msg.encode_msg(3, 0)).presentation_data_value_list
+        assert sent[0].presentation_data_value_list == pdvs
+
+        # Falls back to primitive_to_message()
+        primitive.ErrorComment = "Coercion of data elements"
+        dimse.send_msg(primitive, 3)
+        assert len(sent) == 2
+        msg = C_STORE_RSP()
+        msg.primitive_to_message(primitive)
+        pdvs = next(msg.encode_msg(3, 0)).presentation_data_value_list
+        assert sent[1].presentation_data_value_list == pdvs
+
+    def test_queue_full_messages(self, monkeypatch):
+        """Test the queue is full at MAX_QUEUED_MESSAGES"""
+        monkeypatch.setattr(_config, "MAX_QUEUED_MESSAGES", 2)
+        dimse = DIMSEServiceProvider(DummyAssociation())
+        self.receive_c_store(dimse)
+        assert not dimse.msg_queue.is_full
+        self.receive_c_store(dimse)
+        assert dimse.msg_queue.is_full
+        # Items are always added
+        self.receive_c_store(dimse)
+        assert dimse.queued_messages == 3
+
+        # DUL woken when no longer full
+        dimse.get_msg()
+        assert dimse.msg_queue.is_full
+        assert not hasattr(dimse.dul, "wakeups")
+        dimse.get_msg()
+        assert not dimse.msg_queue.is_full
+        assert dimse.dul.wakeups == 1
+        dimse.get_msg()
+        assert dimse.dul.wakeups == 1
+
+    def test_queue_full_bytes(self, monkeypatch):
+        """Test the queue is full at MAX_QUEUED_BYTES"""
+        dimse = DIMSEServiceProvider(DummyAssociation())
+        nbytes = self.receive_c_store(dimse)
+        monkeypatch.setattr(_config, "MAX_QUEUED_BYTES", nbytes + 1)
+        assert not dimse.msg_queue.is_full
+        self.receive_c_store(dimse)
+        assert dimse.msg_queue.is_full
+
+        dimse.get_msg()
+        assert not dimse.msg_queue.is_full
+        assert dimse.dul.wakeups == 1
+
+    @staticmethod
+    def receive_c_echo_rsp(dimse, msg_id):
+        """Receive a C-ECHO response to the request with `msg_id`"""
+        primitive = C_ECHO()
+        primitive.MessageIDBeingRespondedTo = msg_id
+        primitive.AffectedSOPClassUID = Verification
+        primitive.Status = 0x0000
+        msg = C_ECHO_RSP()
+        msg.primitive_to_message(primitive)
+        for pdata in msg.encode_msg(1, 0):
+            dimse.receive_primitive(pdata)
+
+    @staticmethod
+    def c_echo_rq(msg_id):
+        """Return a C-ECHO request with `msg_id`"""
+        primitive = C_ECHO()
+        primitive.MessageID = msg_id
+        primitive.AffectedSOPClassUID = Verification
+        return primitive
+
+    def test_receive_outstanding_response(self):
+        """Test responses to outstanding requests aren't queued."""
+        dimse = DIMSEServiceProvider(DummyAssociation())
+        responses = []
+        dimse.assoc._outstanding[2] = None
+        dimse.assoc._receive_response = responses.append
+
+        self.receive_c_echo_rsp(dimse, 2)
+        assert dimse.queued_messages == 0
+        assert len(responses) == 1
+        assert isinstance(responses[0], C_ECHO)
+        assert responses[0].MessageIDBeingRespondedTo == 2
+
+        # Responses to other requests are still queued
+        self.receive_c_echo_rsp(dimse, 3)
+        assert dimse.queued_messages == 1
+        assert len(responses) == 1
+
+        # As are C-CANCEL requests once 10 have been received
+        dimse.cancel_req = dict.fromkeys(range(10))
+        primitive = C_CANCEL()
+        primitive.MessageIDBeingRespondedTo = 2
+        msg = C_CANCEL_RQ()
+        msg.primitive_to_message(primitive)
+        for pdata in msg.encode_msg(1, 0):
+            dimse.receive_primitive(pdata)
+
+        assert dimse.queued_messages == 2
+        assert len(responses) == 1
+
+    def test_send_msg_threads(self):
+        """Test messages sent by several threads aren't interleaved."""
+        dimse = DIMSEServiceProvider(DummyAssociation())
+        dimse.assoc.acceptor.maximum_length = 20
+        sent = []
+
+        def send_pdus(pdus):
+            sent.extend(pdus)
+            time.sleep(0.001)
+
+        dimse.dul.send_pdus = send_pdus
+        threads = [
+            threading.Thread(target=dimse.send_msg, args=(self.c_echo_rq(msg_id), 1))
+            for msg_id in range(5)
+        ]
+        for t in threads:
+            t.start()
+
+        for t in threads:
+            t.join()
+
+        # Each command set is sent in several P-DATA, which shouldn't interleave
+        headers = [
+            pdv[1][0] for pdata in sent for pdv in pdata.presentation_data_value_list
+        ]
+        assert headers.count(0x03) == 5
+        ends = [idx for idx, header in enumerate(headers) if header == 0x03]
+        assert ends == [(idx + 1) * len(headers) // 5 - 1 for idx in range(5)]
+
 
 class TestEventHandlingAcceptor:
     """Test the transport events and handling as acceptor."""
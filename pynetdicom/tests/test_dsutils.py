@@ -3,16 +3,30 @@
 from copy import deepcopy
 from io import BytesIO
 import logging
+import os
 from pathlib import Path
+import shutil
 
 import pytest
 
-from pydicom import config
+from pydicom import config, dcmread
 from pydicom.dataset import Dataset
+from pydicom.errors import InvalidDicomError
+from pydicom.uid import DeflatedExplicitVRLittleEndian, ExplicitVRBigEndian
 from pydicom.valuerep import DA, DSfloat, DSdecimal, DT, IS, TM
 
 from pynetdicom import debug_logger
-from pynetdicom.dsutils import decode, encode, pretty_dataset, pretty_element
+from pynetdicom.dsutils import (
+    decode,
+    encode,
+    pretty_dataset,
+    pretty_element,
+    read_header,
+    DatasetWriter,
+    HeaderCache,
+    HEADER_KEYWORDS,
+)
+from pynetdicom import dsutils
 
 
 # debug_logger()
@@ -21,6 +35,7 @@ from pynetdicom.dsutils import decode, encode, pretty_dataset, pretty_element
 DEFL_DATASET = (
     Path(__file__).parent / "dicom_files" / "SCImageStorage_Deflated.dcm"
 ).resolve(strict=True)
+DATA_DIR = Path(__file__).parent / "dicom_files"
 
 
 class TestEncode:
@@ -634,3 +649,206 @@ class TestPrettyDataset:
         for line in out:
             print(line)
         assert ref == pretty_dataset(ds)
+
+
+class TestDatasetWriter:
+    """Tests for DatasetWriter"""
+
+    def test_temporary(self):
+        """Test writing to a temporary file"""
+        writer = DatasetWriter()
+        assert writer.is_temporary
+        path = writer.open()
+        assert path.exists()
+        writer.write(b"\x00\x01")
+        writer.write(b"\x02")
+        assert writer.commit() == path
+        assert path.read_bytes() == b"\x00\x01\x02"
+
+        writer.close()
+        assert not path.exists()
+
+    def test_path(self, tmp_path):
+        """Test writing to a final path"""
+        dst = tmp_path / "a" / "b" / "foo.dcm"
+        writer = DatasetWriter(dst)
+        assert not writer.is_temporary
+        tmp = writer.open()
+        assert tmp.parent == dst.parent
+        assert tmp != dst
+        assert not dst.exists()
+        writer.write(b"\x00\x01\x02")
+        assert writer.commit() == dst
+        assert dst.read_bytes() == b"\x00\x01\x02"
+        assert not tmp.exists()
+
+        # Closing after commit doesn't remove the file
+        writer.close()
+        assert dst.exists()
+        assert list(dst.parent.iterdir()) == [dst]
+
+    def test_finish(self, tmp_path):
+        """Test finishing writing before moving the file"""
+        dst = tmp_path / "foo.dcm"
+        writer = DatasetWriter(dst, preallocate=1024)
+        tmp = writer.open()
+        writer.write(b"\x00\x01\x02")
+        assert writer.finish() == tmp
+        assert tmp.read_bytes() == b"\x00\x01\x02"
+        assert not dst.exists()
+
+        assert writer.commit() == dst
+        assert dst.read_bytes() == b"\x00\x01\x02"
+        assert not tmp.exists()
+
+    def test_finish_close(self, tmp_path):
+        """Test closing after finish removes the temporary file"""
+        dst = tmp_path / "foo.dcm"
+        writer = DatasetWriter(dst)
+        tmp = writer.open()
+        writer.write(b"\x00\x01\x02")
+        writer.finish()
+        writer.close()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_path_incomplete(self, tmp_path):
+        """Test closing before commit removes the temporary file"""
+        dst = tmp_path / "foo.dcm"
+        writer = DatasetWriter(str(dst))
+        tmp = writer.open()
+        writer.write(b"\x00\x01\x02")
+        writer.close()
+        assert not tmp.exists()
+        assert not dst.exists()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_preallocate(self, tmp_path):
+        """Test unused preallocated space is removed"""
+        dst = tmp_path / "foo.dcm"
+        writer = DatasetWriter(dst, buffer_size=2, preallocate=1024)
+        writer.open()
+        writer.write(b"\x00\x01\x02")
+        writer.commit()
+        assert dst.read_bytes() == b"\x00\x01\x02"
+
+
+class TestReadHeader:
+    """Tests for read_header()"""
+
+    def test_default(self):
+        """Test reading the default elements"""
+        path = DATA_DIR / "CTImageStorage.dcm"
+        ds = read_header(path)
+        ref = dcmread(path)
+        for kw in HEADER_KEYWORDS:
+            assert ds[kw] == ref[kw]
+
+        assert ds.file_meta == ref.file_meta
+        # Stops after the last element
+        assert "ImagePositionPatient" not in ds
+        assert "PixelData" not in ds
+        # Other elements aren't read
+        assert "ImageType" not in ds
+        assert "PatientSex" not in ds
+
+    def test_keywords(self):
+        """Test reading selected elements"""
+        ds = read_header(
+            str(DATA_DIR / "MRImageStorage_ExplicitVRBigEndian.dcm"),
+            ["SOPClassUID", "SOPInstanceUID"],
+        )
+        assert ds.file_meta.TransferSyntaxUID == ExplicitVRBigEndian
+        assert ds.SOPClassUID == "1.2.840.10008.5.1.4.1.1.4"
+        assert "SOPInstanceUID" in ds
+        assert "StudyDate" not in ds
+
+    def test_deflated(self):
+        """Test reading a deflated dataset"""
+        ds = read_header(DEFL_DATASET, ["SOPClassUID", "PatientName"])
+        assert ds.file_meta.TransferSyntaxUID == DeflatedExplicitVRLittleEndian
+        assert ds.SOPClassUID == dcmread(DEFL_DATASET).SOPClassUID
+        assert ds.PatientName == dcmread(DEFL_DATASET).PatientName
+
+    def test_missing_meta(self):
+        """Test reading a dataset with incomplete File Meta Information"""
+        ds = read_header(DATA_DIR / "CTImageStorage_bad_meta.dcm", ["SOPClassUID"])
+        assert "MediaStorageSOPClassUID" not in ds.file_meta
+        assert ds.SOPClassUID == "1.2.840.10008.5.1.4.1.1.2"
+
+    def test_not_dicom(self):
+        """Test reading a file that's not DICOM"""
+        with pytest.raises(InvalidDicomError):
+            read_header(__file__)
+
+
+class TestHeaderCache:
+    """Tests for HeaderCache"""
+
+    def test_cache(self, tmp_path, monkeypatch):
+        """Test cached elements are used"""
+        path = DATA_DIR / "CTImageStorage.dcm"
+        with HeaderCache(tmp_path / "cache.db") as cache:
+            assert cache.path == tmp_path / "cache.db"
+            ref = read_header(path, cache=cache)
+            assert read_header(path, cache=cache) == ref
+
+        def read_partial(*args, **kwargs):
+            raise RuntimeError("File read")
+
+        monkeypatch.setattr(dsutils, "read_partial", read_partial)
+        with HeaderCache(tmp_path / "cache.db") as cache:
+            ds = read_header(str(path), cache=cache)
+            assert ds == ref
+            assert ds.file_meta == ref.file_meta
+            assert ds.PatientName == "CompressedSamples^CT1"
+            assert ds.SeriesNumber == 1
+
+            # Entries are keyed by the elements read
+            with pytest.raises(RuntimeError, match="File read"):
+                read_header(path, ["SOPClassUID"], cache=cache)
+
+            assert cache.get(path, [0x00080016]) is None
+
+    def test_modified(self, tmp_path):
+        """Test modified files are read again"""
+        path = tmp_path / "foo.dcm"
+        shutil.copy(DATA_DIR / "CTImageStorage.dcm", path)
+        cache = HeaderCache(tmp_path / "cache.db")
+        assert read_header(path, cache=cache).Modality == "CT"
+        assert cache.get(path, [0x00080060]) is None
+        assert cache.get(path, [0x00080060, 0x00080016]) is None
+
+        ds = dcmread(path)
+        ds.Modality = "MR"
+        ds.save_as(path)
+        st = os.stat(path)
+        # Same size, different modification time
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert read_header(path, cache=cache).Modality == "MR"
+        assert read_header(path, cache=cache).Modality == "MR"
+
+        # Different size, same modification time
+        st = os.stat(path)
+        ds.Modality = "OT"
+        ds.PatientID = "12345678"
+        ds.save_as(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert read_header(path, cache=cache).Modality == "OT"
+        cache.close()
+
+    def test_batched(self, tmp_path):
+        """Test entries are committed in batches and on close"""
+        path = DATA_DIR / "CTImageStorage.dcm"
+        ds = read_header(path)
+        cache = HeaderCache(tmp_path / "cache.db")
+        for ii in range(1001):
+            cache.set(path, [ii], ds)
+
+        assert cache._pending == 1
+        other = HeaderCache(tmp_path / "cache.db")
+        assert other.get(path, [999]) == ds
+        assert other.get(path, [1000]) is None
+
+        cache.close()
+        assert other.get(path, [1000]) == ds
+        other.close()
@@ -8,8 +8,13 @@ import time
 
 import pytest
 
-from pynetdicom import AE, debug_logger, evt
-from pynetdicom.dul import DULServiceProvider
+from pydicom import dcmread
+from pydicom.dataset import Dataset
+
+from pynetdicom import AE, debug_logger, evt, _config
+from pynetdicom.dimse_messages import DIMSEMessage
+from pynetdicom.dimse_primitives import C_ECHO
+from pynetdicom.dul import DULServiceProvider, AsyncioDULServiceProvider
 from pynetdicom.pdu import (
     A_ASSOCIATE_RQ,
     A_ASSOCIATE_AC,
@@ -20,7 +25,12 @@ from pynetdicom.pdu import (
     A_ABORT_RQ,
 )
 from pynetdicom.pdu_primitives import A_ASSOCIATE, A_RELEASE, A_ABORT, P_DATA
-from pynetdicom.sop_class import Verification
+from pynetdicom.sop_class import (
+    Verification,
+    CTImageStorage,
+    PatientRootQueryRetrieveInformationModelFind,
+)
+from pynetdicom.transport import AsyncioAssociationSocket
 from .encoded_pdu_items import a_associate_ac, a_release_rq
 from .parrot import start_server, ThreadedParrot, ParrotRequest
 from .utils import sleep, get_port
@@ -29,6 +39,10 @@ from .utils import sleep, get_port
 # debug_logger()
 
 
+TEST_DS_DIR = os.path.join(os.path.dirname(__file__), "dicom_files")
+DATASET = dcmread(os.path.join(TEST_DS_DIR, "CTImageStorage.dcm"))
+
+
 class DummyACSE:
     """Dummy ACSE class"""
 
@@ -425,3 +439,648 @@ class TestDUL:
 
             scp.shutdown()
             assert "Attempted to send data over closed connection" in caplog.text
+
+    def test_send_coalesced(self, monkeypatch):
+        """Test the command set is sent together with the data set."""
+        self.ae = ae = AE()
+        ae.network_timeout = 5
+        ae.dimse_timeout = 5
+        ae.acse_timeout = 5
+        ae.add_supported_context(CTImageStorage)
+        ae.add_supported_context(Verification)
+
+        handlers = [(evt.EVT_C_STORE, lambda event: 0x0000)]
+        scp = ae.start_server(
+            ("localhost", get_port()), block=False, evt_handlers=handlers
+        )
+
+        ae.add_requested_context(CTImageStorage)
+        ae.add_requested_context(Verification)
+        assoc = ae.associate("localhost", get_port())
+        assert assoc.is_established
+
+        sent = []
+        pdus = []
+        sock = assoc.dul.socket
+        send_buffers = sock.send_buffers
+
+        def record(buffers):
+            sent.append(buffers)
+            send_buffers(buffers)
+
+        sock.send_buffers = record
+        assoc.bind(evt.EVT_PDU_SENT, lambda event: pdus.append(event.pdu))
+
+        # Command set only, nothing to coalesce with
+        assert assoc.send_c_echo().Status == 0x0000
+        assert len(sent) == 1
+        assert len(pdus) == 1
+
+        # Command set and data set are packed into the same PDUs
+        del sent[:], pdus[:]
+        assert assoc.send_c_store(DATASET).Status == 0x0000
+        assert len(sent) == len(pdus)
+        headers = [
+            item.presentation_data_value[0]
+            for item in pdus[0].presentation_data_value_items
+        ]
+        assert headers == [0x03, 0x00]
+
+        # Unpacked command set and data set are sent together
+        encode_msg = DIMSEMessage.encode_msg
+        monkeypatch.setattr(
+            DIMSEMessage,
+            "encode_msg",
+            lambda self, context_id, length, pack=False: encode_msg(
+                self, context_id, length
+            ),
+        )
+        del sent[:], pdus[:]
+        assert assoc.send_c_store(DATASET).Status == 0x0000
+        nr_pdus = len(pdus)
+        assert nr_pdus > 2
+        assert len(sent) < nr_pdus
+        # The command set PDV is the final buffer of the first PDU
+        assert sent[0][2][0] == 0x03
+        assert sent[0][5][0] == 0x00
+        cmd_pdu, ds_pdu = pdus[:2]
+        assert b"".join(sent[0]) == cmd_pdu.encode() + ds_pdu.encode()
+
+        assoc.release()
+        assert assoc.is_released
+
+        scp.shutdown()
+
+    def test_pack_p_data(self):
+        """Test packing queued P-DATA primitives."""
+
+        class DummyDIMSE:
+            maximum_pdu_size = 20
+
+        assoc = DummyAssociation()
+        assoc.dimse = DummyDIMSE()
+        dul = DULServiceProvider(assoc)
+
+        def p_data(*values):
+            primitive = P_DATA()
+            primitive.presentation_data_value_list.extend(
+                (1, value) for value in values
+            )
+            return primitive
+
+        # Nothing queued
+        primitive = p_data(b"\x03\x00")
+        assert dul._pack_p_data(primitive) is primitive
+
+        # Not a P-DATA queued
+        dul.to_provider_queue.put(A_RELEASE())
+        assert dul._pack_p_data(primitive) is primitive
+        dul.to_provider_queue.get(False)
+
+        # Too large to be packed
+        dul.to_provider_queue.put(p_data(b"\x03" + b"\x00" * 12))
+        assert dul._pack_p_data(primitive) is primitive
+        dul.to_provider_queue.get(False)
+
+        # 7 + 7 + 6 bytes fit, the release and the following P-DATA don't
+        dul.to_provider_queue.put(p_data(b"\x03\x01"))
+        dul.to_provider_queue.put(p_data(b"\x03"))
+        dul.to_provider_queue.put(A_RELEASE())
+        dul.to_provider_queue.put(p_data(b"\x03"))
+        packed = dul._pack_p_data(primitive)
+        assert packed.presentation_data_value_list == [
+            (1, b"\x03\x00"),
+            (1, b"\x03\x01"),
+            (1, b"\x03"),
+        ]
+        assert primitive.presentation_data_value_list == [(1, b"\x03\x00")]
+        assert isinstance(dul.to_provider_queue.get(False), A_RELEASE)
+
+        # No maximum
+        assoc.dimse.maximum_pdu_size = 0
+        dul.to_provider_queue.put(p_data(b"\x03" + b"\x00" * 100))
+        packed = dul._pack_p_data(primitive)
+        assert len(packed.presentation_data_value_list) == 3
+        assert dul.to_provider_queue.empty()
+
+    def test_send_packed_messages(self, monkeypatch):
+        """Test sending consecutive messages in the same PDUs."""
+        monkeypatch.setattr(_config, "PACK_DIMSE_MESSAGES", True)
+
+        self.ae = ae = AE()
+        ae.network_timeout = 5
+        ae.dimse_timeout = 5
+        ae.acse_timeout = 5
+        ae.add_supported_context(PatientRootQueryRetrieveInformationModelFind)
+
+        def handle_find(event):
+            for ii in range(50):
+                ds = Dataset()
+                ds.PatientID = f"{ii:04d}"
+                yield 0xFF00, ds
+
+        handlers = [(evt.EVT_C_FIND, handle_find)]
+        scp = ae.start_server(
+            ("localhost", get_port()), block=False, evt_handlers=handlers
+        )
+
+        ae.add_requested_context(PatientRootQueryRetrieveInformationModelFind)
+        assoc = ae.associate("localhost", get_port())
+        assert assoc.is_established
+
+        pdus = []
+        scp.active_associations[0].bind(
+            evt.EVT_PDU_SENT, lambda event: pdus.append(event.pdu)
+        )
+
+        query = Dataset()
+        query.QueryRetrieveLevel = "PATIENT"
+        query.PatientID = "*"
+        responses = assoc.send_c_find(
+            query, PatientRootQueryRetrieveInformationModelFind
+        )
+        results = [(status.Status, ds) for status, ds in responses]
+        assert len(results) == 51
+        assert [ds.PatientID for _, ds in results[:-1]] == [
+            f"{ii:04d}" for ii in range(50)
+        ]
+        assert results[-1] == (0x0000, None)
+        # Each response is at least two PDVs
+        nr_pdvs = sum(len(pdu.presentation_data_value_items) for pdu in pdus)
+        assert nr_pdvs >= 101
+        assert all(len(pdu) <= 6 + 16382 for pdu in pdus)
+
+        assoc.release()
+        assert assoc.is_released
+
+        scp.shutdown()
+
+    def test_recv_buffer_grows(self):
+        """Test the receive buffer is grown for large PDUs."""
+        self.ae = ae = AE()
+        ae.network_timeout = 5
+        ae.dimse_timeout = 5
+        ae.acse_timeout = 5
+        ae.maximum_pdu_size = 0
+        ae.add_supported_context(CTImageStorage)
+
+        handlers = [(evt.EVT_C_STORE, lambda event: 0x0000)]
+        scp = ae.start_server(
+            ("localhost", get_port()), block=False, evt_handlers=handlers
+        )
+
+        ae.add_requested_context(CTImageStorage)
+        assoc = ae.associate("localhost", get_port(), max_pdu=0)
+        assert assoc.is_established
+
+        child = scp.active_associations[0]
+        assert len(child.dul._recv_buffer) == 16388
+        status = assoc.send_c_store(DATASET)
+        assert status.Status == 0x0000
+        assert len(child.dul._recv_buffer) > 16388
+
+        assoc.release()
+        assert assoc.is_released
+
+        scp.shutdown()
+
+    def test_grow_recv_buffer(self):
+        """Test growing the receive buffer is limited."""
+        dul = DULServiceProvider(DummyAssociation())
+        dul._assoc.local = {"pdv_size": 0}
+        dul._recv_buffer[:6] = b"\x04\x00\x00\x01\x00\x00"
+        dul._grow_recv_buffer(6, 2**32)
+        assert len(dul._recv_buffer) == 2 * 16388
+        assert dul._recv_buffer[:6] == b"\x04\x00\x00\x01\x00\x00"
+
+        dul._grow_recv_buffer(6, 40000)
+        assert len(dul._recv_buffer) == 40000
+
+        dul._assoc.local = {"pdv_size": 100000}
+        dul._grow_recv_buffer(6, 2**32)
+        assert len(dul._recv_buffer) == 100006
+
+    def test_recv_buffer_queued_pdu(self):
+        """Test a queued P-DATA-TF isn't overwritten by the next PDU."""
+
+        class DummySocket:
+            def __init__(self, data):
+                self.data = bytearray(data)
+
+            def recv_into(self, view):
+                nr_bytes = min(len(view), len(self.data))
+                view[:nr_bytes] = self.data[:nr_bytes]
+                del self.data[:nr_bytes]
+                return nr_bytes
+
+        assoc = DummyAssociation()
+        assoc.get_handlers = lambda event: []
+        dul = DULServiceProvider(assoc)
+        dul.socket = DummySocket(
+            b"\x04\x00\x00\x00\x00\x08\x00\x00\x00\x04\x01\x02\x00\x01"
+            b"\x04\x00\x00\x00\x00\x08\x00\x00\x00\x04\x03\x02\x00\x02"
+        )
+
+        buffer = dul._recv_buffer
+        dul._read_pdu_data()
+        assert dul._recv_buffer is buffer
+        dul._read_pdu_data()
+        assert dul._recv_buffer is not buffer
+        assert len(dul._recv_buffer) == len(buffer)
+        assert list(dul.event_queue.queue) == ["Evt10", "Evt10"]
+
+        first = dul._recv_pdu.get(False)
+        second = dul._recv_pdu.get(False)
+        assert first.presentation_data_values == [(1, b"\x02\x00\x01")]
+        assert second.presentation_data_values == [(3, b"\x02\x00\x02")]
+
+        # Nothing waiting so the buffer is reused
+        buffer = dul._recv_buffer
+        dul.socket = DummySocket(
+            b"\x04\x00\x00\x00\x00\x08\x00\x00\x00\x04\x01\x02\x00\x01"
+        )
+        dul._read_pdu_data()
+        assert dul._recv_buffer is buffer
+
+    def test_wakeup_queue(self):
+        """Test adding to the DUL queues wakes the reactor."""
+        dul = DULServiceProvider(DummyAssociation())
+        dul._open_selector()
+        dul._max_wait = 5
+
+        t = threading.Timer(0.1, dul.event_queue.put, args=("Evt1",))
+        t.start()
+        start = time.monotonic()
+        dul._wait()
+        assert time.monotonic() - start < 2
+        assert dul.event_queue.get(False) == "Evt1"
+        assert not dul._wakeup_pending
+
+        t = threading.Timer(0.1, dul.to_provider_queue.put, args=(A_ABORT(),))
+        t.start()
+        start = time.monotonic()
+        dul._wait()
+        assert time.monotonic() - start < 2
+        assert isinstance(dul.to_provider_queue.get(False), A_ABORT)
+
+        dul._close_selector()
+        assert dul._selector is None
+        # No reactor running, so no wakeup
+        dul.event_queue.put("Evt2")
+        assert not dul._wakeup_pending
+
+    def test_wakeup_during_drain(self):
+        """Test a wakeup while the wakeup socket is drained isn't lost."""
+        dul = DULServiceProvider(DummyAssociation())
+        dul._open_selector()
+        dul._max_wait = 5
+
+        class Recv:
+            """Wake the reactor from another thread part way through the
+            drain"""
+
+            def __init__(self, sock):
+                self.sock = sock
+                self.woken = False
+
+            def recv(self, size):
+                data = self.sock.recv(size)
+                if not self.woken:
+                    self.woken = True
+                    t = threading.Thread(target=dul._wakeup)
+                    t.start()
+                    t.join()
+
+                return data
+
+        dul._wakeup()
+        dul._wakeup_recv = Recv(dul._wakeup_recv)
+        dul._wait()
+        assert not dul._wakeup_pending
+
+        # The next wakeup isn't skipped
+        t = threading.Timer(0.1, dul.event_queue.put, args=("Evt1",))
+        t.start()
+        start = time.monotonic()
+        dul._wait()
+        assert time.monotonic() - start < 2
+
+        dul._wakeup_recv = dul._wakeup_recv.sock
+        dul._close_selector()
+
+    def test_wait_artim(self):
+        """Test the reactor only blocks until the ARTIM timer expires."""
+        dul = DULServiceProvider(DummyAssociation())
+        dul._open_selector()
+        dul._max_wait = 5
+        dul.artim_timer.timeout = 0.1
+        dul.artim_timer.start()
+
+        start = time.monotonic()
+        dul._wait()
+        assert time.monotonic() - start < 2
+        assert dul.artim_timer.expired
+        # Woken by the timer wheel
+        assert dul._artim_expired
+
+        dul._close_selector()
+
+    def test_idle_timer_expired(self):
+        """Test the idle timer is flagged by the timer wheel"""
+        dul = DULServiceProvider(DummyAssociation())
+        dul._idle_timer.timeout = 0.05
+        dul._idle_timer.start()
+        assert not dul.idle_timer_expired()
+        time.sleep(0.1)
+        start = time.monotonic()
+        while not dul._idle_expired and time.monotonic() - start < 5:
+            time.sleep(0.01)
+
+        assert dul.idle_timer_expired()
+        dul._idle_timer.restart()
+        assert not dul.idle_timer_expired()
+
+    def test_idle_reactor_blocks(self):
+        """Test an idle association doesn't spin the DUL reactor."""
+        self.ae = ae = AE()
+        ae.network_timeout = 5
+        ae.dimse_timeout = 5
+        ae.acse_timeout = 5
+        ae.add_supported_context(Verification)
+
+        scp = ae.start_server(("localhost", get_port()), block=False)
+
+        ae.add_requested_context(Verification)
+        assoc = ae.associate("localhost", get_port())
+        assert assoc.is_established
+
+        dul = assoc.dul
+        count = []
+        original = dul._wait
+
+        def wait():
+            count.append(None)
+            original()
+
+        dul._wait = wait
+        time.sleep(0.5)
+        # Max of one pass per `_max_wait` (plus the pass in progress)
+        assert len(count) < 5
+
+        # Round trip not limited by the maximum wait
+        start = time.monotonic()
+        status = assoc.send_c_echo()
+        assert status.Status == 0x0000
+        assert time.monotonic() - start < dul._max_wait
+
+        assoc.release()
+        assert assoc.is_released
+        timeout = 0
+        while dul.is_alive() and timeout < 5:
+            time.sleep(0.05)
+            timeout += 0.05
+
+        assert dul._selector is None
+
+        scp.shutdown()
+
+
+class TestRecvBackpressure:
+    """Tests for pausing reading while received messages are queued."""
+
+    def setup_method(self):
+        self.ae = None
+
+    def teardown_method(self):
+        if self.ae:
+            self.ae.shutdown()
+
+    @pytest.mark.parametrize("use_asyncio", [False, True])
+    def test_max_queued_messages(self, use_asyncio, monkeypatch):
+        """Test reading stops while the message queue is full."""
+        monkeypatch.setattr(_config, "USE_ASYNCIO_DUL", use_asyncio)
+        monkeypatch.setattr(_config, "MAX_QUEUED_MESSAGES", 2)
+
+        self.ae = ae = AE()
+        ae.network_timeout = 5
+        ae.dimse_timeout = 5
+        ae.acse_timeout = 5
+        ae.add_supported_context(PatientRootQueryRetrieveInformationModelFind)
+
+        def handle_find(event):
+            for ii in range(20):
+                identifier = Dataset()
+                identifier.PatientID = f"{ii}"
+                yield 0xFF00, identifier
+
+        handlers = [(evt.EVT_C_FIND, handle_find)]
+        scp = ae.start_server(
+            ("localhost", get_port()), block=False, evt_handlers=handlers
+        )
+
+        ae.add_requested_context(PatientRootQueryRetrieveInformationModelFind)
+        assoc = ae.associate("localhost", get_port())
+        assert assoc.is_established
+
+        query = Dataset()
+        query.QueryRetrieveLevel = "PATIENT"
+        query.PatientID = "*"
+        queued = []
+        identifiers = []
+        for status, identifier in assoc.send_c_find(
+            query, PatientRootQueryRetrieveInformationModelFind
+        ):
+            time.sleep(0.02)
+            queued.append(assoc.dimse.queued_messages)
+            if status.Status == 0xFF00:
+                identifiers.append(identifier.PatientID)
+
+        assert identifiers == [f"{ii}" for ii in range(20)]
+        assert max(queued) == 2
+        assert assoc.dimse.queued_messages == 0
+        assert assoc.dimse.queued_bytes == 0
+
+        assoc.release()
+        assert assoc.is_released
+
+        scp.shutdown()
+
+    @pytest.mark.parametrize("use_asyncio", [False, True])
+    def test_abort_while_paused(self, use_asyncio, monkeypatch):
+        """Test an A-ABORT from the peer is still read while paused."""
+        monkeypatch.setattr(_config, "USE_ASYNCIO_DUL", use_asyncio)
+        monkeypatch.setattr(_config, "MAX_QUEUED_MESSAGES", 1)
+
+        self.ae = ae = AE()
+        ae.network_timeout = 5
+        ae.dimse_timeout = 5
+        ae.acse_timeout = 5
+        ae.add_supported_context(Verification)
+        ae.add_requested_context(Verification)
+
+        blocked = threading.Event()
+        release = threading.Event()
+        finished = threading.Event()
+
+        def handle_echo(event):
+            blocked.set()
+            release.wait(5)
+            finished.set()
+            return 0x0000
+
+        handlers = [(evt.EVT_C_ECHO, handle_echo)]
+        scp = ae.start_server(
+            ("localhost", get_port()), block=False, evt_handlers=handlers
+        )
+
+        assoc = ae.associate("localhost", get_port())
+        assert assoc.is_established
+
+        # The first request blocks the handler, the second fills the queue
+        cx_id = assoc.accepted_contexts[0].context_id
+        for msg_id in (1, 2):
+            req = C_ECHO()
+            req.MessageID = msg_id
+            req.AffectedSOPClassUID = Verification
+            assoc.dimse.send_msg(req, cx_id)
+
+        assert blocked.wait(5)
+        scp_assoc = scp.active_associations[0]
+        timeout = 0
+        while not scp_assoc.dul._is_recv_paused() and timeout < 5:
+            time.sleep(0.05)
+            timeout += 0.05
+
+        assert scp_assoc.dul._is_recv_paused()
+
+        assoc.abort()
+        assert assoc.is_aborted
+
+        # The A-ABORT is acted on while the handler is still running
+        state = scp_assoc.dul.state_machine
+        timeout = 0
+        while state.current_state != "Sta1" and timeout < 5:
+            time.sleep(0.05)
+            timeout += 0.05
+
+        assert state.current_state == "Sta1"
+        assert not finished.is_set()
+
+        release.set()
+        scp.shutdown()
+
+    def test_idle_timer_paused(self, monkeypatch):
+        """Test time spent paused doesn't count towards the idle timer."""
+        dul = DULServiceProvider(DummyAssociation())
+        paused = [True]
+        monkeypatch.setattr(dul, "_is_recv_paused", lambda: paused[0])
+        dul._idle_timer.timeout = 0.1
+        dul._idle_timer.start()
+
+        time.sleep(0.3)
+        assert not dul.idle_timer_expired()
+        assert not dul._idle_timer.expired
+
+        paused[0] = False
+        time.sleep(0.3)
+        assert dul.idle_timer_expired()
+        dul._idle_timer.stop()
+
+
+class TestAsyncioDUL:
+    """Tests for the asyncio DUL service provider."""
+
+    def setup_method(self):
+        self.ae = None
+        _config.USE_ASYNCIO_DUL = True
+
+    def teardown_method(self):
+        _config.USE_ASYNCIO_DUL = False
+
+        if self.ae:
+            self.ae.shutdown()
+
+    def test_association(self):
+        """Test associating, DIMSE and releasing with the asyncio DUL."""
+        self.ae = ae = AE()
+        ae.network_timeout = 5
+        ae.dimse_timeout = 5
+        ae.acse_timeout = 5
+        ae.add_supported_context(Verification)
+        ae.add_supported_context(CTImageStorage)
+
+        def handle_store(event):
+            assert event.assoc.dul.is_alive()
+            assert event.dataset.PatientName == DATASET.PatientName
+            return 0x0000
+
+        handlers = [(evt.EVT_C_STORE, handle_store)]
+        scp = ae.start_server(
+            ("localhost", get_port()), block=False, evt_handlers=handlers
+        )
+
+        ae.add_requested_context(Verification)
+        ae.add_requested_context(CTImageStorage)
+        assoc = ae.associate("localhost", get_port())
+        assert assoc.is_established
+        assert isinstance(assoc.dul, AsyncioDULServiceProvider)
+        assert isinstance(assoc.dul.socket, AsyncioAssociationSocket)
+        assert isinstance(scp.active_associations[0].dul, AsyncioDULServiceProvider)
+
+        names = [t.name for t in threading.enumerate()]
+        assert "AsyncioReactor" in names
+        threads = threading.enumerate()
+        assert not [t for t in threads if isinstance(t, DULServiceProvider)]
+
+        for _ in range(5):
+            assert assoc.send_c_echo().Status == 0x0000
+
+        assert assoc.send_c_store(DATASET).Status == 0x0000
+
+        assoc.release()
+        assert assoc.is_released
+
+        timeout = 0
+        while assoc.dul.is_alive() and timeout < 5:
+            time.sleep(0.05)
+            timeout += 0.05
+
+        assert not assoc.dul.is_alive()
+        assert assoc.dul.socket.socket is None
+
+        scp.shutdown()
+
+    def test_abort(self):
+        """Test aborting an association with the asyncio DUL."""
+        self.ae = ae = AE()
+        ae.network_timeout = 5
+        ae.dimse_timeout = 5
+        ae.acse_timeout = 5
+        ae.add_supported_context(Verification)
+
+        scp = ae.start_server(("localhost", get_port()), block=False)
+
+        ae.add_requested_context(Verification)
+        assoc = ae.associate("localhost", get_port())
+        assert assoc.is_established
+        assoc.abort()
+        assert assoc.is_aborted
+
+        timeout = 0
+        while scp.active_associations and timeout < 5:
+            time.sleep(0.05)
+            timeout += 0.05
+
+        assert not scp.active_associations
+
+        scp.shutdown()
+
+    def test_connection_refused(self):
+        """Test a failed connection with the asyncio DUL."""
+        self.ae = ae = AE()
+        ae.network_timeout = 5
+        ae.acse_timeout = 5
+        ae.add_requested_context(Verification)
+        assoc = ae.associate("localhost", get_port())
+        assert not assoc.is_established
+        assert assoc.is_aborted
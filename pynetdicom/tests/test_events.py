@@ -156,6 +156,9 @@ class TestEvent:
         with pytest.raises(AttributeError, match=msg):
             event.encoded_dataset()
 
+        with pytest.raises(AttributeError, match=msg):
+            event.encoded_dataset_buffers()
+
         msg = (
             r"The corresponding event is not a C-FIND, C-GET or C-MOVE request "
             r"and has no 'Identifier' parameter"
@@ -552,6 +555,33 @@ class TestEvent:
         bs = event.encoded_dataset(include_meta=False)
         assert bs == b"\x00\x01"
 
+    def test_encoded_dataset_buffers(self):
+        """Test Event.encoded_dataset_buffers()"""
+        request = C_STORE()
+        request.AffectedSOPClassUID = "1.2"
+        request.AffectedSOPInstanceUID = "1.3"
+        request.DataSet = BytesIO(b"\x00\x01")
+
+        event = Event(
+            None,
+            evt.EVT_C_STORE,
+            {"request": request, "context": self.context.as_tuple},
+        )
+        buffers = event.encoded_dataset_buffers()
+        assert len(buffers) == 2
+        assert all(isinstance(b, memoryview) and b.readonly for b in buffers)
+        assert b"".join(buffers) == event.encoded_dataset()
+
+        # The dataset isn't copied
+        stream = request.DataSet.getvalue()
+        assert buffers[1].obj is stream
+
+        # Test without file_meta
+        buffers = event.encoded_dataset_buffers(include_meta=False)
+        assert len(buffers) == 1
+        assert buffers[0] == b"\x00\x01"
+        assert buffers[0].obj is stream
+
 
 # TODO: Should be able to remove in v1.4
 INTERVENTION_HANDLERS = [
@@ -190,6 +190,83 @@ class TestStateMachine:
             assert fsm.dul.is_killed is True
             assert fsm.current_state == state
 
+    def test_compiled_tables(self):
+        """Test the compiled tables match the transition table."""
+        tables = FINITE_STATE
+        for state, state_id in tables._STATE_IDS.items():
+            assert tables._STATE_NAMES[state_id] == state
+            for event, event_id in tables._EVENT_IDS.items():
+                action_id = tables._TRANSITIONS[state_id][event_id]
+                if (event, state) not in TRANSITION_TABLE:
+                    assert action_id == -1
+                    continue
+
+                action = TRANSITION_TABLE[(event, state)]
+                assert tables._ACTION_NAMES[action_id] == action
+                assert tables._ACTION_FUNCS[action_id] == ACTIONS[action][1]
+
+            # Unknown events
+            assert tables._TRANSITIONS[state_id][-1] == -1
+
+    def test_unknown_event_raises(self):
+        """Test StateMachine.do_action raises if the event is unknown."""
+        ae = AE()
+        ae.add_requested_context(Verification)
+
+        assoc = Association(ae, mode="requestor")
+        fsm = assoc.dul.state_machine
+
+        msg = r"Invalid event 'Evt20' for the current state 'Sta1'"
+        with pytest.raises(InvalidEventError, match=msg):
+            fsm.do_action("Evt20")
+
+    def test_invalid_current_state_raises(self):
+        """Test setting StateMachine.current_state to an invalid state."""
+        ae = AE()
+        ae.add_requested_context(Verification)
+
+        assoc = Association(ae, mode="requestor")
+        fsm = assoc.dul.state_machine
+
+        msg = r"Invalid state 'Sta14' for State Machine"
+        with pytest.raises(ValueError, match=msg):
+            fsm.current_state = "Sta14"
+
+        assert fsm.current_state == "Sta1"
+
+    def test_transition_event_not_bound(self, monkeypatch):
+        """Test EVT_FSM_TRANSITION isn't triggered without a handler."""
+        triggered = []
+
+        def trigger(assoc, event, attrs=None):
+            triggered.append(event)
+
+        monkeypatch.setattr(FINITE_STATE.evt, "trigger", trigger)
+
+        ae = AE()
+        ae.add_requested_context(Verification)
+
+        assoc = Association(ae, mode="requestor")
+        fsm = assoc.dul.state_machine
+
+        with monkeypatch.context() as m:
+            m.setitem(ACTIONS, "AR-5", ("Bluh", lambda dul: "Sta1", "Sta1"))
+            FINITE_STATE._compile_tables()
+            try:
+                fsm.current_state = "Sta13"
+                fsm.do_action("Evt17")
+                assert fsm.current_state == "Sta1"
+                assert triggered == []
+
+                assoc.bind(evt.EVT_FSM_TRANSITION, lambda event: None)
+                fsm.current_state = "Sta13"
+                fsm.do_action("Evt17")
+                assert fsm.current_state == "Sta1"
+                assert triggered == [evt.EVT_FSM_TRANSITION]
+            finally:
+                m.undo()
+                FINITE_STATE._compile_tables()
+
 
 class TestStateBase:
     """Base class for State tests."""
@@ -8257,6 +8334,7 @@ class TestStateMachineFunctionalRequestor:
 
         FINITE_STATE.ACTIONS["AR-4"] = self.orig_ar4
         FINITE_STATE.ACTIONS["AR-2"] = self.orig_ar2
+        FINITE_STATE._compile_tables()
 
         time.sleep(0.1)
 
@@ -8619,6 +8697,7 @@ class TestStateMachineFunctionalRequestor:
 
         # In this case the association acceptor will hit AR_4
         FINITE_STATE.ACTIONS["AR-4"] = ("Bluh", AR_4, "Sta13")
+        FINITE_STATE._compile_tables()
 
         self.ae = ae = AE()
         ae.add_supported_context(Verification)
@@ -8689,6 +8768,7 @@ class TestStateMachineFunctionalRequestor:
 
         # In this case the association acceptor will hit AR_2
         FINITE_STATE.ACTIONS["AR-2"] = ("Bluh", AR_2, "Sta8")
+        FINITE_STATE._compile_tables()
 
         self.ae = ae = AE()
         ae.add_supported_context(Verification)
@@ -8781,6 +8861,7 @@ class TestStateMachineFunctionalAcceptor:
             self.ae.shutdown()
 
         FINITE_STATE.ACTIONS["AE-2"] = self.orig_entry
+        FINITE_STATE._compile_tables()
 
     def monkey_patch(self, fsm):
         """Monkey patch the StateMachine to add testing hooks."""
@@ -8827,6 +8908,7 @@ class TestStateMachineFunctionalAcceptor:
             return "Sta5"
 
         FINITE_STATE.ACTIONS["AE-2"] = ("Bluh", AE_2, "Sta5")
+        FINITE_STATE._compile_tables()
 
         self.assoc.start()
 
@@ -39,6 +39,7 @@ from pynetdicom.pdu_primitives import (
     ImplementationVersionNameNotification,
     A_P_ABORT,
     A_ABORT,
+    P_DATA,
 )
 from .encoded_pdu_items import (
     a_associate_rq,
@@ -54,6 +55,11 @@ from .encoded_pdu_items import (
     a_associate_ac_no_ts,
     a_associate_rq_called,
     a_associate_rq_calling,
+    a_associate_ac_user,
+    a_associate_rq_role,
+    a_associate_rq_user_async,
+    a_associate_rq_com_ext_neg,
+    p_data_tf_rq,
 )
 from pynetdicom.sop_class import Verification
 from pynetdicom.utils import pretty_bytes
@@ -222,6 +228,74 @@ class TestPDU:
         assert out == 1
 
 
+REFERENCE_PDUS = [
+    (A_ASSOCIATE_RQ, a_associate_rq),
+    (A_ASSOCIATE_RQ, a_associate_rq_role),
+    (A_ASSOCIATE_RQ, a_associate_rq_user_async),
+    (A_ASSOCIATE_RQ, a_associate_rq_user_id_ext_neg),
+    (A_ASSOCIATE_AC, a_associate_ac),
+    (A_ASSOCIATE_AC, a_associate_ac_no_ts),
+    (A_ASSOCIATE_AC, a_associate_rq_com_ext_neg),
+    (A_ASSOCIATE_RJ, a_associate_rj),
+    (P_DATA_TF, p_data_tf),
+    (P_DATA_TF, p_data_tf_rq),
+    (A_RELEASE_RQ, a_release_rq),
+    (A_RELEASE_RP, a_release_rp),
+    (A_ABORT_RQ, a_abort),
+    (A_ABORT_RQ, a_p_abort),
+]
+
+
+class TestCompiledCodec:
+    """Test the compiled PDU encoders and decoders."""
+
+    @pytest.mark.parametrize("cls, encoded", REFERENCE_PDUS)
+    def test_decode(self, cls, encoded):
+        """Test decoding matches the table driven decoder."""
+        pdu = cls()
+        pdu.decode(encoded)
+
+        reference = cls()
+        PDU.decode(reference, encoded)
+        assert pdu == reference
+
+    @pytest.mark.parametrize("cls, encoded", REFERENCE_PDUS)
+    def test_encode(self, cls, encoded):
+        """Test encoding matches the table driven encoder."""
+        pdu = cls()
+        pdu.decode(encoded)
+        assert pdu.encode() == encoded
+        assert PDU.encode(pdu) == encoded
+        assert b"".join(pdu.encode_buffers()) == encoded
+
+    def test_decode_memoryview(self):
+        """Test decoding a P-DATA-TF from a memoryview."""
+        pdu = P_DATA_TF()
+        pdu.decode(memoryview(bytearray(p_data_tf_rq)))
+        assert pdu.encode() == p_data_tf_rq
+        for item in pdu.presentation_data_value_items:
+            assert isinstance(item.presentation_data_value, bytes)
+
+    def test_p_data_tf_invalid_item_length(self):
+        """Test decoding a P-DATA-TF with an invalid PDV item length."""
+        msg = "Invalid 'Item Length' value for a Presentation Data Value Item"
+        pdu = P_DATA_TF()
+        # Item length longer than the PDU
+        with pytest.raises(ValueError, match=msg):
+            pdu.decode(b"\x04\x00\x00\x00\x00\x07\x00\x00\x00\x04\x01\x01\x02")
+
+        # Item length shorter than the context ID
+        with pytest.raises(ValueError, match=msg):
+            pdu.decode(b"\x04\x00\x00\x00\x00\x05\x00\x00\x00\x00\x01")
+
+    def test_associate_short_items(self):
+        """Test decoding an A-ASSOCIATE-RQ with a truncated item."""
+        msg = "The encoded item is shorter than its 'Item Length'"
+        pdu = A_ASSOCIATE_RQ()
+        with pytest.raises(ValueError, match=msg):
+            pdu.decode(a_associate_rq[:-1])
+
+
 class TestASSOC_RQ:
     """Test the A_ASSOCIATE_RQ class."""
 
@@ -1184,6 +1258,31 @@ class TestP_DATA_TF:
 
         assert pdu.encode() == p_data_tf
 
+    def test_encode_buffers(self):
+        """Check encoding a p_data as separate buffers"""
+        pdu = P_DATA_TF()
+        pdu.decode(p_data_tf)
+
+        pdv = pdu.presentation_data_value_items[0]
+        buffers = pdu.encode_buffers()
+        assert len(buffers) == 3
+        assert buffers[2] is pdv.presentation_data_value
+        assert b"".join(buffers) == p_data_tf
+
+        data = b"\x00\x00\x00\x04\x01\x01\x02\x03"
+        data += b"\x00\x00\x00\x05\x02\x03\x01\x02\x03"
+        pdu = P_DATA_TF()
+        pdu.decode(b"\x04\x00\x00\x00\x00\x11" + data)
+        assert len(pdu.encode_buffers()) == 5
+        assert b"".join(pdu.encode_buffers()) == pdu.encode()
+
+        pdu = P_DATA_TF()
+        assert pdu.encode_buffers() == [b"\x04\x00\x00\x00\x00\x00"]
+
+        pdu = A_RELEASE_RQ()
+        pdu.decode(a_release_rq)
+        assert pdu.encode_buffers() == [a_release_rq]
+
     def test_to_primitive(self):
         """Check converting PDU to primitive"""
         pdu = P_DATA_TF()
@@ -1206,6 +1305,55 @@ class TestP_DATA_TF:
 
         assert new_pdu == orig_pdu
 
+    def test_decode_lazy(self):
+        """Test decoding only records the location of the PDVs."""
+        data = bytearray(
+            b"\x04\x00\x00\x00\x00\x11"
+            b"\x00\x00\x00\x04\x01\x01\x02\x03"
+            b"\x00\x00\x00\x05\x03\x03\x01\x02\x03"
+        )
+        pdu = P_DATA_TF()
+        pdu.decode(memoryview(data))
+        assert pdu._values is not None
+        assert pdu.pdu_length == 17
+
+        values = pdu.presentation_data_values
+        assert values == [(1, b"\x01\x02\x03"), (3, b"\x03\x01\x02\x03")]
+        assert all(isinstance(value, memoryview) for _, value in values)
+        assert pdu._values is not None
+
+        # The values are views of the decoded data
+        data[13] = 0xFF
+        assert values[0][1] == b"\x01\x02\xFF"
+
+        # Primitive values are the same views
+        primitive = pdu.to_primitive()
+        assert primitive.presentation_data_value_list[0][1] is values[0][1]
+
+        # The items are created and the data copied on first access
+        items = pdu.presentation_data_value_items
+        assert pdu._values is None
+        assert [ii.presentation_context_id for ii in items] == [1, 3]
+        assert items[0].presentation_data_value == b"\x01\x02\xFF"
+        data[13] = 0x03
+        assert items[0].presentation_data_value == b"\x01\x02\xFF"
+        assert pdu.presentation_data_values == [
+            (1, b"\x01\x02\xFF"),
+            (3, b"\x03\x01\x02\x03"),
+        ]
+
+    def test_presentation_data_values_from_items(self):
+        """Test presentation_data_values for a PDU with items."""
+        primitive = P_DATA()
+        primitive.presentation_data_value_list = [[1, b"\x03\x00"]]
+        pdu = P_DATA_TF(primitive)
+        assert pdu.presentation_data_values == [(1, b"\x03\x00")]
+
+        pdu.decode(p_data_tf)
+        pdu.presentation_data_value_items = []
+        assert pdu.presentation_data_values == []
+        assert pdu.pdu_length == 0
+
     def test_generate_items(self):
         """Test ._generate_items"""
         pdu = P_DATA_TF()
@@ -27,6 +27,8 @@ from pynetdicom.pdu_items import (
     TransferSyntaxSubItem,
     PresentationDataValueItem,
     AbstractSyntaxSubItem,
+    _FileFragment,
+    _FileSource,
     SCP_SCU_RoleSelectionSubItem,
     PDUItem,
     PACK_UCHAR,
@@ -302,6 +304,14 @@ class TestPDU:
         assert b"1.2.3\x00" == item._wrap_uid_bytes(b"1.2.3\x00\x00")
         assert b"\x001.2.3" == item._wrap_uid_bytes(b"\x001.2.3")
 
+    def test_wrap_uid(self):
+        """Test PDU._wrap_uid()."""
+        item = PDUItem()
+        assert isinstance(item._wrap_uid(b"1.2.3"), UID)
+        assert "1.2.3" == item._wrap_uid(b"1.2.3")
+        # Removes trailing padding
+        assert "1.2.3" == item._wrap_uid(b"1.2.3\x00")
+
     def test_wrap_unpack(self):
         """Test PDU._wrap_unpack()."""
         item = PDUItem()
@@ -324,6 +334,46 @@ class TestPDU:
         assert out == b"1.2.840.10008.1.10"
 
 
+REFERENCE_ITEMS = [
+    (ApplicationContextItem, application_context),
+    (ApplicationContextItem, application_context_empty),
+    (PresentationContextItemRQ, presentation_context_rq),
+    (PresentationContextItemAC, presentation_context_ac),
+    (AbstractSyntaxSubItem, abstract_syntax),
+    (TransferSyntaxSubItem, transfer_syntax),
+    (PresentationDataValueItem, presentation_data_value),
+    (UserInformationItem, user_information),
+    (MaximumLengthSubItem, maximum_length_received),
+    (ImplementationClassUIDSubItem, implementation_class_uid),
+    (ImplementationVersionNameSubItem, implementation_version_name),
+    (AsynchronousOperationsWindowSubItem, asynchronous_window_ops),
+    (SCP_SCU_RoleSelectionSubItem, role_selection),
+    (SCP_SCU_RoleSelectionSubItem, role_selection_odd),
+]
+
+
+class TestCompiledCodec:
+    """Test the compiled item encoders and decoders."""
+
+    @pytest.mark.parametrize("cls, encoded", REFERENCE_ITEMS)
+    def test_decode(self, cls, encoded):
+        """Test decoding matches the table driven decoder."""
+        item = cls()
+        item.decode(encoded)
+
+        reference = cls()
+        PDUItem.decode(reference, encoded)
+        assert item == reference
+
+    @pytest.mark.parametrize("cls, encoded", REFERENCE_ITEMS)
+    def test_encode(self, cls, encoded):
+        """Test encoding matches the table driven encoder."""
+        item = cls()
+        item.decode(encoded)
+        assert item.encode() == encoded
+        assert PDUItem.encode(item) == encoded
+
+
 class TestApplicationContext:
     def setup_method(self):
         self.default_conformance = _config.ENFORCE_UID_CONFORMANCE
@@ -1182,6 +1232,56 @@ class TestPresentationDataValue:
             item.presentation_data_value = value
             assert item.message_control_header_byte == ref[value[0:1]]
 
+    def test_file_fragment(self, tmp_path):
+        """Test using a _FileFragment as the presentation data value"""
+        path = tmp_path / "fragment"
+        path.write_bytes(b"\x00\x01\x02\x03\x04\x05")
+
+        source = _FileSource(path)
+        fragment = _FileFragment(b"\x02", source, 2, 3)
+        assert fragment.is_last
+        assert not _FileFragment(b"\x00", source, 2, 3).is_last
+        assert len(fragment) == 4
+        assert bytes(fragment) == b"\x02\x02\x03\x04"
+        assert fragment[0] == 0x02
+        assert fragment[0:1] == b"\x02"
+        assert fragment[1] == 0x02
+        assert fragment[1:] == b"\x02\x03\x04"
+        assert fragment[-1] == 0x04
+
+        # The file is only read when required
+        source.close()
+        assert source._file is None
+        path.unlink()
+        assert fragment[0:1] == b"\x02"
+
+        path.write_bytes(b"\x00\x01\x02\x03\x04\x05")
+        item = PresentationDataValueItem()
+        item.presentation_context_id = 1
+        item.presentation_data_value = fragment
+        assert item.item_length == 5
+        assert item.message_control_header_byte == "00000010"
+        assert item.encode() == b"\x00\x00\x00\x05\x01\x02\x02\x03\x04"
+        source.close()
+
+    def test_file_source(self, tmp_path):
+        """Test _FileSource only opens the file once"""
+        path = tmp_path / "fragment"
+        path.write_bytes(b"\x00\x01\x02\x03\x04\x05")
+
+        source = _FileSource(path)
+        assert source._file is None
+        assert source.read(1, 2) == b"\x01\x02"
+        f = source._file
+        assert f is not None
+        assert source.read(4, 10) == b"\x04\x05"
+        assert source._file is f
+
+        source.close()
+        assert f.closed
+        assert source._file is None
+        source.close()
+
 
 class TestUserInformation:
     def test_init(self):
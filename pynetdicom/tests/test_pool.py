@@ -0,0 +1,280 @@
+"""Tests for the pool module."""
+
+import threading
+import time
+
+import pytest
+
+from pynetdicom import AE, AssociationPool, evt, debug_logger
+from pynetdicom.sop_class import CTImageStorage, Verification
+
+from .utils import get_port
+
+
+# debug_logger()
+
+
+class TestAssociationPool:
+    """Tests for AssociationPool."""
+
+    def setup_method(self):
+        """Run prior to each test"""
+        self.ae = None
+        self.echoes = []
+
+    def teardown_method(self):
+        """Clear any active threads"""
+        if self.ae:
+            self.ae.shutdown()
+
+    def start(self, status=0x0000):
+        """Start an SCP and return a requestor AE."""
+
+        def handle_echo(event):
+            self.echoes.append(event.assoc)
+            return status
+
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        ae.add_supported_context(Verification)
+        ae.add_supported_context(CTImageStorage)
+        self.scp = ae.start_server(
+            ("localhost", get_port()),
+            block=False,
+            evt_handlers=[(evt.EVT_C_ECHO, handle_echo)],
+        )
+
+        ae.add_requested_context(Verification)
+        ae.add_requested_context(CTImageStorage)
+
+        return ae
+
+    def test_init(self):
+        """Test creating a pool."""
+        ae = AE()
+        pool = AssociationPool(ae)
+        assert pool.ae is ae
+        assert pool.max_size == 4
+        assert pool.idle_timeout == 30
+        assert pool.check_idle == 5
+        assert pool.size == 0
+        assert not pool.is_closed
+
+        msg = "'max_size' must be greater than 0"
+        with pytest.raises(ValueError, match=msg):
+            AssociationPool(ae, max_size=0)
+
+    def test_reuse(self):
+        """Test idle associations are reused."""
+        ae = self.start()
+        pool = AssociationPool(ae)
+        assoc = pool.acquire("localhost", get_port())
+        assert assoc.is_established
+        assert pool.size == 1
+        pool.release(assoc)
+        assert assoc.is_established
+        assert pool.size == 1
+
+        assert pool.acquire("localhost", get_port()) is assoc
+        assert assoc.send_c_echo().Status == 0x0000
+        pool.release(assoc)
+        # Releasing twice has no effect
+        pool.release(assoc)
+        assert len(self.scp.active_associations) == 1
+
+        pool.close()
+        assert pool.is_closed
+        assert assoc.is_released
+        assert pool.size == 0
+
+        msg = "The association pool has been closed"
+        with pytest.raises(RuntimeError, match=msg):
+            pool.acquire("localhost", get_port())
+
+        self.scp.shutdown()
+
+    def test_keys(self):
+        """Test associations are only reused for the same parameters."""
+        ae = self.start()
+        with AssociationPool(ae) as pool:
+            assoc = pool.acquire("localhost", get_port())
+            pool.release(assoc)
+
+            other = pool.acquire("localhost", get_port(), ae_title="OTHER")
+            assert other is not assoc
+            assert other.acceptor.ae_title == "OTHER"
+            pool.release(other)
+
+            contexts = [ae.requested_contexts[0]]
+            other = pool.acquire("localhost", get_port(), contexts=contexts)
+            assert other is not assoc
+            assert len(other.accepted_contexts) == 1
+            pool.release(other)
+
+            assert pool.acquire("localhost", get_port()) is assoc
+            pool.release(assoc)
+            assert pool.size == 3
+
+        assert pool.size == 0
+        assert assoc.is_released
+
+        self.scp.shutdown()
+
+    def test_exclusive(self):
+        """Test associations are handed out exclusively."""
+        ae = self.start()
+        pool = AssociationPool(ae, max_size=2)
+        first = pool.acquire("localhost", get_port())
+        second = pool.acquire("localhost", get_port())
+        assert first is not second
+        assert pool.size == 2
+
+        msg = "Timed out waiting for an association to become available"
+        with pytest.raises(TimeoutError, match=msg):
+            pool.acquire("localhost", get_port(), timeout=0.1)
+
+        # Blocks until an association is released
+        acquired = []
+        t = threading.Thread(
+            target=lambda: acquired.append(pool.acquire("localhost", get_port()))
+        )
+        t.start()
+        time.sleep(0.1)
+        assert acquired == []
+        pool.release(second)
+        t.join(5)
+        assert acquired == [second]
+        assert pool.size == 2
+
+        pool.release(first)
+        pool.release(second)
+        pool.close()
+
+        self.scp.shutdown()
+
+    def test_association(self):
+        """Test the association() context manager."""
+        ae = self.start()
+        with AssociationPool(ae) as pool:
+            with pool.association("localhost", get_port()) as assoc:
+                assert assoc.is_established
+                assert pool._in_use == {assoc: pool._in_use[assoc]}
+
+            assert pool._in_use == {}
+            with pool.association("localhost", get_port()) as other:
+                assert other is assoc
+
+        assert assoc.is_released
+
+        self.scp.shutdown()
+
+    def test_not_established(self):
+        """Test an association that isn't established isn't pooled."""
+        ae = AE()
+        ae.acse_timeout = 5
+        ae.add_requested_context(Verification)
+        pool = AssociationPool(ae)
+        assoc = pool.acquire("localhost", get_port())
+        assert not assoc.is_established
+        assert pool.size == 0
+        pool.release(assoc)
+        assert pool.size == 0
+
+    def test_aborted(self):
+        """Test aborted associations are discarded."""
+        ae = self.start()
+        pool = AssociationPool(ae)
+        assoc = pool.acquire("localhost", get_port())
+        pool.release(assoc)
+        assoc.abort()
+        assert assoc.is_aborted
+
+        other = pool.acquire("localhost", get_port())
+        assert other is not assoc
+        assert other.is_established
+        assert pool.size == 1
+
+        # Released back to the pool after being aborted
+        other.abort()
+        pool.release(other)
+        assert pool.size == 0
+
+        self.scp.shutdown()
+
+    def test_idle_timeout(self):
+        """Test idle associations are released after the timeout."""
+        ae = self.start()
+        pool = AssociationPool(ae, idle_timeout=0.1)
+        assoc = pool.acquire("localhost", get_port())
+        pool.release(assoc)
+        time.sleep(0.2)
+
+        other = pool.acquire("localhost", get_port())
+        assert other is not assoc
+        assert pool.size == 1
+
+        timeout = time.monotonic() + 5
+        while not assoc.is_released and time.monotonic() < timeout:
+            time.sleep(0.01)
+
+        assert assoc.is_released
+
+        pool.release(other)
+        pool.close()
+
+        self.scp.shutdown()
+
+    def test_check_idle(self):
+        """Test idle associations are checked with C-ECHO."""
+        ae = self.start()
+        pool = AssociationPool(ae, check_idle=0.1)
+        assoc = pool.acquire("localhost", get_port())
+        pool.release(assoc)
+        assert pool.acquire("localhost", get_port()) is assoc
+        assert self.echoes == []
+        pool.release(assoc)
+
+        time.sleep(0.2)
+        assert pool.acquire("localhost", get_port()) is assoc
+        assert len(self.echoes) == 1
+        pool.release(assoc)
+
+        # No check without an accepted Verification context
+        contexts = [ae.requested_contexts[1]]
+        other = pool.acquire("localhost", get_port(), contexts=contexts)
+        pool.release(other)
+        time.sleep(0.2)
+        assert pool.acquire("localhost", get_port(), contexts=contexts) is other
+        assert len(self.echoes) == 1
+        pool.release(other)
+
+        pool = AssociationPool(ae, check_idle=None)
+        assoc = pool.acquire("localhost", get_port())
+        pool.release(assoc)
+        time.sleep(0.2)
+        assert pool.acquire("localhost", get_port()) is assoc
+        assert len(self.echoes) == 1
+        pool.release(assoc)
+
+        self.scp.shutdown()
+
+    def test_check_idle_fails(self):
+        """Test idle associations that fail the check are discarded."""
+        ae = self.start(status=0xC000)
+        pool = AssociationPool(ae, check_idle=0)
+        assoc = pool.acquire("localhost", get_port())
+        pool.release(assoc)
+        time.sleep(0.01)
+
+        other = pool.acquire("localhost", get_port())
+
+        assert other is not assoc
+        assert len(self.echoes) == 1
+        assert assoc.is_released
+        assert pool.size == 1
+        pool.release(other)
+        pool.close()
+
+        self.scp.shutdown()
@@ -189,6 +189,17 @@ class TestPresentationContext:
         assert pc_a == pc_b
         assert not "a" == pc_b
 
+    def test_equality_result(self):
+        """Test presentation context equality uses the result"""
+        pc_a = build_context("1.2.3", "1.2.3.4")
+        pc_b = build_context("1.2.3", "1.2.3.4")
+        assert pc_a == pc_b
+        pc_a.result = 0x00
+        assert pc_a != pc_b
+        pc_b.result = 0x00
+        assert pc_a == pc_b
+        assert not hasattr(pc_a, "__dict__")
+
     def test_hash(self):
         """Test hashing the context"""
         cx_a = build_context("1.2.3", "1.2.3.4")
@@ -1190,6 +1190,13 @@ class TestPrimitive_P_DATA:
         primitive.presentation_data_value_list = [[0, b"\x03\x00"]]
         assert "Byte: 00000011" in primitive.__str__()
 
+    def test_slots(self):
+        """Check the primitive has no instance dict."""
+        primitive = P_DATA()
+        assert not hasattr(primitive, "__dict__")
+        with pytest.raises(AttributeError):
+            primitive.foo = None
+
 
 class TestServiceParameter:
     def test_equality(self):
@@ -81,8 +81,8 @@ class TestNonPatientObjectStorageServiceClass:
         # Send C-STORE request to DIMSE and get response
         # Need to manually hit the checkpoint
         assoc._reactor_checkpoint.clear()
-        assoc.dimse.send_msg(req, 1)
         with pytest.warns(UserWarning):
+            assoc.dimse.send_msg(req, 1)
             cx_id, rsp = assoc.dimse.get_msg(True)
         assoc._reactor_checkpoint.set()
 
@@ -134,8 +134,8 @@ class TestQRFindServiceClass:
             b"\x08\x00\x01\x00\x40\x40\x00\x00\x00\x00\x00\x08\x00\x49"
         )
         assoc._reactor_checkpoint.clear()
-        assoc.dimse.send_msg(req, 1)
         with pytest.warns(UserWarning):
+            assoc.dimse.send_msg(req, 1)
             cx_id, rsp = assoc.dimse.get_msg(True)
         assoc._reactor_checkpoint.set()
         assert rsp.Status == 0xC310
@@ -1406,8 +1406,8 @@ class TestQRGetServiceClass:
             b"\x08\x00\x01\x00\x40\x40\x00\x00\x00\x00\x00\x08\x00\x49"
         )
         assoc._reactor_checkpoint.clear()
-        assoc.dimse.send_msg(req, 1)
         with pytest.warns(UserWarning):
+            assoc.dimse.send_msg(req, 1)
             cx_id, status = assoc.dimse.get_msg(True)
         assoc._reactor_checkpoint.set()
         assert status.Status == 0xC410
@@ -4037,8 +4037,8 @@ class TestQRMoveServiceClass:
             b"\x08\x00\x01\x00\x40\x40\x00\x00\x00\x00\x00\x08\x00\x49"
         )
         assoc._reactor_checkpoint.clear()
-        assoc.dimse.send_msg(req, 1)
         with pytest.warns(UserWarning):
+            assoc.dimse.send_msg(req, 1)
             cx_id, status = assoc.dimse.get_msg(True)
         assoc._reactor_checkpoint.set()
         assert status.Status == 0xC410
@@ -72,8 +72,8 @@ class TestRelevantPatientServiceClass:
             b"\x08\x00\x01\x00\x40\x40\x00\x00\x00\x00\x00\x08\x00\x49"
         )
         assoc._reactor_checkpoint.clear()
-        assoc.dimse.send_msg(req, 1)
         with pytest.warns(UserWarning):
+            assoc.dimse.send_msg(req, 1)
             cx_id, rsp = assoc.dimse.get_msg(True)
         assoc._reactor_checkpoint.set()
         assert rsp.Status == 0xC310
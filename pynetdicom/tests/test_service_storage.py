@@ -14,6 +14,8 @@ from pydicom.uid import ExplicitVRLittleEndian, ImplicitVRLittleEndian
 
 from pynetdicom import AE, _config, evt, debug_logger, register_uid, sop_class
 from pynetdicom.dimse_primitives import C_STORE
+from pynetdicom.dimse_messages import C_STORE_RQ
+from pynetdicom.dsutils import DatasetWriter, encode
 from pynetdicom.pdu_primitives import SOPClassExtendedNegotiation
 from pynetdicom.sop_class import (
     Verification,
@@ -121,8 +123,8 @@ class TestStorageServiceClass:
 
         # Send C-STORE request to DIMSE and get response
         assoc._reactor_checkpoint.clear()
-        assoc.dimse.send_msg(req, 1)
         with pytest.warns(UserWarning):
+            assoc.dimse.send_msg(req, 1)
             cx_id, rsp = assoc.dimse.get_msg(True)
         assoc._reactor_checkpoint.set()
 
@@ -173,8 +175,8 @@ class TestStorageServiceClass:
 
         # Send C-STORE request to DIMSE and get response
         assoc._reactor_checkpoint.clear()
-        assoc.dimse.send_msg(req, 1)
         with pytest.warns(UserWarning):
+            assoc.dimse.send_msg(req, 1)
             cx_id, rsp = assoc.dimse.get_msg(True)
         assoc._reactor_checkpoint.set()
 
@@ -541,6 +543,170 @@ class TestStorageServiceClass:
 
         scp.shutdown()
 
+    def test_scp_handler_dataset_writer(self, tmp_path):
+        """Test using AE.dataset_writer to store the dataset directly"""
+        attrs = {}
+
+        def handle(event):
+            attrs["dataset_path"] = event.dataset_path
+            attrs["dataset"] = event.dataset
+            return 0x0000
+
+        def factory(file_meta):
+            attrs["file_meta"] = file_meta
+            uid = file_meta.MediaStorageSOPInstanceUID
+            return DatasetWriter(tmp_path / "CT" / f"{uid}.dcm")
+
+        _config.STORE_RECV_CHUNKED_DATASET = True
+
+        handlers = [(evt.EVT_C_STORE, handle)]
+
+        self.ae = ae = AE()
+        ae.maximum_pdu_size = 256
+        ae.dataset_writer = factory
+        ae.add_supported_context(CTImageStorage)
+        ae.add_requested_context(CTImageStorage)
+        scp = ae.start_server(
+            ("localhost", get_port()), block=False, evt_handlers=handlers
+        )
+
+        assoc = ae.associate("localhost", get_port())
+        assert assoc.is_established
+        status = assoc.send_c_store(DATASET)
+        assert status.Status == 0x0000
+        assoc.release()
+        assert assoc.is_released
+
+        scp.shutdown()
+
+        file_meta = attrs["file_meta"]
+        assert file_meta.MediaStorageSOPClassUID == CTImageStorage
+        uid = DATASET.SOPInstanceUID
+        assert file_meta.MediaStorageSOPInstanceUID == uid
+
+        # File is moved to its final location after the handler
+        dataset_path = tmp_path / "CT" / f"{uid}.dcm"
+        assert attrs["dataset_path"].parent == dataset_path.parent
+        assert attrs["dataset_path"] != dataset_path
+        assert list((tmp_path / "CT").iterdir()) == [dataset_path]
+        ds = dcmread(dataset_path)
+        assert ds.PatientName == DATASET.PatientName
+        assert ds.file_meta.TransferSyntaxUID == ImplicitVRLittleEndian
+        assert attrs["dataset"].PatientName == DATASET.PatientName
+
+    @pytest.mark.parametrize("status", [0xC000, "raise"])
+    def test_scp_handler_dataset_writer_failure(self, tmp_path, status):
+        """Test AE.dataset_writer doesn't keep the dataset on failure"""
+        attrs = {}
+
+        def handle(event):
+            attrs["dataset_path"] = event.dataset_path
+            assert event.dataset_path.exists()
+            if status == "raise":
+                raise ValueError("Failed")
+
+            return status
+
+        def factory(file_meta):
+            return DatasetWriter(tmp_path / "CT" / "foo.dcm")
+
+        _config.STORE_RECV_CHUNKED_DATASET = True
+
+        handlers = [(evt.EVT_C_STORE, handle)]
+
+        self.ae = ae = AE()
+        ae.dataset_writer = factory
+        ae.add_supported_context(CTImageStorage)
+        ae.add_requested_context(CTImageStorage)
+        scp = ae.start_server(
+            ("localhost", get_port()), block=False, evt_handlers=handlers
+        )
+
+        assoc = ae.associate("localhost", get_port())
+        assert assoc.is_established
+        rsp = assoc.send_c_store(DATASET)
+        assert rsp.Status == (0xC211 if status == "raise" else status)
+        assoc.release()
+        assert assoc.is_released
+
+        scp.shutdown()
+
+        assert not attrs["dataset_path"].exists()
+        assert list((tmp_path / "CT").iterdir()) == []
+
+    def test_scp_dataset_writer_aborted(self, tmp_path):
+        """Test a partly received dataset is deleted if the association is
+        aborted"""
+        _config.STORE_RECV_CHUNKED_DATASET = True
+
+        self.ae = ae = AE()
+        ae.dataset_writer = lambda file_meta: DatasetWriter(tmp_path / "foo.dcm")
+        ae.add_supported_context(CTImageStorage)
+        ae.add_requested_context(CTImageStorage)
+        scp = ae.start_server(("localhost", get_port()), block=False)
+
+        assoc = ae.associate("localhost", get_port())
+        assert assoc.is_established
+
+        req = C_STORE()
+        req.MessageID = 1
+        req.AffectedSOPClassUID = DATASET.SOPClassUID
+        req.AffectedSOPInstanceUID = DATASET.SOPInstanceUID
+        req.Priority = 2
+        req.DataSet = BytesIO(encode(DATASET, True, True))
+        msg = C_STORE_RQ()
+        msg.primitive_to_message(req)
+
+        # Send everything but the final data set fragment
+        cx_id = assoc.accepted_contexts[0].context_id
+        for pdata in list(msg.encode_msg(cx_id, 256))[:-1]:
+            assoc.dul.send_pdu(pdata)
+
+        timeout = 0
+        while not list(tmp_path.iterdir()) and timeout < 5:
+            time.sleep(0.05)
+            timeout += 0.05
+
+        assert len(list(tmp_path.iterdir())) == 1
+        assoc.abort()
+        assert assoc.is_aborted
+
+        scp.shutdown()
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_scp_handler_dataset_writer_default(self):
+        """Test AE.dataset_writer returning None uses the default"""
+        attrs = {}
+
+        def handle(event):
+            attrs["dataset_path"] = event.dataset_path
+            assert event.dataset_path.exists()
+            return 0x0000
+
+        _config.STORE_RECV_CHUNKED_DATASET = True
+
+        handlers = [(evt.EVT_C_STORE, handle)]
+
+        self.ae = ae = AE()
+        ae.dataset_writer = lambda file_meta: None
+        ae.add_supported_context(CTImageStorage)
+        ae.add_requested_context(CTImageStorage)
+        scp = ae.start_server(
+            ("localhost", get_port()), block=False, evt_handlers=handlers
+        )
+
+        assoc = ae.associate("localhost", get_port())
+        assert assoc.is_established
+        status = assoc.send_c_store(DATASET)
+        assert status.Status == 0x0000
+        assoc.release()
+        assert assoc.is_released
+
+        scp.shutdown()
+
+        assert not attrs["dataset_path"].exists()
+
     def test_scp_handler_dataset_path_windows_unlink(self, monkeypatch):
         """Test handler event's dataset_path property:
         user has file open on Windows"""
@@ -1,11 +1,13 @@
 """Unit tests for the Timer class."""
 
 import logging
+import random
+import threading
 import time
 
 import pytest
 
-from pynetdicom.timer import Timer
+from pynetdicom.timer import Timer, TimerWheel, get_timer_wheel
 from .utils import sleep
 
 LOGGER = logging.getLogger(__name__)
@@ -61,6 +63,15 @@ class TestTimer:
         time.sleep(0.5)
         assert not timer.expired
 
+    def test_running(self):
+        """Test Timer.running."""
+        timer = Timer(0.2)
+        assert not timer.running
+        timer.start()
+        assert timer.running
+        timer.stop()
+        assert not timer.running
+
     def test_restart(self):
         """Test Timer restarts correctly."""
         timer = Timer(0.2)
@@ -124,3 +135,171 @@ class TestTimer:
         assert timer.timeout == 0.1
         assert timer.expired is True
         assert timer.remaining < 0
+
+    def test_callback(self):
+        """Test the callback is called on expiry."""
+        called = threading.Event()
+        timer = Timer(0.05, called.set)
+        start = time.time()
+        timer.start()
+        assert called.wait(5)
+        assert time.time() - start >= 0.05
+        assert timer.expired
+
+    def test_callback_restart(self):
+        """Test the callback isn't called while the timer is restarted."""
+        called = threading.Event()
+        timer = Timer(0.1, called.set)
+        timer.start()
+        start = time.time()
+        while time.time() - start < 0.3:
+            timer.restart()
+            assert not called.is_set()
+            time.sleep(0.01)
+
+        assert called.wait(5)
+
+    def test_callback_once(self):
+        """Test the callback is only called once per start."""
+        called = []
+        timer = Timer(0.02, lambda: called.append(time.time()))
+        timer.start()
+        time.sleep(0.1)
+        # Shorter timeout after expiry doesn't call again
+        timer.timeout = 0.01
+        time.sleep(0.1)
+        assert len(called) == 1
+
+        timer.start()
+        time.sleep(0.1)
+        assert len(called) == 2
+
+    def test_callback_stop(self):
+        """Test the callback isn't called if the timer is stopped."""
+        called = threading.Event()
+        timer = Timer(0.05, called.set)
+        timer.start()
+        timer.stop()
+        assert not called.wait(0.2)
+
+    def test_callback_shorter_timeout(self):
+        """Test the callback is called early enough if the timeout reduced"""
+        called = threading.Event()
+        timer = Timer(10, called.set)
+        timer.start()
+        timer.stop()
+        timer.timeout = 0.05
+        timer.start()
+        assert called.wait(1)
+
+        called.clear()
+        timer.timeout = 10
+        timer.start()
+        timer.timeout = 0.05
+        assert called.wait(1)
+
+    def test_callback_no_timeout(self):
+        """Test the callback isn't called if no timeout"""
+        called = threading.Event()
+        timer = Timer(None, called.set)
+        timer.start()
+        assert timer._check_time is None
+        timer.timeout = 0.05
+        assert called.wait(1)
+
+
+class TestTimerWheel:
+    """Test the TimerWheel class."""
+
+    def test_get_timer_wheel(self):
+        """Test the timer wheel is shared"""
+        wheel = get_timer_wheel()
+        assert isinstance(wheel, TimerWheel)
+        assert wheel is get_timer_wheel()
+
+    def test_schedule(self):
+        """Test scheduling callbacks."""
+        wheel = TimerWheel()
+        called = []
+        done = threading.Event()
+
+        def callback(name):
+            called.append((name, time.monotonic()))
+            if len(called) == 3:
+                done.set()
+
+        start = time.monotonic()
+        wheel.schedule(0.1, lambda: callback("c"))
+        wheel.schedule(0.02, lambda: callback("a"))
+        wheel.schedule(0.05, lambda: callback("b"))
+        assert done.wait(5)
+        assert [name for name, _ in called] == ["a", "b", "c"]
+        for (_, t), delay in zip(called, (0.02, 0.05, 0.1)):
+            assert t - start >= delay
+
+        assert wheel._thread.name == "TimerWheel"
+
+    def test_callback_raises(self, caplog):
+        """Test an exception in a callback doesn't stop the wheel."""
+        wheel = TimerWheel()
+        done = threading.Event()
+
+        def callback():
+            raise ValueError("Bad callback")
+
+        with caplog.at_level(logging.ERROR, logger="pynetdicom"):
+            wheel.schedule(0, callback)
+            wheel.schedule(0.02, done.set)
+            assert done.wait(5)
+            assert "Exception raised by a timer callback" in caplog.text
+            assert "Bad callback" in caplog.text
+
+    def test_advance(self):
+        """Test callbacks are only due on or after their deadline."""
+        wheel = TimerWheel()
+        wheel._tick = 0
+        due = {}
+
+        span = 1 << (wheel._bits * wheel.levels)
+        deadlines = [1, 2, 63, 64, 65, 4095, 4096, 5000, 300000, span + 10]
+        deadlines += [random.randint(1, 2 * span) for _ in range(100)]
+        for deadline in deadlines:
+            wheel._incoming.append((deadline, lambda deadline=deadline: deadline))
+
+        assert wheel._advance(0) == []
+        now = 0
+        while now < 2 * span + 1:
+            now += random.choice([1, 7, 63, 64, 65, 4097, 300000, 2000000])
+            next_tick = wheel._next_tick()
+            for callback in wheel._advance(now):
+                deadline = callback()
+                assert deadline <= now
+                # Not due before the wheel says it needs to be advanced
+                assert next_tick is not None and next_tick <= deadline
+                due[deadline] = due.get(deadline, 0) + 1
+
+            # Nothing due is left in the wheel
+            for level in wheel._wheel:
+                for slot in level:
+                    assert all(deadline > now for deadline, _ in slot)
+
+        assert sorted(due) == sorted(set(deadlines))
+        assert sum(due.values()) == len(deadlines)
+        assert wheel._next_tick() is None
+
+    def test_next_tick(self):
+        """Test the next tick is the earliest across all levels."""
+        wheel = TimerWheel()
+        wheel._tick = 0
+        assert wheel._next_tick() is None
+
+        # Level 1, cascaded at tick 128
+        wheel._incoming.append((130, lambda: None))
+        wheel._advance(0)
+        assert wheel._next_tick() == 128
+        # Level 0
+        wheel._incoming.append((150, lambda: None))
+        wheel._advance(100)
+        assert wheel._next_tick() == 128
+        assert wheel._advance(128) == []
+        assert wheel._next_tick() == 130
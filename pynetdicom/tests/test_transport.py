@@ -2,6 +2,7 @@
 
 from datetime import datetime
 import logging
+import multiprocessing
 import queue
 import os
 import platform
@@ -22,12 +23,14 @@ from pynetdicom import AE, evt, _config, debug_logger
 from pynetdicom.association import Association
 from pynetdicom.events import Event
 from pynetdicom._globals import MODE_REQUESTOR
+from pynetdicom.pdu_items import _FileFragment, _FileSource
 from pynetdicom.pdu_primitives import A_ASSOCIATE
 from pynetdicom import transport
 from pynetdicom.transport import (
     AssociationSocket,
     AssociationServer,
     ThreadedAssociationServer,
+    MultiProcessAssociationServer,
     T_CONNECT,
     AddressInformation,
 )
@@ -332,6 +335,122 @@ class TestAssociationSocket:
         assert sock.ready is False
         assert sock.event_queue.get() == "Evt17"
 
+    def test_recv_into(self):
+        """Test AssociationSocket.recv_into() and recv()."""
+        local, remote = socket.socketpair()
+        sock = AssociationSocket(self.assoc, client_socket=local)
+
+        remote.sendall(b"\x01\x02\x03")
+        threading.Timer(0.1, remote.sendall, args=(b"\x04\x05",)).start()
+        buffer = bytearray(6)
+        assert sock.recv_into(memoryview(buffer)[:4]) == 4
+        assert buffer == b"\x01\x02\x03\x04\x00\x00"
+
+        remote.sendall(b"\x06")
+        remote.close()
+        assert sock.recv(4) == b"\x05\x06"
+        assert sock.recv_into(memoryview(buffer)) == 0
+
+        local.close()
+
+    def test_send_buffers(self):
+        """Test AssociationSocket.send_buffers()."""
+        local, remote = socket.socketpair()
+        sock = AssociationSocket(self.assoc, client_socket=local)
+        assert sock.event_queue.get(block=False) == "Evt5"
+
+        data = []
+        self.assoc.bind(evt.EVT_DATA_SENT, lambda event: data.append(event.data))
+        payload = os.urandom(2**20)
+        buffers = [b"\x04\x00", b"", payload, b"\x01"]
+        thread = threading.Thread(target=sock.send_buffers, args=(buffers,))
+        thread.start()
+
+        received = bytearray()
+        while len(received) < len(payload) + 3:
+            received += remote.recv(65536)
+
+        thread.join()
+        assert received == b"".join(buffers)
+        assert data == [b"".join(buffers)]
+        with pytest.raises(queue.Empty):
+            sock.event_queue.get(block=False)
+
+        remote.close()
+        local.close()
+
+    def test_send_buffers_file(self, tmp_path):
+        """Test AssociationSocket.send_buffers() with a file fragment."""
+        path = tmp_path / "fragment"
+        payload = os.urandom(2**20)
+        path.write_bytes(b"\x00" * 10 + payload)
+
+        local, remote = socket.socketpair()
+        sock = AssociationSocket(self.assoc, client_socket=local)
+        assert sock.event_queue.get(block=False) == "Evt5"
+
+        data = []
+        self.assoc.bind(evt.EVT_DATA_SENT, lambda event: data.append(event.data))
+        source = _FileSource(path)
+        buffers = [
+            b"\x04\x00",
+            _FileFragment(b"\x00", source, 10, 2**19),
+            _FileFragment(b"\x02", source, 10 + 2**19, 2**19),
+            b"\x01",
+        ]
+        thread = threading.Thread(target=sock.send_buffers, args=(buffers,))
+        thread.start()
+
+        received = bytearray()
+        while len(received) < len(payload) + 5:
+            received += remote.recv(65536)
+
+        thread.join()
+        expected = b"\x04\x00\x00" + payload[: 2**19]
+        expected += b"\x02" + payload[2**19 :] + b"\x01"
+        assert received == expected
+        # The file is closed after the last fragment is sent
+        assert source._file is None
+        assert data == [received]
+        with pytest.raises(queue.Empty):
+            sock.event_queue.get(block=False)
+
+        # File shorter than expected
+        buffers = [_FileFragment(b"\x02", _FileSource(path), 2**20, 20)]
+        sock.send_buffers(buffers)
+        assert sock.event_queue.get(block=False) == "Evt17"
+
+        remote.close()
+        local.close()
+
+    def test_send_buffers_partial(self):
+        """Test AssociationSocket.send_buffers() with partial sends."""
+
+        class DummySocket:
+            def __init__(self):
+                self.data = bytearray()
+
+            def sendmsg(self, buffers):
+                # Only send up to 3 bytes at a time
+                nr_sent = min(3, sum(len(b) for b in buffers))
+                self.data += b"".join(buffers)[:nr_sent]
+                return nr_sent
+
+        sock = AssociationSocket(self.assoc, client_socket=DummySocket())
+        sock.send_buffers([b"\x00\x01", b"\x02\x03\x04\x05\x06", b"\x07"])
+        assert sock.socket.data == b"\x00\x01\x02\x03\x04\x05\x06\x07"
+
+    def test_send_buffers_closed(self):
+        """Test AssociationSocket.send_buffers() with a closed socket."""
+        local, remote = socket.socketpair()
+        sock = AssociationSocket(self.assoc, client_socket=local)
+        assert sock.event_queue.get(block=False) == "Evt5"
+        local.close()
+        remote.close()
+
+        sock.send_buffers([b"\x00\x01"])
+        assert sock.event_queue.get(block=False) == "Evt17"
+
     def test_print(self):
         """Test str(AssociationSocket)."""
         sock = AssociationSocket(self.assoc, address=AddressInformation("", 0))
@@ -1049,6 +1168,117 @@ class TestAssociationServer:
         server.shutdown()
 
 
+HAS_REUSEPORT = hasattr(os, "fork") and hasattr(socket, "SO_REUSEPORT")
+
+
+@pytest.mark.skipif(not HAS_REUSEPORT, reason="Requires fork and SO_REUSEPORT")
+class TestMultiProcessAssociationServer:
+    def setup_method(self):
+        self.ae = None
+
+    def teardown_method(self):
+        if self.ae:
+            self.ae.shutdown()
+
+    def test_associations(self):
+        """Test associations are handled by the worker processes."""
+        pids = multiprocessing.get_context("fork").Queue()
+
+        def handle(event, pids):
+            pids.put(os.getpid())
+            return 0x0000
+
+        self.ae = ae = AE()
+        ae.add_supported_context(Verification)
+        ae.add_requested_context(Verification)
+        handlers = [(evt.EVT_C_ECHO, handle, [pids])]
+        server = ae.start_server(
+            ("localhost", 0), block=False, evt_handlers=handlers, processes=2
+        )
+        assert isinstance(server, pynetdicom.transport.MultiProcessAssociationServer)
+        assert server in ae._servers
+        assert server.is_alive()
+        assert len(server._workers) == 2
+        workers = [proc.pid for proc in server._workers]
+
+        port = server.server_address[1]
+        for _ in range(6):
+            assoc = ae.associate("localhost", port)
+            assert assoc.is_established
+            assert assoc.send_c_echo().Status == 0x0000
+            assoc.release()
+            assert assoc.is_released
+
+        results = {pids.get(timeout=5) for _ in range(6)}
+        assert os.getpid() not in results
+        assert results.issubset(workers)
+
+        server.shutdown()
+        assert not server.is_alive()
+        assert server not in ae._servers
+
+        assoc = ae.associate("localhost", port)
+        assert not assoc.is_established
+
+    def test_shutdown_aborts(self):
+        """Test shutting down the server aborts the worker's associations."""
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        ae.add_supported_context(Verification)
+        ae.add_requested_context(Verification)
+        server = ae.start_server(("localhost", 0), block=False, processes=2)
+
+        assoc = ae.associate("localhost", server.server_address[1])
+        assert assoc.is_established
+        ae.shutdown()
+        assert not server.is_alive()
+
+        timeout = 0
+        while not assoc.is_aborted and timeout < 5:
+            time.sleep(0.05)
+            timeout += 0.05
+
+        assert assoc.is_aborted
+
+    def test_bad_processes(self):
+        """Test an invalid number of processes raises an exception."""
+        self.ae = ae = AE()
+        ae.add_supported_context(Verification)
+        msg = r"'processes' must be greater than or equal to 1"
+        with pytest.raises(ValueError, match=msg):
+            ae.make_server(
+                ("localhost", 0),
+                server_class=MultiProcessAssociationServer,
+                processes=0,
+            )
+
+    def test_worker_start_failure(self):
+        """Test a worker failing to start its server raises an exception."""
+        self.ae = ae = AE()
+        ae.add_supported_context(Verification)
+        server = ae.make_server(
+            ("localhost", 0), server_class=MultiProcessAssociationServer, processes=2
+        )
+        server.contexts = [None]
+
+        msg = "Unable to start the association server worker processes"
+        with pytest.raises(RuntimeError, match=msg):
+            server.start()
+
+        assert not server.is_alive()
+
+    def test_no_support(self, monkeypatch):
+        """Test an exception is raised if the platform isn't supported."""
+        monkeypatch.delattr(socket, "SO_REUSEPORT")
+        self.ae = ae = AE()
+        ae.add_supported_context(Verification)
+        msg = "A multi-process association server requires a platform"
+        with pytest.raises(RuntimeError, match=msg):
+            ae.start_server(("localhost", 0), block=False, processes=2)
+
+
 class TestEventHandlingAcceptor:
     """Test the transport events and handling as acceptor."""
 
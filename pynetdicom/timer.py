@@ -2,13 +2,230 @@
 A generic timer class suitable for use as the DICOM UL's ARTIM timer.
 """
 
+from collections import deque
 import logging
+import math
+import os
+import threading
 import time
+from typing import Callable, cast
+import weakref
 
 
 LOGGER = logging.getLogger(__name__)
 
 
+class TimerWheel:
+    """A hierarchical timer wheel for running callbacks after a delay.
+
+    .. versionadded:: 3.1
+
+    Callbacks are run in the wheel's own thread, which only wakes when the
+    earliest scheduled callback is due, so they should return quickly. A
+    single wheel is shared by all :class:`Timer` instances with a `callback`,
+    see :func:`get_timer_wheel`.
+
+    Scheduled callbacks are kept in :attr:`~TimerWheel.levels` levels of
+    :attr:`~TimerWheel.slots` slots, with each slot in the first level
+    covering :attr:`~TimerWheel.resolution` seconds and each slot in the
+    following levels covering the entire span of the level below it. As time
+    passes the callbacks in the higher levels are moved down until they're
+    due, so scheduling a callback is O(1) regardless of how many there are.
+    Callbacks due further in the future than the span of the wheel are
+    rescheduled when they reach the end of the last level.
+
+    Callbacks may be scheduled from any thread without waiting for the wheel,
+    and are run no earlier than their delay and at most
+    :attr:`~TimerWheel.resolution` seconds late (while the wheel's thread
+    isn't busy).
+    """
+
+    # The number of bits used for the slots in each level
+    _bits = 6
+    levels = 4
+    slots = 1 << _bits
+
+    def __init__(self, resolution: float = 0.01) -> None:
+        """Create a new :class:`TimerWheel`.
+
+        Parameters
+        ----------
+        resolution : float, optional
+            The time covered by each slot in the first level of the wheel, in
+            seconds (default ``0.01``).
+        """
+        self.resolution = resolution
+
+        # [level][slot] -> [(deadline tick, callback), ...]
+        self._wheel: list[list[list[tuple[int, Callable[[], None]]]]] = [
+            [[] for _ in range(self.slots)] for _ in range(self.levels)
+        ]
+        # The last tick processed by the wheel
+        self._tick = self._now()
+        # Callbacks scheduled by other threads, waiting to be added to the
+        #   wheel by the wheel's thread
+        self._incoming: deque[tuple[int, Callable[[], None]]] = deque()
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def _add(self, deadline: int, callback: Callable[[], None]) -> None:
+        """Add `callback` to the slot corresponding to its `deadline` tick,
+        or return it if already due.
+        """
+        now = self._tick
+        if deadline <= now:
+            self._due.append(callback)
+            return
+
+        bits = self._bits
+        for level in range(self.levels):
+            shift = bits * level
+            if (deadline >> shift) - (now >> shift) < self.slots:
+                idx = (deadline >> shift) & (self.slots - 1)
+                self._wheel[level][idx].append((deadline, callback))
+                return
+
+        # Too far in the future, add to the end of the last level and it'll
+        #   be rescheduled when reached
+        shift = bits * (self.levels - 1)
+        idx = ((now >> shift) + self.slots - 1) & (self.slots - 1)
+        self._wheel[-1][idx].append((deadline, callback))
+
+    def _advance(self, now: int) -> list[Callable[[], None]]:
+        """Move the wheel forward to tick `now` and return the callbacks that
+        are due.
+        """
+        self._due: list[Callable[[], None]] = []
+        last, self._tick = self._tick, now
+
+        while self._incoming:
+            self._add(*self._incoming.popleft())
+
+        expired = []
+        mask = self.slots - 1
+        for level in range(self.levels):
+            shift = self._bits * level
+            start, end = last >> shift, now >> shift
+            if start == end:
+                # Higher levels can only have changed if this level has
+                break
+
+            for block in range(start + 1, min(end, start + self.slots) + 1):
+                slot = self._wheel[level][block & mask]
+                if slot:
+                    expired.extend(slot)
+                    slot.clear()
+
+        # Due callbacks are returned, the rest moved to a lower level
+        for deadline, callback in expired:
+            self._add(deadline, callback)
+
+        return self._due
+
+    def _next_tick(self) -> int | None:
+        """Return the tick the wheel next needs to be advanced at, or ``None``
+        if there are no scheduled callbacks.
+        """
+        now = self._tick
+        mask = self.slots - 1
+        ticks = []
+        for level in range(self.levels):
+            shift = self._bits * level
+            block = now >> shift
+            slots = self._wheel[level]
+            for offset in range(1, self.slots + 1):
+                if slots[(block + offset) & mask]:
+                    ticks.append((block + offset) << shift)
+                    break
+
+        return min(ticks, default=None)
+
+    def _now(self) -> int:
+        """Return the current tick."""
+        return int(time.monotonic() / self.resolution)
+
+    def _run(self) -> None:
+        """Run the wheel, called in the wheel's thread."""
+        while True:
+            for callback in self._advance(self._now()):
+                try:
+                    callback()
+                except Exception as exc:
+                    LOGGER.error("Exception raised by a timer callback")
+                    LOGGER.exception(exc)
+
+            self._wake.clear()
+            if self._incoming:
+                continue
+
+            timeout = None
+            tick = self._next_tick()
+            if tick is not None:
+                timeout = max(tick * self.resolution - time.monotonic(), 0)
+
+            self._wake.wait(timeout)
+
+    def schedule(self, delay: float, callback: Callable[[], None]) -> None:
+        """Run `callback` after `delay` seconds.
+
+        Parameters
+        ----------
+        delay : float
+            The minimum number of seconds to wait before running `callback`.
+        callback : Callable[[], None]
+            The callable to run in the wheel's thread, takes no parameters.
+        """
+        # Round up so we never run early
+        deadline = math.ceil((time.monotonic() + max(delay, 0)) / self.resolution)
+        self._incoming.append((deadline, callback))
+        if self._thread is None:
+            self._start()
+
+        self._wake.set()
+
+    def _start(self) -> None:
+        """Start the wheel's thread if it's not already running."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="TimerWheel")
+                self._thread.daemon = True
+                self._thread.start()
+
+
+_TIMER_WHEEL: TimerWheel | None = None
+_TIMER_WHEEL_LOCK = threading.Lock()
+
+
+def get_timer_wheel() -> TimerWheel:
+    """Return the :class:`TimerWheel` shared by all :class:`Timer` instances.
+
+    .. versionadded:: 3.1
+    """
+    global _TIMER_WHEEL
+
+    if _TIMER_WHEEL is None:
+        with _TIMER_WHEEL_LOCK:
+            if _TIMER_WHEEL is None:
+                _TIMER_WHEEL = TimerWheel()
+
+    return _TIMER_WHEEL
+
+
+def _reset_timer_wheel() -> None:
+    """Discard the shared timer wheel in a forked child process, as the thread
+    running it doesn't exist in the child.
+    """
+    global _TIMER_WHEEL, _TIMER_WHEEL_LOCK
+
+    _TIMER_WHEEL = None
+    _TIMER_WHEEL_LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_timer_wheel)
+
+
 class Timer:
     """A generic timer.
 
@@ -40,7 +257,9 @@ class Timer:
       :dcm:`Section 9.1.5<part08/chapter_9.html#sect_9.1.5>`.
     """
 
-    def __init__(self, timeout: float | None) -> None:
+    def __init__(
+        self, timeout: float | None, callback: Callable[[], None] | None = None
+    ) -> None:
         """Create a new :class:`Timer`.
 
         Parameters
@@ -48,10 +267,67 @@ class Timer:
         timeout : numeric or None
             The number of seconds before the timer expires. A value of ``None``
             means the timer never expires.
+        callback : Callable[[], None] | None, optional
+            If used then a callable that takes no parameters which will be
+            called from the shared :class:`TimerWheel` thread when the timer
+            expires while running. The callback is called at most once per
+            start of the timer and only after :attr:`~Timer.expired` returns
+            ``True``, which remains the definitive check for expiry.
+
+            .. versionadded:: 3.1
         """
         self._start_time: float | None = None
         self._end_time: float | None = None
         self._timeout = timeout
+        self._callback = callback
+        # When the timer wheel's scheduled check of the timer is due
+        self._check_time: float | None = None
+        # The start time of the timer when the callback was last called
+        self._called: float | None = None
+        self._lock = threading.Lock()
+
+    def _check(self) -> None:
+        """Call the callback if expired or reschedule the check if
+        restarted, called from the timer wheel's thread.
+        """
+        with self._lock:
+            self._check_time = None
+            if not self.running or self.timeout is None:
+                return
+
+            # Already called for this start of the timer
+            if self._called == self._start_time:
+                return
+
+            if self.remaining > 0:
+                # Restarted since the check was scheduled
+                self._schedule()
+                return
+
+            self._called = self._start_time
+
+        cast(Callable[[], None], self._callback)()
+
+    def _schedule(self) -> None:
+        """Schedule a check for expiry with the timer wheel, if there's not
+        already one scheduled for on or before the timer's expiry.
+        """
+        if not self.running or self.timeout is None:
+            return
+
+        deadline = cast(float, self._start_time) + self.timeout
+        if self._check_time is not None and self._check_time <= deadline:
+            return
+
+        self._check_time = deadline
+        ref = weakref.ref(self)
+
+        def check() -> None:
+            timer = ref()
+            if timer is not None:
+                timer._check()
+
+        get_timer_wheel().schedule(deadline - time.time(), check)
 
     @property
     def expired(self) -> bool:
@@ -97,6 +373,14 @@ class Timer:
         # Time has been start and been stopped
         return self.timeout - (self._end_time - self._start_time)
 
+    @property
+    def running(self) -> bool:
+        """Return ``True`` if the timer has been started and not stopped.
+
+        .. versionadded:: 3.1
+        """
+        return self._start_time is not None and self._end_time is None
+
     def restart(self) -> None:
         """Restart the timer."""
         self.start()
@@ -106,6 +390,14 @@ class Timer:
         self._start_time = time.time()
         self._end_time = None
 
+        # Restarting a timer usually doesn't need the timer wheel, as the
+        #   already scheduled check will reschedule itself
+        if self._callback and self.timeout is not None:
+            check_time = self._check_time
+            if check_time is None or self._start_time + self.timeout < check_time:
+                with self._lock:
+                    self._schedule()
+
     def stop(self) -> None:
         """Stops the timer and resets it."""
         self._end_time = time.time()
@@ -126,3 +418,8 @@ class Timer:
             means the timer never expires.
         """
         self._timeout = value
+
+        if self._callback:
+            # May now expire earlier than the scheduled check
+            with self._lock:
+                self._schedule()
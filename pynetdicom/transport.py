@@ -1,9 +1,12 @@
 """Implementation of the Transport Service."""
 
+import asyncio
 from copy import deepcopy
 from datetime import datetime
 import gc
 import logging
+import multiprocessing
+import os
 import queue
 import select
 import socket
@@ -29,8 +32,10 @@ from pynetdicom._handlers import (
     standard_pdu_recv_handler,
     standard_pdu_sent_handler,
 )
+from pynetdicom.pdu_items import _FileFragment
 from pynetdicom.pdu_primitives import A_ASSOCIATE
 from pynetdicom.presentation import PresentationContext
+from pynetdicom.utils import make_target
 
 if TYPE_CHECKING:  # pragma: no cover
     from socketserver import BaseServer
@@ -38,10 +43,68 @@ if TYPE_CHECKING:  # pragma: no cover
     from pynetdicom.ae import ApplicationEntity
     from pynetdicom.association import Association
     from pynetdicom.dul import _QueueType
+    from pynetdicom.pdu import _BufferType
 
 
 LOGGER = logging.getLogger(__name__)
 
+_HAS_SENDMSG = hasattr(socket.socket, "sendmsg")
+# The maximum number of buffers passed to a single sendmsg() call, kept well
+#   below the usual IOV_MAX of 1024
+_MAX_IOV = 512
+
+# The event loop shared by associations using the asyncio upper layer
+_EVENT_LOOP: asyncio.AbstractEventLoop | None = None
+_EVENT_LOOP_THREAD: threading.Thread | None = None
+_EVENT_LOOP_LOCK = threading.Lock()
+
+
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """Return the event loop shared by associations using the asyncio upper
+    layer, starting it in a new thread if required.
+    """
+    global _EVENT_LOOP, _EVENT_LOOP_THREAD
+
+    with _EVENT_LOOP_LOCK:
+        if _EVENT_LOOP is None or _EVENT_LOOP.is_closed():
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=make_target(loop.run_forever), name="AsyncioReactor"
+            )
+            thread.daemon = True
+            thread.start()
+            _EVENT_LOOP, _EVENT_LOOP_THREAD = loop, thread
+
+    return _EVENT_LOOP
+
+
+def _in_event_loop() -> bool:
+    """Return ``True`` if called from the shared event loop's thread."""
+    return threading.current_thread() is _EVENT_LOOP_THREAD
+
+
+def _reset_event_loop() -> None:
+    """Discard the shared event loop in a forked child process, as the thread
+    running it doesn't exist in the child.
+    """
+    global _EVENT_LOOP, _EVENT_LOOP_THREAD, _EVENT_LOOP_LOCK
+
+    _EVENT_LOOP, _EVENT_LOOP_THREAD = None, None
+    _EVENT_LOOP_LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_event_loop)
+
+
+def _close_sent_files(buffers: "list[_BufferType]") -> None:
+    """Close the file used by each message whose last fragment is in
+    `buffers`.
+    """
+    for buffer in buffers:
+        if isinstance(buffer, _FileFragment) and buffer.is_last:
+            buffer.source.close()
+
 
 class AddressInformation:
     """IPv4 or IPv6 address information.
@@ -420,39 +483,62 @@ class AssociationSocket:
             # Clear ae connection timeout
             self.socket.settimeout(None)
 
-            # Update the Association.requestor's host and port with the actual values
-            conn_info = self.socket.getsockname()
-            self.assoc.requestor.address_info = AddressInformation.from_tuple(conn_info)
-
-            # Trigger event - connection open
-            self._is_connected = True
-            evt.trigger(
-                self.assoc,
-                evt.EVT_CONN_OPEN,
-                {"address": primitive.address_info.as_tuple},
-            )
-            # Evt2: Transport connection confirmation
-            primitive.result = "Evt2"
-            self.provider_queue.put(primitive)
+            self._connection_confirmed(primitive)
         except OSError as exc:
-            # Log connection failure
-            LOGGER.error("Association request failed: unable to connect to remote")
-            LOGGER.error(f"TCP Initialisation Error: {exc}")
-            # Log exception if TLS issue to help with troubleshooting
-            if _HAS_SSL and isinstance(exc, ssl.SSLError):
-                LOGGER.exception(exc)
-
-            # Don't be tempted to replace this with a self.close() call -
-            #   it doesn't work because `_is_connected` is False
-            if self.socket:
-                self._shutdown_socket()
-                self.socket = None
-
-            primitive.result = "Evt17"
-            self.provider_queue.put(primitive)
+            self._connection_failed(primitive, exc)
         finally:
             self._ready.set()
 
+    def _connection_confirmed(self, primitive: T_CONNECT) -> None:
+        """Update the association after successfully connecting to the peer.
+
+        Parameters
+        ----------
+        primitive : pynetdicom.transport.T_CONNECT
+            The TRANSPORT CONNECT primitive used when connecting to the peer.
+        """
+        sock = cast(socket.socket, self.socket)
+        # Update the Association.requestor's host and port with the actual values
+        conn_info = sock.getsockname()
+        self.assoc.requestor.address_info = AddressInformation.from_tuple(conn_info)
+
+        # Trigger event - connection open
+        self._is_connected = True
+        evt.trigger(
+            self.assoc,
+            evt.EVT_CONN_OPEN,
+            {"address": primitive.address_info.as_tuple},
+        )
+        # Evt2: Transport connection confirmation
+        primitive.result = "Evt2"
+        self.provider_queue.put(primitive)
+
+    def _connection_failed(self, primitive: T_CONNECT, exc: OSError) -> None:
+        """Update the association after failing to connect to the peer.
+
+        Parameters
+        ----------
+        primitive : pynetdicom.transport.T_CONNECT
+            The TRANSPORT CONNECT primitive used when connecting to the peer.
+        exc : OSError
+            The exception raised while trying to connect.
+        """
+        # Log connection failure
+        LOGGER.error("Association request failed: unable to connect to remote")
+        LOGGER.error(f"TCP Initialisation Error: {exc}")
+        # Log exception if TLS issue to help with troubleshooting
+        if _HAS_SSL and isinstance(exc, ssl.SSLError):
+            LOGGER.exception(exc)
+
+        # Don't be tempted to replace this with a self.close() call -
+        #   it doesn't work because `_is_connected` is False
+        if self.socket:
+            self._shutdown_socket()
+            self.socket = None
+
+        primitive.result = "Evt17"
+        self.provider_queue.put(primitive)
+
     def _create_socket(self, address: AddressInformation) -> socket.socket:
         """Create a new IPv4 or IPv6 TCP socket and set it up for use.
 
@@ -584,32 +670,53 @@ class AssociationSocket:
         bytearray
             The data read from the socket.
         """
+        bytestream = bytearray(nr_bytes)
+        nr_read = self.recv_into(memoryview(bytestream))
+        if nr_read < nr_bytes:
+            del bytestream[nr_read:]
+
+        return bytestream
+
+    def recv_into(self, buffer: memoryview) -> int:
+        """Read from the socket until `buffer` has been filled.
+
+        .. versionadded:: 3.1
+
+        *Events Emitted*
+
+        - None
+
+        Parameters
+        ----------
+        buffer : memoryview
+            A writeable buffer to read the data into, the number of bytes
+            to attempt to read is the length of the buffer.
+
+        Returns
+        -------
+        int
+            The number of bytes read, which will only be less than the length
+            of `buffer` if the connection was closed by the peer.
+        """
         self.socket = cast(socket.socket, self.socket)
-        bytestream = bytearray()
+        nr_bytes = len(buffer)
         nr_read = 0
-        # socket.recv() returns when the network buffer has been emptied
+        # socket.recv_into() returns when the network buffer has been emptied
         #   not necessarily when the number of bytes requested have been
-        #   read. Its up to us to keep calling recv() until we have all the
-        #   data we want
+        #   read. Its up to us to keep calling recv_into() until we have all
+        #   the data we want
         # **BLOCKING** until either all the data is read or an error occurs
         while nr_read < nr_bytes:
-            # Python docs recommend reading a relatively small power of 2
-            #   such as 4096
-            bufsize = 4096
-            if (nr_bytes - nr_read) < bufsize:
-                bufsize = nr_bytes - nr_read
-
-            bytes_read = self.socket.recv(bufsize)
+            nr_recv = self.socket.recv_into(buffer[nr_read:])
 
-            # If socket.recv() reads 0 bytes then the connection has been
+            # If socket.recv_into() reads 0 bytes then the connection has been
             #   broken, so return what we have so far
-            if not bytes_read:
-                return bytestream
+            if not nr_recv:
+                break
 
-            bytestream.extend(bytes_read)
-            nr_read += len(bytes_read)
+            nr_read += nr_recv
 
-        return bytestream
+        return nr_read
 
     def send(self, bytestream: bytes) -> None:
         """Try and send the data in `bytestream` to the remote.
@@ -628,16 +735,108 @@ class AssociationSocket:
         total_sent = 0
         length_data = len(bytestream)
         try:
-            while total_sent < length_data:
-                # Returns the number of bytes sent
-                nr_sent = self.socket.send(bytestream[total_sent:])
-                total_sent += nr_sent
+            # Use a view so partial sends don't copy the remaining data
+            with memoryview(bytestream) as view:
+                while total_sent < length_data:
+                    # Returns the number of bytes sent
+                    nr_sent = self.socket.send(view[total_sent:])
+                    total_sent += nr_sent
 
             evt.trigger(self.assoc, evt.EVT_DATA_SENT, {"data": bytestream})
         except Exception:
             # Evt17: Transport connection closed
             self.event_queue.put("Evt17")
 
+    def send_buffers(self, buffers: "list[_BufferType]") -> None:
+        """Try and send the data in `buffers` to the remote.
+
+        .. versionadded:: 3.1
+
+        Where supported the buffers are sent using scatter/gather I/O with
+        :meth:`socket.sendmsg()<socket.socket.sendmsg>`, otherwise they're
+        joined and sent together. Data set fragments that are sent from a file
+        are sent with :meth:`socket.sendfile()<socket.socket.sendfile>`.
+
+        *Events Emitted*
+
+        - None
+        - Evt17: Transport connected closed.
+
+        Parameters
+        ----------
+        buffers : list[bytes | pdu_items._FileFragment]
+            The data to send to the remote, in order.
+        """
+        self.socket = cast(socket.socket, self.socket)
+        try:
+            views: list[memoryview] = []
+            for buffer in buffers:
+                if isinstance(buffer, _FileFragment):
+                    # Send the message control header with any preceding data
+                    #   then the rest of the fragment directly from the file
+                    views.append(memoryview(buffer.header))
+                    self._send_views(views)
+                    views = []
+                    self._send_file(buffer)
+                elif buffer:
+                    views.append(memoryview(buffer))
+
+            self._send_views(views)
+
+            # Only join the data if there's a handler to receive it
+            if self.assoc.get_handlers(evt.EVT_DATA_SENT):
+                data = b"".join(bytes(b) for b in buffers)
+                evt.trigger(self.assoc, evt.EVT_DATA_SENT, {"data": data})
+        except Exception:
+            # Evt17: Transport connection closed
+            self.event_queue.put("Evt17")
+        finally:
+            _close_sent_files(buffers)
+
+    def _send_file(self, fragment: _FileFragment) -> None:
+        """Send the data set fragment from the file in `fragment`.
+
+        Parameters
+        ----------
+        fragment : pdu_items._FileFragment
+            The fragment to send, excluding the message control header.
+        """
+        sock = cast(socket.socket, self.socket)
+        nr_sent = fragment.source.sendfile(sock, fragment.offset, fragment.length)
+        if nr_sent != fragment.length:
+            raise EOFError(
+                f"Only {nr_sent} of {fragment.length} bytes were sent from the "
+                f"file at '{fragment.source.path}'"
+            )
+
+    def _send_views(self, views: list[memoryview]) -> None:
+        """Send the data in `views`, in order.
+
+        Parameters
+        ----------
+        views : list[memoryview]
+            The data to send.
+        """
+        sock = cast(socket.socket, self.socket)
+        if not _HAS_SENDMSG or (_HAS_SSL and isinstance(sock, ssl.SSLSocket)):
+            if views:
+                sock.sendall(b"".join(views))
+
+            return
+
+        idx = 0
+        while idx < len(views):
+            # Returns the number of bytes sent
+            nr_sent = sock.sendmsg(views[idx : idx + _MAX_IOV])
+
+            # Skip past the buffers that have been completely sent
+            while idx < len(views) and nr_sent >= len(views[idx]):
+                nr_sent -= len(views[idx])
+                idx += 1
+
+            if nr_sent:
+                views[idx] = views[idx][nr_sent:]
+
     def _shutdown_socket(self) -> None:
         """Try to shutdown and close the socket."""
         sock = cast(socket.socket, self.socket)
@@ -680,6 +879,289 @@ class AssociationSocket:
         self._tls_args = tls_args
 
 
+class _DULProtocol(asyncio.Protocol):
+    """Buffers the data received by an :class:`AsyncioAssociationSocket`."""
+
+    def __init__(self, sock: "AsyncioAssociationSocket") -> None:
+        self._sock = sock
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self._sock._transport = cast(asyncio.Transport, transport)
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self._sock._eof = True
+        self._sock._notify()
+
+    def data_received(self, data: bytes) -> None:
+        self._sock._recv_buffer.extend(data)
+        self._sock._notify()
+
+    def eof_received(self) -> bool:
+        self._sock._eof = True
+        self._sock._notify()
+        # Close the transport
+        return False
+
+    def pause_writing(self) -> None:
+        self._sock._write_paused = True
+
+    def resume_writing(self) -> None:
+        self._sock._write_paused = False
+        self._sock._notify()
+
+
+class AsyncioAssociationSocket(AssociationSocket):
+    """An :class:`AssociationSocket` that uses :mod:`asyncio` for I/O.
+
+    .. versionadded:: 3.1
+
+    Used by the :class:`~pynetdicom.dul.AsyncioDULServiceProvider`, the wrapped
+    socket is handed over to an :class:`asyncio.Transport` on the shared event
+    loop once connected. Incoming data is buffered as it arrives and
+    :meth:`recv` never blocks, while :meth:`send` queues the data for writing.
+    """
+
+    def __init__(
+        self,
+        assoc: "Association",
+        client_socket: socket.socket | None = None,
+        address: AddressInformation | None = None,
+    ) -> None:
+        """Create a new :class:`AsyncioAssociationSocket`.
+
+        Parameters
+        ----------
+        assoc : association.Association
+            The :class:`~pynetdicom.association.Association` instance that will
+            be using the socket to communicate.
+        client_socket : socket.socket, optional
+            Required if `address` is ``None``, the ``socket.socket`` to wrap.
+        address : pynetdicom.transport.AddressInformation, optional
+            Required if `client_socket` is ``None`` then create a new socket and
+            bind it to this address.
+        """
+        self._transport: asyncio.Transport | None = None
+        self._recv_buffer = bytearray()
+        self._eof = False
+        self._write_paused = False
+        self._read_paused = False
+
+        super().__init__(assoc, client_socket, address)
+
+    def _call(self, func: Callable[..., Any], *args: Any) -> None:
+        """Call `func` in the event loop's thread."""
+        if _in_event_loop():
+            func(*args)
+        else:
+            _get_event_loop().call_soon_threadsafe(func, *args)
+
+    def connect(self, primitive: T_CONNECT) -> None:
+        """Start connecting to the remote using connection details from
+        `primitive`.
+
+        Returns immediately, the result of the connection attempt is added
+        to the provider queue once known.
+
+        Parameters
+        ----------
+        primitive : pynetdicom.transport.T_CONNECT
+            The TRANSPORT CONNECT primitive to use when connecting to a peer.
+        """
+        if self.socket is None:
+            raise ValueError(
+                "A socket must be created before calling AssociationSocket.connect()"
+            )
+
+        _get_event_loop().create_task(self._connect(primitive))
+
+    async def _connect(self, primitive: T_CONNECT) -> None:
+        """Connect to the remote and start the transport."""
+        sock = cast(socket.socket, self.socket)
+        loop = asyncio.get_running_loop()
+
+        context, server_hostname = self.tls_args or (None, None)
+
+        async def _open() -> None:
+            await loop.sock_connect(sock, primitive.address_info.as_tuple)
+            await loop.create_connection(
+                lambda: _DULProtocol(self),
+                sock=sock,
+                ssl=context,
+                server_hostname=server_hostname if context else None,
+            )
+
+        try:
+            sock.setblocking(False)
+            await asyncio.wait_for(_open(), self.assoc.connection_timeout)
+            self._connection_confirmed(primitive)
+        except asyncio.TimeoutError:
+            self._connection_failed(primitive, TimeoutError("timed out"))
+        except OSError as exc:
+            self._connection_failed(primitive, exc)
+        finally:
+            self._ready.set()
+
+    def _notify(self) -> None:
+        """Let the DUL know the transport needs attention."""
+        self.assoc.dul._wakeup()
+
+    def _pause_reading(self, paused: bool) -> None:
+        """Pause or resume reading from the transport."""
+        transport = self._transport
+        if transport is None or paused == self._read_paused:
+            return
+
+        self._read_paused = paused
+        if paused:
+            self._call(transport.pause_reading)
+        else:
+            self._call(transport.resume_reading)
+
+    @property
+    def ready(self) -> bool:
+        """Return ``True`` if there is a PDU available to be read.
+
+        Returns
+        -------
+        bool
+            ``True`` if a complete PDU (or PDU with an unknown type) has
+            been received or the connection has been closed by the peer,
+            ``False`` otherwise.
+        """
+        if self.socket is None or self._is_connected is False:
+            return False
+
+        buffer = self._recv_buffer
+        if len(buffer) < 6:
+            return self._eof
+
+        # Unrecognised PDUs are handled without reading the rest of the PDU
+        if not 0x01 <= buffer[0] <= 0x07 or self._eof:
+            return True
+
+        return len(buffer) >= 6 + int.from_bytes(buffer[2:6], "big")
+
+    def recv_into(self, buffer: memoryview) -> int:
+        """Copy the received data into `buffer`.
+
+        Parameters
+        ----------
+        buffer : memoryview
+            A writeable buffer to copy the data into.
+
+        Returns
+        -------
+        int
+            The number of bytes copied, which will only be less than the length
+            of `buffer` if the connection has been closed.
+        """
+        nr_bytes = min(len(buffer), len(self._recv_buffer))
+        with memoryview(self._recv_buffer) as view:
+            buffer[:nr_bytes] = view[:nr_bytes]
+
+        del self._recv_buffer[:nr_bytes]
+
+        return nr_bytes
+
+    def send(self, bytestream: bytes) -> None:
+        """Queue the data in `bytestream` to be sent to the remote.
+
+        *Events Emitted*
+
+        - None
+        - Evt17: Transport connected closed.
+
+        Parameters
+        ----------
+        bytestream : bytes
+            The data to send to the remote.
+        """
+        transport = self._transport
+        if transport is None or transport.is_closing():
+            # Evt17: Transport connection closed
+            self.event_queue.put("Evt17")
+            return
+
+        self._call(transport.write, bytestream)
+        evt.trigger(self.assoc, evt.EVT_DATA_SENT, {"data": bytestream})
+
+    def send_buffers(self, buffers: "list[_BufferType]") -> None:
+        """Queue the data in `buffers` to be sent to the remote.
+
+        Data set fragments that are sent from a file are read into memory
+        before being queued.
+
+        *Events Emitted*
+
+        - None
+        - Evt17: Transport connected closed.
+
+        Parameters
+        ----------
+        buffers : list[bytes | pdu_items._FileFragment]
+            The data to send to the remote, in order.
+        """
+        transport = self._transport
+        if transport is None or transport.is_closing():
+            # Evt17: Transport connection closed
+            self.event_queue.put("Evt17")
+            return
+
+        try:
+            data = [bytes(b) for b in buffers]
+        except OSError:
+            # Evt17: Transport connection closed
+            self.event_queue.put("Evt17")
+            return
+        finally:
+            _close_sent_files(buffers)
+
+        self._call(transport.writelines, data)
+        if self.assoc.get_handlers(evt.EVT_DATA_SENT):
+            evt.trigger(self.assoc, evt.EVT_DATA_SENT, {"data": b"".join(data)})
+
+    def _shutdown_socket(self) -> None:
+        """Close the transport, or the socket if no transport is running."""
+        if self._transport is not None:
+            self._call(self._transport.close)
+            return
+
+        super()._shutdown_socket()
+
+    def _start_transport(self) -> None:
+        """Start the transport for an already connected client socket."""
+        if not self._is_connected or self._transport is not None or not self.socket:
+            return
+
+        _get_event_loop().create_task(self._start_client_transport())
+
+    async def _start_client_transport(self) -> None:
+        """Start the transport for an accepted client socket."""
+        server = self.assoc._server
+        try:
+            await asyncio.get_running_loop().connect_accepted_socket(
+                lambda: _DULProtocol(self),
+                cast(socket.socket, self.socket),
+                ssl=server.ssl_context if server else None,
+            )
+        except (OSError, ValueError) as exc:
+            LOGGER.error("Unable to start the transport for the connection")
+            LOGGER.exception(exc)
+            self._eof = True
+            self._notify()
+
+    def _stop_transport(self) -> None:
+        """Close the transport and release the socket."""
+        if self._transport is not None and not self._transport.is_closing():
+            self._transport.close()
+
+        if self._transport is not None:
+            # The socket belongs to the transport and must not be closed
+            #   by anything else
+            self.socket = None
+            self._is_connected = False
+
+
 class RequestHandler(BaseRequestHandler):
     """Connection request handler for the ``AssociationServer``.
 
@@ -753,7 +1235,7 @@ class RequestHandler(BaseRequestHandler):
         timestamp = datetime.strftime(datetime.now(), "%Y%m%d%H%M%S")
         assoc.name = f"AcceptorThread@{timestamp}"
 
-        sock = AssociationSocket(assoc, client_socket=self.request)
+        sock = assoc.dul._socket_class(assoc, client_socket=self.request)
         assoc.set_socket(sock)
 
         # Association Acceptor object -> local AE
@@ -808,6 +1290,9 @@ class AssociationServer(TCPServer):
         scope_id: int)`` that the server is running on.
     """
 
+    # If ``True`` then set ``SO_REUSEPORT`` when binding the socket
+    allow_reuse_port = False
+
     def __init__(
         self,
         ae: "ApplicationEntity",
@@ -965,7 +1450,8 @@ class AssociationServer(TCPServer):
         """
         self.socket = cast(socket.socket, self.socket)
         client_socket, address = self.socket.accept()
-        if self.ssl_context:
+        # The asyncio upper layer performs the TLS handshake itself
+        if self.ssl_context and not _config.USE_ASYNCIO_DUL:
             client_socket = self.ssl_context.wrap_socket(
                 client_socket, server_side=True
             )
@@ -985,6 +1471,8 @@ class AssociationServer(TCPServer):
         """Bind the socket and set the socket options.
 
         - ``socket.SO_REUSEADDR`` is set to ``1``
+        - ``socket.SO_REUSEPORT`` is set to ``1`` if ``allow_reuse_port`` is
+          ``True``
         - socket.settimeout is used to set to
           :attr:`AE.network_timeout
           <pynetdicom.ae.ApplicationEntity.network_timeout>` unless the
@@ -995,6 +1483,11 @@ class AssociationServer(TCPServer):
         #   waiting for its natural timeout to expire
         #   Allows local address reuse
         self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        # SO_REUSEPORT: allow multiple listening sockets on the same port,
+        #   with incoming connections distributed between them
+        if self.allow_reuse_port and hasattr(socket, "SO_REUSEPORT"):
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+
         # If no timeout is set then recv() will block forever if
         #   the connection is kept alive with no data sent
         if self.ae.network_timeout is not None:
@@ -1087,3 +1580,232 @@ class ThreadedAssociationServer(ThreadingMixIn, AssociationServer):
         except Exception:
             self.handle_error(request, client_address)
             self.shutdown_request(request)
+
+
+class _WorkerAssociationServer(ThreadedAssociationServer):
+    """A :class:`ThreadedAssociationServer` run by a worker process of a
+    :class:`MultiProcessAssociationServer`.
+    """
+
+    allow_reuse_port = True
+
+
+class MultiProcessAssociationServer:
+    """An association server that runs in multiple worker processes.
+
+    Each worker is forked from the current process and runs its own
+    :class:`ThreadedAssociationServer`. All the workers listen on the same port
+    using ``SO_REUSEPORT``, with the operating system distributing incoming
+    connections between them. As the workers are separate processes, each has
+    its own copy of the bound event handlers, and any state the handlers modify
+    isn't shared with the parent process or the other workers.
+
+    .. versionadded:: 3.1
+
+    Attributes
+    ----------
+    ae : ae.ApplicationEntity
+        The parent AE that is running the server.
+    processes : int
+        The number of worker processes.
+    server_address : tuple[str, int] | tuple[str, int, int, int]
+        The ``(host: str, port: int)`` or ``(host: str, port: int, flowinfo: int,
+        scope_id: int)`` that the server is running on.
+    """
+
+    def __init__(
+        self,
+        ae: "ApplicationEntity",
+        address: tuple[str, int] | tuple[str, int, int, int],
+        ae_title: str,
+        contexts: list[PresentationContext],
+        ssl_context: "ssl.SSLContext | None" = None,
+        evt_handlers: list[evt.EventHandlerType] | None = None,
+        processes: int = 2,
+    ) -> None:
+        """Create a new :class:`MultiProcessAssociationServer` and reserve the
+        listening address.
+
+        Parameters
+        ----------
+        ae : ae.ApplicationEntity
+            The parent AE that's running the server.
+        address : tuple[str, int] | tuple[str, int, int, int]
+            The ``(host: str, port: int)`` or ``(host: str, port: int, flowinfo: int,
+            scope_id: int)`` that the server should run on.
+        ae_title : str
+            The AE title of the SCP.
+        contexts : list of presentation.PresentationContext
+            The SCPs supported presentation contexts.
+        ssl_context : ssl.SSLContext, optional
+            If TLS is to be used then this should be the
+            :class:`ssl.SSLContext` used to wrap the client sockets, otherwise
+            if ``None`` then no TLS will be used (default).
+        evt_handlers : list of 2- or 3-tuple, optional
+            A list of ``(event, callable)`` or ``(event, callable, args)``,
+            the *callable* function to run when *event* occurs and the
+            optional extra *args* to pass to the callable.
+        processes : int, optional
+            The number of worker processes to use (default ``2``).
+        """
+        if not hasattr(os, "fork") or not hasattr(socket, "SO_REUSEPORT"):
+            raise RuntimeError(
+                "A multi-process association server requires a platform that "
+                "supports 'fork' and 'SO_REUSEPORT'"
+            )
+
+        if processes < 1:
+            raise ValueError("'processes' must be greater than or equal to 1")
+
+        self.ae = ae
+        self.ae_title = ae_title
+        self.contexts = contexts
+        self.ssl_context = ssl_context
+        self.evt_handlers = evt_handlers or []
+        self.processes = processes
+
+        # Reserve the address so the workers share the same port, the socket
+        #   never listens so the parent doesn't receive any connections
+        address_info = AddressInformation.from_tuple(address)
+        self.socket = socket.socket(address_info.address_family, socket.SOCK_STREAM)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        self.socket.bind(address)
+        self.server_address: tuple[str, int] | tuple[str, int, int, int] = (
+            self.socket.getsockname()
+        )
+
+        self._context = multiprocessing.get_context("fork")
+        self._ready = self._context.Queue()
+        self._stop = self._context.Event()
+        self._workers: list[multiprocessing.process.BaseProcess] = []
+
+    def is_alive(self) -> bool:
+        """Return ``True`` if any of the worker processes are running."""
+        return any(proc.is_alive() for proc in self._workers)
+
+    def _run_worker(self, parent: int) -> None:
+        """Run the association server for a worker process.
+
+        Parameters
+        ----------
+        parent : int
+            The process ID of the parent process.
+        """
+        try:
+            server = self.ae.make_server(
+                self.server_address,
+                ae_title=self.ae_title,
+                contexts=self.contexts,
+                ssl_context=self.ssl_context,
+                evt_handlers=self.evt_handlers,
+                server_class=_WorkerAssociationServer,
+            )
+        except Exception as exc:  # pylint: disable=broad-except
+            self._ready.put(f"{type(exc).__name__}: {exc}")
+            return
+
+        # Only the worker's own server is running in this process
+        self.ae._servers = [server]
+
+        thread = threading.Thread(
+            target=make_target(server.serve_forever),
+            name=f"AcceptorServer@{os.getpid()}",
+        )
+        thread.daemon = True
+        thread.start()
+        self._ready.put(None)
+
+        # Wait until shutdown is requested or the parent process exits
+        while not self._stop.wait(0.5):
+            if os.getppid() != parent:
+                break
+
+        self.ae.shutdown()
+
+    def serve_forever(self, poll_interval: float = 0.5) -> None:
+        """Start the worker processes (if required) and block until
+        :meth:`shutdown` is called or all the workers have exited.
+
+        Parameters
+        ----------
+        poll_interval : float, optional
+            The interval (in seconds) between checks on the worker processes
+            (default ``0.5``).
+        """
+        if not self._workers:
+            self.start()
+
+        while not self._stop.wait(poll_interval):
+            if not self.is_alive():
+                break
+
+    def server_close(self) -> None:
+        """Close the socket used to reserve the server's address."""
+        self.socket.close()
+
+    def shutdown(self, timeout: float | None = 10) -> None:
+        """Stop the worker processes and close the server.
+
+        Each worker stops accepting new connections and aborts its active
+        associations before exiting.
+
+        Parameters
+        ----------
+        timeout : float | None, optional
+            The maximum time (in seconds) to wait for each worker to exit
+            before it's terminated (default ``10``). If ``None`` then wait
+            indefinitely.
+        """
+        self._stop.set()
+        for proc in self._workers:
+            proc.join(timeout)
+            if proc.is_alive():
+                LOGGER.warning(f"Terminating unresponsive worker process {proc.pid}")
+                proc.terminate()
+                proc.join()
+
+        self.server_close()
+        if self in self.ae._servers:
+            self.ae._servers.remove(self)
+
+    def start(self, timeout: float | None = 10) -> None:
+        """Start the worker processes.
+
+        Parameters
+        ----------
+        timeout : float | None, optional
+            The maximum time (in seconds) to wait for each worker to start
+            listening (default ``10``). If ``None`` then wait indefinitely.
+
+        Raises
+        ------
+        RuntimeError
+            If any of the workers were unable to start their server.
+        """
+        for idx in range(self.processes):
+            proc = self._context.Process(
+                target=self._run_worker,
+                args=(os.getpid(),),
+                name=f"AcceptorWorker-{idx}",
+                daemon=True,
+            )
+            proc.start()
+            self._workers.append(proc)
+
+        errors = []
+        for _ in range(self.processes):
+            try:
+                error = self._ready.get(timeout=timeout)
+            except queue.Empty:
+                error = "timed out waiting for the worker to start"
+
+            if error:
+                errors.append(error)
+
+        if errors:
+            self.shutdown()
+            raise RuntimeError(
+                f"Unable to start the association server worker processes: "
+                f"{errors[0]}"
+            )